@@ -1,4 +1,15 @@
 from janis_bioinformatics.__meta__ import __version__
+from janis_bioinformatics.utils.lazyimport import attach
 
-import janis_bioinformatics.tools as tools
-import janis_bioinformatics.data_types as data_types
+# tools and data_types are only imported on first access, so importing a single
+# data type (or tool) doesn't pull in every tool definition in the package
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["tools", "data_types"],
+    submod_attrs={
+        "tools.bioinformaticstoolbase": [
+            "BioinformaticsTool",
+            "BioinformaticsWorkflow",
+        ],
+    },
+)
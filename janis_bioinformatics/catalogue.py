@@ -0,0 +1,276 @@
+"""
+A precomputed catalogue of every tool in janis_bioinformatics.
+
+The catalogue (catalogue.json, next to this file) is generated at build time with:
+
+    python -m janis_bioinformatics.catalogue
+
+and lets tools be listed and looked up (by id, version or versioned_id) without
+importing any tool definitions. The real tool class is only imported when
+CatalogueEntry.tool() is called.
+
+janis_bioinformatics.shed looks tools up through it (shed.get_tool, shed.versions),
+while the janis.tools entry point (shed:tools) still hands JanisShed the fully loaded
+tools package, as the shed discovers tools by walking module.__dict__ rather than
+through an index.
+"""
+import importlib
+import inspect
+import json
+import os
+import re
+from types import ModuleType
+from typing import Dict, List, Optional
+
+CATALOGUE_VERSION = 1
+CATALOGUE_PATH = os.path.join(os.path.dirname(__file__), "catalogue.json")
+
+
+class CatalogueEntry:
+    def __init__(
+        self,
+        tool_id: str,
+        version: Optional[str],
+        versioned_id: str,
+        tool_type: str,
+        module: str,
+        name: str,
+        container: Optional[str] = None,
+        inputs: Optional[Dict[str, str]] = None,
+        outputs: Optional[Dict[str, str]] = None,
+    ):
+        self.tool_id = tool_id
+        self.version = version
+        self.versioned_id = versioned_id
+        self.tool_type = tool_type
+        # the tool is found at getattr(importlib.import_module(module), name)
+        self.module = module
+        self.name = name
+        self.container = container
+        self.inputs = inputs or {}
+        self.outputs = outputs or {}
+
+    def __repr__(self):
+        return f"CatalogueEntry({self.versioned_id} -> {self.module}.{self.name})"
+
+    def tool(self):
+        """
+        Import the module that defines this tool, and return an instance of it
+        """
+        tool = getattr(importlib.import_module(self.module), self.name)
+        return tool() if inspect.isclass(tool) else tool
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.tool_id,
+            "version": self.version,
+            "versioned_id": self.versioned_id,
+            "type": self.tool_type,
+            "module": self.module,
+            "name": self.name,
+            "container": self.container,
+            "inputs": self.inputs,
+            "outputs": self.outputs,
+        }
+
+    @staticmethod
+    def from_dict(d: dict) -> "CatalogueEntry":
+        return CatalogueEntry(
+            tool_id=d["id"],
+            version=d.get("version"),
+            versioned_id=d["versioned_id"],
+            tool_type=d["type"],
+            module=d["module"],
+            name=d["name"],
+            container=d.get("container"),
+            inputs=d.get("inputs"),
+            outputs=d.get("outputs"),
+        )
+
+    @staticmethod
+    def from_tool(tool, module: str, name: str) -> "CatalogueEntry":
+        container = None
+        if hasattr(tool, "container"):
+            try:
+                container = tool.container()
+            except Exception:
+                # eg: abstract containers on base classes
+                container = None
+
+        try:
+            inputs = {i.id(): i.intype.id() for i in tool.tool_inputs()}
+        except Exception:
+            # eg: tools that don't define their inputs, the tool is still listed
+            inputs = {}
+        try:
+            outputs = {o.id(): o.outtype.id() for o in tool.tool_outputs()}
+        except Exception:
+            # eg: StarLiftOver, whose outputs() is None
+            outputs = {}
+
+        return CatalogueEntry(
+            tool_id=tool.id(),
+            version=tool.version(),
+            versioned_id=tool.versioned_id(),
+            tool_type=tool.type().value,
+            module=module,
+            name=name,
+            container=container,
+            inputs=inputs,
+            outputs=outputs,
+        )
+
+
+def _version_key(version: Optional[str]):
+    # natural sort, so that 4.1.10 > 4.1.9 and 'v2' > 'v1'
+    return [
+        (0, int(p)) if p.isdigit() else (1, p)
+        for p in re.split(r"(\d+)", version or "")
+        if p
+    ]
+
+
+class ToolCatalogue:
+    def __init__(self, entries: List[CatalogueEntry]):
+        self.entries = entries
+        self._by_versioned_id = {e.versioned_id.lower(): e for e in entries}
+        self._by_id: Dict[str, List[CatalogueEntry]] = {}
+        for e in entries:
+            self._by_id.setdefault(e.tool_id.lower(), []).append(e)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def ids(self) -> List[str]:
+        return sorted({e.tool_id for e in self.entries})
+
+    def versions(self, tool_id: str) -> List[str]:
+        entries = self._by_id.get(tool_id.lower(), [])
+        return sorted((e.version for e in entries if e.version), key=_version_key)
+
+    def get(self, tool_id: str, version: Optional[str] = None):
+        """
+        Find a tool by its id, returning the latest version if one isn't specified
+
+        :param tool_id: tool id (eg: Gatk4HaplotypeCaller), case insensitive
+        :param version: tool version (eg: 4.1.3.0)
+        :return: Optional[CatalogueEntry]
+        """
+        entries = self._by_id.get(tool_id.lower())
+        if not entries:
+            return None
+        if version is None:
+            return max(entries, key=lambda e: _version_key(e.version))
+        for e in entries:
+            if e.version == version:
+                return e
+        return None
+
+    def find(self, versioned_id: str) -> Optional[CatalogueEntry]:
+        """
+        Find a tool by its versioned_id (case insensitive)
+        """
+        return self._by_versioned_id.get(versioned_id.lower())
+
+    def search(self, query: str) -> List[CatalogueEntry]:
+        """
+        All tools whose versioned_id contains the query (case insensitive)
+        """
+        q = query.lower()
+        return [e for e in self.entries if q in e.versioned_id.lower()]
+
+    def to_dict(self) -> dict:
+        return {
+            "catalogue_version": CATALOGUE_VERSION,
+            "tools": [e.to_dict() for e in self.entries],
+        }
+
+    def write(self, path: str = CATALOGUE_PATH):
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=1, sort_keys=True)
+
+    @staticmethod
+    def load(path: str = CATALOGUE_PATH) -> "ToolCatalogue":
+        """
+        Load the prebuilt catalogue, raises a FileNotFoundError if it doesn't exist
+        (eg: a source checkout), generate it or use ToolCatalogue.build().
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"Couldn't find the janis_bioinformatics tool catalogue at '{path}', "
+                f"generate it with 'python -m janis_bioinformatics.catalogue'"
+            )
+
+        with open(path) as f:
+            d = json.load(f)
+        found_version = d.get("catalogue_version")
+        if found_version != CATALOGUE_VERSION:
+            raise Exception(
+                f"The tool catalogue at '{path}' has version {found_version}, "
+                f"expected {CATALOGUE_VERSION}, please regenerate it with "
+                f"'python -m janis_bioinformatics.catalogue'"
+            )
+        return ToolCatalogue([CatalogueEntry.from_dict(t) for t in d["tools"]])
+
+    @staticmethod
+    def build() -> "ToolCatalogue":
+        """
+        Import every tool definition and collect a CatalogueEntry for each unique tool
+        """
+        from janis_bioinformatics.shed import tools
+
+        entries: Dict[str, CatalogueEntry] = {}
+        _collect_tools(tools, entries, set())
+        return ToolCatalogue(
+            sorted(entries.values(), key=lambda e: e.versioned_id.lower())
+        )
+
+
+def _collect_tools(module: ModuleType, entries: Dict[str, CatalogueEntry], seen: set):
+    from janis_core import Logger, Tool
+
+    if module.__name__ in seen:
+        return
+    seen.add(module.__name__)
+
+    # private classes (eg: _JoinIndexedFasta) are still tools of the shed, so this
+    # filters on where a tool is defined rather than on its name
+    for name, obj in list(vars(module).items()):
+        if isinstance(obj, ModuleType):
+            if obj.__name__.startswith("janis_bioinformatics.tools"):
+                _collect_tools(obj, entries, seen)
+            continue
+
+        if inspect.isclass(obj):
+            if not issubclass(obj, Tool) or inspect.isabstract(obj):
+                continue
+            source_module, source_name = obj.__module__, obj.__qualname__
+        elif isinstance(obj, Tool):
+            source_module, source_name = module.__name__, name
+        else:
+            continue
+
+        if not source_module.startswith("janis_bioinformatics.tools"):
+            continue
+
+        try:
+            tool = obj() if inspect.isclass(obj) else obj
+            entry = CatalogueEntry.from_tool(tool, source_module, source_name)
+        except Exception as e:
+            Logger.debug(f"Skipping {source_module}.{source_name} in catalogue: {e}")
+            continue
+
+        if entry.versioned_id not in entries:
+            entries[entry.versioned_id] = entry
+
+
+if __name__ == "__main__":
+    import sys
+
+    catalogue = ToolCatalogue.build()
+    path = sys.argv[1] if len(sys.argv) > 1 else CATALOGUE_PATH
+    catalogue.write(path)
+    print(f"Wrote {len(catalogue)} tools to {path}")
@@ -1,4 +1,3 @@
-import subprocess
 from janis_core import File
 from janis_core.tool.test_classes import (
     TTestPreprocessor,
@@ -22,18 +21,12 @@ class Bam(File):
 
     @classmethod
     def flagstat(cls, file_path: str):
-        command = ["samtools", "flagstat", file_path]
-        result = subprocess.run(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-        )
+        """
+        The same text as 'samtools flagstat', computed in-process
+        """
+        from janis_bioinformatics.utils.flagstat import flagstat
 
-        if result.stderr:
-            raise Exception(result.stderr)
-
-        return result.stdout
+        return flagstat(file_path)
 
     @classmethod
     def equal(cls, file_path_1: str, file_path_2: str):
@@ -1,7 +1,7 @@
 import operator
 import os.path
-import zipfile
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from janis_core import File, Array, Logger
 from janis_core.tool.test_classes import TTestExpectedOutput, TTestPreprocessor
@@ -94,22 +94,68 @@ class FastqGzPairedEnd(Array):
 
         :param file_paths: a string containing all file paths, separated by |
         :type file_paths: str
-        :param expected_sizes: expected minimum sizes of all files
+        :param expected_sizes: expected minimum sizes of all files (in the same order)
         :type expected_sizes: List[int]
         :return: a boolean value indicating if all files are bigger than or equal to their expected minimum sizes
         """
-        files = file_paths.split("|")
+        files = _split_file_paths(file_paths)
         if len(files) != len(expected_sizes):
             return "Number of expected values don't match number of outputs"
-        for file in files:
-            unzipped = zipfile.ZipFile(file)
-            if "R1" in unzipped.namelist()[0]:
-                if os.path.getsize(file) < expected_sizes[0]:
-                    return False
-            else:
-                if os.path.getsize(file) < expected_sizes[1]:
-                    return False
-        return True
+        return all(
+            os.path.getsize(file) >= expected
+            for file, expected in zip(files, expected_sizes)
+        )
+
+    @classmethod
+    def validate_files(
+        cls, file_paths: Union[str, List[str]], max_reads: Optional[int] = None
+    ):
+        """
+        Pre-flight check of the fastq pair, eg: before running an aligner. Both mates
+        are read in a single pass, and a FastqValidationError is raised for the first
+        malformed record, mismatched read name or difference in read count.
+
+        :param file_paths: the two fastqs, either as a list or separated by |
+        :param max_reads: only check the first max_reads pairs (fails faster)
+        :return: the (FastqStats, FastqStats) of each mate
+        """
+        from janis_bioinformatics.utils.fastqchecks import fastq_pair_stats
+
+        files = _split_file_paths(file_paths)
+        if len(files) != 2:
+            raise Exception(f"There must be exactly 2 (found {len(files)}) fastq files")
+        return fastq_pair_stats(files[0], files[1], max_reads=max_reads)
+
+    @classmethod
+    def ReadCount(cls, file_paths: Union[str, List[str]]) -> int:
+        """
+        Number of read pairs (the pair is validated while it's counted)
+        """
+        return _pair_stats(*_file_paths_key(file_paths))[0].reads
+
+    @classmethod
+    def BaseCount(cls, file_paths: Union[str, List[str]]) -> int:
+        """
+        Total number of bases in both mates
+        """
+        stats1, stats2 = _pair_stats(*_file_paths_key(file_paths))
+        return stats1.bases + stats2.bases
+
+    @classmethod
+    def MeanQuality(cls, file_paths: Union[str, List[str]]) -> float:
+        """
+        Mean (phred+33) base quality across both mates, rounded to 2 decimal places
+        """
+        stats1, stats2 = _pair_stats(*_file_paths_key(file_paths))
+        bases = stats1.bases + stats2.bases
+        if not bases:
+            return 0.0
+        total = sum(
+            q * n
+            for stats in (stats1, stats2)
+            for q, n in stats.quality_distribution().items()
+        )
+        return round(total / bases, 2)
 
     @classmethod
     def basic_test(
@@ -118,6 +164,7 @@ class FastqGzPairedEnd(Array):
         min_total_size: int,
         min_first_size: Optional[int] = None,
         min_second_size: Optional[int] = None,
+        read_count: Optional[int] = None,
     ) -> List[TTestExpectedOutput]:
         outcome = [
             TTestExpectedOutput(
@@ -144,6 +191,15 @@ class FastqGzPairedEnd(Array):
                     expected_value=[min_first_size, min_second_size],
                 )
             ]
+        if read_count is not None:
+            outcome += [
+                TTestExpectedOutput(
+                    tag=tag,
+                    preprocessor=FastqGzPairedEnd.ReadCount,
+                    operator=operator.eq,
+                    expected_value=read_count,
+                )
+            ]
         return outcome
 
 
@@ -183,3 +239,21 @@ class FastqPairedEnd(Array):
 
 FastqGzPair = FastqGzPairedEnd
 FastqPair = FastqPairedEnd
+
+
+def _split_file_paths(file_paths: Union[str, List[str]]) -> List[str]:
+    if isinstance(file_paths, str):
+        return file_paths.split("|")
+    return list(file_paths)
+
+
+def _file_paths_key(file_paths: Union[str, List[str]]) -> Tuple:
+    # the modified times are part of the key, so a rewritten file isn't cached
+    files = tuple(_split_file_paths(file_paths))
+    return files, tuple(os.path.getmtime(f) for f in files)
+
+
+@lru_cache(maxsize=8)
+def _pair_stats(files: Tuple[str, ...], mtimes: Tuple[float, ...]):
+    # the preprocessors each need a pass over the same (large) files, so share it
+    return FastqGzPairedEnd.validate_files(list(files))
@@ -1,5 +1,3 @@
-import gzip
-import hashlib
 import re
 from abc import ABC
 from typing import List, Optional
@@ -46,15 +44,9 @@ class Vcf(File):
         :return: md5
         :rtype: str
         """
-        with open(file_path, "r") as f:
-            hash_md5 = hashlib.md5()
-            while True:
-                line = f.readline()
-                if not line:
-                    break
-                if all(("##" + header) not in line for header in headers_to_remove):
-                    hash_md5.update(line.encode())
-        return hash_md5.hexdigest()
+        from janis_bioinformatics.utils.vcfchecks import md5_without_header
+
+        return md5_without_header(file_path, headers_to_remove, compressed=False)
 
     @classmethod
     def basic_test(
@@ -164,11 +156,18 @@ class CompressedVcf(Gunzipped):
 
     @classmethod
     def LineCount(cls, file_path: str):
-        count = 0
-        with gzip.open(file_path, "rt") as f:
-            while f.readline():
-                count += 1
-        return count
+        from janis_bioinformatics.utils.vcfchecks import line_count
+
+        return line_count(file_path, compressed=True)
+
+    @classmethod
+    def RecordCount(cls, file_path: str):
+        """
+        Number of variant records, ie: lines that aren't headers (don't start with '#')
+        """
+        from janis_bioinformatics.utils.vcfchecks import record_count
+
+        return record_count(file_path, compressed=True)
 
     @classmethod
     def md5_without_header(cls, file_path: str, headers_to_remove: List[str]) -> str:
@@ -182,15 +181,9 @@ class CompressedVcf(Gunzipped):
         :return: md5
         :rtype: str
         """
-        with gzip.open(file_path, "rt") as f:
-            hash_md5 = hashlib.md5()
-            while True:
-                line = f.readline()
-                if not line:
-                    break
-                if all(("##" + header) not in line for header in headers_to_remove):
-                    hash_md5.update(line.encode())
-        return hash_md5.hexdigest()
+        from janis_bioinformatics.utils.vcfchecks import md5_without_header
+
+        return md5_without_header(file_path, headers_to_remove, compressed=True)
 
     @classmethod
     def basic_test(
@@ -200,6 +193,7 @@ class CompressedVcf(Gunzipped):
         line_count: Optional[int] = None,
         headers_to_remove: Optional[List[str]] = None,
         md5_value: Optional[str] = None,
+        record_count: Optional[int] = None,
     ) -> List[TTestExpectedOutput]:
         outcome = [
             TTestExpectedOutput(
@@ -220,6 +214,16 @@ class CompressedVcf(Gunzipped):
                 ),
             ]
 
+        if record_count is not None:
+            outcome += [
+                TTestExpectedOutput(
+                    tag=tag,
+                    preprocessor=CompressedVcf.RecordCount,
+                    operator=operator.eq,
+                    expected_value=record_count,
+                ),
+            ]
+
         if md5_value is not None:
             if headers_to_remove is not None:
                 outcome += [
@@ -262,9 +266,10 @@ class VcfTabix(CompressedVcf, FileTabix):
         headers_to_remove: Optional[List[str]] = None,
         vcf_md5: Optional[str] = None,
         tbi_md5: Optional[str] = None,
+        record_count: Optional[int] = None,
     ) -> List[TTestExpectedOutput]:
         outcome = super().basic_test(
-            tag, min_vcf_size, line_count, headers_to_remove, vcf_md5
+            tag, min_vcf_size, line_count, headers_to_remove, vcf_md5, record_count
         ) + [
             TTestExpectedOutput(
                 tag=tag,
@@ -0,0 +1,421 @@
+"""
+Input size aware resource estimates (cpus, memory, disk and time) for the tools.
+
+Each tool's cpus() / memory() asks resource_for_hints, which estimates the resource
+from the size of the sample being processed:
+
+    value = intercept + per_gb * input size (GB) + per_million_reads * reads (millions)
+
+with per tool (and per resource) coefficients. The size comes from the 'inputSize'
+(GB of reads / alignments) and 'readCount' hints, or if those aren't given, from a
+nominal size for the 'captureType' hint. Tools without coefficients (or without any
+size hints) fall back to their capture type table (eg: CORES_TUPLE / MEM_TUPLE).
+
+Disk and time (disk_for_hints / time_for_hints, used by every BioinformaticsTool) fall
+back to the tool's IoProfile instead: how much disk (inputs, outputs, temp files) and
+time the tool needs for each GB of input. The 'disk' (GB) and 'time' (seconds) hints
+override both.
+
+The coefficients (resources.json, next to this file, or $JANIS_BIOINFORMATICS_RESOURCES)
+are fitted from the peak usage of previous runs with:
+
+    python -m janis_bioinformatics.resources calibrate runs.tsv
+
+where runs.tsv has a header and the columns (blank values are skipped):
+
+    tool  inputSize (GB)  readCount  cpus  memory (GB)  disk (GB)  time (seconds)
+
+Until a tool has runs, the shipped resources.json has a model seeded from its capture
+type table (for the tools whose cpus / memory depend on the capture type), generated
+with:
+
+    python -m janis_bioinformatics.resources seed
+
+A seeded model only answers an explicit inputSize hint, where it estimates between the
+values of the capture types, a captureType hint still gets the table's exact value.
+Both commands update the existing file: calibrate replaces the models it fits, seed
+regenerates the seeded models and keeps the ones fitted from runs.
+"""
+import csv
+import json
+import math
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from janis_core import CaptureType, get_value_for_hints_and_ordered_resource_tuple
+
+RESOURCES_PATH = os.environ.get(
+    "JANIS_BIOINFORMATICS_RESOURCES",
+    os.path.join(os.path.dirname(__file__), "resources.json"),
+)
+RESOURCES = ["cpus", "memory", "disk", "time"]
+
+INPUT_SIZE_HINT = "inputSize"
+READ_COUNT_HINT = "readCount"
+DISK_HINT = "disk"
+TIME_HINT = "time"
+
+# a typical (compressed) BAM size for each capture type, in GB
+CAPTURE_TYPE_SIZES = {
+    CaptureType.TARGETED: 2,
+    CaptureType.EXOME: 10,
+    CaptureType.CHROMOSOME: 5,
+    CaptureType.THIRTYX: 90,
+    CaptureType.NINETYX: 270,
+    CaptureType.THREEHUNDREDX: 900,
+}
+
+# the fitted model is shifted to cover every run, then scaled by this much
+DEFAULT_HEADROOM = 1.2
+
+
+class ResourceModel(NamedTuple):
+    intercept: float
+    per_gb: float = 0.0
+    per_million_reads: float = 0.0
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    # the number of runs the model was fitted from
+    runs: int = 0
+    # [size (GB), value] points of a model seeded from a capture type table, the
+    # estimate is interpolated between them instead of the linear model
+    knots: Optional[List[List[float]]] = None
+
+    def estimate(self, size_gb: float, million_reads: Optional[float] = None):
+        if self.knots:
+            return math.ceil(_interpolate(self.knots, size_gb))
+        value = self.intercept + self.per_gb * size_gb
+        if million_reads is not None:
+            value += self.per_million_reads * million_reads
+        if self.minimum is not None:
+            value = max(value, self.minimum)
+        if self.maximum is not None:
+            value = min(value, self.maximum)
+        return math.ceil(value)
+
+
+def _interpolate(knots: List[List[float]], x: float) -> float:
+    if x <= knots[0][0]:
+        return knots[0][1]
+    for (x0, y0), (x1, y1) in zip(knots, knots[1:]):
+        if x <= x1:
+            return y0 + (y1 - y0) * (x - x0) / (x1 - x0)
+    return knots[-1][1]
+
+
+@lru_cache(maxsize=None)
+def load_models(path: str = RESOURCES_PATH) -> Dict[str, Dict[str, ResourceModel]]:
+    """
+    tool id -> resource -> ResourceModel, empty if the file doesn't exist
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        models = json.load(f)
+    return {
+        tool: {resource: ResourceModel(**m) for resource, m in resources.items()}
+        for tool, resources in models.items()
+    }
+
+
+def input_size(hints: Optional[Dict[str, Any]]) -> Optional[Tuple[float, Any]]:
+    """
+    (input size in GB, millions of reads or None) from the hints, None if the hints
+    don't say anything about the size of the input
+    """
+    if not hints:
+        return None
+    reads = hints.get(READ_COUNT_HINT)
+    million_reads = float(reads) / 1e6 if reads else None
+    if hints.get(INPUT_SIZE_HINT):
+        return float(hints[INPUT_SIZE_HINT]), million_reads
+    size = CAPTURE_TYPE_SIZES.get(hints.get(CaptureType.key()))
+    if size is None:
+        return None
+    return size, million_reads
+
+
+def estimate_resource(
+    tool_id: str,
+    resource: str,
+    hints: Optional[Dict[str, Any]],
+    models: Optional[Dict[str, Dict[str, ResourceModel]]] = None,
+):
+    """
+    The estimate of the resource (cpus, memory in GB, disk in GB or time in seconds)
+    for the tool, or None if there's no model for the tool or no size in the hints
+    """
+    if models is None:
+        models = load_models()
+    model = models.get(tool_id, {}).get(resource)
+    size = input_size(hints)
+    if model is None or size is None:
+        return None
+    if model.knots and not hints.get(INPUT_SIZE_HINT):
+        # the table it was seeded from is exact for the capture type
+        return None
+    return model.estimate(*size)
+
+
+def resource_for_hints(
+    tool, resource: str, hints: Optional[Dict[str, Any]], table: Optional[list] = None
+):
+    """
+    The estimated resource for the tool, falling back to the value in the (ordered
+    resource tuple) table for the hints, or None if neither has a value.
+    """
+    estimate = estimate_resource(tool.id(), resource, hints)
+    if estimate is not None:
+        return estimate
+    if table:
+        return get_value_for_hints_and_ordered_resource_tuple(hints, table)
+    return None
+
+
+class IoProfile(NamedTuple):
+    """
+    The disk (GB) and time (seconds) a tool needs, as a function of the input size.
+    These are rough defaults for the kind of tool, calibrated models replace them.
+    """
+
+    # inputs + outputs + temp files (eg: sort spills, indexes), per GB of input
+    disk_per_gb: float = 2.0
+    # reference, indexes and databases that don't scale with the input
+    disk_overhead: float = 10.0
+    seconds_per_gb: float = 60.0
+    time_overhead: float = 1800.0
+
+    def disk(self, size_gb: float) -> int:
+        return math.ceil(self.disk_overhead + self.disk_per_gb * size_gb)
+
+    def time(self, size_gb: float) -> int:
+        return math.ceil(self.time_overhead + self.seconds_per_gb * size_gb)
+
+
+def disk_for_hints(tool, hints: Optional[Dict[str, Any]], profile: IoProfile):
+    """
+    Disk (GB) for the tool: the 'disk' hint, the calibrated model or the IoProfile
+    estimate for the input size, or None if the hints don't give a size
+    """
+    if hints and hints.get(DISK_HINT):
+        return float(hints[DISK_HINT])
+    estimate = estimate_resource(tool.id(), "disk", hints)
+    if estimate is not None:
+        return estimate
+    size = input_size(hints)
+    return profile.disk(size[0]) if size else None
+
+
+def time_for_hints(tool, hints: Optional[Dict[str, Any]], profile: IoProfile):
+    """
+    Walltime (seconds) for the tool, like disk_for_hints
+    """
+    if hints and hints.get(TIME_HINT):
+        return int(hints[TIME_HINT])
+    estimate = estimate_resource(tool.id(), "time", hints)
+    if estimate is not None:
+        return estimate
+    size = input_size(hints)
+    return profile.time(size[0]) if size else None
+
+
+def _least_squares(rows: List[List[float]], ys: List[float]) -> List[float]:
+    """
+    Solve the normal equations (XᵀX)b = Xᵀy by Gaussian elimination, there are at
+    most 3 coefficients so numpy isn't worth depending on.
+    """
+    n = len(rows[0])
+    a = [
+        [sum(r[i] * r[j] for r in rows) for j in range(n)]
+        + [sum(r[i] * y for r, y in zip(rows, ys))]
+        for i in range(n)
+    ]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            raise ValueError("singular")
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(n):
+            if r != col:
+                factor = a[r][col] / a[col][col]
+                a[r] = [x - factor * y for x, y in zip(a[r], a[col])]
+    return [a[i][n] / a[i][i] for i in range(n)]
+
+
+def fit_model(
+    sizes: List[float],
+    million_reads: List[Optional[float]],
+    values: List[float],
+    headroom: float = DEFAULT_HEADROOM,
+) -> ResourceModel:
+    """
+    Fit value ~ intercept + per_gb * size (+ per_million_reads * reads, if every run
+    has a read count), then shift the intercept so that no run is underestimated.
+    """
+    use_reads = all(r is not None for r in million_reads)
+    rows = [[1.0, s] + ([r] if use_reads else []) for s, r in zip(sizes, million_reads)]
+    try:
+        coefficients = _least_squares(rows, values)
+    except ValueError:
+        # eg: every run had the same size
+        coefficients = [max(values)] + [0.0] * (len(rows[0]) - 1)
+    # resources don't shrink with larger inputs
+    coefficients = [coefficients[0]] + [max(c, 0.0) for c in coefficients[1:]]
+
+    predicted = [sum(c * x for c, x in zip(coefficients, r)) for r in rows]
+    shortfall = max(0.0, max(v - p for v, p in zip(values, predicted)))
+    coefficients[0] += shortfall
+    coefficients = [c * headroom for c in coefficients]
+
+    return ResourceModel(
+        intercept=round(coefficients[0], 4),
+        per_gb=round(coefficients[1], 6),
+        per_million_reads=round(coefficients[2], 6) if use_reads else 0.0,
+        minimum=min(values),
+        runs=len(values),
+    )
+
+
+def calibrate(
+    runs_path: str, headroom: float = DEFAULT_HEADROOM, min_runs: int = 3
+) -> Dict[str, Dict[str, ResourceModel]]:
+    """
+    Fit a ResourceModel for every tool / resource with at least min_runs runs
+    """
+    observations: Dict[Tuple[str, str], List[Tuple[float, Any, float]]] = {}
+    with open(runs_path, newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            if not row.get(INPUT_SIZE_HINT):
+                continue
+            size = float(row[INPUT_SIZE_HINT])
+            reads = row.get(READ_COUNT_HINT)
+            million_reads = float(reads) / 1e6 if reads else None
+            for resource in RESOURCES:
+                if row.get(resource):
+                    observations.setdefault((row["tool"], resource), []).append(
+                        (size, million_reads, float(row[resource]))
+                    )
+
+    models: Dict[str, Dict[str, ResourceModel]] = {}
+    for (tool, resource), obs in sorted(observations.items()):
+        if len(obs) < min_runs:
+            continue
+        sizes, million_reads, values = map(list, zip(*obs))
+        models.setdefault(tool, {})[resource] = fit_model(
+            sizes, million_reads, values, headroom=headroom
+        )
+    return models
+
+
+def seed(tools: Iterable) -> Dict[str, Dict[str, ResourceModel]]:
+    """
+    Seed a model from the cpus / memory each tool asks for at the nominal size of each
+    capture type, for the tools where that depends on the capture type. The values
+    never decrease with the size, so a larger input never gets less.
+    """
+    models: Dict[str, Dict[str, ResourceModel]] = {}
+    for tool in tools:
+        for resource in ("cpus", "memory"):
+            points = {}
+            for capture_type, size in CAPTURE_TYPE_SIZES.items():
+                try:
+                    value = getattr(tool, resource)({CaptureType.key(): capture_type})
+                except Exception:
+                    # eg: a resource that's an expression of the inputs
+                    continue
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    points[size] = value
+            knots, highest = [], 0
+            for size in sorted(points):
+                highest = max(highest, points[size])
+                knots.append([size, highest])
+            if len({value for _, value in knots}) < 2:
+                # eg: the same for every capture type, or only less for a chromosome
+                continue
+            models.setdefault(tool.id(), {})[resource] = ResourceModel(
+                intercept=0, knots=knots
+            )
+    return models
+
+
+def merge_models(
+    existing: Dict[str, Dict[str, ResourceModel]],
+    models: Dict[str, Dict[str, ResourceModel]],
+) -> Dict[str, Dict[str, ResourceModel]]:
+    """
+    existing, with models added (or replacing the existing model of a resource)
+    """
+    merged = {tool: dict(resources) for tool, resources in existing.items()}
+    for tool, resources in models.items():
+        merged.setdefault(tool, {}).update(resources)
+    return merged
+
+
+def measured_models(
+    models: Dict[str, Dict[str, ResourceModel]]
+) -> Dict[str, Dict[str, ResourceModel]]:
+    """
+    The models fitted from runs (not seeded)
+    """
+    measured = {
+        tool: {r: m for r, m in resources.items() if not m.knots}
+        for tool, resources in models.items()
+    }
+    return {tool: resources for tool, resources in measured.items() if resources}
+
+
+def write_models(models: Dict[str, Dict[str, ResourceModel]], path: str):
+    with open(path, "w") as f:
+        json.dump(
+            {
+                tool: {resource: m._asdict() for resource, m in resources.items()}
+                for tool, resources in models.items()
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
+    load_models.cache_clear()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Fit the resource coefficients of each tool from previous runs"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    calibrate_parser = subparsers.add_parser("calibrate")
+    calibrate_parser.add_argument("runs", help="tsv of the peak usage of each run")
+    calibrate_parser.add_argument("-o", "--output", default=RESOURCES_PATH)
+    calibrate_parser.add_argument("--headroom", type=float, default=DEFAULT_HEADROOM)
+    calibrate_parser.add_argument("--min-runs", type=int, default=3)
+    seed_parser = subparsers.add_parser("seed")
+    seed_parser.add_argument("-o", "--output", default=RESOURCES_PATH)
+    args = parser.parse_args()
+
+    if args.command == "calibrate":
+        fitted = calibrate(args.runs, headroom=args.headroom, min_runs=args.min_runs)
+    else:
+        from janis_core import ToolType
+        from janis_bioinformatics.catalogue import ToolCatalogue
+
+        # the latest version of each command tool
+        catalogue = ToolCatalogue.build()
+        fitted = seed(
+            catalogue.get(tool_id).tool()
+            for tool_id in catalogue.ids()
+            if catalogue.get(tool_id).tool_type == ToolType.CommandTool.value
+        )
+    existing = load_models(args.output)
+    if args.command == "calibrate":
+        merged = merge_models(existing, fitted)
+    else:
+        # the seeds are regenerated, the models of measured runs are kept
+        merged = merge_models(fitted, measured_models(existing))
+    write_models(merged, args.output)
+    for tool_id, tool_models in fitted.items():
+        for resource_name, model in tool_models.items():
+            print(f"{tool_id}\t{resource_name}\t{model}")
+    print(f"Wrote {sum(map(len, fitted.values()))} models to {args.output}")
@@ -0,0 +1,57 @@
+"""
+Target of the janis.tools entry point. The JanisShed discovers tools by walking
+module.__dict__, so every lazily attached tool has to be loaded before it's handed over.
+That only happens when the entry point resolves 'tools'.
+
+Looking a tool up by its id and version (get_tool, versions, ids) goes through the
+prebuilt catalogue (janis_bioinformatics.catalogue) instead, which only imports the
+module that defines the tool that's returned.
+"""
+import warnings
+from typing import List, Optional
+
+from janis_bioinformatics.catalogue import CATALOGUE_PATH, ToolCatalogue
+
+_catalogue: Optional[ToolCatalogue] = None
+
+
+def __getattr__(name):
+    if name == "tools":
+        import janis_bioinformatics.tools as tools
+        from janis_bioinformatics.utils.lazyimport import load_all
+
+        # cache it on the module so __getattr__ is only hit once
+        globals()["tools"] = load_all(tools)
+        return tools
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def catalogue() -> ToolCatalogue:
+    """
+    The catalogue shipped with the package. Without one (eg: a source checkout, where
+    it hasn't been generated) this warns, and builds it from the tool definitions.
+    """
+    global _catalogue
+    if _catalogue is None:
+        try:
+            _catalogue = ToolCatalogue.load(CATALOGUE_PATH)
+        except FileNotFoundError as e:
+            warnings.warn(f"{e}, building it from the tool definitions instead")
+            _catalogue = ToolCatalogue.build()
+    return _catalogue
+
+
+def get_tool(tool_id: str, version: Optional[str] = None):
+    """
+    An instance of the tool (the latest version if one isn't given), or None
+    """
+    entry = catalogue().get(tool_id, version)
+    return entry.tool() if entry is not None else None
+
+
+def versions(tool_id: str) -> List[str]:
+    return catalogue().versions(tool_id)
+
+
+def ids() -> List[str]:
+    return catalogue().ids()
@@ -1,44 +1,54 @@
-from janis_bioinformatics.tools.bioinformaticstoolbase import (
-    BioinformaticsTool,
-    BioinformaticsWorkflow,
-)
-from janis_bioinformatics.tools import (
-    arriba,
-    babrahambioinformatics,
-    biobambam,
-    bcftools,
-    bedtools,
-    bwa,
-    common,
-    cellranger,
-    cutadapt,
-    dawson,
-    ensembl,
-    facets,
-    freebayes,
-    gatk3,
-    gatk4,
-    htseq,
-    htslib,
-    igvtools,
-    illumina,
-    io_lib,
-    kallisto,
-    multiqc,
-    oshlack,
-    papenfuss,
-    pmac,
-    rnaseqqc,
-    samtools,
-    sequenza,
-    star,
-    subread,
-    suhrig,
-    ucsf,
-    usadellab,
-    validation,
-    variantcallers,
-    vcflib,
-    whisper,
-    vcftools,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=[
+        "arriba",
+        "babrahambioinformatics",
+        "biobambam",
+        "bcftools",
+        "bedtools",
+        "bwa",
+        "common",
+        "cellranger",
+        "cutadapt",
+        "dawson",
+        "ensembl",
+        "facets",
+        "freebayes",
+        "gatk3",
+        "gatk4",
+        "htseq",
+        "htslib",
+        "igvtools",
+        "illumina",
+        "io_lib",
+        "kallisto",
+        "multiqc",
+        "oshlack",
+        "papenfuss",
+        "pmac",
+        "rnaseqqc",
+        "samtools",
+        "sequenza",
+        "star",
+        "subread",
+        "suhrig",
+        "ucsf",
+        "usadellab",
+        "validation",
+        "variantcallers",
+        "vcflib",
+        "whisper",
+        "vcftools",
+    ],
+    submod_attrs={
+        "bioinformaticstoolbase": [
+            "BioinformaticsTool",
+            "BioinformaticsWorkflow",
+            "BioinformaticsPythonTool",
+            "BioinformaticsToolBuilder",
+            "BioinformaticsWorkflowBuilder",
+        ],
+    },
 )
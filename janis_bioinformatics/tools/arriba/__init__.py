@@ -1,2 +1,9 @@
-from .run_arriba.versions import RunArriba_2_1_0, RunArriba_1_1_0
-from .draw_fusions.versions import ArribaDrawFusions_2_1_0, ArribaDrawFusions_1_1_0
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "run_arriba.versions": ["RunArriba_2_1_0", "RunArriba_1_1_0"],
+        "draw_fusions.versions": ["ArribaDrawFusions_2_1_0", "ArribaDrawFusions_1_1_0"],
+    },
+)
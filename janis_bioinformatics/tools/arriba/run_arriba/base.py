@@ -21,6 +21,7 @@ from janis_core import (
     Array,
 )
 from janis_bioinformatics.tools.arriba.base import ArribaBase
+from janis_bioinformatics.resources import resource_for_hints
 
 
 class RunArribaBase(ArribaBase, ABC):
@@ -36,6 +37,9 @@ class RunArribaBase(ArribaBase, ABC):
 
     # set a bigger default memory
     def memory(self, hints):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 64
 
     def inputs(self):
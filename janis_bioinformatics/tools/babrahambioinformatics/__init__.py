@@ -1,9 +1,16 @@
-from .fastqc.versions import (
-    FastQC_0_11_8,
-    FastQC_0_11_5,
-    FastQCLatest,
-    FastQCSingle_0_11_8,
-    FastQCSingle_0_11_5,
-    FastQCSingleLatest,
-    FastqcSingleScattered,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "fastqc.versions": [
+            "FastQC_0_11_8",
+            "FastQC_0_11_5",
+            "FastQCLatest",
+            "FastQCSingle_0_11_8",
+            "FastQCSingle_0_11_5",
+            "FastQCSingleLatest",
+            "FastqcSingleScattered",
+        ],
+    },
 )
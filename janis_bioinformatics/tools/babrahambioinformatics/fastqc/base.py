@@ -18,7 +18,7 @@ from janis_core import (
     CpuSelector,
     InputSelector,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import (
     TTestCase,
     TTestExpectedOutput,
@@ -91,13 +91,13 @@ class FastQCBase(BioinformaticsTool, ABC):
         )
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -17,7 +17,7 @@ from janis_core import (
     CpuSelector,
     InputSelector,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix.data_types import ZipFile, HtmlFile
 
 from janis_bioinformatics.data_types import FastqGzPair, FastqGz
@@ -86,13 +86,13 @@ class FastQCSingleBase(BioinformaticsTool, ABC):
         )
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
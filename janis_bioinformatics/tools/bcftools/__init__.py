@@ -1,14 +1,21 @@
-from .annotate.versions import (
-    BcfToolsAnnotate_1_5,
-    BcfToolsAnnotate_1_9,
-    BcfToolsAnnotateLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "annotate.versions": [
+            "BcfToolsAnnotate_1_5",
+            "BcfToolsAnnotate_1_9",
+            "BcfToolsAnnotateLatest",
+        ],
+        "concat.versions": ["BcfToolsConcat_1_9", "BcfToolsConcatLatest"],
+        "fill_from_fasta.versions": [
+            "BcfToolsFillFromFasta_1_12",
+            "BcfToolsFillFromFastaLatest",
+        ],
+        "index.versions": ["BcfToolsIndex_1_9", "BcfToolsIndexLatest"],
+        "norm.versions": ["BcfToolsNorm_1_5", "BcfToolsNorm_1_9", "BcfToolsNormLatest"],
+        "sort.versions": ["BcfToolsSort_1_9", "BcfToolsSortLatest"],
+        "view.versions": ["BcfToolsView_1_5", "BcfToolsView_1_9", "BcfToolsViewLatest"],
+    },
 )
-from .concat.versions import BcfToolsConcat_1_9, BcfToolsConcatLatest
-from .fill_from_fasta.versions import (
-    BcfToolsFillFromFasta_1_12,
-    BcfToolsFillFromFastaLatest,
-)
-from .index.versions import BcfToolsIndex_1_9, BcfToolsIndexLatest
-from .norm.versions import BcfToolsNorm_1_5, BcfToolsNorm_1_9, BcfToolsNormLatest
-from .sort.versions import BcfToolsSort_1_9, BcfToolsSortLatest
-from .view.versions import BcfToolsView_1_5, BcfToolsView_1_9, BcfToolsViewLatest
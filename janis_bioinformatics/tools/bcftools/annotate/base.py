@@ -3,7 +3,7 @@ from typing import Dict, Any
 from datetime import date
 
 from ..bcftoolstoolbase import BcfToolsToolBase
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_bioinformatics.data_types import Vcf, CompressedVcf, VcfTabix
 
 from janis_core import (
@@ -76,13 +76,13 @@ class BcfToolsAnnotateBase(BcfToolsToolBase, ABC):
         return ["bcftools", "annotate"]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
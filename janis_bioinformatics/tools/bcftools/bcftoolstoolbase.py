@@ -1,8 +1,14 @@
 from abc import ABC
 
 from janis_bioinformatics.tools import BioinformaticsTool
+from janis_bioinformatics.resources import IoProfile
 
 
 class BcfToolsToolBase(BioinformaticsTool, ABC):
+    # vcfs are a small fraction of the size of the sample's bam
+    io_profile = IoProfile(
+        disk_per_gb=0.2, disk_overhead=5, seconds_per_gb=10, time_overhead=900
+    )
+
     def tool_provider(self):
         return "bcftools"
@@ -3,7 +3,6 @@ from abc import ABC
 from typing import Dict, Any, List
 
 from janis_core import (
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolInput,
     ToolOutput,
     String,
@@ -14,6 +13,7 @@ from janis_core import (
     ToolArgument,
     File,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 from janis_core.types import UnionType
 from janis_core.types.common_data_types import Boolean
@@ -60,13 +60,13 @@ class BcfToolsFillFromFastaBase(BcfToolsToolBase, ABC):
         return ["bcftools", "+fill-from-fasta"]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -12,7 +12,7 @@ from janis_core import (
     ToolMetadata,
     CaptureType,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 from janis_core.types import UnionType
 
@@ -58,13 +58,13 @@ class BcfToolsSortBase(BcfToolsToolBase, ABC):
         return ["bcftools", "sort"]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
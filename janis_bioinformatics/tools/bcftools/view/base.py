@@ -1,7 +1,8 @@
 from abc import ABC
 from typing import List, Dict, Any
 
-from janis_core import get_value_for_hints_and_ordered_resource_tuple, ToolArgument
+from janis_core import ToolArgument
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core import (
     ToolOutput,
     ToolInput,
@@ -78,13 +79,13 @@ class BcfToolsViewBase(BcfToolsToolBase, ABC):
         return ["bcftools", "view"]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
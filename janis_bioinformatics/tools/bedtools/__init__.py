@@ -1,11 +1,19 @@
-from .intersectbed.versions import (
-    BedToolsIntersectBed_2_29_2,
-    BedToolsIntersectBedLatest,
-)
-
-from .coveragebed.versions import BedToolsCoverageBed_2_29_2, BedToolsCoverageBedLatest
+from janis_bioinformatics.utils.lazyimport import attach
 
-from .genomecoveragebed.versions import (
-    BedToolsGenomeCoverageBed_2_29_2,
-    BedToolsGenomeCoverageBedLatest,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "intersectbed.versions": [
+            "BedToolsIntersectBed_2_29_2",
+            "BedToolsIntersectBedLatest",
+        ],
+        "coveragebed.versions": [
+            "BedToolsCoverageBed_2_29_2",
+            "BedToolsCoverageBedLatest",
+        ],
+        "genomecoveragebed.versions": [
+            "BedToolsGenomeCoverageBed_2_29_2",
+            "BedToolsGenomeCoverageBedLatest",
+        ],
+    },
 )
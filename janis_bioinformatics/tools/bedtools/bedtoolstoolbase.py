@@ -3,6 +3,7 @@ from datetime import date
 
 from ..bioinformaticstoolbase import BioinformaticsTool
 from janis_core import ToolMetadata
+from janis_bioinformatics.resources import resource_for_hints
 
 
 class BedToolsToolBase(BioinformaticsTool, ABC):
@@ -10,4 +11,7 @@ class BedToolsToolBase(BioinformaticsTool, ABC):
         return "bedtools"
 
     def memory(self, hints):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 8
@@ -1 +1,13 @@
-from .bamsormadup.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "bamsormadup.versions": [
+            "BioBamBam_2_0_87",
+            "BamSorMaDupBase",
+            "BamSorMaDup_2_0_87",
+            "BamSorMaDupLatest",
+        ],
+    },
+)
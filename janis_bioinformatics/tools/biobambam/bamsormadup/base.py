@@ -15,9 +15,9 @@ from janis_core import (
     CaptureType,
     CpuSelector,
     Stdout,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.data_types import Sam, FastaWithDict, FastqGzPair, Bam, File
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
@@ -104,17 +104,13 @@ class BamSorMaDupBase(BioinformaticsTool, ABC):
         ]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(
-            hints, BAMSORMADUP_MEM_TUPLE
-        )
+        val = resource_for_hints(self, "memory", hints, BAMSORMADUP_MEM_TUPLE)
         if val:
             return val
         return 16
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(
-            hints, BAMSORMADUP_CORES_TUPLE
-        )
+        val = resource_for_hints(self, "cpus", hints, BAMSORMADUP_CORES_TUPLE)
         if val:
             return val
         return 4
@@ -1,6 +1,9 @@
+import importlib
+import inspect
 import os
 import sys
 from abc import ABC
+from typing import Any, Dict, List
 
 from janis_core import (
     CommandTool,
@@ -10,23 +13,93 @@ from janis_core import (
     WorkflowBuilder,
 )
 
+from janis_bioinformatics.resources import IoProfile, disk_for_hints, time_for_hints
+
 BIOINFORMATICS_MODULE = "bioinformatics"
 
 
 class BioinformaticsTool(CommandTool, ABC):
+    # disk / time per GB of input, tool bases override this for their I/O pattern
+    io_profile = IoProfile()
+
     def tool_module(self):
         return BIOINFORMATICS_MODULE
 
+    def disk(self, hints: Dict[str, Any]):
+        return disk_for_hints(self, hints, self.io_profile)
+
+    def time(self, hints: Dict[str, Any]):
+        return time_for_hints(self, hints, self.io_profile)
+
 
 class BioinformaticsWorkflow(Workflow, ABC):
     def tool_module(self):
         return BIOINFORMATICS_MODULE
 
+    def translate(self, translation, to_console=True, to_disk=False, **kwargs):
+        """
+        Workflow.translate, but a translation that's only returned (not written to
+        disk) is memoised on disk by janis_bioinformatics.utils.translationcache
+        """
+        from janis_bioinformatics.utils.translationcache import (
+            cache_enabled,
+            translate_cached,
+        )
+
+        if to_disk or not cache_enabled():
+            return self.translate_uncached(
+                translation, to_console=to_console, to_disk=to_disk, **kwargs
+            )
+        return translate_cached(self, translation, to_console=to_console, **kwargs)
+
+    def translate_uncached(self, translation, **kwargs):
+        return super().translate(translation, **kwargs)
+
+    def remove_redundant_conversions(self):
+        """
+        Remove the compress / decompress steps this workflow doesn't need (eg: an
+        UncompressArchive before a tool that accepts the compressed file). translate
+        doesn't call this, a workflow opts in by calling it at the end of its
+        constructor. Returns an OptimisationReport of the removed steps.
+        """
+        from janis_bioinformatics.utils.workflowoptimiser import (
+            remove_redundant_conversions,
+        )
+
+        return remove_redundant_conversions(self)
+
 
 class BioinformaticsPythonTool(PythonTool, ABC):
+    # janis_bioinformatics modules the code_block imports (eg:
+    # "janis_bioinformatics.utils.bgzf"), the container doesn't have
+    # janis_bioinformatics installed, so their source is embedded in the script
+    embedded_modules: List[str] = []
+
     def tool_module(self):
         return BIOINFORMATICS_MODULE
 
+    def prepared_script(self, *args, **kwargs):
+        script = super().prepared_script(*args, **kwargs)
+        if not self.embedded_modules:
+            return script
+        return embed_modules(self.embedded_modules) + script
+
+
+def embed_modules(names: List[str]) -> str:
+    """
+    Python that registers the (standard library only) modules under their own names,
+    so 'from janis_bioinformatics.utils.bgzf import BgzfFile' works without the package
+    """
+    lines = ["import sys as _sys, types as _types"]
+    for name in names:
+        source = inspect.getsource(importlib.import_module(name))
+        lines += [
+            f"_module = _types.ModuleType({name!r})",
+            f"_sys.modules[{name!r}] = _module",
+            f"exec(compile({source!r}, {name!r}, 'exec'), _module.__dict__)",
+        ]
+    return "\n".join(lines) + "\n\n"
+
 
 class BioinformaticsToolBuilder(CommandToolBuilder):
     def __init__(self, *args, **kwargs):
@@ -1,2 +1,14 @@
-from .mem.versions import *
-from .index.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "mem.versions": ["BwaMemBase", "BwaMem_0_7_15", "BwaMemLatest"],
+        "index.versions": [
+            "BwaIndexBase",
+            "Bwa_0_7_15",
+            "BwaIndex_0_7_15",
+            "BwaIndexLatest",
+        ],
+    },
+)
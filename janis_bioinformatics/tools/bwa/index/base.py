@@ -5,6 +5,7 @@ from janis_core import ToolInput, ToolOutput, ToolMetadata, String, Int, InputSe
 
 from janis_bioinformatics.data_types import Fasta, FastaBwa
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import resource_for_hints
 
 
 class BwaIndexBase(BioinformaticsTool, ABC):
@@ -51,9 +52,15 @@ BWT construction algorithm: bwtsw, is or rb2 [auto]
         return [ToolOutput("out", FastaBwa, glob=InputSelector("reference"))]
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 8
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 1
 
     def bind_metadata(self):
@@ -15,9 +15,9 @@ from janis_core import (
     CaptureType,
     CpuSelector,
     Stdout,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 
 from janis_bioinformatics.data_types import Sam, FastaBwa, FastqGz, FastqGzPair, Bam
@@ -78,13 +78,13 @@ class BwaMemBase(BioinformaticsTool, ABC):
         return [ToolOutput("out", Stdout(Sam()))]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, BWA_MEM_TUPLE)
         if val:
             return val
         return 16
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, BWA_CORES_TUPLE)
         if val:
             return val
         return 16
@@ -1 +1,12 @@
-from .mkfastq.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "mkfastq.versions": [
+            "CellRangerMkfastqBase",
+            "CellRanger_3_0_2",
+            "CellRangerMkfastq_3_0_2",
+        ],
+    },
+)
@@ -1 +1,8 @@
-from .versions import CloneFinder_0_2, CloneFinderLatest
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "versions": ["CloneFinder_0_2", "CloneFinderLatest"],
+    },
+)
@@ -6,11 +6,11 @@ from janis_core import (
     Filename,
     ToolOutput,
     CpuSelector,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
     CaptureType,
     WildcardSelector,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_unix import TextFile
 
@@ -33,13 +33,13 @@ class CloneFinderBase(BioinformaticsTool, ABC):
         return ["clonefinder.py" "snv"]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 12
@@ -83,13 +83,13 @@ class CloneFinderBase(BioinformaticsTool, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 12
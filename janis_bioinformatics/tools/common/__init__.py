@@ -1,13 +1,25 @@
-from .bwaaligner import BwaAligner
-from .mergeandmark.mergeandmark_4_0 import MergeAndMarkBams_4_0
-from .mergeandmark.mergeandmark_4_1_2 import MergeAndMarkBams_4_1_2
-from .mergeandmark.mergeandmark_4_1_3 import MergeAndMarkBams_4_1_3
-from .splitmultiallele import SplitMultiAllele
-from .bwamem_samtoolsview import BwaMem_SamToolsView
-from .indexfasta import IndexFasta
-from .concat_strelkasomaticvcf import ConcatStrelkaSomaticVcf
-from .splitmultiallele_normalistvcf import SplitMultiAlleleNormaliseVcf
-from .filtervardictsomaticvcf import FilterVardictSomaticVcf
-from .gatkbasecalbam import GATKBaseRecalBQSRWorkflow_4_1_3
-from .gatkbasecalbam_4_1_2 import GATKBaseRecalBQSRWorkflow_4_1_2
-from .facetsWorkflow import FacetsWorkflow
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "bwaaligner": ["BwaAligner"],
+        "bwaaligner_samtoolssort": ["BwaAlignerSamToolsSort"],
+        "mergeandmark.mergeandmark_4_0": ["MergeAndMarkBams_4_0"],
+        "mergeandmark.mergeandmark_4_1_2": ["MergeAndMarkBams_4_1_2"],
+        "mergeandmark.mergeandmark_4_1_3": ["MergeAndMarkBams_4_1_3"],
+        "splitmultiallele": ["SplitMultiAllele"],
+        "normalisefiltervcf": ["NormaliseFilterVcf"],
+        "bwamem_samtoolsview": ["BwaMem_SamToolsView"],
+        "bwamem_samtoolssort": ["BwaMem_SamToolsSort"],
+        "trimmomatic_star": ["TrimmomaticPairedEnd_StarAlignReads"],
+        "indexfasta": ["IndexFasta"],
+        "concat_strelkasomaticvcf": ["ConcatStrelkaSomaticVcf"],
+        "splitmultiallele_normalistvcf": ["SplitMultiAlleleNormaliseVcf"],
+        "filtervardictsomaticvcf": ["FilterVardictSomaticVcf"],
+        "gatkbasecalbam": ["GATKBaseRecalBQSRWorkflow_4_1_3"],
+        "gatkbasecalbam_4_1_2": ["GATKBaseRecalBQSRWorkflow_4_1_2"],
+        "gatkbasecalbam_scattered_4_1_2": ["GATKBaseRecalBQSRWorkflowScattered_4_1_2"],
+        "facetsWorkflow": ["FacetsWorkflow"],
+    },
+)
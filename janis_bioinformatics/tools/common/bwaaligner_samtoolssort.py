@@ -0,0 +1,103 @@
+from janis_bioinformatics.data_types import FastqGzPair, FastaWithDict
+from janis_bioinformatics.data_types.bam import BamBai
+from janis_bioinformatics.tools.common.bwaaligner import BwaAligner
+from janis_bioinformatics.tools.common.bwamem_samtoolssort import BwaMem_SamToolsSort
+from janis_bioinformatics.tools.cutadapt import CutAdapt_2_1
+
+from janis_core import Array
+from janis_core.tool.test_classes import TTestCase
+
+
+class BwaAlignerSamToolsSort(BwaAligner):
+    def id(self):
+        return "BwaAlignerSamToolsSort"
+
+    def friendly_name(self):
+        return "Align and sort reads (bwa mem | samtools sort)"
+
+    def version(self):
+        return "1.0.0"
+
+    def constructor(self):
+        # Inputs
+        self.input("sample_name", str)
+        self.input("reference", FastaWithDict)
+        self.input("fastq", FastqGzPair)
+
+        # pipe adapters
+        self.input("three_prime_adapter_read1", Array(str, optional=True))
+        self.input("three_prime_adapter_read2", Array(str, optional=True))
+        self.input("five_prime_adapter_read1", Array(str, optional=True))
+        self.input("five_prime_adapter_read2", Array(str, optional=True))
+
+        # Steps
+        self.step(
+            "cutadapt",
+            CutAdapt_2_1(
+                fastq=self.fastq,
+                adapter=self.three_prime_adapter_read1,
+                adapterSecondRead=self.three_prime_adapter_read2,
+                front=self.five_prime_adapter_read1,
+                frontAdapterSecondRead=self.five_prime_adapter_read2,
+                qualityCutoff=15,
+                minimumLength=50,
+                outputPrefix=self.sample_name,
+            ),
+        )
+
+        # aligns, sorts and indexes in one step (and container), instead of
+        # BwaMem_SamToolsView writing an unsorted BAM for Gatk4SortSam to read back
+        self.step(
+            "bwamem",
+            BwaMem_SamToolsSort(
+                reads=self.cutadapt.out,
+                sampleName=self.sample_name,
+                reference=self.reference,
+                markShorterSplits=True,
+            ),
+        )
+
+        # outputs
+        self.output("out", source=self.bwamem.out)
+
+    def bind_metadata(self):
+        self.metadata.documentation = (
+            "Align sorted bam with this subworkflow consisting of BWA Mem piped into "
+            "SamTools sort (+ index), the unsorted alignments are never written to disk"
+        )
+        self.metadata.contributors = ["Peter MacCallum Cancer Centre"]
+        self.metadata.dateCreated = "2026-10-18"
+        self.metadata.dateUpdated = "2026-10-18"
+        self.metadata.version = "1.0"
+
+    def tests(self):
+        remote_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics/wgsgermline_data"
+        inputs = {
+            "sample_name": "NA12878-BRCA1",
+            "fastq": [
+                f"{remote_dir}/NA12878-BRCA1_R1.fastq.gz",
+                f"{remote_dir}/NA12878-BRCA1_R2.fastq.gz",
+            ],
+            "reference": f"{remote_dir}/Homo_sapiens_assembly38.chr17.fasta",
+            "cutadapt_qualityCutoff": 15,
+            "cutadapt_minimumLength": 50,
+            "bwamem_markShorterSplits": True,
+        }
+        return [
+            TTestCase(
+                name="basic",
+                input=inputs,
+                # the same alignments as BwaAligner, so the same flagstat
+                output=BamBai.basic_test(
+                    "out",
+                    2826000,
+                    49688,
+                    f"{remote_dir}/NA12878-BRCA1.bam.flagstat",
+                ),
+            ),
+            TTestCase(name="minimal", input=inputs, output=self.minimal_test()),
+        ]
+
+
+if __name__ == "__main__":
+    BwaAlignerSamToolsSort().translate("wdl", with_resource_overrides=True)
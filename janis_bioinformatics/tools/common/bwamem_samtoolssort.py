@@ -0,0 +1,186 @@
+from typing import List, Dict, Any
+from datetime import datetime
+from janis_core import (
+    ToolInput,
+    Int,
+    String,
+    ToolOutput,
+    Filename,
+    InputSelector,
+    ToolArgument,
+    CpuSelector,
+    MemorySelector,
+    StringFormatter,
+    ToolMetadata,
+)
+from janis_bioinformatics.resources import resource_for_hints
+from janis_core.operators.logical import FloorOperator
+
+from janis_bioinformatics.data_types import FastaWithDict, FastqGzPair, BamBai
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.tools.common.bwamem_samtoolsview import (
+    BwaMem_SamToolsView,
+    BWA_MEM_TUPLE,
+    BWA_CORES_TUPLE,
+)
+
+
+class BwaMem_SamToolsSort(BioinformaticsTool):
+    def tool(self) -> str:
+        return "BwaMemSamtoolsSort"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "0.7.17|1.9"
+
+    def container(self):
+        return "michaelfranklin/bwasamtools:0.7.17-1.9"
+
+    def base_command(self):
+        return None
+
+    def arguments(self):
+        return [
+            ToolArgument("bwa", position=0, shell_quote=False),
+            ToolArgument("mem", position=1, shell_quote=False),
+            ToolArgument(
+                StringFormatter(
+                    "@RG\\tID:{name}\\tSM:{name}\\tLB:{name}\\tPL:{pl}",
+                    name=InputSelector("sampleName"),
+                    pl=InputSelector("platformTechnology"),
+                ),
+                prefix="-R",
+                position=2,
+                doc="Complete read group header line. ’\\t’ can be used in STR and will be converted to a TAB"
+                "in the output SAM. The read group ID will be attached to every read in the output. "
+                "An example is ’@RG\\tID:foo\\tSM:bar’. (Default=null) "
+                "https://gatkforums.broadinstitute.org/gatk/discussion/6472/read-groups",
+            ),
+            ToolArgument(
+                CpuSelector(),
+                prefix="-t",
+                position=2,
+                shell_quote=False,
+                doc="Number of threads. (default = 1)",
+            ),
+            # the SAM is sorted as it streams out of bwa, so the unsorted alignments
+            # are never written to (or read back from) disk
+            ToolArgument("|", position=5, shell_quote=False),
+            ToolArgument("samtools", position=6, shell_quote=False),
+            ToolArgument("sort", position=7, shell_quote=False),
+            ToolArgument(
+                CpuSelector(),
+                position=8,
+                shell_quote=False,
+                prefix="-@",
+                doc="Number of additional sorting and compression threads",
+            ),
+            ToolArgument(
+                StringFormatter(
+                    "{memory}M",
+                    # half of the memory goes to samtools sort, bwa mem needs the
+                    # rest for the reference index (~5.5GB for GRCh38) + buffers
+                    memory=FloorOperator(MemorySelector() * 1024 * 0.5 / CpuSelector()),
+                ),
+                position=8,
+                shell_quote=False,
+                prefix="-m",
+                doc="Maximum memory per sorting thread",
+            ),
+            ToolArgument(
+                "-", position=9, shell_quote=False, doc="Sort the alignments from stdin"
+            ),
+            ToolArgument("&&", position=10, shell_quote=False),
+            ToolArgument("samtools", position=11, shell_quote=False),
+            ToolArgument("index", position=12, shell_quote=False),
+            ToolArgument(CpuSelector(), prefix="-@", position=13, shell_quote=False),
+            ToolArgument(InputSelector("outputFilename"), position=14),
+        ]
+
+    def inputs(self) -> List[ToolInput]:
+        return [
+            ToolInput("reference", FastaWithDict(), position=2, shell_quote=False),
+            ToolInput("reads", FastqGzPair, position=3, shell_quote=False, doc=None),
+            ToolInput(
+                "mates",
+                FastqGzPair(optional=True),
+                separator=" ",
+                position=4,
+                shell_quote=False,
+                doc=None,
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(prefix=InputSelector("sampleName"), extension=".bam"),
+                position=8,
+                prefix="-o",
+                doc="output file name",
+            ),
+            ToolInput(
+                "sampleName",
+                String(),
+                doc="Used to construct the readGroupHeaderLine with format: "
+                "'@RG\\tID:{name}\\tSM:{name}\\tLB:{name}\\tPL:ILLUMINA'",
+            ),
+            ToolInput(
+                "platformTechnology",
+                String(optional=True),
+                doc="(ReadGroup: PL) Used to construct the readGroupHeaderLine, defaults: ILLUMINA",
+                default="ILLUMINA",
+            ),
+            ToolInput(
+                "compressionLevel",
+                Int(optional=True),
+                prefix="-l",
+                position=8,
+                shell_quote=False,
+                doc="Set compression level, from 0 (uncompressed) to 9 (best)",
+            ),
+            *BwaMem_SamToolsView.bwa_additional_inputs,
+        ]
+
+    def outputs(self) -> List[ToolOutput]:
+        return [
+            ToolOutput(
+                "out",
+                BamBai(),
+                glob=InputSelector("outputFilename"),
+                doc="Coordinate sorted and indexed BAM",
+            ),
+        ]
+
+    def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints, BWA_MEM_TUPLE)
+        if val:
+            return val
+        return 16
+
+    def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints, BWA_CORES_TUPLE)
+        if val:
+            return val
+        return 16
+
+    def friendly_name(self) -> str:
+        return "Bwa mem + Samtools Sort"
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            contributors=["Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2026, 10, 18),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Align reads with bwa mem, and pipe the alignments straight into samtools sort
+(then samtools index), producing a coordinate sorted, indexed BAM in one step.
+
+Compared to BwaMem_SamToolsView followed by a separate sort (eg: Gatk4SortSam), the
+unsorted BAM is never written to disk and read back, and there's no JVM to start.
+""",
+        )
+
+
+if __name__ == "__main__":
+    print(BwaMem_SamToolsSort().translate("wdl"))
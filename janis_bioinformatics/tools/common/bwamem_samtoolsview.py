@@ -17,7 +17,7 @@ from janis_core import (
     StringFormatter,
     ToolMetadata,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.data_types import FastaWithDict, FastqGzPair, Bam, Bed
 
@@ -165,13 +165,13 @@ class BwaMem_SamToolsView(BioinformaticsTool):
         ]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, BWA_MEM_TUPLE)
         if val:
             return val
         return 16
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, BWA_CORES_TUPLE)
         if val:
             return val
         return 16
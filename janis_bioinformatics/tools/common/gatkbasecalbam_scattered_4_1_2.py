@@ -0,0 +1,109 @@
+from datetime import datetime
+
+from janis_core import Int, ToolMetadata
+
+from janis_bioinformatics.data_types import BamBai, FastaWithDict, VcfTabix, Bed
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.tools.gatk4 import (
+    Gatk4BaseRecalibrator_4_1_2,
+    Gatk4ApplyBqsr_4_1_2,
+    Gatk4GatherBQSRReports_4_1_2,
+    Gatk4GatherBamFiles_4_1_2,
+)
+from janis_bioinformatics.tools.pmac import SplitIntervalsIntoShards
+
+
+class GATKBaseRecalBQSRWorkflowScattered_4_1_2(BioinformaticsWorkflow):
+    def id(self):
+        return "GATKBaseRecalBQSRWorkflowScattered"
+
+    def friendly_name(self):
+        return "GATK Base Recalibration on Bam (scattered by intervals)"
+
+    def version(self):
+        return "4.1.2"
+
+    def tool_provider(self):
+        return "common"
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input(
+            "intervals",
+            Bed,
+            doc="The regions to recalibrate, these are split into 'scatter_count' "
+            "shards. The intervals must be sorted in the order of the reference, and "
+            "reads outside of them (including unmapped reads) aren't in the output.",
+        )
+        self.input("reference", FastaWithDict)
+        self.input("snps_dbsnp", VcfTabix)
+        self.input("snps_1000gp", VcfTabix)
+        self.input("known_indels", VcfTabix)
+        self.input("mills_indels", VcfTabix)
+        self.input(
+            "scatter_count",
+            Int(optional=True),
+            default=24,
+            doc="The number of shards to split the intervals into (and run "
+            "BaseRecalibrator and ApplyBQSR on in parallel), there are fewer shards if "
+            "there are fewer (well separated) intervals.",
+        )
+
+        # shards are only split between intervals that are far enough apart that no
+        # read is in two shards, otherwise ApplyBQSR would write it twice
+        self.step(
+            "split_intervals",
+            SplitIntervalsIntoShards(
+                intervals=self.intervals, shards=self.scatter_count, minGap=1000
+            ),
+        )
+
+        self.step(
+            "base_recalibrator",
+            Gatk4BaseRecalibrator_4_1_2(
+                bam=self.bam,
+                intervals=self.split_intervals.out_shards,
+                reference=self.reference,
+                knownSites=[
+                    self.snps_dbsnp,
+                    self.snps_1000gp,
+                    self.known_indels,
+                    self.mills_indels,
+                ],
+            ),
+            scatter="intervals",
+        )
+        self.step(
+            "gather_reports",
+            Gatk4GatherBQSRReports_4_1_2(reports=self.base_recalibrator.out),
+        )
+        self.step(
+            "apply_bqsr",
+            Gatk4ApplyBqsr_4_1_2(
+                bam=self.bam,
+                intervals=self.split_intervals.out_shards,
+                recalFile=self.gather_reports.out,
+                reference=self.reference,
+            ),
+            scatter="intervals",
+        )
+        # shards are in coordinate order, so the bams can be concatenated as is
+        self.step(
+            "gather_bams",
+            Gatk4GatherBamFiles_4_1_2(bams=self.apply_bqsr.out, create_index=True),
+        )
+        self.output("out", source=self.gather_bams.out)
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            contributors=["Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2026, 10, 18),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Like GATKBaseRecalBQSRWorkflow, but the intervals are split into 'scatter_count' shards,
+BaseRecalibrator is run on each shard and the reports are gathered into one
+recalibration table. ApplyBQSR then recalibrates each shard with the gathered table,
+and the recalibrated shards are gathered (in coordinate order) into one indexed bam.
+""",
+        )
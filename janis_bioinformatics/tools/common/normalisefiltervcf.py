@@ -0,0 +1,159 @@
+from datetime import datetime
+from typing import List, Dict, Any
+from janis_core import (
+    ToolMetadata,
+    UnionType,
+    String,
+    ToolOutput,
+    ToolInput,
+    Filename,
+    ToolArgument,
+    InputSelector,
+    CaptureType,
+)
+from janis_bioinformatics.resources import resource_for_hints
+
+from janis_bioinformatics.data_types import FastaWithDict, CompressedVcf, VcfTabix
+from janis_bioinformatics.data_types import Vcf
+from janis_bioinformatics.tools.bcftools.bcftoolstoolbase import BcfToolsToolBase
+from janis_bioinformatics.tools.bcftools.versions import BcfTools_1_12
+
+CORES_TUPLE = [
+    (
+        CaptureType.key(),
+        {
+            CaptureType.CHROMOSOME: 1,
+            CaptureType.EXOME: 1,
+            CaptureType.THIRTYX: 1,
+            CaptureType.NINETYX: 1,
+            CaptureType.THREEHUNDREDX: 1,
+        },
+    )
+]
+
+MEM_TUPLE = [
+    (
+        CaptureType.key(),
+        {
+            CaptureType.CHROMOSOME: 4,
+            CaptureType.EXOME: 4,
+            CaptureType.THIRTYX: 4,
+            CaptureType.NINETYX: 8,
+            CaptureType.THREEHUNDREDX: 8,
+        },
+    )
+]
+
+
+class NormaliseFilterVcf(BcfTools_1_12, BcfToolsToolBase):
+    def tool(self):
+        return "NormaliseFilterVcf"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def friendly_name(self):
+        return "Normalise, trim IUPAC and filter Vcf"
+
+    def base_command(self):
+        return None
+
+    def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
+        if val:
+            return val
+        return 1
+
+    def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
+        if val:
+            return val
+        return 4
+
+    def inputs(self) -> List[ToolInput]:
+        return [
+            ToolInput(
+                "reference", FastaWithDict(), prefix="-f", position=1, shell_quote=False
+            ),
+            ToolInput(
+                "vcf", UnionType(Vcf, CompressedVcf), position=2, shell_quote=False
+            ),
+            ToolInput(
+                "filters",
+                String(optional=True),
+                default="PASS,.",
+                prefix="-f",
+                position=5,
+                doc="Keep the records with these FILTER values",
+            ),
+            ToolInput(
+                "exclude",
+                String(optional=True),
+                prefix="-e",
+                position=6,
+                doc="Also remove the records matching this bcftools expression, "
+                'eg: STATUS="Germline" for VarDict somatic calls',
+            ),
+            ToolInput(
+                "outputFilename",
+                Filename(
+                    prefix=InputSelector("vcf", remove_file_extension=True),
+                    suffix=".norm",
+                    extension=".vcf.gz",
+                ),
+                prefix="-o",
+                position=7,
+                shell_quote=False,
+            ),
+        ]
+
+    def arguments(self):
+        return [
+            ToolArgument(
+                "bcftools norm -m -any -c w -O v", position=0, shell_quote=False
+            ),
+            ToolArgument(
+                "| awk -F '\\t' 'BEGIN {OFS = FS} /^#/ {print; next} "
+                '{gsub(/[^ACGTNacgtn]/, "N", $4); print}\' ',
+                position=3,
+                shell_quote=False,
+            ),
+            ToolArgument("| bcftools view -O z", position=4, shell_quote=False),
+            ToolArgument("&& bcftools index -t", position=8, shell_quote=False),
+            ToolArgument(
+                InputSelector("outputFilename"), position=9, shell_quote=False
+            ),
+        ]
+
+    def outputs(self) -> List[ToolOutput]:
+        return [ToolOutput("out", VcfTabix(), glob=InputSelector("outputFilename"))]
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            contributors=["Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2026, 10, 18),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="",
+        )
+
+    def doc(self):
+        return """
+    Post-process a caller's vcf (compressed or not) in one streaming step, instead of
+    UncompressArchive -> SplitMultiAllele -> TrimIUPAC -> vcftools --remove-filtered-all,
+    which each write the whole (uncompressed) vcf:
+
+    bcftools norm -m -any -c w -f $reference -O v $vcf
+        | awk (replace IUPAC codes in REF with N)
+        | bcftools view -O z -f PASS,. [-e $exclude] -o $output.vcf.gz
+        && bcftools index -t $output.vcf.gz
+
+    1. Split multiallelic records (like vt decompose -s)
+    2. Left-align and trim the alleles (like vt normalize -n, warning on REF mismatches)
+    3. Replace the IUPAC ambiguity codes in REF with N
+    4. Keep the records that PASS (or aren't filtered), and remove the excluded records
+    5. Compress and index the output
+        """.strip()
+
+
+if __name__ == "__main__":
+    print(NormaliseFilterVcf().help())
@@ -2,10 +2,10 @@ import os
 from datetime import datetime
 from typing import List, Dict, Any
 from janis_core import (
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
     UnionType,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 
 from janis_bioinformatics.data_types import FastaWithDict, CompressedVcf
@@ -68,13 +68,13 @@ class SplitMultiAllele(BioinformaticsTool):
         return "v0.5772"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -0,0 +1,146 @@
+from copy import copy
+from datetime import datetime
+from typing import List, Dict, Any
+
+from janis_core import (
+    ToolInput,
+    ToolOutput,
+    ToolArgument,
+    ToolMetadata,
+    WildcardSelector,
+)
+
+from janis_bioinformatics.data_types import FastqGzPair
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.tools.star.versions import StarAlignReads_2_7_1
+from janis_bioinformatics.tools.usadellab import TrimmomaticPairedEnd_0_35
+from janis_bioinformatics.resources import resource_for_hints
+
+# the trimmed pairs go from trimmomatic to STAR through these, uncompressed
+TRIMMED_R1_FIFO = "trimmed_R1.fastq.fifo"
+TRIMMED_R2_FIFO = "trimmed_R2.fastq.fifo"
+STAR_DONE = "star.done"
+# opening a fifo read-write never blocks, and wakes up a reader or writer waiting on it
+UNBLOCK_FIFOS = f": <> {TRIMMED_R1_FIFO}; : <> {TRIMMED_R2_FIFO}; sleep 1;"
+
+# trimmomatic sits on positions 0 - 102, STAR on 103 - 105
+STAR_POSITION = 104
+
+# the paired trimmomatic outputs are the fifos, and STAR reads them as they're written
+EXCLUDED_TRIMMOMATIC_INPUTS = {"outputFilename_R1", "outputFilename_R2"}
+EXCLUDED_STAR_INPUTS = {"readFilesIn", "readFilesCommand"}
+
+
+class TrimmomaticPairedEnd_StarAlignReads(BioinformaticsTool):
+    def tool(self) -> str:
+        return "TrimmomaticPairedEndStarAlignReads"
+
+    def tool_provider(self):
+        return "common"
+
+    def version(self):
+        return "0.35|2.7.1a"
+
+    def container(self):
+        return "michaelfranklin/trimmomaticstar:0.35-2.7.1a"
+
+    def base_command(self):
+        return None
+
+    def arguments(self):
+        return [
+            ToolArgument(
+                f"mkfifo {TRIMMED_R1_FIFO} {TRIMMED_R2_FIFO} || exit 1; "
+                "( trimmomatic PE",
+                position=0,
+                shell_quote=False,
+            ),
+            ToolArgument(TRIMMED_R1_FIFO, position=7, shell_quote=False),
+            ToolArgument(TRIMMED_R2_FIFO, position=9, shell_quote=False),
+            # if trimmomatic fails before opening the fifos, STAR would wait for a
+            # writer forever, so keep opening them until STAR has finished
+            ToolArgument(
+                f"|| {{ s=$?; while [ ! -e {STAR_DONE} ]; do {UNBLOCK_FIFOS} done; "
+                "exit $s; } ) & trim=$!;",
+                position=102,
+                shell_quote=False,
+            ),
+            ToolArgument(
+                "STAR --runMode alignReads --readFilesIn "
+                f"{TRIMMED_R1_FIFO} {TRIMMED_R2_FIFO}",
+                position=103,
+                shell_quote=False,
+            ),
+            # and the same for trimmomatic (waiting for a reader) if STAR fails
+            ToolArgument(
+                f"; s=$?; touch {STAR_DONE}; "
+                f"while [ $s -ne 0 ] && kill -0 $trim 2> /dev/null; "
+                f"do {UNBLOCK_FIFOS} done; wait $trim; t=$?; "
+                f"rm -f {TRIMMED_R1_FIFO} {TRIMMED_R2_FIFO} {STAR_DONE}; "
+                "[ $t -eq 0 ] || exit 1; exit $s",
+                position=105,
+                shell_quote=False,
+            ),
+        ]
+
+    def inputs(self) -> List[ToolInput]:
+        trimmomatic_inputs = []
+        for inp in TrimmomaticPairedEnd_0_35().inputs():
+            if inp.id() in EXCLUDED_TRIMMOMATIC_INPUTS:
+                continue
+            inp = copy(inp)
+            inp.position = (inp.position or 0) + 1
+            trimmomatic_inputs.append(inp)
+
+        star_inputs = []
+        for inp in StarAlignReads_2_7_1().inputs():
+            if inp.id() in EXCLUDED_STAR_INPUTS:
+                continue
+            inp = copy(inp)
+            inp.position = STAR_POSITION
+            star_inputs.append(inp)
+
+        return [*trimmomatic_inputs, *star_inputs]
+
+    def outputs(self) -> List[ToolOutput]:
+        return [
+            *StarAlignReads_2_7_1().outputs(),
+            ToolOutput(
+                "unpairedOut", FastqGzPair, glob=WildcardSelector("*unpaired.fastq.gz")
+            ),
+        ]
+
+    def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
+        return StarAlignReads_2_7_1().memory(hints)
+
+    def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
+        # trimmomatic and STAR run at the same time
+        return 8
+
+    def friendly_name(self) -> str:
+        return "Trimmomatic (PE) + STAR Aligner"
+
+    def bind_metadata(self):
+        return ToolMetadata(
+            contributors=["Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2026, 10, 18),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation=f"""\
+Trim paired end reads with Trimmomatic and align them with STAR, streaming the trimmed
+pairs through named pipes ({TRIMMED_R1_FIFO}, {TRIMMED_R2_FIFO}) instead of writing
+(and gzip compressing) them to disk for STAR to read back with zcat. The unpaired reads
+are still written by Trimmomatic, the STAR outputs are the same as StarAlignReads.
+
+Both tools run at the same time, so the threads / runThreadN are shared between them.
+The tool fails if either of them does.
+
+The container has trimmomatic (0.35) and STAR (2.7.1a) on the PATH, it's built from
+docker/trimmomaticstar/Dockerfile (the trimmomatic biocontainer plus the STAR release
+binary) and published by the "Publish containers" GitHub workflow.""",
+        )
@@ -1 +1,17 @@
-from .versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "base_1": ["CutAdaptBase_1"],
+        "base_2": ["CutAdaptBase_2"],
+        "versions": [
+            "CutAdapt_1_18",
+            "CutAdapt_2_1",
+            "CutAdapt_2_4",
+            "CutAdapt_2_5",
+            "CutAdapt_2_6",
+            "CutAdaptLatest",
+        ],
+    },
+)
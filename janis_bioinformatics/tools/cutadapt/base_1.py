@@ -12,8 +12,8 @@ from janis_core import (
     Filename,
     ToolMetadata,
     WildcardSelector,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.data_types import FastqGzPair
 from janis_bioinformatics.tools import BioinformaticsTool
@@ -95,13 +95,13 @@ class CutAdaptBase_1(BioinformaticsTool):
         return [ToolOutput("out", FastqGzPair, glob=WildcardSelector("*.fastq.gz"))]
 
     def memory(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 4
 
     def cpus(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 5
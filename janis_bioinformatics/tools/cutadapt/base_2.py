@@ -12,11 +12,11 @@ from janis_core import (
     Filename,
     ToolMetadata,
     WildcardSelector,
-    get_value_for_hints_and_ordered_resource_tuple,
     InputSelector,
     CaptureType,
     Array,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 
 from janis_bioinformatics.data_types import FastqGzPair
@@ -117,13 +117,13 @@ class CutAdaptBase_2(BioinformaticsTool):
         ]
 
     def memory(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 4
 
     def cpus(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 5
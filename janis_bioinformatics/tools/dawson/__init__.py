@@ -1,22 +1,31 @@
-# tools import
-from .refilterstrelka2calls.versions import (
-    RefilterStrelka2CallsLatest,
-    RefilterStrelka2Calls_0_1,
-)
-
+from janis_bioinformatics.utils.lazyimport import attach
 
-from .callsomaticfreebayes.versions import (
-    CallSomaticFreeBayesLatest,
-    CallSomaticFreeBayes_0_1,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        # tools import
+        "refilterstrelka2calls.versions": [
+            "RefilterStrelka2CallsLatest",
+            "RefilterStrelka2Calls_0_1",
+        ],
+        "callsomaticfreebayes.versions": [
+            "CallSomaticFreeBayesLatest",
+            "CallSomaticFreeBayes_0_1",
+        ],
+        "createcallregions.base": ["CreateCallRegions"],
+        "fixupfreebayesmnps.versions": [
+            "FixUpFreeBayesMNPsLatest",
+            "FixUpFreeBayesMNPs_0_1",
+        ],
+        # workflow import
+        "workflows": [
+            "FreeBayesSomaticWorkflow",
+            "FreeBayesSomaticWorkflow_0_2_0",
+            "FreeBayesSomaticWorkflowCram",
+            "Mutect2JointSomaticWorkflow",
+            "Mutect2JointSomaticWorkflowCram",
+            "Strelka2PassWorkflow",
+            "Strelka2PassWorkflowCram",
+        ],
+    },
 )
-
-from .createcallregions.base import CreateCallRegions
-
-from .fixupfreebayesmnps.versions import (
-    FixUpFreeBayesMNPsLatest,
-    FixUpFreeBayesMNPs_0_1,
-)
-
-
-# workflow import
-from .workflows import *
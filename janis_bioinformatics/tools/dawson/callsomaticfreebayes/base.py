@@ -14,9 +14,9 @@ from janis_core import (
     ToolInput,
     ToolMetadata,
     ToolOutput,
-    get_value_for_hints_and_ordered_resource_tuple,
     InputSelector,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix import TextFile
 
 
@@ -87,13 +87,13 @@ class CallSomaticFreeBayesBase(BioinformaticsTool, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 12
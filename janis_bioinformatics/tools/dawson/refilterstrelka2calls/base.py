@@ -6,7 +6,6 @@ from janis_core import (
     Filename,
     ToolOutput,
     CpuSelector,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
     CaptureType,
     Array,
@@ -15,6 +14,7 @@ from janis_core import (
     Int,
     WildcardSelector,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_unix import TextFile
 
@@ -65,13 +65,13 @@ class RefilterStrelka2CallsBase(BioinformaticsTool, ABC):
         return "filterStrelkaCalls.R"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 12
@@ -166,13 +166,13 @@ class RefilterStrelka2CallsBase(BioinformaticsTool, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 20
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 48
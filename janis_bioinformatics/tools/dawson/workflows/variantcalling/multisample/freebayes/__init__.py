@@ -1,2 +1,5 @@
-from .freebayessomaticworkflow import FreeBayesSomaticWorkflow
+from .freebayessomaticworkflow import (
+    FreeBayesSomaticWorkflow,
+    FreeBayesSomaticWorkflow_0_2_0,
+)
 from .freebayessomaticworkflow_cram import FreeBayesSomaticWorkflowCram
@@ -9,6 +9,7 @@ from janis_bioinformatics.tools.dawson import (
 )
 
 from janis_bioinformatics.tools.dawson.createcallregions.base import CreateCallRegions
+from janis_bioinformatics.tools.pmac import CreateBalancedCallRegions
 
 from janis_bioinformatics.tools.htslib import BGZipLatest as BGZip, TabixLatest as Tabix
 from janis_bioinformatics.tools.vcflib import (
@@ -66,6 +67,21 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
 
         return BamBai
 
+    def getRegionSizeDoc(self):
+        return "the size of the regions, to parallelise the analysis over. This needs to be adjusted if there are lots of samples or very high depth sequencing in the analysis."
+
+    # the regions to scatter freebayes over, as (the freebayes input, the regions)
+    def addCallRegions(self):
+        # this could be a conditional (if the callregions are supplied we use them, otherwise we
+        # create them)
+        self.step(
+            "createCallRegions",
+            CreateCallRegions(
+                reference=self.reference, regionSize=self.regionSize, equalize=True
+            ),
+        )
+        return "region", self.createCallRegions.regions
+
     def constructor(self):
 
         self.input(
@@ -83,7 +99,7 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
             "regionSize",
             int,
             default=10000000,
-            doc="the size of the regions, to parallelise the analysis over. This needs to be adjusted if there are lots of samples or very high depth sequencing in the analysis.",
+            doc=self.getRegionSizeDoc(),
         )
 
         self.input(
@@ -109,14 +125,7 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
             doc="Minimum coverage over all samples, to still call variants.",
         )
 
-        # this could be a conditional (if the callregions are supplied we use them, otherwise we
-        # create them)
-        self.step(
-            "createCallRegions",
-            CreateCallRegions(
-                reference=self.reference, regionSize=self.regionSize, equalize=True
-            ),
-        )
+        regionsInput, regions = self.addCallRegions()
 
         self.step(
             "callVariants",
@@ -131,7 +140,7 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
                 noABPriorsFlag=True,
                 maxNumOfAlleles=4,
                 noPartObsFlag=True,
-                region=self.createCallRegions.regions,
+                **{regionsInput: regions},
                 # here we multiply the skipCov input by the amount of input that we have
                 skipCov=(self.skipCov * self.bams.length()),
                 # things that are actually default, but janis does not recognize yet
@@ -151,7 +160,7 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
                 # 2 is better than one
                 minAltTotal=2,
             ),
-            scatter="region",
+            scatter=regionsInput,
         )
         # might actually rewrite this once everything works, to not combine the files here, but do
         # all of it scattered and then only combine the final output
@@ -227,6 +236,34 @@ class FreeBayesSomaticWorkflow(BioinformaticsWorkflow):
         self.output("somaticOutVcf", source=self.fixUpFreeBayesMNPs)
 
 
+class FreeBayesSomaticWorkflow_0_2_0(FreeBayesSomaticWorkflow):
+    def version(self):
+        return "0.2.0"
+
+    def bind_metadata(self):
+        super().bind_metadata()
+        self.metadata.version = "0.2.0"
+        self.metadata.dateUpdated = date(2026, 10, 18)
+        self.metadata.contributors = [
+            *self.metadata.contributors,
+            "Peter MacCallum Cancer Centre",
+        ]
+
+    def getRegionSizeDoc(self):
+        return "the amount of callable (non-N) sequence in each region, to parallelise the analysis over. This needs to be adjusted if there are lots of samples or very high depth sequencing in the analysis."
+
+    def addCallRegions(self):
+        # regions are balanced by callable sequence (gaps and runs of N are left out),
+        # so that no region is much slower than the others
+        self.step(
+            "createCallRegions",
+            CreateBalancedCallRegions(
+                reference=self.reference, regionSize=self.regionSize
+            ),
+        )
+        return "targetsFile", self.createCallRegions.out_shards
+
+
 if __name__ == "__main__":
 
     wf = FreeBayesSomaticWorkflow()
@@ -1,2 +1,16 @@
-from .vep import *
-from .filtervep.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "vep": [
+            "VepCacheBase_98_3",
+            "VepDatabaseBase_98_3",
+            "VepCache_98_3",
+            "VepDatabase_98_3",
+            "VepCacheLatest",
+            "VepDatabaseLatest",
+        ],
+        "filtervep.versions": ["FilterVepBase", "Vep_98_3", "FilterVep_98_3"],
+    },
+)
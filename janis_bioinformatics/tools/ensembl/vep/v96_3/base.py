@@ -18,9 +18,15 @@ from janis_unix import Tsv
 from janis_bioinformatics.data_types import Fasta, CompressedVcf
 
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import IoProfile
 
 
 class VepBase_96_3(BioinformaticsTool):
+    # the cache / plugin data dominates the disk, annotation is slow per variant
+    io_profile = IoProfile(
+        disk_per_gb=0.2, disk_overhead=30, seconds_per_gb=120, time_overhead=3600
+    )
+
     def tool(self) -> str:
         return "vep"
 
@@ -1,5 +1,9 @@
-from .run_facets.versions import RunFacets_2_0_8, RunFacetsLatest
-from .snp_pileup.versions import (
-    FacetsSnpPileup_2_0_8,
-    FacetsSnpPileupLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "run_facets.versions": ["RunFacets_2_0_8", "RunFacetsLatest"],
+        "snp_pileup.versions": ["FacetsSnpPileup_2_0_8", "FacetsSnpPileupLatest"],
+    },
 )
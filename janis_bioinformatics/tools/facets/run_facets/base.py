@@ -15,8 +15,8 @@ from janis_core import (
     File,
     Double,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from typing import List, Dict, Any
 from janis_bioinformatics.tools.facets.facets_base import FacetsBase
 
@@ -43,7 +43,7 @@ class RunFacetsBase(FacetsBase, ABC):
         return "RunFacets"
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 64
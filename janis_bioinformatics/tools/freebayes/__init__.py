@@ -1 +1,13 @@
-from .versions import FreeBayesLatest, FreeBayes_1_2, FreeBayes_1_3
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "versions": [
+            "FreeBayesLatest",
+            "FreeBayes_1_2",
+            "FreeBayes_1_3",
+            "FreeBayesCram_1_3",
+        ],
+    },
+)
@@ -12,9 +12,9 @@ from janis_core import (
     Int,
     Boolean,
     File,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix import TextFile
 
 from janis_bioinformatics.data_types import BamBai, Bed, FastaFai, Vcf
@@ -523,13 +523,13 @@ class FreeBayesBase_1_2(BioinformaticsTool):
         return [ToolOutput("out", Vcf, glob=InputSelector("outputFilename"))]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 16
@@ -15,8 +15,8 @@ from janis_core import (
     ToolInput,
     ToolMetadata,
     ToolOutput,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix import TextFile
 
 CORES_TUPLE = [
@@ -528,13 +528,13 @@ class FreeBayesBase_1_3(BioinformaticsTool):
         return [ToolOutput("out", Vcf, glob=InputSelector("outputFilename"))]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 2
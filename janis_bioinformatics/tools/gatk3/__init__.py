@@ -1,4 +1,12 @@
-from .depthofcoverage.versions import (
-    GATK3DepthOfCoverage_3_8_1,
-    GATK3DepthOfCoverageLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "depthofcoverage.versions": [
+            "GATK3DepthOfCoverage_3_8_1",
+            "GATK3DepthOfCoverageLatest",
+            "GATK3DepthOfCoverage_3_8_0",
+        ],
+    },
 )
@@ -1,145 +1,242 @@
-from .applybqsr.versions import (
-    Gatk4ApplyBqsr_4_0,
-    Gatk4ApplyBqsr_4_1_2,
-    Gatk4ApplyBqsr_4_1_3,
-    Gatk4ApplyBqsr_4_1_4,
-    Gatk4ApplyBqsrLatest,
-)
-from .baserecalibrator.versions import (
-    Gatk4BaseRecalibrator_4_0,
-    Gatk4BaseRecalibrator_4_1_2,
-    Gatk4BaseRecalibrator_4_1_3,
-    Gatk4BaseRecalibrator_4_1_4,
-    Gatk4BaseRecalibratorLatest,
-)
-from .calculatecontaminations.versions import (
-    Gatk4CalculateContamination_4_1_2,
-    Gatk4CalculateContamination_4_1_3,
-    Gatk4CalculateContamination_4_1_4,
-    Gatk4CalculateContaminationLatest,
-)
-from .createsequencedictionary.versions import (
-    Gatk4CreateSequenceDictionary_4_1_2,
-    Gatk4CreateSequenceDictionary_4_1_3,
-    Gatk4CreateSequenceDictionary_4_1_4,
-    Gatk4CreateSequenceDictionaryLatest,
-)
-from .fastqtosam.versions import *
-from .filtermutectcalls.versions import (
-    Gatk4FilterMutectCalls_4_1_2,
-    Gatk4FilterMutectCalls_4_1_3,
-    Gatk4FilterMutectCalls_4_1_4,
-    Gatk4FilterMutectCallsLatest,
-)
-from .gathervcfs.versions import (
-    Gatk4GatherVcfs_4_0,
-    Gatk4GatherVcfs_4_1_2,
-    Gatk4GatherVcfs_4_1_3,
-    Gatk4GatherVcfs_4_1_4,
-    Gatk4GatherVcfsLatest,
-)
-from .genotypeconcordance.versions import (
-    Gatk4GenotypeConcordance_4_0,
-    Gatk4GenotypeConcordance_4_1_2,
-    Gatk4GenotypeConcordance_4_1_3,
-    Gatk4GenotypeConcordance_4_1_4,
-    Gatk4GenotypeConcordanceLatest,
-)
-from .getpileupsummaries.versions import (
-    Gatk4GetPileUpSummaries_4_1_2,
-    Gatk4GetPileUpSummaries_4_1_3,
-    Gatk4GetPileUpSummaries_4_1_4,
-    Gatk4GetPileUpSummariesLatest,
-)
-from .haplotypecaller.versions import *
-from .learnreadorientationmodel.versions import (
-    Gatk4LearnReadOrientationModel_4_1_2,
-    Gatk4LearnReadOrientationModel_4_1_3,
-    Gatk4LearnReadOrientationModel_4_1_4,
-    Gatk4LearnReadOrientationModelLatest,
-)
-from .markduplicates.versions import (
-    Gatk4MarkDuplicates_4_0,
-    Gatk4MarkDuplicates_4_1_2,
-    Gatk4MarkDuplicates_4_1_3,
-    Gatk4MarkDuplicates_4_1_4,
-    Gatk4MarkDuplicatesLatest,
-)
-from .mergebamalignment.versions import *
-from .mergemutectstats.versions import (
-    Gatk4MergeMutectStats_4_1_2,
-    Gatk4MergeMutectStats_4_1_3,
-    Gatk4MergeMutectStats_4_1_4,
-    Gatk4MergeMutectStatsLatest,
-)
-from .mergesamfiles.versions import (
-    Gatk4MergeSamFiles_4_0,
-    Gatk4MergeSamFiles_4_1_2,
-    Gatk4MergeSamFiles_4_1_3,
-    Gatk4MergeSamFiles_4_1_4,
-    Gatk4MergeSamFilesLatest,
-)
-from .mutect2.versions import *
-from .printreads.versions import (
-    Gatk4PrintReads_4_0,
-    Gatk4PrintReads_4_1_2,
-    Gatk4PrintReads_4_1_3,
-    Gatk4PrintReads_4_1_4,
-    Gatk4PrintReadsLatest,
-)
-from .selectvariants.versions import (
-    Gatk4SelectVariants_4_0,
-    Gatk4SelectVariants_4_1_2,
-    Gatk4SelectVariants_4_1_3,
-    Gatk4SelectVariants_4_1_4,
-    Gatk4SelectVariantsLatest,
-)
-from .sortsam.versions import (
-    Gatk4SortSam_4_0,
-    Gatk4SortSam_4_1_2,
-    Gatk4SortSam_4_1_3,
-    Gatk4SortSam_4_1_4,
-    Gatk4SortSamLatest,
-)
-from .splitreads.versions import (
-    Gatk4SplitReadsLatest,
-    Gatk4SplitReads_4_1_2,
-    Gatk4SplitReads_4_1_3,
-    Gatk4SplitReads_4_1_4,
-)
-
-from .collectinsertsizemetrics.versions import (
-    Gatk4CollectInsertSizeMetrics_4_1_2,
-    Gatk4CollectInsertSizeMetrics_4_1_3,
-    Gatk4CollectInsertSizeMetrics_4_1_4,
-    Gatk4CollectInsertSizeMetricsLatest,
-)
-
-from .setnmmdanduqtags.versions import (
-    Gatk4SetNmMdAndUqTags_4_1_3,
-    Gatk4SetNmMdAndUqTags_4_1_4,
-    Gatk4SetNmMdAndUqTagsLatest,
-)
-
-from .gatherbqsrreports.versions import (
-    Gatk4GatherBQSRReports_4_1_2,
-    Gatk4GatherBQSRReports_4_1_3,
-    Gatk4GatherBQSRReports_4_1_4,
-    Gatk4GatherBQSRReportsLatest,
-)
+from janis_bioinformatics.utils.lazyimport import attach
 
-from .gatherbamfiles.versions import (
-    Gatk4GatherBamFiles_4_1_2,
-    Gatk4GatherBamFiles_4_1_3,
-    Gatk4GatherBamFiles_4_1_4,
-    Gatk4GatherBamFilesLatest,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "applybqsr.versions": [
+            "Gatk4ApplyBqsr_4_0",
+            "Gatk4ApplyBqsr_4_1_2",
+            "Gatk4ApplyBqsr_4_1_3",
+            "Gatk4ApplyBqsr_4_1_4",
+            "Gatk4ApplyBqsrLatest",
+        ],
+        "baserecalibrator.versions": [
+            "Gatk4BaseRecalibrator_4_0",
+            "Gatk4BaseRecalibrator_4_1_2",
+            "Gatk4BaseRecalibrator_4_1_3",
+            "Gatk4BaseRecalibrator_4_1_4",
+            "Gatk4BaseRecalibratorLatest",
+        ],
+        "calculatecontaminations.versions": [
+            "Gatk4CalculateContamination_4_1_2",
+            "Gatk4CalculateContamination_4_1_3",
+            "Gatk4CalculateContamination_4_1_4",
+            "Gatk4CalculateContaminationLatest",
+            "Gatk4CalculateContamination_4_1_6",
+            "Gatk4CalculateContamination_4_1_7",
+            "Gatk4CalculateContamination_4_1_8",
+        ],
+        "createsequencedictionary.versions": [
+            "Gatk4CreateSequenceDictionary_4_1_2",
+            "Gatk4CreateSequenceDictionary_4_1_3",
+            "Gatk4CreateSequenceDictionary_4_1_4",
+            "Gatk4CreateSequenceDictionaryLatest",
+        ],
+        "fastqtosam.versions": [
+            "Gatk4FastqToSamBase",
+            "Gatk4FastqToSam_4_0",
+            "Gatk4FastqToSam_4_1_2",
+            "Gatk4FastqToSam_4_1_3",
+            "Gatk4FastqToSam_4_1_4",
+            "Gatk4FastqToSamLatest",
+        ],
+        "filtermutectcalls.versions": [
+            "Gatk4FilterMutectCalls_4_1_2",
+            "Gatk4FilterMutectCalls_4_1_3",
+            "Gatk4FilterMutectCalls_4_1_4",
+            "Gatk4FilterMutectCallsLatest",
+            "Gatk4FilterMutectCalls_4_1_6",
+            "Gatk4FilterMutectCalls_4_1_7",
+            "Gatk4FilterMutectCalls_4_1_8",
+        ],
+        "gathervcfs.versions": [
+            "Gatk4GatherVcfs_4_0",
+            "Gatk4GatherVcfs_4_1_2",
+            "Gatk4GatherVcfs_4_1_3",
+            "Gatk4GatherVcfs_4_1_4",
+            "Gatk4GatherVcfsLatest",
+            "Gatk4GatherCompressedVcfsLatest",
+            "Gatk4GatherCompressedVcfs_4_0",
+            "Gatk4GatherCompressedVcfs_4_1_2",
+            "Gatk4GatherCompressedVcfs_4_1_3",
+            "Gatk4GatherCompressedVcfs_4_1_4",
+        ],
+        "genotypeconcordance.versions": [
+            "Gatk4GenotypeConcordance_4_0",
+            "Gatk4GenotypeConcordance_4_1_2",
+            "Gatk4GenotypeConcordance_4_1_3",
+            "Gatk4GenotypeConcordance_4_1_4",
+            "Gatk4GenotypeConcordanceLatest",
+        ],
+        "getpileupsummaries.versions": [
+            "Gatk4GetPileUpSummaries_4_1_2",
+            "Gatk4GetPileUpSummaries_4_1_3",
+            "Gatk4GetPileUpSummaries_4_1_4",
+            "Gatk4GetPileUpSummariesLatest",
+            "Gatk4GetPileUpSummariesCram_4_1_2",
+            "Gatk4GetPileUpSummariesCram_4_1_3",
+            "Gatk4GetPileUpSummariesCram_4_1_4",
+            "Gatk4GetPileUpSummariesCram_4_1_6",
+            "Gatk4GetPileUpSummariesCram_4_1_7",
+            "Gatk4GetPileUpSummariesCram_4_1_8",
+            "Gatk4GetPileUpSummaries_4_1_6",
+            "Gatk4GetPileUpSummaries_4_1_7",
+            "Gatk4GetPileUpSummaries_4_1_8",
+        ],
+        "haplotypecaller.versions": [
+            "Gatk4HaplotypeCallerBase",
+            "Gatk4HaplotypeCaller_4_0",
+            "Gatk4HaplotypeCaller_4_1_2",
+            "Gatk4HaplotypeCaller_4_1_3",
+            "Gatk4HaplotypeCaller_4_1_4",
+            "Gatk4HaplotypeCaller_4_1_6",
+            "Gatk4HaplotypeCaller_4_1_7",
+            "Gatk4HaplotypeCaller_4_1_8",
+            "Gatk4HaplotypeCallerLatest",
+        ],
+        "learnreadorientationmodel.versions": [
+            "Gatk4LearnReadOrientationModel_4_1_2",
+            "Gatk4LearnReadOrientationModel_4_1_3",
+            "Gatk4LearnReadOrientationModel_4_1_4",
+            "Gatk4LearnReadOrientationModelLatest",
+            "Gatk4LearnReadOrientationModel_4_1_6",
+            "Gatk4LearnReadOrientationModel_4_1_7",
+            "Gatk4LearnReadOrientationModel_4_1_8",
+        ],
+        "markduplicates.versions": [
+            "Gatk4MarkDuplicates_4_0",
+            "Gatk4MarkDuplicates_4_1_2",
+            "Gatk4MarkDuplicates_4_1_3",
+            "Gatk4MarkDuplicates_4_1_4",
+            "Gatk4MarkDuplicatesLatest",
+        ],
+        "mergebamalignment.versions": [
+            "Gatk4MergeBamAlignmentBase",
+            "Gatk_4_1_4_1",
+            "Gatk4MergeBamAlignment_4_0",
+            "Gatk4MergeBamAlignment_4_1_2",
+            "Gatk4MergeBamAlignment_4_1_3",
+            "Gatk4MergeBamAlignment_4_1_4",
+            "Gatk4MergeBamAlignmentLatest",
+        ],
+        "mergemutectstats.versions": [
+            "Gatk4MergeMutectStats_4_1_2",
+            "Gatk4MergeMutectStats_4_1_3",
+            "Gatk4MergeMutectStats_4_1_4",
+            "Gatk4MergeMutectStatsLatest",
+            "Gatk4MergeMutectStats_4_1_6",
+            "Gatk4MergeMutectStats_4_1_7",
+            "Gatk4MergeMutectStats_4_1_8",
+        ],
+        "mergesamfiles.versions": [
+            "Gatk4MergeSamFiles_4_0",
+            "Gatk4MergeSamFiles_4_1_2",
+            "Gatk4MergeSamFiles_4_1_3",
+            "Gatk4MergeSamFiles_4_1_4",
+            "Gatk4MergeSamFilesLatest",
+        ],
+        "mutect2.versions": [
+            "Gatk4Mutect2Base_4_0",
+            "Gatk4Mutect2Base_4_1",
+            "Gatk4Mutect2CramBase_4_1",
+            "Gatk_4_1_6_0",
+            "Gatk_4_1_7_0",
+            "Gatk_4_1_8_1",
+            "GatkMutect2_4_0",
+            "GatkMutect2_4_1_2",
+            "GatkMutect2_4_1_3",
+            "GatkMutect2_4_1_4",
+            "GatkMutect2_4_1_6",
+            "GatkMutect2_4_1_7",
+            "GatkMutect2_4_1_8",
+            "GatkMutect2Cram_4_1_2",
+            "GatkMutect2Cram_4_1_3",
+            "GatkMutect2Cram_4_1_4",
+            "GatkMutect2Cram_4_1_6",
+            "GatkMutect2Cram_4_1_7",
+            "GatkMutect2Cram_4_1_8",
+            "GatkMutect2Latest",
+        ],
+        "printreads.versions": [
+            "Gatk4PrintReads_4_0",
+            "Gatk4PrintReads_4_1_2",
+            "Gatk4PrintReads_4_1_3",
+            "Gatk4PrintReads_4_1_4",
+            "Gatk4PrintReadsLatest",
+        ],
+        "selectvariants.versions": [
+            "Gatk4SelectVariants_4_0",
+            "Gatk4SelectVariants_4_1_2",
+            "Gatk4SelectVariants_4_1_3",
+            "Gatk4SelectVariants_4_1_4",
+            "Gatk4SelectVariantsLatest",
+        ],
+        "sortsam.versions": [
+            "Gatk4SortSam_4_0",
+            "Gatk4SortSam_4_1_2",
+            "Gatk4SortSam_4_1_3",
+            "Gatk4SortSam_4_1_4",
+            "Gatk4SortSamLatest",
+        ],
+        "splitreads.versions": [
+            "Gatk4SplitReadsLatest",
+            "Gatk4SplitReads_4_1_2",
+            "Gatk4SplitReads_4_1_3",
+            "Gatk4SplitReads_4_1_4",
+        ],
+        "collectinsertsizemetrics.versions": [
+            "Gatk4CollectInsertSizeMetrics_4_1_2",
+            "Gatk4CollectInsertSizeMetrics_4_1_3",
+            "Gatk4CollectInsertSizeMetrics_4_1_4",
+            "Gatk4CollectInsertSizeMetricsLatest",
+            "Gatk4CollectInsertSizeMetrics_4_0",
+        ],
+        "setnmmdanduqtags.versions": [
+            "Gatk4SetNmMdAndUqTags_4_1_3",
+            "Gatk4SetNmMdAndUqTags_4_1_4",
+            "Gatk4SetNmMdAndUqTagsLatest",
+        ],
+        "gatherbqsrreports.versions": [
+            "Gatk4GatherBQSRReports_4_1_2",
+            "Gatk4GatherBQSRReports_4_1_3",
+            "Gatk4GatherBQSRReports_4_1_4",
+            "Gatk4GatherBQSRReportsLatest",
+            "Gatk4GatherBQSRReports_4_0",
+        ],
+        "gatherbamfiles.versions": [
+            "Gatk4GatherBamFiles_4_1_2",
+            "Gatk4GatherBamFiles_4_1_3",
+            "Gatk4GatherBamFiles_4_1_4",
+            "Gatk4GatherBamFilesLatest",
+        ],
+        "depthofcoverage.versions": [
+            "Gatk4DepthOfCoverage_4_1_6",
+            "Gatk4DepthOfCoverageLatest",
+        ],
+        "splitncigarreads.versions": [
+            "Gatk4SplitNCigarReadsBase",
+            "Gatk4SplitNCigarReads_4_0",
+            "Gatk4SplitNCigarReads_4_1_2",
+            "Gatk4SplitNCigarReads_4_1_3",
+            "Gatk4SplitNCigarReads_4_1_4",
+            "Gatk4SplitNCigarReadsLatest",
+        ],
+        "addorreplacereadgroups.versions": [
+            "Gatk4AddOrReplaceReadGroupsBase",
+            "Gatk_4_0_12",
+            "Gatk_4_1_2_0",
+            "Gatk_4_1_3_0",
+            "Gatk4AddOrReplaceReadGroups_4_0",
+            "Gatk4AddOrReplaceReadGroups_4_1_2",
+            "Gatk4AddOrReplaceReadGroups_4_1_3",
+            "Gatk4AddOrReplaceReadGroups_4_1_4",
+            "Gatk4AddOrReplaceReadGroupsLatest",
+        ],
+        "reordersam.versions": [
+            "Gatk4ReorderSamBase",
+            "Gatk_4_1_4_0",
+            "Gatk4ReorderSam_4_1_4",
+            "Gatk4ReorderSamLatest",
+        ],
+    },
 )
-
-from .depthofcoverage.versions import (
-    Gatk4DepthOfCoverage_4_1_6,
-    Gatk4DepthOfCoverageLatest,
-)
-
-from .splitncigarreads.versions import *
-from .addorreplacereadgroups.versions import *
-from .reordersam.versions import *
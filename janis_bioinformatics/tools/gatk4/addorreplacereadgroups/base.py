@@ -16,8 +16,8 @@ from janis_core import (
     ToolMetadata,
     InputDocumentation,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.data_types import Bam, BamBai
 from janis_bioinformatics.tools.gatk4.gatk4toolbase import Gatk4ToolBase
@@ -61,13 +61,13 @@ class Gatk4AddOrReplaceReadGroupsBase(Gatk4ToolBase, ABC):
         return "GatkAddOrReplaceReadGroups"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -21,8 +21,8 @@ from janis_core import (
     CaptureType,
     ToolMetadata,
     Array,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix import Tsv
 
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
@@ -66,13 +66,13 @@ class Gatk4ApplyBqsrBase(Gatk4ToolBase, ABC):
         return "Gatk4ApplyBQSR"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
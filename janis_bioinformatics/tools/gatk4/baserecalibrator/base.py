@@ -2,7 +2,7 @@ import os
 from abc import ABC
 from typing import Dict, Any
 
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core import (
     ToolInput,
     ToolOutput,
@@ -67,13 +67,13 @@ class Gatk4BaseRecalibratorBase(Gatk4ToolBase, ABC):
         return "Gatk4BaseRecalibrator"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 16
@@ -5,6 +5,7 @@ from janis_core import ToolInput, ToolOutput, InputSelector, ToolMetadata
 
 from janis_bioinformatics.data_types import Fasta, FastaDict
 from ..gatk4toolbase import Gatk4ToolBase
+from janis_bioinformatics.resources import resource_for_hints
 
 
 class Gatk4CreateSequenceDictionaryBase(Gatk4ToolBase, ABC):
@@ -41,9 +42,15 @@ class Gatk4CreateSequenceDictionaryBase(Gatk4ToolBase, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 2
 
     def bind_metadata(self):
@@ -9,9 +9,9 @@ from janis_core import (
     CaptureType,
     File,
     ToolMetadata,
-    get_value_for_hints_and_ordered_resource_tuple,
     Filename,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 from janis_unix.data_types import TextFile
 
@@ -85,13 +85,13 @@ class Gatk4FilterMutectCallsBase(Gatk4ToolBase, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 16
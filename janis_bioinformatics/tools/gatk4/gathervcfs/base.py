@@ -1,7 +1,7 @@
 import os
 from abc import ABC
 from typing import Dict, Any
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core import (
     ToolInput,
     Filename,
@@ -60,13 +60,13 @@ class Gatk4GatherVcfsBase(Gatk4ToolBase, ABC):
         return "GATK4: Gather VCFs"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -1,10 +1,11 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
 
-from janis_core.operators.logical import If, IsDefined
+from janis_core.operators.logical import If, IsDefined, GteOperator
 from janis_core.operators.standard import JoinOperator, FirstOperator
 
 from janis_bioinformatics.data_types import Bed
+from janis_bioinformatics.resources import IoProfile
 
 from .. import BioinformaticsTool
 from janis_core import (
@@ -13,6 +14,7 @@ from janis_core import (
     ToolArgument,
     StringFormatter,
     MemorySelector,
+    CpuSelector,
     String,
     Array,
     InputSelector,
@@ -22,6 +24,9 @@ from janis_core import (
 
 
 class Gatk4ToolBase(BioinformaticsTool, ABC):
+    # bam in + bam out (+ temp files), and the reference / known sites
+    io_profile = IoProfile(disk_per_gb=2.5, disk_overhead=20, seconds_per_gb=180)
+
     def tool_provider(self):
         return "GATK4"
 
@@ -55,22 +60,45 @@ class Gatk4ToolBase(BioinformaticsTool, ABC):
             "and the subclass must contain a definition for docker."
         )
 
+    # The fraction of the container's memory given to the java heap, the rest is
+    # headroom for off heap memory: the native (AVX / OpenMP) PairHMM, the Intel
+    # deflater / inflater buffers, thread stacks and metaspace.
+    java_heap_fraction = 3 / 4
+    # Heaps of at least this many GB use the G1 collector, smaller heaps use the
+    # parallel collector (higher throughput, and less overhead for short runs)
+    java_g1gc_min_heap = 8
+
+    def java_options(self):
+        """
+        The JVM performance profile. Without it the JVM sizes its GC (and JIT /
+        fork-join) thread pools from every core of the host, instead of the cores
+        allocated to the container, so many small jobs on one node each spin up
+        dozens of GC threads. Values in javaOptions come last, so they override these.
+        """
+        heap = MemorySelector() * self.java_heap_fraction
+        return StringFormatter(
+            # ActiveProcessorCount needs 8u191+, older JVMs ignore it (not fail)
+            "-Xmx{memory}G -XX:+IgnoreUnrecognizedVMOptions "
+            "-XX:ActiveProcessorCount={cpus} -XX:ParallelGCThreads={cpus} {gc} "
+            "-Djava.io.tmpdir=. {compression} {otherargs}",
+            memory=heap,
+            cpus=CpuSelector(),
+            gc=If(
+                GteOperator(heap, self.java_g1gc_min_heap),
+                "-XX:+UseG1GC",
+                "-XX:+UseParallelGC",
+            ),
+            compression=If(
+                IsDefined(InputSelector("compression_level")),
+                "-Dsamjdk.compress_level=" + InputSelector("compression_level"),
+                "",
+            ),
+            otherargs=JoinOperator(
+                FirstOperator([InputSelector("javaOptions"), []]), " "
+            ),
+        )
+
     def arguments(self):
         return [
-            ToolArgument(
-                StringFormatter(
-                    "-Xmx{memory}G {compression} {otherargs}",
-                    memory=MemorySelector() * 3 / 4,
-                    compression=If(
-                        IsDefined(InputSelector("compression_level")),
-                        "-Dsamjdk.compress_level=" + InputSelector("compression_level"),
-                        "",
-                    ),
-                    otherargs=JoinOperator(
-                        FirstOperator([InputSelector("javaOptions"), []]), " "
-                    ),
-                ),
-                prefix="--java-options",
-                position=-1,
-            )
+            ToolArgument(self.java_options(), prefix="--java-options", position=-1)
         ]
@@ -11,8 +11,8 @@ from janis_core import (
     Array,
     ToolMetadata,
     String,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.operators.standard import (
     JoinOperator,
     FilterNullOperator,
@@ -132,13 +132,13 @@ class Gatk4GetPileUpSummariesBase(Gatk4ToolBase, ABC):
         ]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 64
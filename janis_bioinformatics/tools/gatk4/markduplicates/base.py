@@ -14,9 +14,9 @@ from janis_core import (
     Boolean,
     InputSelector,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import IoProfile, resource_for_hints
 from janis_core.operators.logical import If
 from janis_core.operators.standard import JoinOperator, FirstOperator
 from janis_core.tool.test_classes import (
@@ -59,6 +59,9 @@ MEM_TUPLE = [
 
 
 class Gatk4MarkDuplicatesBase(Gatk4ToolBase, ABC):
+    # the read ends spill to the tmp dir, on top of the bam in and out
+    io_profile = IoProfile(disk_per_gb=3.5, disk_overhead=20, seconds_per_gb=300)
+
     @classmethod
     def gatk_command(cls):
         return "MarkDuplicates"
@@ -70,13 +73,13 @@ class Gatk4MarkDuplicatesBase(Gatk4ToolBase, ABC):
         return "GATK4: Mark Duplicates"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
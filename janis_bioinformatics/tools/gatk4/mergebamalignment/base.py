@@ -13,7 +13,7 @@ from janis_core import (
     InputSelector,
     CaptureType,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core import ToolMetadata
 
 from janis_bioinformatics.data_types import FastaWithDict, Bam, Sam, BamBai
@@ -58,13 +58,13 @@ class Gatk4MergeBamAlignmentBase(Gatk4ToolBase, ABC):
         return "GATK4: Merge SAM or BAM with unmapped BAM file"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 4
@@ -14,7 +14,7 @@ from janis_core import (
     InputSelector,
     CaptureType,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import IoProfile, resource_for_hints
 from janis_core import ToolMetadata
 
 from janis_bioinformatics.data_types import Bam, BamBai, FastaWithDict
@@ -51,6 +51,9 @@ MEM_TUPLE = [
 
 
 class Gatk4SortSamBase(Gatk4ToolBase, ABC):
+    # sorted runs are spilled to the tmp dir before being merged
+    io_profile = IoProfile(disk_per_gb=3.0, disk_overhead=20, seconds_per_gb=240)
+
     @classmethod
     def gatk_command(cls):
         return "SortSam"
@@ -77,13 +80,13 @@ class Gatk4SortSamBase(Gatk4ToolBase, ABC):
         )
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -14,9 +14,9 @@ from janis_core import (
     ToolOutput,
     InputSelector,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
     Filename,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.tool.test_classes import TTestCase
 
 from janis_bioinformatics.data_types import FastaWithDict, Bed, BamBai
@@ -79,7 +79,7 @@ class Gatk4SplitReadsBase(Gatk4ToolBase):
         ]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 4
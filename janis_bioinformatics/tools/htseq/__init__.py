@@ -1 +1,8 @@
-from .htseqcount.versions import HTSeqCount_1_99_2, HTSeqCountLatest
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "htseqcount.versions": ["HTSeqCount_1_99_2", "HTSeqCountLatest"],
+    },
+)
@@ -11,9 +11,9 @@ from janis_core import (
     Float,
     ToolOutput,
     InputSelector,
-    get_value_for_hints_and_ordered_resource_tuple,
     CaptureType,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_bioinformatics.data_types import Bam
 from janis_bioinformatics.tools.htseq.htseqtoolbase import HTSeqToolBase
 
@@ -72,13 +72,13 @@ class HTSeqCountBase(HTSeqToolBase, ABC):
         return [ToolOutput("out", File(), glob=InputSelector("outputFilename"))]
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -1,8 +1,13 @@
-from .bgzip.bgzip_1_2_1 import BGZip_1_2_1
-from .tabix.tabix_1_2_1 import Tabix_1_2_1
+from janis_bioinformatics.utils.lazyimport import attach
 
-from .bgzip.bgzip_1_9 import BGZip_1_9
-from .tabix.tabix_1_9 import Tabix_1_9
-
-from .bgzip.latest import BGZipLatest
-from .tabix.latest import TabixLatest
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "bgzip.bgzip_1_2_1": ["BGZip_1_2_1"],
+        "tabix.tabix_1_2_1": ["Tabix_1_2_1"],
+        "bgzip.bgzip_1_9": ["BGZip_1_9"],
+        "tabix.tabix_1_9": ["Tabix_1_9"],
+        "bgzip.latest": ["BGZipLatest"],
+        "tabix.latest": ["TabixLatest"],
+    },
+)
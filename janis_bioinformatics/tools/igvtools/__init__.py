@@ -1 +1,8 @@
-from .index.versions import IgvIndexFeature_2_5_3
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "index.versions": ["IgvIndexFeature_2_5_3"],
+    },
+)
@@ -1,18 +1,28 @@
-from .strelkagermline.strelkagermline import (
-    StrelkaGermline_2_9_9,
-    StrelkaGermline_2_9_10,
-    StrelkaGermlineLatest,
-)
-from .strelkasomatic.strelkasomatic import (
-    StrelkaSomatic_2_9_9,
-    StrelkaSomatic_2_9_10,
-    StrelkaSomaticLatest,
-)
-
-from .manta.manta import Manta_1_4_0
-from .manta.manta import Manta_1_5_0
-from .manta.manta import MantaLatest
+from janis_bioinformatics.utils.lazyimport import attach
 
-from .happy.versions import HapPyValidator_0_3_9, HapPyValidatorLatest
-
-from .bcl2fastq.versions import *
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "strelkagermline.strelkagermline": [
+            "StrelkaGermline_2_9_9",
+            "StrelkaGermline_2_9_10",
+            "StrelkaGermlineLatest",
+        ],
+        "strelkasomatic.strelkasomatic": [
+            "StrelkaSomatic_2_9_9",
+            "StrelkaSomatic_2_9_10",
+            "StrelkaSomaticLatest",
+            "StrelkaSomaticCram_2_9_10",
+            "StrelkaSomaticCram_2_9_9",
+        ],
+        "manta.manta": [
+            "Manta_1_4_0",
+            "Manta_1_5_0",
+            "MantaLatest",
+            "MantaCram_1_4_0",
+            "MantaCram_1_5_0",
+        ],
+        "happy.versions": ["HapPyValidator_0_3_9", "HapPyValidatorLatest"],
+        "bcl2fastq.versions": ["Bcl2FastqBase", "Bcl2Fastq_2_20_0", "Bcl2FastqLatest"],
+    },
+)
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 import janis_core as j
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix.data_types.csv import Csv
 from janis_unix.data_types.json import JsonFile
 from janis_unix.data_types.tsv import Tsv
@@ -47,13 +48,13 @@ class HapPyValidatorBase(IlluminaToolBase, ABC):
         return "/opt/hap.py/bin/hap.py"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = j.get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 2
 
     def memory(self, hints: Dict[str, Any]):
-        val = j.get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
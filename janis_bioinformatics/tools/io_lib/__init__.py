@@ -1 +1,13 @@
-from .scramble.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "scramble.versions": [
+            "ioLib_1_14_1_2",
+            "ScrambleBase",
+            "Scramble_1_14_1_2",
+            "ScrambleLatest",
+        ],
+    },
+)
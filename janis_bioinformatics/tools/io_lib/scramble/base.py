@@ -17,8 +17,8 @@ from janis_core import (
     ToolInput,
     ToolMetadata,
     ToolOutput,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 SCRAMBLE_MEM_TUPLE = [
     (
@@ -86,15 +86,13 @@ class ScrambleBase(BioinformaticsTool, ABC):
         return [ToolOutput("out", Stdout(Cram()))]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, SCRAMBLE_MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, SCRAMBLE_MEM_TUPLE)
         if val:
             return val
         return 16
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(
-            hints, SCRAMBLE_CORES_TUPLE
-        )
+        val = resource_for_hints(self, "cpus", hints, SCRAMBLE_CORES_TUPLE)
         if val:
             return val
         return 4
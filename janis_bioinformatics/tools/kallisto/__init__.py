@@ -1,2 +1,18 @@
-from .index.versions import *
-from .quant.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "index.versions": [
+            "KallistoIndexBase",
+            "KallistoIndex_0_46_2",
+            "KallistoIndexLatest",
+        ],
+        "quant.versions": [
+            "KallistoQuantBase",
+            "Kallisto_0_46_2",
+            "KallistoQuant_0_46_2",
+            "KallistoQuantLatest",
+        ],
+    },
+)
@@ -13,6 +13,7 @@ from janis_core import (
 
 from janis_bioinformatics.data_types import Fasta
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import resource_for_hints
 
 from ..data_types import KallistoIdx
 
@@ -60,9 +61,15 @@ class KallistoIndexBase(BioinformaticsTool, ABC):
         return [ToolOutput("out", KallistoIdx, glob=InputSelector("index"))]
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 2
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 1
 
     def bind_metadata(self):
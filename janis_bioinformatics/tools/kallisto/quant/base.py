@@ -17,6 +17,7 @@ from janis_core import (
 
 from janis_bioinformatics.data_types import Fasta, Fastq
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import resource_for_hints
 
 from ..data_types import KallistoIdx
 
@@ -108,9 +109,15 @@ class KallistoQuantBase(BioinformaticsTool, ABC):
         ]
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 2
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 1
 
     def bind_metadata(self):
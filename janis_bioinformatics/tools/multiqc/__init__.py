@@ -1 +1,9 @@
-from .versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "base": ["MultiqcBase"],
+        "versions": ["Multiqc_1_7", "Multiqc_1_11", "MultiqcLatest"],
+    },
+)
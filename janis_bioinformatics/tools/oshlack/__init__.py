@@ -1,5 +1,23 @@
-from .allsorts.versions import *
-from .oncopipe.oncopipe import OncopipeWorkflow, OncopipeSamplePreparation
-from .oncopipe.star import OncopipeStarAligner
-from .oncopipe.variants import OncopipeVariantCaller
-from .prepareallsortsinput import PrepareALLSortsInput_0_1_0
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "allsorts.versions": ["AllSortsBase", "AllSorts_0_1_0"],
+        "oncopipe.oncopipe": [
+            "OncopipeWorkflow",
+            "OncopipeBatchWorkflow",
+            "OncopipeCohortWorkflow",
+            "OncopipeSamplePreparation",
+            "OncopipeSamplePreparation_0_2_0",
+            "OncopipeSampleAnalysis",
+            "OncopipeSampleFusions",
+            "OncopipeCohortAllSorts",
+        ],
+        "oncopipe.star": ["OncopipeStarAligner"],
+        "oncopipe.variants": ["OncopipeVariantCaller"],
+        "prepareallsortsinput": ["PrepareALLSortsInput_0_1_0"],
+        "prepareallsortsinput.v0_2_0": ["PrepareALLSortsInput_0_2_0"],
+        "splitallsortsoutputs": ["SplitALLSortsOutputs_0_1_0"],
+    },
+)
@@ -8,20 +8,66 @@ from janis_core import (
     StringFormatter,
     Directory,
     File,
+    Int,
+    ScatterDescription,
+    ScatterMethods,
 )
+from janis_core.operators.standard import FlattenOperator
 
-from janis_bioinformatics.data_types import FastqGzPairedEnd, FastaWithIndexes, Fasta
+from janis_bioinformatics.data_types import (
+    FastqGzPairedEnd,
+    FastaWithIndexes,
+    Fasta,
+    Bam,
+)
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsWorkflow
+from janis_bioinformatics.tools.common import TrimmomaticPairedEnd_StarAlignReads
 from janis_bioinformatics.tools.gatk4 import Gatk4SortSamLatest
 from janis_bioinformatics.tools.oshlack.prepareallsortsinput import (
     PrepareALLSortsInput_0_1_0,
 )
+from janis_bioinformatics.tools.oshlack.prepareallsortsinput.v0_2_0 import (
+    PrepareALLSortsInput_0_2_0,
+)
 from janis_bioinformatics.tools.oshlack.allsorts.versions import AllSorts_0_1_0
-from janis_bioinformatics.tools.star import StarAlignReads_2_7_1
+from janis_bioinformatics.tools.oshlack.splitallsortsoutputs import (
+    SplitALLSortsOutputs_0_1_0,
+)
+from janis_bioinformatics.tools.star import (
+    StarAlignReads_2_7_1,
+    StarAlignReadsBatch_2_7_1,
+)
 from janis_bioinformatics.tools.subread import FeatureCounts_2_0_1
 from janis_bioinformatics.tools.suhrig import Arriba_1_2_0
 from janis_bioinformatics.tools.usadellab import TrimmomaticPairedEnd_0_35
 
+TRIMMOMATIC_STEPS = [
+    "ILLUMINACLIP:/usr/local/share/trimmomatic-0.35-6/adapters/TruSeq2-PE.fa:2:30:10",
+    "LEADING:15",
+    "TRAILING:15",
+    "SLIDINGWINDOW:4:15",
+    "MINLEN:35",
+]
+
+# https://arriba.readthedocs.io/en/latest/workflow/
+ARRIBA_STAR_OPTIONS = dict(
+    limitOutSJcollapsed=3000000,  # lots of splice junctions may need more than default 1M buffer
+    outSAMtype=["BAM", "Unsorted"],
+    outSAMunmapped="Within",
+    outBAMcompression=0,
+    outFilterMultimapNmax=1,
+    outFilterMismatchNmax=3,
+    chimSegmentMin=10,
+    chimOutType=["WithinBAM", "SoftClip"],
+    chimJunctionOverhangMin=10,
+    chimScoreMin=1,
+    chimScoreDropMax=30,
+    chimScoreJunctionNonGTAG=0,
+    chimScoreSeparation=1,
+    alignSJstitchMismatchNmax=[5, -1, 5, 5],
+    chimSegmentReadGapMax=3,
+)
+
 
 class OncopipeWorkflow(BioinformaticsWorkflow):
     def tool_provider(self):
@@ -181,11 +227,14 @@ class OncopipeSamplePreparation(BioinformaticsWorkflow):
             ),
         )
 
+    def aligned_bam(self):
+        return self.star.out_unsorted_bam.assert_not_null()
+
     def add_arriba(self):
         self.step(
             "arriba",
             Arriba_1_2_0(
-                aligned_inp=self.star.out_unsorted_bam.assert_not_null(),
+                aligned_inp=self.aligned_bam(),
                 blacklist=self.blacklist,
                 fusion_transcript=True,
                 peptide_sequence=True,
@@ -198,7 +247,7 @@ class OncopipeSamplePreparation(BioinformaticsWorkflow):
         self.step(
             "sortsam",
             Gatk4SortSamLatest(
-                bam=self.star.out_unsorted_bam.assert_not_null(),
+                bam=self.aligned_bam(),
                 sortOrder="coordinate",
                 createIndex=True,
             ),
@@ -222,24 +271,15 @@ class OncopipeSamplePreparation(BioinformaticsWorkflow):
         self.step(
             "featureCounts",
             FeatureCounts_2_0_1(
-                bam=[self.star.out_unsorted_bam.assert_not_null()],
+                bam=[self.aligned_bam()],
                 annotationFile=self.gtf,
                 attributeType="gene_name",
             ),
         )
 
-        # A script that transforms featurecounts output to allsorts input
         self.step(
-            "prepareAllsortsInput",
-            PrepareALLSortsInput_0_1_0(
-                inps=[self.featureCounts.out],
-                labels=[self.name],
-                fusion_caller="featureCounts",
-            ),
-        )
-
-        self.step(
-            "allsorts", AllSorts_0_1_0(samples=self.prepareAllsortsInput.out),
+            "allsorts",
+            AllSorts_0_1_0(samples=self.prepare_all_sorts_input()),
         )
 
         self.output(
@@ -286,6 +326,18 @@ class OncopipeSamplePreparation(BioinformaticsWorkflow):
             ),
         )
 
+    def prepare_all_sorts_input(self):
+        # A script that transforms featurecounts output to allsorts input
+        self.step(
+            "prepareAllsortsInput",
+            PrepareALLSortsInput_0_1_0(
+                inps=[self.featureCounts.out],
+                labels=[self.name],
+                fusion_caller="featureCounts",
+            ),
+        )
+        return self.prepareAllsortsInput.out
+
     def bind_metadata(self):
         return WorkflowMetadata(
             contributors=["Michael Franklin"],
@@ -295,6 +347,325 @@ class OncopipeSamplePreparation(BioinformaticsWorkflow):
         )
 
 
+class OncopipeSamplePreparation_0_2_0(OncopipeSamplePreparation):
+    def version(self):
+        return "v0.2.0"
+
+    def add_trim_and_align(self):
+
+        self.step(
+            "trim_and_align",
+            TrimmomaticPairedEnd_StarAlignReads(
+                sampleName=self.name,
+                inp=self.reads,
+                phred33=True,
+                steps=TRIMMOMATIC_STEPS,
+                genomeDir=self.genome_dir,
+                **ARRIBA_STAR_OPTIONS,
+            ),
+            doc="Trim reads using Trimmomatic, streaming them (uncompressed) to STAR",
+        )
+
+    def aligned_bam(self):
+        return self.trim_and_align.out_unsorted_bam.assert_not_null()
+
+    def prepare_all_sorts_input(self):
+        # streams the count columns, out is optional when output_format is npy
+        self.step(
+            "prepareAllsortsInput",
+            PrepareALLSortsInput_0_2_0(
+                inps=[self.featureCounts.out],
+                labels=[self.name],
+                fusion_caller="featureCounts",
+            ),
+        )
+        return self.prepareAllsortsInput.out.assert_not_null()
+
+    def bind_metadata(self):
+        metadata = super().bind_metadata()
+        metadata.contributors = [
+            *metadata.contributors,
+            "Peter MacCallum Cancer Centre",
+        ]
+        metadata.dateUpdated = datetime(2026, 10, 18)
+        metadata.documentation = """\
+OncopipeSamplePreparation with the trimmed reads streamed from Trimmomatic to STAR
+(TrimmomaticPairedEnd_StarAlignReads) instead of written to disk and read back with
+zcat. It needs a container with both Trimmomatic 0.35 and STAR 2.7.1a, see
+TrimmomaticPairedEnd_StarAlignReads. The ALLSorts input is prepared by
+PrepareALLSortsInput 0.2.0, which reads the counts a batch of columns at a time.
+"""
+        return metadata
+
+
+class OncopipeSampleAnalysis(OncopipeSamplePreparation):
+    def friendly_name(self):
+        return "Oncopipe: sample analysis"
+
+    def id(self) -> str:
+        return "OncopipeSampleAnalysis"
+
+    def constructor(self):
+
+        self.input("name", String, doc="Sample ID")
+        self.input("bam", Bam, doc="Unsorted STAR alignments of the sample")
+        self.input("reference", Fasta)
+        self.input("gtf", File)
+        self.input("blacklist", File)
+        self.input("contigs", Array(String(), optional=True))
+
+        self.add_arriba()
+
+    def aligned_bam(self):
+        return self.bam
+
+
+class OncopipeSampleFusions(OncopipeSamplePreparation):
+    def friendly_name(self):
+        return "Oncopipe: sample fusions"
+
+    def id(self) -> str:
+        return "OncopipeSampleFusions"
+
+    def constructor(self):
+
+        self.input("name", String, doc="Sample ID")
+        self.input("reads", FastqGzPairedEnd)
+        self.input("genome_dir", Directory)
+        self.input("reference", Fasta)
+        self.input("blacklist", File)
+        self.input("gtf", File)
+        self.input("contigs", Array(String(), optional=True))
+
+        self.add_trim_and_align()
+        self.add_arriba()
+
+        # for the featureCounts of the cohort
+        self.output("out_aligned_bam", source=self.aligned_bam())
+
+
+class OncopipeCohortAllSorts(BioinformaticsWorkflow):
+    def tool_provider(self):
+        return "Oncopipe"
+
+    def friendly_name(self):
+        return "Oncopipe: cohort ALLSorts"
+
+    def id(self) -> str:
+        return "OncopipeCohortAllSorts"
+
+    def version(self):
+        return "v0.1.0"
+
+    def constructor(self):
+
+        self.input("names", Array(String), doc="Sample IDs")
+        self.input("bams", Array(Bam), doc="Alignments of each sample (as the names)")
+        self.input("gtf", File)
+        self.input("featurecounts_threads", Int(optional=True), default=8)
+
+        # one featureCounts (so one parse of the gtf) for every sample
+        self.step(
+            "featureCounts",
+            FeatureCounts_2_0_1(
+                bam=self.bams,
+                annotationFile=self.gtf,
+                attributeType="gene_name",
+                threads=self.featurecounts_threads,
+            ),
+        )
+
+        self.step(
+            "prepareAllsortsInput",
+            PrepareALLSortsInput_0_2_0(
+                inps=[self.featureCounts.out],
+                labels=self.names,
+                fusion_caller="featureCounts",
+            ),
+        )
+
+        # and one ALLSorts (one load of the model) over the combined matrix
+        self.step(
+            "allsorts",
+            AllSorts_0_1_0(samples=self.prepareAllsortsInput.out.assert_not_null()),
+        )
+
+        self.step(
+            "split",
+            SplitALLSortsOutputs_0_1_0(
+                names=self.names,
+                counts=self.featureCounts.out,
+                predictions=self.allsorts.out_predictions,
+                probabilities=self.allsorts.out_probabilities,
+            ),
+        )
+
+        self.output("out_gene_counts", source=self.split.out_gene_counts)
+        self.output(
+            "out_predictions",
+            source=self.split.out_predictions,
+            output_folder="allsorts",
+        )
+        self.output(
+            "out_probabilities",
+            source=self.split.out_probabilities,
+            output_folder="allsorts",
+        )
+        self.output(
+            "out_distributions",
+            source=self.allsorts.out_distributions,
+            output_folder="allsorts",
+        )
+        self.output(
+            "out_waterfalls",
+            source=self.allsorts.out_waterfalls,
+            output_folder="allsorts",
+        )
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            contributors=["Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2026, 10, 18),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+The ALLSorts stage of oncopipe for a cohort: a single featureCounts over the bams of
+every sample and a single ALLSorts prediction over the combined count matrix, instead
+of one of each per sample, so the gtf is parsed (and the model loaded) once. The gene
+counts, predictions and probabilities are split back out per sample.
+""",
+        )
+
+
+class OncopipeCohortWorkflow(OncopipeWorkflow):
+    def friendly_name(self):
+        return "Oncopipe (cohort)"
+
+    def id(self) -> str:
+        return "oncopipe_cohort"
+
+    def constructor(self):
+
+        self.input("names", Array(String), doc="Sample IDs")
+        self.input(
+            "reads", Array(FastqGzPairedEnd), doc="Reads of each sample (as the names)"
+        )
+        self.input("genome_dir", Directory)
+        self.input("reference", Fasta)
+        self.input("gtf", File)
+        self.input("blacklist", File)
+        self.input("contigs", Array(String(), optional=True))
+
+        self.step(
+            "process",
+            OncopipeSampleFusions(
+                name=self.names,
+                reads=self.reads,
+                genome_dir=self.genome_dir,
+                reference=self.reference,
+                gtf=self.gtf,
+                blacklist=self.blacklist,
+                contigs=self.contigs,
+            ),
+            scatter=ScatterDescription(["name", "reads"], ScatterMethods.dot),
+        )
+
+        self.step(
+            "allsorts",
+            OncopipeCohortAllSorts(
+                names=self.names, bams=self.process.out_aligned_bam, gtf=self.gtf
+            ),
+        )
+
+        self.output("out_arriba_bam", source=self.process.out_arriba_bam)
+        self.output("out_arriba_fusion", source=self.process.out_arriba_fusion)
+        self.output(
+            "out_arriba_fusion_discarded",
+            source=self.process.out_arriba_fusion_discarded,
+        )
+        self.add_cohort_all_sorts_outputs()
+
+    def add_cohort_all_sorts_outputs(self):
+        self.output("out_gene_counts", source=self.allsorts.out_gene_counts)
+        self.output("out_predictions", source=self.allsorts.out_predictions)
+        self.output("out_probabilities", source=self.allsorts.out_probabilities)
+        self.output("out_distributions", source=self.allsorts.out_distributions)
+        self.output("out_waterfalls", source=self.allsorts.out_waterfalls)
+
+
+class OncopipeBatchWorkflow(OncopipeCohortWorkflow):
+    def friendly_name(self):
+        return "Oncopipe (batch alignment)"
+
+    def id(self) -> str:
+        return "oncopipe_batch"
+
+    def constructor(self):
+
+        self.input("names", Array(String), doc="Sample IDs")
+        self.input(
+            "reads", Array(FastqGzPairedEnd), doc="Reads of each sample (as the names)"
+        )
+        self.input("genome_dir", Directory)
+        self.input("reference", Fasta)
+        self.input("gtf", File)
+        self.input("blacklist", File)
+        self.input("contigs", Array(String(), optional=True))
+
+        self.step(
+            "trim",
+            TrimmomaticPairedEnd_0_35(
+                sampleName=self.names,
+                inp=self.reads,
+                phred33=True,
+                steps=TRIMMOMATIC_STEPS,
+            ),
+            scatter=ScatterDescription(["sampleName", "inp"], ScatterMethods.dot),
+            doc="Trim reads using Trimmomatic",
+        )
+
+        # every sample on one node, against a single (shared memory) genome load
+        self.step(
+            "star",
+            StarAlignReadsBatch_2_7_1(
+                sampleNames=self.names,
+                reads=FlattenOperator(self.trim.pairedOut),
+                genomeDir=self.genome_dir,
+                readFilesCommand="zcat",
+                **ARRIBA_STAR_OPTIONS,
+            ),
+        )
+
+        self.step(
+            "analysis",
+            OncopipeSampleAnalysis(
+                name=self.names,
+                bam=self.star.out_unsorted_bam.assert_not_null(),
+                reference=self.reference,
+                gtf=self.gtf,
+                blacklist=self.blacklist,
+                contigs=self.contigs,
+            ),
+            scatter=ScatterDescription(["name", "bam"], ScatterMethods.dot),
+        )
+
+        self.step(
+            "allsorts",
+            OncopipeCohortAllSorts(
+                names=self.names,
+                bams=self.star.out_unsorted_bam.assert_not_null(),
+                gtf=self.gtf,
+            ),
+        )
+
+        self.output("out_arriba_bam", source=self.analysis.out_arriba_bam)
+        self.output("out_arriba_fusion", source=self.analysis.out_arriba_fusion)
+        self.output(
+            "out_arriba_fusion_discarded",
+            source=self.analysis.out_arriba_fusion_discarded,
+        )
+        self.add_cohort_all_sorts_outputs()
+
+
 __JANIS_ENTRYPOINT = OncopipeSamplePreparation
 
 if __name__ == "__main__":
@@ -0,0 +1,243 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from janis_core import TOutput, File, OutputDocumentation
+from janis_unix import Csv
+from janis_unix.data_types import TextFile
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class PrepareALLSortsInput_0_2_0(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        inps: List[File],
+        labels: List[str] = None,
+        output_filename: str = "output.csv",
+        fusion_caller: str = "featureCounts",
+        output_format: str = "csv",
+        batch_size: int = 128,
+    ) -> Dict[str, Any]:
+        """
+        :param inps: featureCounts (one or more samples per file) or htseq-count outputs
+        :param labels: name of each sample (count column) in the order of the inps,
+            defaults to the featureCounts column names or the htseq-count filenames
+        :param output_filename: the samples (rows) x genes (columns) csv, or with the
+            npy output_format, the prefix of the .npy, .genes.txt and .samples.txt
+        :param fusion_caller: the format of the inps, "featureCounts" or "htseq"
+        :param output_format: "csv" (for ALLSorts) or "npy", an int32 matrix
+        :param batch_size: the number of samples (count columns) held in memory at once
+        """
+        import os
+        import numpy as np
+
+        if batch_size < 1:
+            raise Exception(f"The batch_size must be at least 1, got {batch_size}")
+        if fusion_caller not in ("featureCounts", "htseq"):
+            raise Exception(
+                f"Unrecognised fusion_caller '{fusion_caller}', expected "
+                f"'featureCounts' or 'htseq'"
+            )
+        if output_format not in ("csv", "npy"):
+            raise Exception(
+                f"Unrecognised output_format '{output_format}', expected 'csv' or 'npy'"
+            )
+        is_featurecounts = fusion_caller == "featureCounts"
+        # featureCounts: Geneid Chr Start End Strand Length <count per bam>
+        first_count_column = 6 if is_featurecounts else 1
+
+        def sample_names(path):
+            if not is_featurecounts:
+                return [os.path.basename(path)]
+            with open(path) as f:
+                for line in f:
+                    if not line.startswith("#"):
+                        header = line.rstrip("\n").split("\t")
+                        return [os.path.basename(n) for n in header[6:]]
+            raise Exception(f"Couldn't find the featureCounts header in {path}")
+
+        def count_lines(path):
+            # streamed, so only the genes and the columns being read are in memory
+            with open(path) as f:
+                if is_featurecounts:
+                    lines = (l for l in f if not l.startswith("#"))
+                    next(lines, None)
+                else:
+                    # the counts are followed by __no_feature, __ambiguous, ...
+                    lines = (l for l in f if not l.startswith("__"))
+                yield from (l for l in lines if l.strip())
+
+        def read_genes(path):
+            return [l[: l.index("\t")] for l in count_lines(path)]
+
+        def read_counts(path, start, stop):
+            # the count columns [start, stop), the samples, of the file
+            return np.loadtxt(
+                count_lines(path),
+                dtype=np.int64,
+                delimiter="\t",
+                usecols=range(first_count_column + start, first_count_column + stop),
+                ndmin=2,
+            )
+
+        names = [sample_names(inp) for inp in inps]
+        n_samples = sum(len(n) for n in names)
+        if labels is None:
+            labels = [name for file_names in names for name in file_names]
+        elif len(labels) != n_samples:
+            raise Exception(
+                f"There are {len(labels)} labels for the {n_samples} samples in the "
+                f"inputs ({', '.join(map(str, inps))})"
+            )
+
+        # the genes of the first file are the index (the rows of every batch)
+        genes, gene_index = None, None
+        int32_max = np.iinfo(np.int32).max
+
+        def index_order(path, file_genes):
+            # the row of each of the file's genes in the index, None if the same
+            nonlocal gene_index
+            if file_genes == genes:
+                return None
+            if gene_index is None:
+                gene_index = {g: i for i, g in enumerate(genes)}
+                if len(gene_index) != len(genes):
+                    raise Exception(f"There are duplicate genes in {inps[0]}")
+            missing = set(genes).difference(file_genes)
+            unexpected = set(file_genes).difference(gene_index)
+            if missing or unexpected or len(file_genes) != len(genes):
+                raise Exception(
+                    f"The genes of {path} differ from {inps[0]}: "
+                    f"{len(missing)} missing (eg: {sorted(missing)[:5]}), "
+                    f"{len(unexpected)} unexpected (eg: {sorted(unexpected)[:5]})"
+                )
+            # same genes in a different order
+            return [gene_index[g] for g in file_genes]
+
+        out, matrix, written = None, None, 0
+        outputs = {}
+
+        def write_batch(blocks):
+            nonlocal out, matrix, written
+            batch = np.concatenate(blocks, axis=1).T
+            batch_labels = labels[written : written + len(batch)]
+            if output_format == "csv":
+                if out is None:
+                    out = open(output_filename, "w")
+                    out.write("," + ",".join(genes) + "\n")
+                for label, row in zip(batch_labels, batch):
+                    out.write(label + ",")
+                    np.savetxt(out, row[np.newaxis], fmt="%d", delimiter=",")
+            else:
+                if batch.max(initial=0) > int32_max:
+                    raise Exception(f"A count of {batch.max()} doesn't fit in int32")
+                if matrix is None:
+                    matrix = np.lib.format.open_memmap(
+                        outputs["out_matrix"],
+                        mode="w+",
+                        dtype=np.int32,
+                        shape=(n_samples, len(genes)),
+                    )
+                matrix[written : written + len(batch)] = batch
+                matrix.flush()
+            written += len(batch)
+
+        if output_format == "csv":
+            outputs["out"] = output_filename
+        else:
+            prefix = output_filename
+            if prefix.endswith(".csv"):
+                prefix = prefix[: -len(".csv")]
+            outputs["out_matrix"] = prefix + ".npy"
+            outputs["out_genes"] = prefix + ".genes.txt"
+            outputs["out_samples"] = prefix + ".samples.txt"
+
+        # a file with more samples than fit in the batch is read a slice at a time
+        blocks, n_batch = [], 0
+        for inp, file_names in zip(inps, names):
+            file_genes = read_genes(inp)
+            if genes is None:
+                genes = file_genes
+            order = index_order(inp, file_genes)
+            start = 0
+            while start < len(file_names):
+                stop = min(len(file_names), start + batch_size - n_batch)
+                counts = read_counts(inp, start, stop)
+                if order is not None:
+                    ordered = np.empty_like(counts)
+                    ordered[order] = counts
+                    counts = ordered
+                blocks.append(counts)
+                n_batch += stop - start
+                start = stop
+                if n_batch >= batch_size:
+                    write_batch(blocks)
+                    blocks, n_batch = [], 0
+        if blocks:
+            write_batch(blocks)
+
+        if out is not None:
+            out.close()
+        if output_format == "npy":
+            del matrix
+            with open(outputs["out_genes"], "w") as f:
+                f.writelines(g + "\n" for g in genes)
+            with open(outputs["out_samples"], "w") as f:
+                f.writelines(l + "\n" for l in labels)
+
+        return outputs
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput(
+                "out",
+                Csv(optional=True),
+                doc=OutputDocumentation("samples (rows) x genes (columns) counts"),
+            ),
+            TOutput(
+                "out_matrix",
+                File(optional=True, extension=".npy"),
+                doc=OutputDocumentation(
+                    "samples (rows) x genes (columns) int32 counts, as a numpy array"
+                ),
+            ),
+            TOutput(
+                "out_genes",
+                TextFile(optional=True),
+                doc=OutputDocumentation("the genes (columns) of the out_matrix"),
+            ),
+            TOutput(
+                "out_samples",
+                TextFile(optional=True),
+                doc=OutputDocumentation("the samples (rows) of the out_matrix"),
+            ),
+        ]
+
+    def container(self):
+        # has python with numpy
+        return "breons/allsorts:0.1.0"
+
+    def id(self):
+        return "prepareALLSortsInput"
+
+    def version(self):
+        return "v0.2.0"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Prepare ALLSorts Input"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        self.metadata.dateCreated = datetime(2020, 9, 21)
+        self.metadata.dateUpdated = datetime(2026, 10, 18)
+        self.metadata.contributors = ["Jiaan Yu", "Peter MacCallum Cancer Centre"]
+        self.metadata.documentation = """\
+Build the samples x genes count matrix (the ALLSorts input) from featureCounts or
+htseq-count outputs. The count columns are streamed from each file a batch_size slice
+at a time into integer (numpy) arrays keyed by the genes of the first file: files with
+the same genes in another order are reordered, and files with different genes are an
+error. The matrix is written a batch of samples at a time, as a csv or an int32 .npy,
+so the memory is genes x batch_size rather than the whole cohort (or file).
+"""
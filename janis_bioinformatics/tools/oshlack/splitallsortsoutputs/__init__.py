@@ -0,0 +1,107 @@
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+from janis_core import TOutput, File, Array, OutputDocumentation
+from janis_unix import Csv
+from janis_unix.data_types import TextFile
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class SplitALLSortsOutputs_0_1_0(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        names: List[str], counts: File, predictions: File, probabilities: File
+    ) -> Dict[str, Any]:
+        """
+        Split the cohort featureCounts and ALLSorts outputs back into files per sample,
+        named {name}_feature_counts.txt, {name}_predictions.csv and
+        {name}_probabilities.csv.
+        :param names: the samples, in the order of the bams given to featureCounts
+        :param counts: featureCounts output with a count column per sample
+        :param predictions: ALLSorts predictions.csv, a row per sample
+        :param probabilities: ALLSorts probabilities.csv, a row per sample
+        """
+        with open(counts) as f:
+            lines = f.read().splitlines()
+        comments = [l + "\n" for l in lines if l.startswith("#")]
+        rows = [l.split("\t") for l in lines if l and not l.startswith("#")]
+        # Geneid Chr Start End Strand Length <count per bam>
+        if not rows or len(rows[0]) - 6 != len(names):
+            raise Exception(
+                f"Expected a count column for each of the {len(names)} samples in "
+                f"{counts}, found {len(rows[0]) - 6 if rows else 0}"
+            )
+        annotation = ["\t".join(r[:6]) + "\t" for r in rows]
+
+        outputs = {
+            "out_gene_counts": [],
+            "out_predictions": [],
+            "out_probabilities": [],
+        }
+        for i, name in enumerate(names):
+            filename = f"{name}_feature_counts.txt"
+            with open(filename, "w") as out:
+                out.writelines(comments)
+                out.writelines(a + r[6 + i] + "\n" for a, r in zip(annotation, rows))
+            outputs["out_gene_counts"].append(filename)
+
+        for key, path in (
+            ("out_predictions", predictions),
+            ("out_probabilities", probabilities),
+        ):
+            with open(path) as f:
+                header = next(f)
+                # the first column is the sample (the labels of the ALLSorts input)
+                sample_rows = {l.split(",", 1)[0]: l for l in f if l.strip()}
+            suffix = key[len("out_") :]
+            for name in names:
+                if name not in sample_rows:
+                    raise Exception(f"Couldn't find the sample '{name}' in {path}")
+                filename = f"{name}_{suffix}.csv"
+                with open(filename, "w") as out:
+                    out.write(header)
+                    out.write(sample_rows[name])
+                outputs[key].append(filename)
+
+        return outputs
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput(
+                "out_gene_counts",
+                Array(TextFile),
+                doc=OutputDocumentation("featureCounts output of each sample"),
+            ),
+            TOutput(
+                "out_predictions",
+                Array(Csv),
+                doc=OutputDocumentation("ALLSorts prediction of each sample"),
+            ),
+            TOutput(
+                "out_probabilities",
+                Array(Csv),
+                doc=OutputDocumentation("ALLSorts probabilities of each sample"),
+            ),
+        ]
+
+    def id(self):
+        return "splitALLSortsOutputs"
+
+    def version(self):
+        return "v0.1.0"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Split ALLSorts Outputs"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def bind_metadata(self):
+        self.metadata.dateCreated = datetime(2026, 10, 18)
+        self.metadata.dateUpdated = datetime(2026, 10, 18)
+        self.metadata.contributors = ["Peter MacCallum Cancer Centre"]
+        self.metadata.documentation = """\
+Fan the outputs of a cohort featureCounts (a count column per sample) and ALLSorts (a
+row per sample) run back out into the per sample files of OncopipeSamplePreparation.
+"""
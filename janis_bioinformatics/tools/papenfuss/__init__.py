@@ -1 +1,20 @@
-from .gridss.gridss import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "gridss.base_2_2": ["GridssBase_2_2"],
+        "gridss.base_2_4": ["GridssBase_2_4"],
+        "gridss.base_2_10": ["GridssBase_2_10"],
+        "gridss.gridss": [
+            "Gridss_2_2_3",
+            "Gridss_2_4_0",
+            "Gridss_2_5_1",
+            "Gridss_2_6_2",
+            "Gridss_2_9_4",
+            "Gridss_2_8_3",
+            "Gridss_2_10_2",
+            "GridssLatest",
+        ],
+    },
+)
@@ -1,29 +1,96 @@
-from .combinevariants.versions import *
-from .trimiupac.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
 
-# Keep the old tool ParseFastqcAdaptors from breaking the other pipelines
-from .parsefastqc.v0_1_0 import ParseFastqcAdaptors
-from .parsefastqc.v0_2_0 import ParseFastqcAdapters
-from .performancesummary.versions import *
-from .genecovpersample.versions import *
-from .addsymtodepthofcoverage.versions import *
-from .addbamstats.versions import *
-from .extractstrelkasomaticaddp.versions import *
-from .annotateDepthOfCoverageWorkflow import AnnotateDepthOfCoverage_0_1_0
-from .performanceSummaryTargetedWorkflow import PerformanceSummaryTargeted_0_1_0
-from .performanceSummaryGenomeWorkflow import PerformanceSummaryGenome_0_1_0
-from .addBamStatsSomaticWorkflow import AddBamStatsSomatic_0_1_0
-from .addBamStatsGermlineWorkflow import AddBamStatsGermline_0_1_0
-from .generatevardictheaderlines import GenerateVardictHeaderLines
-from .generatebedtoolscoveragegenomefile import GenerateGenomeFileForBedtoolsCoverage
-from .generateintervalsbychromosome.generateintervalsbychromosome import (
-    GenerateIntervalsByChromosome,
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        # the PeterMacUtils containers and tool bases, as the star imports provided
+        "versions": [
+            "PeterMacUtils_0_0_4",
+            "PeterMacUtils_0_0_5",
+            "PeterMacUtils_0_0_7",
+            "PeterMacUtils_0_0_8",
+            "PeterMacUtils_0_1_0",
+            "PeterMacUtils_0_1_1",
+            "PeterMacUtils_0_1_2",
+            "PeterMacUtils_dev",
+            "PeterMacUtils_0_0_6",
+        ],
+        "addbamstats.base": ["AddBamStatsBase"],
+        "addsymtodepthofcoverage.base": ["AddSymToDepthOfCoverageBase"],
+        "circosplot.base": ["CircosPlotBase"],
+        "combinevariants.base": ["CombineVariantsBase"],
+        "extractstrelkasomaticaddp.base": ["ExtractStrelkaSomaticADDPBase"],
+        "genecovpersample.base": ["GeneCoveragePerSampleBase"],
+        "megafusion.base": ["MegaFusionBase"],
+        "performancesummary.base": ["PerformanceSummaryBase"],
+        "replacenfusionvcf.base": ["ReplaceNFusionVcfBase"],
+        "trimiupac.base": ["TrimIUPACBase"],
+        "combinevariants.versions": ["CombineVariants_0_0_8", "CombineVariantsLatest"],
+        "trimiupac.versions": ["TrimIUPAC_0_0_4", "TrimIUPAC_0_0_5", "TrimIUPACLatest"],
+        # Keep the old tool ParseFastqcAdaptors from breaking the other pipelines
+        "parsefastqc.v0_1_0": ["ParseFastqcAdaptors"],
+        "parsefastqc.v0_2_0": ["ParseFastqcAdapters"],
+        "performancesummary.versions": [
+            "PerformanceSummary_0_0_7",
+            "PerformanceSummaryLatest",
+        ],
+        "genecovpersample.versions": [
+            "GeneCoveragePerSample_0_0_7",
+            "GeneCoveragePerSample_0_0_8",
+            "GeneCoveragePerSampleLatest",
+        ],
+        "addsymtodepthofcoverage.versions": [
+            "AddSymToDepthOfCoverage_0_0_7",
+            "AddSymToDepthOfCoverageLatest",
+        ],
+        "addbamstats.versions": ["AddBamStats_0_0_7", "AddBamStatsLatest"],
+        "extractstrelkasomaticaddp.versions": [
+            "ExtractStrelkaSomaticADDP_0_1_0",
+            "ExtractStrelkaSomaticADDP_0_1_1",
+            "ExtractStrelkaSomaticADDPLatest",
+        ],
+        "annotateDepthOfCoverageWorkflow": ["AnnotateDepthOfCoverage_0_1_0"],
+        "performanceSummaryTargetedWorkflow": [
+            "PerformanceSummaryTargeted_0_1_0",
+            "PerformanceSummaryTargeted_0_2_0",
+        ],
+        "performanceSummaryGenomeWorkflow": [
+            "PerformanceSummaryGenome_0_1_0",
+            "PerformanceSummaryGenome_0_2_0",
+        ],
+        "addBamStatsSomaticWorkflow": [
+            "AddBamStatsSomatic_0_1_0",
+            "AddBamStatsSomatic_0_2_0",
+        ],
+        "addBamStatsGermlineWorkflow": [
+            "AddBamStatsGermline_0_1_0",
+            "AddBamStatsGermline_0_2_0",
+        ],
+        "annotatebamstats.annotatebamstats": ["AnnotateBamStats"],
+        "bamqc.bamqc": ["BamQc"],
+        "generatevardictheaderlines": ["GenerateVardictHeaderLines"],
+        "generatebedtoolscoveragegenomefile": ["GenerateGenomeFileForBedtoolsCoverage"],
+        "generateintervalsbychromosome.generateintervalsbychromosome": [
+            "GenerateIntervalsByChromosome",
+        ],
+        "createbalancedcallregions.createbalancedcallregions": [
+            "CreateBalancedCallRegions",
+        ],
+        "splitintervalsintoshards.splitintervalsintoshards": [
+            "SplitIntervalsIntoShards",
+        ],
+        "gatherpileupsummaries.gatherpileupsummaries": ["GatherPileupSummaries"],
+        "gatherchunkedvcfs.gatherchunkedvcfs": ["GatherChunkedVcfs"],
+        "circosplot.versions": ["CircosPlot_0_1_2", "CircosPlotLatest"],
+        "generatemantaconfig": ["GenerateMantaConfig"],
+        "megafusion.versions": ["MegaFusion_0_1_2", "MegaFusionLatest"],
+        "replacenfusionvcf.versions": [
+            "ReplaceNFusionVcf_0_1_2",
+            "ReplaceNFusionVcfLatest",
+        ],
+        "gatherfilesformultiqc": ["GatherFilesForMultiqc"],
+        "localisebambai": ["LocaliseBamBai"],
+        "localisefastawithdict": ["LocaliseFastaWithDict"],
+        "localisefastqgzpair": ["LocaliseFastqGzPair"],
+    },
 )
-from .circosplot.versions import *
-from .generatemantaconfig import GenerateMantaConfig
-from .megafusion.versions import *
-from .replacenfusionvcf.versions import *
-from .gatherfilesformultiqc import GatherFilesForMultiqc
-from .localisebambai import LocaliseBamBai
-from .localisefastawithdict import LocaliseFastaWithDict
-from .localisefastqgzpair import LocaliseFastqGzPair
@@ -18,6 +18,9 @@ from janis_bioinformatics.tools.bioinformaticstoolbase import (
 )
 from janis_bioinformatics.tools.pmac import AddBamStatsLatest
 from janis_bioinformatics.tools.samtools import SamToolsMpileupLatest
+from janis_bioinformatics.tools.pmac.annotatebamstats.annotatebamstats import (
+    AnnotateBamStats,
+)
 
 
 class AddBamStatsGermline_0_1_0(BioinformaticsWorkflow):
@@ -93,3 +96,48 @@ class AddBamStatsGermline_0_1_0(BioinformaticsWorkflow):
                 ),
             )
         ]
+
+
+class AddBamStatsGermline_0_2_0(AddBamStatsGermline_0_1_0):
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.2.0",
+            contributors=["Jiaan Yu", "Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2020, 6, 4),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Count the allele depths of the germline variants from the indexed bam
+(AnnotateBamStats), instead of an mpileup of every variant position.
+""",
+        )
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input("vcf", Vcf)
+        # kept so the inputs match v0.1.0, the allele depths don't need the reference
+        self.input("reference", FastaWithDict)
+
+        self.step(
+            "addbamstats",
+            AnnotateBamStats(
+                inputVcf=self.vcf, bam=self.bam, type="germline", maxDepth=10000
+            ),
+        )
+
+        self.output("out", source=self.addbamstats.out, output_name="addbasmtats.vcf")
+
+    def tests(self):
+        remote_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics/wgsgermline_data"
+        return [
+            TTestCase(
+                name="basic",
+                input={
+                    "bam": f"{remote_dir}/NA12878-BRCA1.markduped.bam",
+                    "reference": f"{remote_dir}/Homo_sapiens_assembly38.chr17.fasta",
+                    "vcf": f"{remote_dir}/NA12878-BRCA1.sorted.uncompressed.stdout",
+                },
+                # the same variants as v0.1.0, but depths are counted differently
+                output=Vcf.basic_test("out", 60000),
+            )
+        ]
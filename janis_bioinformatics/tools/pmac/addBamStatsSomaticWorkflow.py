@@ -18,6 +18,9 @@ from janis_bioinformatics.tools.bioinformaticstoolbase import (
 )
 from janis_bioinformatics.tools.pmac import AddBamStatsLatest
 from janis_bioinformatics.tools.samtools import SamToolsMpileupLatest
+from janis_bioinformatics.tools.pmac.annotatebamstats.annotatebamstats import (
+    AnnotateBamStats,
+)
 
 
 class AddBamStatsSomatic_0_1_0(BioinformaticsWorkflow):
@@ -129,3 +132,67 @@ class AddBamStatsSomatic_0_1_0(BioinformaticsWorkflow):
                 ),
             )
         ]
+
+
+class AddBamStatsSomatic_0_2_0(AddBamStatsSomatic_0_1_0):
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.2.0",
+            contributors=["Jiaan Yu", "Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2020, 6, 4),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Count the tumor and normal allele depths of the somatic variants from the indexed bams
+in one step (AnnotateBamStats), instead of an mpileup per bam and annotating from them.
+""",
+        )
+
+    def constructor(self):
+
+        self.input("normal_id", String)
+        self.input("tumor_id", String)
+        self.input("normal_bam", BamBai)
+        self.input("tumor_bam", BamBai)
+        # kept so the inputs match v0.1.0, the allele depths don't need the reference
+        self.input("reference", FastaWithDict)
+        self.input("vcf", Vcf)
+
+        self.step(
+            "addbamstats",
+            AnnotateBamStats(
+                inputVcf=self.vcf,
+                tumorBam=self.tumor_bam,
+                normalBam=self.normal_bam,
+                normalID=self.normal_id,
+                tumorID=self.tumor_id,
+                type="somatic",
+                maxDepth=10000,
+            ),
+        )
+
+        self.output(
+            "out",
+            source=self.addbamstats.out,
+            output_folder="vcf",
+            output_name="addbamstats",
+        )
+
+    def tests(self):
+        parent_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics"
+        germline_data = f"{parent_dir}/wgsgermline_data"
+        somatic_data = f"{parent_dir}/wgssomatic_data"
+        return [
+            TTestCase(
+                name="basic",
+                input={
+                    "normal_id": "NA24385-BRCA1",
+                    "tumor_id": "NA12878-NA24385-mixture",
+                    "normal_bam": f"{somatic_data}/NA24385-BRCA1.markduped.bam",
+                    "tumor_bam": f"{somatic_data}/NA12878-NA24385-mixture.markduped.bam",
+                    "reference": f"{germline_data}/Homo_sapiens_assembly38.chr17.fasta",
+                    "vcf": f"{somatic_data}/uncompressed.stdout",
+                },
+                # the same variants as v0.1.0, but depths are counted differently
+                output=Vcf.basic_test("out", 40000),
+            )
+        ]
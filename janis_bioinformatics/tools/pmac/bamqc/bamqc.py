@@ -0,0 +1,641 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+from janis_core import TOutput, OutputDocumentation
+from janis_unix.data_types import TextFile
+
+from janis_bioinformatics.data_types import BamBai, Bed
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class BamQc(BioinformaticsPythonTool):
+    embedded_modules = [
+        "janis_bioinformatics.utils.bgzf",
+        "janis_bioinformatics.utils.parallel",
+    ]
+
+    @staticmethod
+    def code_block(
+        bam: BamBai,
+        genomeFile: Optional[TextFile] = None,
+        regionBed: Optional[Bed] = None,
+        geneCoverageBed: Optional[Bed] = None,
+        excludeFlags: int = 0,
+        outputPrefix: str = "bamqc",
+    ) -> Dict[str, Any]:
+        """
+        :param bam: coordinate sorted, indexed bam
+        :param genomeFile: contig names and lengths (bedtools genome file), the order
+            of the whole genome coverage, defaults to the contigs of the bam header
+        :param regionBed: targeted regions, the coverage is the 'bedtools coverage
+            -hist' of these regions (instead of 'bedtools genomecov') and the reads
+            overlapping them are counted in the targetFlagstat
+        :param geneCoverageBed: regions for a second 'bedtools coverage -hist'
+        :param excludeFlags: ignore the reads with any of these flags, like
+            'samtools view -F', eg: 256 to ignore the secondary alignments
+        :param outputPrefix: prefix of the output files
+        """
+        import heapq
+        import os
+        import struct
+        from array import array
+
+        from janis_bioinformatics.utils.bgzf import (
+            BgzfFile,
+            bai_query,
+            read_bai,
+            read_bam_header,
+        )
+        from janis_bioinformatics.utils.parallel import fork_map
+
+        fpaired, fproper_pair, funmap, fmunmap = 0x1, 0x2, 0x4, 0x8
+        freverse, fmreverse, fread1, fread2 = 0x10, 0x20, 0x40, 0x80
+        fsecondary, fqcfail, fdup, fsupplementary = 0x100, 0x200, 0x400, 0x800
+        ref_consuming = (0, 2, 3, 7, 8)
+        # flag (12 bits) | mate on a different chr << 12 | mapq >= 5 << 13
+        n_flag_keys = 1 << 14
+        # insert sizes above this are kept in a dict
+        max_array_insert = 1 << 16
+        orientations = ["FR", "RF", "TANDEM"]
+        # CollectInsertSizeMetrics defaults
+        minimum_pct, deviations = 0.05, 10.0
+
+        def contig_chunks(tid):
+            """The merged chunks (of virtual offsets) of every read of the contig"""
+            return bai_query(index, tid)
+
+        def read_bed(path):
+            """{contig: [(start, end, line)]} sorted by start"""
+            regions = {}
+            if not path:
+                return regions
+            with open(path) as f:
+                for line in f:
+                    if not line.strip() or line.startswith(("#", "track", "browser")):
+                        continue
+                    cols = line.rstrip("\n").split("\t")
+                    regions.setdefault(cols[0], []).append(
+                        (int(cols[1]), int(cols[2]), "\t".join(cols))
+                    )
+            return {c: sorted(r, key=lambda x: x[:2]) for c, r in regions.items()}
+
+        def merge_regions(regions):
+            merged = []
+            for start, end, _ in regions:
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            return merged
+
+        def grow(hist, depth):
+            if depth >= len(hist):
+                hist.extend([0] * (depth + 1 - len(hist)))
+
+        def new_totals():
+            """(flag counts, target flag counts, {orientation: insert sizes})"""
+            return (
+                array("q", [0]) * n_flag_keys,
+                array("q", [0]) * n_flag_keys,
+                {o: (array("q", [0]) * max_array_insert, {}) for o in orientations},
+            )
+
+        def tally_contig(tid, totals):
+            """
+            Stream the reads of one contig (tid -1: the unplaced unmapped reads, at
+            the end of the bam), adding the flag and insert size counts to totals.
+            Returns the contig's (coverage, regionBed and geneCoverageBed histograms).
+            """
+            flags, target_flags, inserts = totals
+            coverage = array("q", [0])
+
+            f = BgzfFile(bam)
+            if tid == -1:
+                for record in f.records(unplaced_start):
+                    if struct.unpack_from("<i", record)[0] == -1:
+                        flag = struct.unpack_from("<H", record, 14)[0]
+                        if not flag & excludeFlags:
+                            flags[flag & 0xFFF] += 1
+                return coverage, [], []
+
+            contig, length = references[tid]
+            beds = [bed.get(contig, []) for bed in (regions, genes)]
+            bed_hists = [[{} for _ in bed] for bed in beds]
+            # regions that might still overlap the next run of the coverage
+            next_region = [0, 0]
+            active = [[], []]
+            targets = merge_regions(beds[0])
+            next_target = 0
+
+            def add_run(start, end, depth):
+                """Bases [start, end) have this depth"""
+                end = min(end, length)
+                if end <= start:
+                    return
+                grow(coverage, depth)
+                coverage[depth] += end - start
+                for b, bed in enumerate(beds):
+                    while next_region[b] < len(bed) and bed[next_region[b]][0] < end:
+                        active[b].append(next_region[b])
+                        next_region[b] += 1
+                    active[b] = [i for i in active[b] if bed[i][1] > start]
+                    for i in active[b]:
+                        overlap = min(end, bed[i][1]) - max(start, bed[i][0])
+                        if overlap > 0:
+                            hist = bed_hists[b][i]
+                            hist[depth] = hist.get(depth, 0) + overlap
+
+            position, depth, ends = 0, 0, []
+            unpack_fixed = struct.Struct("<iiBBHHHiiii").unpack_from
+            for chunk_start, chunk_end in contig_chunks(tid):
+                for record in f.records(chunk_start, chunk_end):
+                    (
+                        ref_id,
+                        pos,
+                        l_name,
+                        mapq,
+                        _,
+                        n_cigar,
+                        flag,
+                        _,
+                        next_ref_id,
+                        next_pos,
+                        tlen,
+                    ) = unpack_fixed(record)
+                    if ref_id != tid:
+                        if ref_id > tid or ref_id == -1:
+                            break
+                        continue
+                    if flag & excludeFlags:
+                        continue
+                    key = (
+                        flag & 0xFFF | (ref_id != next_ref_id) << 12 | (mapq >= 5) << 13
+                    )
+                    flags[key] += 1
+                    if flag & funmap or flag & fdup:
+                        continue
+
+                    cigar = struct.unpack_from(f"<{n_cigar}I", record, 32 + l_name)
+                    ref_length = sum(c >> 4 for c in cigar if c & 0xF in ref_consuming)
+                    if ref_length == 0:
+                        continue
+                    end = pos + ref_length
+
+                    # bedtools intersect -a dedup.bam -b regionBed
+                    while next_target < len(targets) and targets[next_target][1] <= pos:
+                        next_target += 1
+                    if next_target < len(targets) and targets[next_target][0] < end:
+                        target_flags[key] += 1
+
+                    # bedtools genomecov / coverage -hist, reads are sorted by pos
+                    while ends and ends[0] <= pos:
+                        stop = heapq.heappop(ends)
+                        add_run(position, stop, depth)
+                        position, depth = max(position, stop), depth - 1
+                    add_run(position, pos, depth)
+                    position, depth = max(position, pos), depth + 1
+                    heapq.heappush(ends, end)
+
+                    # CollectInsertSizeMetrics (the second read of each pair)
+                    if (
+                        flag & fpaired
+                        and not flag & (fmunmap | fread1 | fsecondary | fsupplementary)
+                        and tlen != 0
+                    ):
+                        if bool(flag & freverse) == bool(flag & fmreverse):
+                            orientation = "TANDEM"
+                        else:
+                            if flag & freverse:
+                                positive_five_prime = next_pos + 1
+                                negative_five_prime = end
+                            else:
+                                positive_five_prime = pos + 1
+                                negative_five_prime = pos + 1 + tlen
+                            orientation = (
+                                "FR"
+                                if positive_five_prime < negative_five_prime
+                                else "RF"
+                            )
+                        small, large = inserts[orientation]
+                        size = abs(tlen)
+                        if size < max_array_insert:
+                            small[size] += 1
+                        else:
+                            large[size] = large.get(size, 0) + 1
+
+            while ends:
+                stop = heapq.heappop(ends)
+                add_run(position, stop, depth)
+                position, depth = max(position, stop), depth - 1
+            add_run(position, length, 0)
+
+            return coverage, bed_hists[0], bed_hists[1]
+
+        def flagstat(keys):
+            counts = {}
+
+            def add(field, n, qcfail):
+                counts.setdefault(field, [0, 0])[1 if qcfail else 0] += n
+
+            for key, n in enumerate(keys):
+                if not n:
+                    continue
+                flag, diff_chr, high_mapq = key & 0xFFF, key >> 12 & 1, key >> 13
+                w = flag & fqcfail
+                add("total", n, w)
+                if flag & fsecondary:
+                    add("secondary", n, w)
+                elif flag & fsupplementary:
+                    add("supplementary", n, w)
+                elif flag & fpaired:
+                    add("paired", n, w)
+                    if flag & fproper_pair and not flag & funmap:
+                        add("properly_paired", n, w)
+                    if flag & fread1:
+                        add("read1", n, w)
+                    if flag & fread2:
+                        add("read2", n, w)
+                    if flag & fmunmap and not flag & funmap:
+                        add("singletons", n, w)
+                    if not flag & funmap and not flag & fmunmap:
+                        add("with_itself_and_mate_mapped", n, w)
+                        if diff_chr:
+                            add("mate_different_chr", n, w)
+                            if high_mapq:
+                                add("mate_different_chr_mapq5", n, w)
+                if not flag & funmap:
+                    add("mapped", n, w)
+                if flag & fdup:
+                    add("duplicates", n, w)
+
+            def pair(field):
+                passed, failed = counts.get(field, [0, 0])
+                return f"{passed} + {failed}"
+
+            def percent(n, total):
+                if total == 0:
+                    return "N/A"
+                # samtools divides in single precision, which matters for %.2f
+                ratio = as_float32(as_float32(n) / as_float32(total))
+                return f"{ratio * 100.0:.2f}%"
+
+            def percents(field, of):
+                (p, f), (pt, ft) = counts.get(field, [0, 0]), counts.get(of, [0, 0])
+                return f"({percent(p, pt)} : {percent(f, ft)})"
+
+            return "".join(
+                line + "\n"
+                for line in [
+                    f"{pair('total')} in total (QC-passed reads + QC-failed reads)",
+                    f"{pair('secondary')} secondary",
+                    f"{pair('supplementary')} supplementary",
+                    f"{pair('duplicates')} duplicates",
+                    f"{pair('mapped')} mapped {percents('mapped', 'total')}",
+                    f"{pair('paired')} paired in sequencing",
+                    f"{pair('read1')} read1",
+                    f"{pair('read2')} read2",
+                    f"{pair('properly_paired')} properly paired "
+                    f"{percents('properly_paired', 'paired')}",
+                    f"{pair('with_itself_and_mate_mapped')} with itself and mate "
+                    "mapped",
+                    f"{pair('singletons')} singletons "
+                    f"{percents('singletons', 'paired')}",
+                    f"{pair('mate_different_chr')} with mate mapped to a different chr",
+                    f"{pair('mate_different_chr_mapq5')} with mate mapped to a "
+                    f"different chr (mapQ>=5)",
+                ]
+            )
+
+        def as_float32(value):
+            return struct.unpack("f", struct.pack("f", value))[0]
+
+        def picard_number(value):
+            if not isinstance(value, float):
+                return str(value)
+            text = f"{value:.6f}".rstrip("0").rstrip(".")
+            return "0" if text == "-0" else text
+
+        def histogram_median(hist):
+            """htsjdk Histogram.getMedian of [(value, count)] sorted by value"""
+            count = sum(n for _, n in hist)
+            if count == 0:
+                return 0.0
+            if count % 2 == 0:
+                mid_low, mid_high = count / 2, count / 2 + 1
+            else:
+                mid_low = mid_high = (count + 1) // 2
+            low = high = None
+            total = 0
+            for value, n in hist:
+                total += n
+                if low is None and total >= mid_low:
+                    low = value
+                if high is None and total >= mid_high:
+                    high = value
+                    break
+            return (low + high) / 2
+
+        def insert_size_metrics(hist):
+            """The InsertSizeMetrics row (as a dict) of [(size, count)]"""
+            total = sum(n for _, n in hist)
+            median = histogram_median(hist)
+            deviations_hist = {}
+            for size, n in hist:
+                d = abs(size - median)
+                deviations_hist[d] = deviations_hist.get(d, 0) + n
+            mad = histogram_median(sorted(deviations_hist.items()))
+            mode = max(hist, key=lambda x: x[1])[0]
+
+            # the width around the median covering 10, 20, ... 99% of the pairs
+            widths = {}
+            center = int(median)
+            by_distance = {}
+            for size, n in hist:
+                d = abs(size - center)
+                by_distance[d] = by_distance.get(d, 0) + n
+            covered = 0
+            pcts = [10, 20, 30, 40, 50, 60, 70, 80, 90, 95, 99]
+            for d in sorted(by_distance):
+                covered += by_distance[d]
+                for pct in pcts:
+                    if pct not in widths and covered / total >= pct / 100:
+                        widths[pct] = 2 * d + 1
+
+            # the mean / sd leave out the outliers, above median + 10 MADs
+            trimmed = [(s, n) for s, n in hist if s <= int(median + deviations * mad)]
+            count = sum(n for _, n in trimmed)
+            mean = sum(s * n for s, n in trimmed) / count if count else 0.0
+            sd = (
+                (sum(n * (s - mean) ** 2 for s, n in trimmed) / (count - 1)) ** 0.5
+                if count > 1
+                else 0.0
+            )
+            return (
+                {
+                    "MEDIAN_INSERT_SIZE": median,
+                    "MODE_INSERT_SIZE": mode,
+                    "MEDIAN_ABSOLUTE_DEVIATION": mad,
+                    "MIN_INSERT_SIZE": hist[0][0],
+                    "MAX_INSERT_SIZE": hist[-1][0],
+                    "MEAN_INSERT_SIZE": mean,
+                    "STANDARD_DEVIATION": sd,
+                    "READ_PAIRS": total,
+                    **{f"WIDTH_OF_{p}_PERCENT": widths.get(p, 0) for p in pcts},
+                },
+                trimmed,
+            )
+
+        def coverage_lines(name, hist, size):
+            return [
+                f"{name}\t{depth}\t{n}\t{size}\t{n / size:.6g}\n"
+                for depth, n in enumerate(hist)
+                if n
+            ]
+
+        def bed_coverage(bed, hists, out_path):
+            """bedtools coverage -hist"""
+            all_hist, all_size = array("q", [0]), 0
+            with open(out_path, "w") as out:
+                for contig, regions in bed.items():
+                    contig_hists = hists.get(contig, [{} for _ in regions])
+                    for (start, end, line), hist in zip(regions, contig_hists):
+                        size = end - start
+                        all_size += size
+                        hist = dict(hist)
+                        hist[0] = hist.get(0, 0) + size - sum(hist.values())
+                        for depth in sorted(hist):
+                            if not hist[depth]:
+                                continue
+                            grow(all_hist, depth)
+                            all_hist[depth] += hist[depth]
+                            out.write(
+                                f"{line}\t{depth}\t{hist[depth]}\t{size}\t"
+                                f"{hist[depth] / size:.6g}\n"
+                            )
+                if all_size:
+                    out.writelines(coverage_lines("all", all_hist, all_size))
+
+        references, header_end = read_bam_header(bam)
+        index = read_bai(bam + ".bai")
+        tids = {contig: tid for tid, (contig, _) in enumerate(references)}
+        regions, genes = read_bed(regionBed), read_bed(geneCoverageBed)
+        # the unplaced unmapped reads come after the last chunk of any contig
+        unplaced_start = max(
+            [header_end]
+            + [stop for bins, _ in index for cs in bins.values() for _, stop in cs]
+        )
+
+        # tally the contigs in (forked) worker processes, in batches of about the same
+        # length (biggest contigs first), each batch keeps its own totals so only
+        # those (and the coverage) are sent back
+        todo = sorted(range(len(index)), key=lambda t: -references[t][1]) + [-1]
+        n_batches = min(len(todo), 4 * len(os.sched_getaffinity(0)))
+        batches, batch_lengths = [[] for _ in range(n_batches)], [0] * n_batches
+        for tid in todo:
+            b = batch_lengths.index(min(batch_lengths))
+            batches[b].append(tid)
+            batch_lengths[b] += references[tid][1] if tid >= 0 else 0
+
+        def tally_batch(batch):
+            totals = new_totals()
+            return {tid: tally_contig(tid, totals) for tid in batch}, totals
+
+        results, batch_totals = {}, []
+        for _, (batch_results, totals) in fork_map(tally_batch, batches):
+            results.update(batch_results)
+            batch_totals.append(totals)
+
+        # combine the batches
+        flags = array("q", [0]) * n_flag_keys
+        target_flags = array("q", [0]) * n_flag_keys
+        inserts = {o: {} for o in orientations}
+        for w_flags, w_target_flags, w_inserts in batch_totals:
+            for key in range(n_flag_keys):
+                flags[key] += w_flags[key]
+                target_flags[key] += w_target_flags[key]
+            for o, (small, large) in w_inserts.items():
+                for size, n in enumerate(small):
+                    if n:
+                        inserts[o][size] = inserts[o].get(size, 0) + n
+                for size, n in large.items():
+                    inserts[o][size] = inserts[o].get(size, 0) + n
+        dedup_flags = array(
+            "q", (0 if key & fdup else n for key, n in enumerate(flags))
+        )
+
+        outputs = {
+            "flagstat": f"{outputPrefix}.flagstat",
+            "rmdupFlagstat": f"{outputPrefix}.rmdup.flagstat",
+            "insertSizeMetrics": f"{outputPrefix}.insert_size_metrics.txt",
+            "coverage": f"{outputPrefix}.coverage.txt",
+            "targetFlagstat": f"{outputPrefix}.target.flagstat" if regionBed else None,
+            "geneCoverage": (
+                f"{outputPrefix}.genecoverage.txt" if geneCoverageBed else None
+            ),
+        }
+        with open(outputs["flagstat"], "w") as out:
+            out.write(flagstat(flags))
+        with open(outputs["rmdupFlagstat"], "w") as out:
+            out.write(flagstat(dedup_flags))
+        if regionBed:
+            with open(outputs["targetFlagstat"], "w") as out:
+                out.write(flagstat(target_flags))
+
+        # CollectInsertSizeMetrics, the orientations with at least 5% of the pairs
+        total_pairs = sum(sum(h.values()) for h in inserts.values())
+        columns = [
+            "MEDIAN_INSERT_SIZE",
+            "MODE_INSERT_SIZE",
+            "MEDIAN_ABSOLUTE_DEVIATION",
+            "MIN_INSERT_SIZE",
+            "MAX_INSERT_SIZE",
+            "MEAN_INSERT_SIZE",
+            "STANDARD_DEVIATION",
+            "READ_PAIRS",
+            "PAIR_ORIENTATION",
+            *(f"WIDTH_OF_{p}_PERCENT" for p in (10, 20, 30, 40, 50, 60, 70, 80, 90)),
+            "WIDTH_OF_95_PERCENT",
+            "WIDTH_OF_99_PERCENT",
+            "SAMPLE",
+            "LIBRARY",
+            "READ_GROUP",
+        ]
+        rows, histograms = [], []
+        for o in orientations:
+            hist = sorted(inserts[o].items())
+            pairs = sum(n for _, n in hist)
+            if not pairs or pairs < total_pairs * minimum_pct:
+                continue
+            metrics, trimmed = insert_size_metrics(hist)
+            metrics.update(PAIR_ORIENTATION=o, SAMPLE="", LIBRARY="", READ_GROUP="")
+            rows.append("\t".join(picard_number(metrics[c]) for c in columns))
+            histograms.append((f"All_Reads.{o.lower()}_count", dict(trimmed)))
+
+        with open(outputs["insertSizeMetrics"], "w") as out:
+            out.write(
+                "## htsjdk.samtools.metrics.StringHeader\n"
+                f"# BamQc (CollectInsertSizeMetrics) INPUT={bam}\n\n"
+                "## METRICS CLASS\tpicard.analysis.InsertSizeMetrics\n"
+            )
+            out.write("\t".join(columns) + "\n")
+            out.writelines(row + "\n" for row in rows)
+            if histograms:
+                out.write("\n## HISTOGRAM\tjava.lang.Integer\n")
+                out.write("\t".join(["insert_size", *(h for h, _ in histograms)]))
+                out.write("\n")
+                for size in sorted(set().union(*(h for _, h in histograms))):
+                    counts = [str(h.get(size, 0)) for _, h in histograms]
+                    out.write("\t".join([str(size), *counts]) + "\n")
+            out.write("\n")
+
+        def contig_bed_hists(i):
+            return {references[t][0]: results[t][i] for t in range(len(index))}
+
+        if regionBed:
+            bed_coverage(regions, contig_bed_hists(1), outputs["coverage"])
+        else:
+            # bedtools genomecov, in the order of the genome file
+            if genomeFile:
+                with open(genomeFile) as f:
+                    contigs = [l.split("\t")[:2] for l in f if l.strip()]
+                contigs = [(c, int(length)) for c, length in contigs]
+            else:
+                contigs = references
+            genome_hist, genome_size = array("q", [0]), 0
+            with open(outputs["coverage"], "w") as out:
+                for contig, length in contigs:
+                    tid = tids.get(contig)
+                    hist = array("q", [length]) if tid is None else results[tid][0]
+                    genome_size += length
+                    for depth, n in enumerate(hist):
+                        grow(genome_hist, depth)
+                        genome_hist[depth] += n
+                    out.writelines(coverage_lines(contig, hist, length))
+                out.writelines(coverage_lines("genome", genome_hist, genome_size))
+
+        if geneCoverageBed:
+            bed_coverage(genes, contig_bed_hists(2), outputs["geneCoverage"])
+
+        return outputs
+
+    def outputs(self) -> List[TOutput]:
+        return [
+            TOutput(
+                "flagstat",
+                TextFile,
+                doc=OutputDocumentation("samtools flagstat of the bam"),
+            ),
+            TOutput(
+                "rmdupFlagstat",
+                TextFile,
+                doc=OutputDocumentation(
+                    "samtools flagstat of the bam without the duplicates"
+                ),
+            ),
+            TOutput(
+                "insertSizeMetrics",
+                TextFile,
+                doc=OutputDocumentation(
+                    "CollectInsertSizeMetrics (metrics and histogram) of the bam"
+                ),
+            ),
+            TOutput(
+                "coverage",
+                TextFile,
+                doc=OutputDocumentation(
+                    "bedtools genomecov of the bam without the duplicates, or bedtools "
+                    "coverage -hist of the regionBed"
+                ),
+            ),
+            TOutput(
+                "targetFlagstat",
+                TextFile(optional=True),
+                doc=OutputDocumentation(
+                    "samtools flagstat of the reads (without the duplicates) "
+                    "overlapping the regionBed"
+                ),
+            ),
+            TOutput(
+                "geneCoverage",
+                TextFile(optional=True),
+                doc=OutputDocumentation(
+                    "bedtools coverage -hist of the geneCoverageBed (without the "
+                    "duplicates)"
+                ),
+            ),
+        ]
+
+    def id(self) -> str:
+        return "BamQc"
+
+    def friendly_name(self) -> str:
+        return "Single pass bam QC"
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        self.metadata.dateCreated = datetime(2026, 10, 18)
+        self.metadata.dateUpdated = datetime(2026, 10, 18)
+        self.metadata.contributors = ["Peter MacCallum Cancer Centre"]
+        self.metadata.documentation = """\
+The inputs of performance_summary.py from a single pass over an indexed bam, instead of
+reading it (and a copy of it without the duplicates) four times:
+
+    - flagstat: samtools flagstat
+    - rmdupFlagstat: samtools view -F 0x400 | samtools flagstat
+    - insertSizeMetrics: gatk CollectInsertSizeMetrics (the metrics and histogram)
+    - coverage: bedtools genomecov of the reads without the duplicates, or with a
+      regionBed, bedtools coverage -hist of the regions
+    - targetFlagstat: bedtools intersect (regionBed) | samtools flagstat
+    - geneCoverage: bedtools coverage -hist of the geneCoverageBed
+
+The counters are small arrays: the flagstat counts are kept per distinct (flag, mate
+on a different chr, mapq >= 5) so the deduplicated counts are the same table without
+the duplicate flag, and the coverage is a histogram of depth -> bases, computed from
+runs between the read starts and ends. Contigs are read through the index and
+tallied in parallel (one process per available cpu). No bam is written.
+"""
@@ -11,8 +11,8 @@ from janis_core import (
     Int,
     InputSelector,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_bioinformatics.data_types import CompressedVcf
 
 BWA_MEM_TUPLE = [
@@ -86,13 +86,13 @@ $normal_name $facets_file $sv_file $out_dir $manta_filter[optional]
         ]
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, BWA_MEM_TUPLE)
         if val:
             return val
         return 16
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, BWA_CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, BWA_CORES_TUPLE)
         if val:
             return val
         return 1
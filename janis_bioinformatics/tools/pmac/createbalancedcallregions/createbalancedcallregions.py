@@ -0,0 +1,193 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import janis_core as j
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+from janis_bioinformatics.data_types import FastaFai, Bed
+
+
+class CreateBalancedCallRegions(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        reference: FastaFai,
+        shards: Optional[int] = None,
+        regionSize: Optional[int] = None,
+        excludedRegions: Optional[Bed] = None,
+        minGapSize: int = 1,
+        prefix: str = "shard",
+    ) -> Dict[str, Any]:
+        """
+        Split the reference into shards (BED files) that contain a roughly equal amount
+        of callable (non-N) sequence. The reference is scanned once to find runs of N
+        (assembly gaps, centromeres, ...), which are left out of every shard, so shards
+        over gappy regions don't finish instantly while shards over dense regions
+        become stragglers.
+        :param reference: FASTA reference with .fai index
+        :param shards: number of shards to produce
+        :param regionSize: alternatively, the amount of callable sequence per shard
+        :param excludedRegions: BED of (known problematic) regions to leave out
+        :param minGapSize: runs of N shorter than this are kept inside shards
+        :param prefix: prefix of the output filenames ({prefix}_0001.bed, ...)
+        """
+        import re
+
+        if (shards is None) == (regionSize is None):
+            raise Exception("Exactly one of 'shards' or 'regionSize' must be specified")
+
+        n_run = re.compile(b"[Nn]+")
+        # number of sequence lines to decompress + scan at once
+        lines_per_block = 16384
+
+        def find_gaps(f, offset, length, linebases, linewidth):
+            """
+            Stream the contig in blocks of lines, and return the (0-based, half-open)
+            runs of N that are at least minGapSize long
+            """
+            gaps = []
+            run_start, run_end = None, None
+            pos = 0
+            block_bases = linebases * lines_per_block
+            while pos < length:
+                n_bases = min(block_bases, length - pos)
+                n_lines = -(-n_bases // linebases)
+                f.seek(offset + (pos // linebases) * linewidth)
+                block = f.read(n_lines * linewidth)
+                block = block.translate(None, b"\r\n")[:n_bases]
+
+                for m in n_run.finditer(block):
+                    start, end = pos + m.start(), pos + m.end()
+                    if run_end == start:
+                        # continues the run from the end of the previous block
+                        run_end = end
+                        continue
+                    if run_start is not None and run_end - run_start >= minGapSize:
+                        gaps.append((run_start, run_end))
+                    run_start, run_end = start, end
+
+                pos += n_bases
+
+            if run_start is not None and run_end - run_start >= minGapSize:
+                gaps.append((run_start, run_end))
+            return gaps
+
+        def subtract(start, end, excluded):
+            """
+            Subtract the (sorted, merged) excluded intervals from [start, end)
+            """
+            segments = []
+            for ex_start, ex_end in excluded:
+                if ex_end <= start:
+                    continue
+                if ex_start >= end:
+                    break
+                if ex_start > start:
+                    segments.append((start, ex_start))
+                start = max(start, ex_end)
+            if start < end:
+                segments.append((start, end))
+            return segments
+
+        def merge(intervals):
+            merged = []
+            for start, end in sorted(intervals):
+                if merged and start <= merged[-1][1]:
+                    merged[-1][1] = max(merged[-1][1], end)
+                else:
+                    merged.append([start, end])
+            return [tuple(i) for i in merged]
+
+        excluded = {}
+        if excludedRegions:
+            with open(excludedRegions) as f:
+                for line in f:
+                    if not line.strip() or line.startswith(("#", "track", "browser")):
+                        continue
+                    cols = line.split("\t")
+                    excluded.setdefault(cols[0], []).append(
+                        (int(cols[1]), int(cols[2]))
+                    )
+
+        # callable segments (contig, start, end) in reference order
+        segments = []
+        with open(f"{reference}.fai") as fai, open(reference, "rb") as fasta:
+            for line in fai:
+                cols = line.rstrip("\n").split("\t")
+                contig, length = cols[0], int(cols[1])
+                offset, linebases, linewidth = int(cols[2]), int(cols[3]), int(cols[4])
+
+                gaps = find_gaps(fasta, offset, length, linebases, linewidth)
+                to_remove = merge(gaps + excluded.get(contig, []))
+                segments.extend(
+                    (contig, start, end)
+                    for start, end in subtract(0, length, to_remove)
+                )
+
+        total = sum(end - start for _, start, end in segments)
+        if total == 0:
+            raise Exception(f"There was no callable sequence in {reference}")
+
+        if shards is None:
+            shards = max(-(-total // regionSize), 1)
+
+        # shard i ends once the running total of callable bases reaches
+        # total * i / shards, segments are cut at that base (which is never inside a
+        # gap, as gaps aren't part of any segment)
+        out_shards = []
+        current, cumulative, shard_idx = [], 0, 1
+
+        def write_shard():
+            out_shards.append(f"{prefix}_{len(out_shards) + 1:04d}.bed")
+            with open(out_shards[-1], "w") as f:
+                f.writelines(f"{c}\t{s}\t{e}\n" for c, s, e in current)
+
+        for contig, start, end in segments:
+            while start < end:
+                boundary = (total * shard_idx) // shards
+                take = min(end - start, boundary - cumulative)
+                if take > 0:
+                    current.append((contig, start, start + take))
+                    start += take
+                    cumulative += take
+                if cumulative >= boundary and shard_idx < shards:
+                    if current:
+                        write_shard()
+                    current, shard_idx = [], shard_idx + 1
+
+        if current:
+            write_shard()
+
+        return {"out_shards": out_shards}
+
+    def outputs(self) -> List[j.TOutput]:
+        return [
+            j.TOutput(
+                "out_shards",
+                j.Array(Bed),
+                doc=j.OutputDocumentation(
+                    "BED files, each with a roughly equal amount of callable sequence"
+                ),
+            )
+        ]
+
+    def id(self) -> str:
+        return "CreateBalancedCallRegions"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Create call regions balanced by callable sequence"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        meta: j.ToolMetadata = self.metadata
+
+        meta.contributors = ["Peter MacCallum Cancer Centre"]
+        meta.dateCreated = datetime(2026, 10, 18)
+        meta.dateUpdated = datetime(2026, 10, 18)
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+
+if __name__ == "__main__":
+    CreateBalancedCallRegions().translate("wdl")
@@ -0,0 +1,105 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import janis_core as j
+
+from janis_bioinformatics.data_types import Bed, Vcf
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class GatherChunkedVcfs(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        vcfs: List[Vcf], cores: List[Bed], outputFilename="gathered.vcf"
+    ) -> Dict[str, Any]:
+        """
+        Concatenate the VCFs called on the overlapping chunks of
+        SplitIntervalsIntoShards (with a maxSize), keeping each call only from the
+        chunk whose core contains its position, so a variant in the overlap of two
+        chunks is kept once, from the chunk with the most context around it.
+        :param vcfs: VCF of each shard, in the order of the shards
+        :param cores: the out_cores BED of each shard, in the same order
+        :param outputFilename: filename of the gathered (unsorted) VCF
+        """
+        from bisect import bisect_right
+
+        if not vcfs:
+            raise Exception("There were no VCFs to gather")
+        if len(vcfs) != len(cores):
+            raise Exception(
+                f"There are {len(cores)} core BEDs for the {len(vcfs)} VCFs, "
+                f"expected one for each"
+            )
+
+        def read_cores(path):
+            # contig -> sorted, merged (start, end) and the starts to bisect
+            intervals = {}
+            with open(path) as f:
+                for line in f:
+                    if not line.strip() or line.startswith(("#", "track", "browser")):
+                        continue
+                    contig, start, end = line.rstrip("\r\n").split("\t", 3)[:3]
+                    intervals.setdefault(contig, []).append((int(start), int(end)))
+            merged = {}
+            for contig, spans in intervals.items():
+                spans.sort()
+                contig_merged = [list(spans[0])]
+                for start, end in spans[1:]:
+                    if start <= contig_merged[-1][1]:
+                        contig_merged[-1][1] = max(contig_merged[-1][1], end)
+                    else:
+                        contig_merged.append([start, end])
+                merged[contig] = ([s for s, _ in contig_merged], contig_merged)
+            return merged
+
+        def in_cores(core_intervals, contig, pos):
+            if contig not in core_intervals:
+                return False
+            starts, spans = core_intervals[contig]
+            idx = bisect_right(starts, pos) - 1
+            return idx >= 0 and pos < spans[idx][1]
+
+        with open(outputFilename, "w") as out:
+            for idx, (vcf, core) in enumerate(zip(vcfs, cores)):
+                core_intervals = read_cores(core)
+                with open(vcf) as f:
+                    for line in f:
+                        if line.startswith("#"):
+                            # the header of the first VCF
+                            if idx == 0:
+                                out.write(line)
+                            continue
+                        if not line.strip():
+                            continue
+                        contig, pos, _ = line.split("\t", 2)
+                        # BED is 0-based, VCF 1-based
+                        if in_cores(core_intervals, contig, int(pos) - 1):
+                            out.write(line)
+
+        return {"out": outputFilename}
+
+    def outputs(self) -> List[j.TOutput]:
+        return [j.TOutput("out", Vcf)]
+
+    def id(self) -> str:
+        return "GatherChunkedVcfs"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Gather VCFs called on overlapping chunks"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        meta: j.ToolMetadata = self.metadata
+
+        meta.contributors = ["Peter MacCallum Cancer Centre"]
+        meta.dateCreated = datetime(2026, 10, 18)
+        meta.dateUpdated = datetime(2026, 10, 18)
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+
+if __name__ == "__main__":
+    GatherChunkedVcfs().translate("wdl")
@@ -0,0 +1,73 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import janis_core as j
+from janis_unix.data_types import TextFile
+
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+
+
+class GatherPileupSummaries(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        tables: List[TextFile], outputFilename="gathered.pileups.table"
+    ) -> Dict[str, Any]:
+        """
+        Concatenate the GetPileupSummaries tables of each shard (in interval order) into
+        one table for CalculateContamination. GATK's GatherPileupSummaries does the same,
+        but it needs the sequence dictionary as a separate file, which we don't have
+        without the reference.
+        :param tables: pileup tables of each shard, in interval order
+        :param outputFilename: filename of the gathered table
+        """
+        if not tables:
+            raise Exception("There were no pileup tables to gather")
+
+        header, sample = None, None
+        with open(outputFilename, "w") as out:
+            for table in tables:
+                with open(table) as f:
+                    lines = [next(f, ""), next(f, "")]
+                    # #<METADATA>SAMPLE=name, then the column names
+                    if not lines[0].startswith("#") or not lines[1].startswith(
+                        "contig"
+                    ):
+                        raise Exception(f"{table} isn't a GetPileupSummaries table")
+                    if header is None:
+                        header, sample = lines, lines[0]
+                        out.writelines(header)
+                    elif lines[0] != sample:
+                        raise Exception(
+                            f"{table} is from a different sample ({lines[0].strip()}) "
+                            f"than {tables[0]} ({sample.strip()})"
+                        )
+                    for line in f:
+                        out.write(line)
+
+        return {"out": outputFilename}
+
+    def outputs(self) -> List[j.TOutput]:
+        return [j.TOutput("out", TextFile)]
+
+    def id(self) -> str:
+        return "GatherPileupSummaries"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Gather pileup summaries"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        meta: j.ToolMetadata = self.metadata
+
+        meta.contributors = ["Peter MacCallum Cancer Centre"]
+        meta.dateCreated = datetime(2026, 10, 18)
+        meta.dateUpdated = datetime(2026, 10, 18)
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+
+if __name__ == "__main__":
+    GatherPileupSummaries().translate("wdl")
@@ -17,6 +17,7 @@ from janis_bioinformatics.tools.gatk4 import Gatk4CollectInsertSizeMetricsLatest
 from janis_bioinformatics.tools.pmac import (
     PerformanceSummaryLatest,
     GeneCoveragePerSampleLatest,
+    BamQc,
 )
 from janis_bioinformatics.tools.samtools import (
     SamToolsFlagstatLatest,
@@ -106,3 +107,57 @@ class PerformanceSummaryGenome_0_1_0(BioinformaticsWorkflow):
                 ),
             )
         ]
+
+
+class PerformanceSummaryGenome_0_2_0(PerformanceSummaryGenome_0_1_0):
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.2.0",
+            contributors=["Jiaan Yu", "Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2020, 4, 28),
+            dateUpdated=datetime(2026, 10, 18),
+        )
+
+    def constructor(self):
+
+        # Inputs
+        self.input("bam", BamBai)
+        # Pending to multiple outputs with same prefix
+        self.input("sample_name", String)
+        self.input("genome_file", TextFile)
+
+        # Steps - Performance Summary, from one pass over the bam
+        self.step("bamqc", BamQc(bam=self.bam, genomeFile=self.genome_file))
+        self.step(
+            "performancesummary",
+            PerformanceSummaryLatest(
+                flagstat=self.bamqc.flagstat,
+                collectInsertSizeMetrics=self.bamqc.insertSizeMetrics,
+                coverage=self.bamqc.coverage,
+                rmdupFlagstat=self.bamqc.rmdupFlagstat,
+                genome=True,
+                outputPrefix=self.sample_name,
+            ),
+        )
+
+        self.output("performanceSummaryOut", source=self.performancesummary.out)
+
+    def tests(self):
+        remote_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics/wgsgermline_data"
+        return [
+            TTestCase(
+                name="basic",
+                input={
+                    "bam": f"{remote_dir}/NA12878-BRCA1.markduped.bam",
+                    "genome_file": f"{remote_dir}/NA12878-BRCA1.genome_file.txt",
+                    "sample_name": "NA12878-BRCA1",
+                },
+                output=TextFile.basic_test(
+                    tag="performanceSummaryOut",
+                    min_size=948,
+                    line_count=2,
+                    md5="575354942cfb8d0367725f9020181443",
+                    expected_file_path=f"{remote_dir}/NA12878-BRCA1_performance_summary.csv",
+                ),
+            )
+        ]
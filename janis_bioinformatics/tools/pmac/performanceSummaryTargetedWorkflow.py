@@ -14,6 +14,7 @@ from janis_bioinformatics.tools.gatk4 import Gatk4CollectInsertSizeMetrics_4_1_2
 from janis_bioinformatics.tools.pmac import (
     PerformanceSummaryLatest,
     GeneCoveragePerSampleLatest,
+    BamQc,
 )
 from janis_bioinformatics.tools.samtools import (
     SamToolsFlagstat_1_9,
@@ -129,3 +130,60 @@ class PerformanceSummaryTargeted_0_1_0(BioinformaticsWorkflow):
         self.output("out", source=self.performancesummary.out)
         self.output("geneFileOut", source=self.genecoverage.geneFileOut)
         self.output("regionFileOut", source=self.genecoverage.regionFileOut)
+
+
+class PerformanceSummaryTargeted_0_2_0(PerformanceSummaryTargeted_0_1_0):
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            version="v0.2.0",
+            contributors=["Jiaan Yu", "Peter MacCallum Cancer Centre"],
+            dateCreated=datetime(2020, 4, 28),
+            dateUpdated=datetime(2026, 10, 18),
+        )
+
+    def constructor(self):
+
+        # Inputs
+        self.input("bam", BamBai)
+        self.input("genecoverage_bed", Bed)
+        self.input("region_bed", Bed)
+        self.input("sample_name", String)
+        self.input("genome_file", TextFile)
+        # Steps
+        # One pass over the bam, without the secondary alignments (0x100)
+        self.step(
+            "bamqc",
+            BamQc(
+                bam=self.bam,
+                genomeFile=self.genome_file,
+                regionBed=self.region_bed,
+                geneCoverageBed=self.genecoverage_bed,
+                excludeFlags=0x100,
+            ),
+        )
+        # Give all the output files to performance summary script
+        self.step(
+            "performancesummary",
+            PerformanceSummaryLatest(
+                flagstat=self.bamqc.flagstat,
+                collectInsertSizeMetrics=self.bamqc.insertSizeMetrics,
+                targetFlagstat=self.bamqc.targetFlagstat,
+                coverage=self.bamqc.coverage,
+                rmdupFlagstat=self.bamqc.rmdupFlagstat,
+                outputPrefix=self.sample_name,
+            ),
+        )
+
+        # Steps - Gene Coverage
+        self.step(
+            "genecoverage",
+            GeneCoveragePerSampleLatest(
+                sampleName=self.sample_name,
+                bedtoolsOutputPath=self.bamqc.geneCoverage,
+            ),
+        )
+
+        # Outputs
+        self.output("out", source=self.performancesummary.out)
+        self.output("geneFileOut", source=self.genecoverage.geneFileOut)
+        self.output("regionFileOut", source=self.genecoverage.regionFileOut)
@@ -0,0 +1,221 @@
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+import janis_core as j
+from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsPythonTool
+from janis_bioinformatics.data_types import Bed
+
+
+class SplitIntervalsIntoShards(BioinformaticsPythonTool):
+    @staticmethod
+    def code_block(
+        intervals: Bed,
+        shards: int,
+        minGap: int = 0,
+        maxSize: Optional[int] = None,
+        overlap: int = 0,
+        prefix="shard",
+    ) -> Dict[str, Any]:
+        """
+        Split a BED file into (at most) 'shards' BED files that cover a roughly equal
+        number of bases (the largest shard is as small as possible), to scatter a
+        caller over. Intervals are kept in their original order (sorted within each
+        contig with a minGap) and are never cut (unless maxSize is given), so the
+        results of each shard can be gathered in order.
+        :param intervals: BED file to split
+        :param shards: number of shards to produce, there are fewer shards if the BED
+            contains fewer intervals than this
+        :param minGap: only split between intervals that are on different contigs or
+            at least this many bases apart, so that no read overlaps two shards (eg:
+            for tools that output the reads, like ApplyBQSR). The intervals of each
+            contig are sorted, so the gathered reads are too.
+        :param maxSize: cut intervals longer than this into chunks of maxSize bases,
+            each extended by 'overlap' bases into the next chunk, to bound the size of
+            the regions a caller works on (eg: VarDict). Variants in the overlaps can
+            be called twice, so the core of each chunk (without the overlap) is also
+            written ({prefix}_0001.core.bed, ...) to keep only the calls of the chunk
+            whose core contains them (see GatherChunkedVcfs).
+        :param overlap: bases of overlap between the chunks of an interval, to call
+            indels spanning the chunk boundaries
+        :param prefix: prefix of the output filenames ({prefix}_0001.bed, ...)
+        """
+        if shards < 1:
+            raise Exception(f"shards ({shards}) must be at least 1")
+        if maxSize is not None and not 0 <= overlap < maxSize:
+            raise Exception(
+                f"overlap ({overlap}) must be less than maxSize ({maxSize})"
+            )
+
+        def chunks(start, end):
+            # (start, end, end of the core), the last chunk's core runs to its end
+            if maxSize is None or end - start <= maxSize + overlap:
+                return [(start, end, end)]
+            pieces = []
+            while True:
+                chunk_end = min(start + maxSize + overlap, end)
+                if chunk_end >= end:
+                    pieces.append((start, end, end))
+                    return pieces
+                pieces.append((start, chunk_end, start + maxSize))
+                start += maxSize
+
+        lines, cores, lengths, spans = [], [], [], []
+        with open(intervals) as f:
+            for line in f:
+                if not line.strip() or line.startswith(("#", "track", "browser")):
+                    continue
+                cols = line.rstrip("\r\n").split("\t", 3)
+                for start, end, core_end in chunks(int(cols[1]), int(cols[2])):
+                    for out, stop in ((lines, end), (cores, core_end)):
+                        out.append(
+                            "\t".join([cols[0], str(start), str(stop), *cols[3:]])
+                            + "\n"
+                        )
+                    lengths.append(max(end - start, 0))
+                    spans.append((cols[0], start, end))
+
+        if not lines:
+            raise Exception(f"There were no intervals in {intervals}")
+
+        if minGap > 0:
+            # the shards are gathered in order (eg: GatherBamFiles), so sort the
+            # intervals of each contig, the contigs have to be in the reference order
+            rank = {}
+            for idx, (contig, _, _) in enumerate(spans):
+                if contig in rank and spans[idx - 1][0] != contig:
+                    raise Exception(
+                        f"The intervals of {contig} aren't together in {intervals}, "
+                        f"sort it in the order of the reference"
+                    )
+                rank.setdefault(contig, len(rank))
+            order = sorted(
+                range(len(lines)),
+                key=lambda i: (rank[spans[i][0]], spans[i][1], spans[i][2]),
+            )
+            lines, cores, lengths, spans = (
+                [x[i] for i in order] for x in (lines, cores, lengths, spans)
+            )
+
+        n_shards = min(shards, len(lines))
+
+        # the furthest end so far on the contig, an earlier interval can reach past
+        # the later (shorter) ones, eg: 0-10000 then 100-200 and 5000-6000
+        reach = []
+        for idx, (contig, _, end) in enumerate(spans):
+            if idx > 0 and spans[idx - 1][0] == contig:
+                end = max(end, reach[-1])
+            reach.append(end)
+
+        def can_split_after(idx):
+            contig = spans[idx][0]
+            next_contig, next_start, _ = spans[idx + 1]
+            return contig != next_contig or next_start - reach[idx] >= minGap
+
+        # the intervals between two places we're allowed to split are kept together
+        blocks, block_start = [], 0
+        for idx in range(len(lines)):
+            if idx == len(lines) - 1 or minGap <= 0 or can_split_after(idx):
+                blocks.append(
+                    (block_start, idx + 1, sum(lengths[block_start : idx + 1]))
+                )
+                block_start = idx + 1
+
+        def pack(capacity):
+            # greedily fill each shard up to capacity, returns the first block of each
+            firsts, size = [0], 0
+            for idx, (_, _, length) in enumerate(blocks):
+                if size + length > capacity and size > 0:
+                    firsts.append(idx)
+                    size = 0
+                size += length
+            return firsts
+
+        # binary search the smallest capacity (the largest shard) that fits the blocks
+        # into n_shards, then split the largest shards (at the most even point) until
+        # there are n_shards, which never makes the largest shard bigger
+        low, high = max(b[2] for b in blocks), sum(b[2] for b in blocks)
+        while low < high:
+            mid = (low + high) // 2
+            if len(pack(mid)) <= n_shards:
+                high = mid
+            else:
+                low = mid + 1
+        firsts = pack(low)
+        parts = [(a, b) for a, b in zip(firsts, [*firsts[1:], len(blocks)])]
+
+        cumulative = [0]
+        for _, _, length in blocks:
+            cumulative.append(cumulative[-1] + length)
+
+        def part_length(part):
+            return cumulative[part[1]] - cumulative[part[0]]
+
+        while len(parts) < n_shards:
+            splittable = [p for p in parts if p[1] - p[0] > 1]
+            if not splittable:
+                break
+            part = max(splittable, key=lambda p: (part_length(p), p[1] - p[0]))
+            a, b = part
+            cut = min(
+                range(a + 1, b),
+                key=lambda c: (
+                    max(part_length((a, c)), part_length((c, b))),
+                    abs((c - a) - (b - c)),
+                ),
+            )
+            idx = parts.index(part)
+            parts[idx : idx + 1] = [(a, cut), (cut, b)]
+
+        boundaries = [blocks[a][0] for a, _ in parts[1:]]
+
+        out_shards, out_cores = [], []
+        starts = [0, *boundaries]
+        ends = [*boundaries, len(lines)]
+        for idx, (start, end) in enumerate(zip(starts, ends)):
+            out_shards.append(f"{prefix}_{idx + 1:04d}.bed")
+            with open(out_shards[-1], "w") as f:
+                f.writelines(lines[start:end])
+            if maxSize is not None:
+                out_cores.append(f"{prefix}_{idx + 1:04d}.core.bed")
+                with open(out_cores[-1], "w") as f:
+                    f.writelines(cores[start:end])
+
+        if maxSize is None:
+            return {"out_shards": out_shards}
+        return {"out_shards": out_shards, "out_cores": out_cores}
+
+    def outputs(self) -> List[j.TOutput]:
+        return [
+            j.TOutput("out_shards", j.Array(Bed)),
+            j.TOutput(
+                "out_cores",
+                j.Array(Bed, optional=True),
+                doc=j.OutputDocumentation(
+                    "With a maxSize, the core of each chunk (without the overlap into "
+                    "the next chunk) of each shard"
+                ),
+            ),
+        ]
+
+    def id(self) -> str:
+        return "SplitIntervalsIntoShards"
+
+    def friendly_name(self) -> Optional[str]:
+        return "Split intervals into balanced shards"
+
+    def version(self):
+        return "v0.1.0"
+
+    def bind_metadata(self):
+        meta: j.ToolMetadata = self.metadata
+
+        meta.contributors = ["Peter MacCallum Cancer Centre"]
+        meta.dateCreated = datetime(2026, 10, 18)
+        meta.dateUpdated = datetime(2026, 10, 18)
+
+    def tool_provider(self):
+        return "Peter MacCallum Cancer Centre"
+
+
+if __name__ == "__main__":
+    SplitIntervalsIntoShards().translate("wdl")
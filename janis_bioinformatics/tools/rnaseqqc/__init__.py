@@ -1 +1,9 @@
-from .versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "base": ["RNASeqQCBase"],
+        "versions": ["RNASeqQC_2_3_5"],
+    },
+)
@@ -11,8 +11,8 @@ from janis_core import (
     StringFormatter,
     ToolOutput,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
 )
+from janis_bioinformatics.resources import resource_for_hints
 from janis_unix import Tsv
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
 from janis_bioinformatics.data_types import BamBai, Bed, Fasta
@@ -159,13 +159,13 @@ class RNASeqQCBase(BioinformaticsTool):
         )
 
     def memory(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 4
 
     def cpus(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 1
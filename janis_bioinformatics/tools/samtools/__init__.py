@@ -1,13 +1,29 @@
-from .flagstat.flagstat import (
-    SamToolsFlagstat_1_7,
-    SamToolsFlagstat_1_9,
-    SamToolsFlagstatLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "flagstat.flagstat": [
+            "SamToolsFlagstat_1_7",
+            "SamToolsFlagstat_1_9",
+            "SamToolsFlagstatLatest",
+        ],
+        "mpileup.versions": [
+            "SamToolsMpileup_1_7",
+            "SamToolsMpileup_1_9",
+            "SamToolsMpileupLatest",
+        ],
+        "sort.sort": ["SamToolsSort_1_7", "SamToolsSort_1_9", "SamToolsSortLatest"],
+        "view.view": ["SamToolsView_1_7", "SamToolsView_1_9", "SamToolsViewLatest"],
+        "index.versions": [
+            "SamToolsIndex_1_7",
+            "SamToolsIndex_1_9",
+            "SamToolsIndexLatest",
+        ],
+        "faidx.versions": [
+            "SamToolsFaidx_1_7",
+            "SamToolsFaidx_1_9",
+            "SamToolsFaidxLatest",
+        ],
+    },
 )
-from .mpileup.versions import (
-    SamToolsMpileup_1_7,
-    SamToolsMpileup_1_9,
-    SamToolsMpileupLatest,
-)
-from .sort.sort import SamToolsSort_1_7, SamToolsSort_1_9, SamToolsSortLatest
-from .view.view import SamToolsView_1_7, SamToolsView_1_9, SamToolsViewLatest
-from .index.versions import SamToolsIndex_1_7, SamToolsIndex_1_9, SamToolsIndexLatest
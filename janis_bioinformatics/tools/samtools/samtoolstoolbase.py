@@ -1,9 +1,13 @@
 from abc import ABC, abstractmethod
 
 from janis_bioinformatics.tools import BioinformaticsTool
+from janis_bioinformatics.resources import IoProfile
 
 
 class SamToolsToolBase(BioinformaticsTool, ABC):
+    # bam in + bam out, and sort spills for the commands that sort
+    io_profile = IoProfile(disk_per_gb=2.5, disk_overhead=10, seconds_per_gb=60)
+
     def tool_provider(self):
         return "Samtools"
 
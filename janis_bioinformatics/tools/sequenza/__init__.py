@@ -1,10 +1,17 @@
-from .bam2seqz.versions import (
-    SequenzaBam2Seqz_2_2_0_9000,
-    SequenzaBam2Seqz_3_0_0,
-    SequenzaBam2SeqzLatest,
-)
-from .seqz_binning.versions import (
-    SequenzaBinning_2_2_0_9000,
-    SequenzaBinning_3_0_0,
-    SequenzaBinningLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "bam2seqz.versions": [
+            "SequenzaBam2Seqz_2_2_0_9000",
+            "SequenzaBam2Seqz_3_0_0",
+            "SequenzaBam2SeqzLatest",
+        ],
+        "seqz_binning.versions": [
+            "SequenzaBinning_2_2_0_9000",
+            "SequenzaBinning_3_0_0",
+            "SequenzaBinningLatest",
+        ],
+    },
 )
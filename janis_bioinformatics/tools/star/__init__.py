@@ -1 +1,38 @@
-from .versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "alignreads": ["StarAlignReadsBase"],
+        "alignreadsbatch": ["StarAlignReadsBatchBase"],
+        "generateindexesbase": ["StarGenerateIndexesBase"],
+        "inputalignmentsfrombam": ["StarInputAlignmentsFromBamBase"],
+        "liftover": ["StarLiftOverBase"],
+        "versions": [
+            "Star_2_5_3",
+            "Star_2_7_1",
+            "Star_2_7_5",
+            "Star_2_7_8",
+            "StarAlignReads_2_5_3",
+            "StarAlignReads_2_7_1",
+            "StarAlignReads_2_7_5",
+            "StarAlignReads_2_7_8",
+            "StarAlignReadsBatch_2_5_3",
+            "StarAlignReadsBatch_2_7_1",
+            "StarAlignReadsBatch_2_7_5",
+            "StarAlignReadsBatch_2_7_8",
+            "StarGenerateIndexes_2_5_3",
+            "StarGenerateIndexes_2_7_1",
+            "StarGenerateIndexes_2_7_5",
+            "StarGenerateIndexes_2_7_8",
+            "StarLiftOver_2_5_3",
+            "StarLiftOver_2_7_1",
+            "StarLiftOver_2_7_5",
+            "StarLiftOver_2_7_8",
+            "StarInputAlignmentsFromBam_2_5_3",
+            "StarInputAlignmentsFromBam_2_7_1",
+            "StarInputAlignmentsFromBam_2_7_5",
+            "StarInputAlignmentsFromBam_2_7_8",
+        ],
+    },
+)
@@ -4,6 +4,7 @@ from typing import List
 from janis_core import File, ToolOutput, InputSelector, WildcardSelector
 
 from janis_bioinformatics.data_types import Bam, Sam
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.tools.star.base import StarBase
 
@@ -13,9 +14,15 @@ class StarAlignReadsBase(StarBase, ABC):
         return "alignReads"
 
     def memory(self, hints):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 64
 
     def cpus(self, hints):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 4
 
     def outputs(self) -> List[ToolOutput]:
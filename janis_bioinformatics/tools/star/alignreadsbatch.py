@@ -0,0 +1,220 @@
+from abc import ABC
+from copy import copy
+from datetime import date
+from typing import Any, Dict, List
+
+from janis_core import (
+    Array,
+    CaptureType,
+    Directory,
+    File,
+    InputSelector,
+    String,
+    StringFormatter,
+    ToolArgument,
+    ToolInput,
+    ToolOutput,
+    WildcardSelector,
+)
+from janis_core.operators.standard import JoinOperator
+
+from janis_bioinformatics.data_types import Bam, FastqGz
+from janis_bioinformatics.resources import resource_for_hints
+from janis_bioinformatics.tools.star.alignreads import StarAlignReadsBase
+
+# the genome index, loaded into shared memory once for the batch: a single chromosome
+# or the whole human (GRCh38) genome
+GENOME_MEMORY_GB = 32
+# STAR's own buffers for the sample being mapped (the samples run one at a time),
+# a sorted bam also needs --limitBAMsortRAM on top of this
+SAMPLE_MEMORY_GB = 4
+# the genome once plus a sample
+STAR_BATCH_MEM_TUPLE = [
+    (CaptureType.key(), {CaptureType.CHROMOSOME: 4 + SAMPLE_MEMORY_GB}),
+]
+STAR_BATCH_CORES_TUPLE = [
+    (CaptureType.key(), {CaptureType.TARGETED: 4, CaptureType.CHROMOSOME: 4}),
+]
+
+# set by the batch around each STAR call, instead of per sample inputs
+BATCH_INPUTS = {
+    "genomeDir",
+    "genomeLoad",
+    "outputGenomeDir",
+    "readFilesIn",
+    "outFileNamePrefix",
+}
+
+
+class StarAlignReadsBatchBase(StarAlignReadsBase, ABC):
+    def tool(self):
+        return "star_alignReadsBatch"
+
+    def friendly_name(self):
+        return "STAR Aligner (batch, shared genome)"
+
+    def base_command(self):
+        return None
+
+    def memory(self, hints: Dict[str, Any]):
+        # the genome is held once, and the samples are mapped one after the other
+        val = resource_for_hints(self, "memory", hints, STAR_BATCH_MEM_TUPLE)
+        if val:
+            return val
+        return GENOME_MEMORY_GB + SAMPLE_MEMORY_GB
+
+    def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints, STAR_BATCH_CORES_TUPLE)
+        if val:
+            return val
+        return 8
+
+    def arguments(self):
+        genome_dir = InputSelector("genomeDir")
+        return [
+            # remove the genome from shared memory however the batch finishes
+            ToolArgument(
+                StringFormatter(
+                    "trap 'STAR --genomeDir {genome_dir} --genomeLoad Remove "
+                    "--outFileNamePrefix genome_remove. > /dev/null' EXIT;",
+                    genome_dir=genome_dir,
+                ),
+                position=0,
+                shell_quote=False,
+            ),
+            ToolArgument(
+                StringFormatter(
+                    "STAR --genomeDir {genome_dir} --genomeLoad LoadAndExit "
+                    "--outFileNamePrefix genome_load. || exit 1;",
+                    genome_dir=genome_dir,
+                ),
+                position=1,
+                shell_quote=False,
+            ),
+            # the reads as R1 R2 R1 R2 ..., consumed two at a time by the (POSIX sh)
+            # loop over the sample names. The loop uses backticks and expr rather than
+            # $(...) and $((...)), which CWL would evaluate as javascript.
+            ToolArgument(
+                StringFormatter(
+                    "set -- {reads}; i=0;",
+                    reads=JoinOperator(InputSelector("reads"), " "),
+                ),
+                position=2,
+                shell_quote=False,
+            ),
+            ToolArgument("for name in", position=3, shell_quote=False),
+            ToolArgument(
+                '; do [ $# -ge 2 ] || { echo "No reads for $name" >&2; exit 1; }; '
+                "STAR --runMode alignReads --genomeLoad LoadAndKeep",
+                position=5,
+                shell_quote=False,
+            ),
+            ToolArgument(genome_dir, prefix="--genomeDir", position=6),
+            ToolArgument(
+                '--readFilesIn "$1" "$2" '
+                "--outFileNamePrefix \"star_`printf '%04d' $i`.$name.\"",
+                position=7,
+                shell_quote=False,
+            ),
+            ToolArgument(
+                "|| exit 1; shift 2; i=`expr $i + 1`; done",
+                position=9,
+                shell_quote=False,
+            ),
+        ]
+
+    def inputs(self) -> List[ToolInput]:
+        # the STAR options are the same for every sample, so they're inside the loop
+        options = []
+        for inp in super().inputs():
+            if inp.id() in BATCH_INPUTS:
+                continue
+            option = copy(inp)
+            option.position = 8
+            options.append(option)
+
+        return [
+            ToolInput(
+                "sampleNames",
+                Array(String()),
+                position=4,
+                doc="Name of each sample, the outputs are prefixed with "
+                "star_{index}.{name}.",
+            ),
+            ToolInput(
+                "reads",
+                Array(FastqGz()),
+                doc="The R1 and R2 of each sample in turn (eg: the flattened paired "
+                "end reads), in the same order as the sampleNames",
+            ),
+            ToolInput(
+                "genomeDir",
+                Directory(),
+                doc="path to the directory where genome files are stored, it's "
+                "loaded into shared memory once for all of the samples",
+            ),
+            *options,
+        ]
+
+    def outputs(self) -> List[ToolOutput]:
+        # star_{index}. keeps the globbed files in the order of the samples
+        return [
+            ToolOutput(
+                "out_unsorted_bam",
+                Array(Bam(), optional=True),
+                glob=WildcardSelector("star_*.Aligned.out.bam"),
+            ),
+            ToolOutput(
+                "out_sorted_bam",
+                Array(Bam(), optional=True),
+                glob=WildcardSelector("star_*.Aligned.sortedByCoord.out.bam"),
+            ),
+            ToolOutput(
+                "out_chimeric_out_junction",
+                Array(File(), optional=True),
+                glob=WildcardSelector("star_*.Chimeric.out.junction"),
+            ),
+            ToolOutput(
+                "out_gene_counts",
+                Array(File(), optional=True),
+                glob=WildcardSelector("star_*.ReadsPerGene.out.tab"),
+            ),
+            ToolOutput(
+                "SJ_out_tab",
+                Array(File()),
+                glob=WildcardSelector("star_*.SJ.out.tab"),
+            ),
+            ToolOutput(
+                "Log_final_out",
+                Array(File()),
+                glob=WildcardSelector("star_*.Log.final.out"),
+                doc="summary mapping statistics of each sample",
+            ),
+        ]
+
+    def bind_metadata(self):
+        metadata = super().bind_metadata()
+        metadata.contributors = [
+            *metadata.contributors,
+            "Peter MacCallum Cancer Centre",
+        ]
+        metadata.dateUpdated = date(2026, 10, 18)
+        metadata.documentation = """\
+Align a batch of samples with STAR on one node, loading the genome index into shared
+memory once instead of once per sample:
+
+    STAR --genomeDir $genomeDir --genomeLoad LoadAndExit
+    for each sample:
+        STAR --genomeLoad LoadAndKeep --genomeDir $genomeDir \\
+            --readFilesIn $R1 $R2 --outFileNamePrefix star_{index}.{name}. [options]
+    STAR --genomeDir $genomeDir --genomeLoad Remove (also if a sample fails)
+
+The reads are the R1 and R2 of each sample in turn, eg: the flattened pairedOut of a
+scattered Trimmomatic. The memory is sized for the genome once (a single chromosome
+with the CHROMOSOME captureType) plus one sample's buffers, as the samples are mapped
+one after the other. A sorted bam (outSAMtype BAM SortedByCoordinate) needs
+limitBAMsortRAM, as STAR can't use the genome size with a shared genome. The genome
+is held in System V shared memory, so a container needs --ipc=host (or a big enough
+kernel.shmmax / shmall).
+"""
+        return metadata
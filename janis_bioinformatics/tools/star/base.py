@@ -24,9 +24,13 @@ from janis_bioinformatics.data_types import (
     FastqGzPair,
 )
 from janis_bioinformatics.tools import BioinformaticsTool
+from janis_bioinformatics.resources import IoProfile, resource_for_hints
 
 
 class StarBase(BioinformaticsTool, ABC):
+    # fastqs in, the unsorted + sorted bam and temp files, and the genome index
+    io_profile = IoProfile(disk_per_gb=4.0, disk_overhead=40, seconds_per_gb=300)
+
     @abstractmethod
     def run_mode(self):
         """
@@ -53,9 +57,15 @@ class StarBase(BioinformaticsTool, ABC):
 
     # Need a better way to specify memory
     def memory(self, hints):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 32
 
     def cpus(self, hints):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 4
 
     def arguments(self):
@@ -14,11 +14,11 @@ from janis_core import (
     CpuSelector,
     Directory,
     Array,
-    get_value_for_hints_and_ordered_resource_tuple,
     CaptureType,
     WildcardSelector,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import IoProfile, resource_for_hints
 
 from janis_bioinformatics.data_types import Bam, FastqGz
 
@@ -54,6 +54,9 @@ CORES_TUPLE = [
 
 
 class StarAlignerBase(BioinformaticsTool, ABC):
+    # fastqs in, the unsorted + sorted bam and temp files, and the genome index
+    io_profile = IoProfile(disk_per_gb=4.0, disk_overhead=40, seconds_per_gb=300)
+
     def tool(self):
         return "star_aligner"
 
@@ -68,13 +71,13 @@ class StarAlignerBase(BioinformaticsTool, ABC):
 
     # Need a better way to specify memory
     def memory(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 32
 
     def cpus(self, hints):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
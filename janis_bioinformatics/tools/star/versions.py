@@ -1,4 +1,5 @@
 from janis_bioinformatics.tools.star.alignreads import StarAlignReadsBase
+from janis_bioinformatics.tools.star.alignreadsbatch import StarAlignReadsBatchBase
 from janis_bioinformatics.tools.star.generateindexesbase import StarGenerateIndexesBase
 from janis_bioinformatics.tools.star.liftover import StarLiftOverBase
 from janis_bioinformatics.tools.star.inputalignmentsfrombam import (
@@ -54,6 +55,22 @@ class StarAlignReads_2_7_8(Star_2_7_8, StarAlignReadsBase):
     pass
 
 
+class StarAlignReadsBatch_2_5_3(Star_2_5_3, StarAlignReadsBatchBase):
+    pass
+
+
+class StarAlignReadsBatch_2_7_1(Star_2_7_1, StarAlignReadsBatchBase):
+    pass
+
+
+class StarAlignReadsBatch_2_7_5(Star_2_7_5, StarAlignReadsBatchBase):
+    pass
+
+
+class StarAlignReadsBatch_2_7_8(Star_2_7_8, StarAlignReadsBatchBase):
+    pass
+
+
 class StarGenerateIndexes_2_5_3(Star_2_5_3, StarGenerateIndexesBase):
     pass
 
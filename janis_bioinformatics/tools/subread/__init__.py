@@ -1 +1,8 @@
-from .featurecounts.versions import FeatureCounts_2_0_1, FeatureCountsLatest
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "featurecounts.versions": ["FeatureCounts_2_0_1", "FeatureCountsLatest"],
+    },
+)
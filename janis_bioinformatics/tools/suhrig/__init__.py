@@ -1 +1,8 @@
-from .arriba.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "arriba.versions": ["ArribaBase", "Arriba_1_1_0", "Arriba_1_2_0"],
+    },
+)
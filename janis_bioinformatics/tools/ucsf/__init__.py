@@ -1 +1,8 @@
-from .cnvkit.cnvkit_0_9_6 import CNVKit_0_9_6, CNVKitLatest
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "cnvkit.cnvkit_0_9_6": ["CNVKit_0_9_6", "CNVKitLatest"],
+    },
+)
@@ -1 +1,16 @@
-from .trimmomatic.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "trimmomatic.versions": [
+            "TrimmomaticSingleEndBase",
+            "TrimmomaticPairedEndBase",
+            "Trimmomatic_0_35",
+            "TrimmomaticSingleEnd_0_35",
+            "TrimmomaticPairedEnd_0_35",
+            "TrimmomaticSingleEndLatest",
+            "TrimmomaticPairedEndLatest",
+        ],
+    },
+)
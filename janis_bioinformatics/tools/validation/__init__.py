@@ -1 +1,8 @@
-from .performancevalidator import PerformanceValidator_1_2_1
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "performancevalidator": ["PerformanceValidator_1_2_1"],
+    },
+)
@@ -14,9 +14,9 @@ from janis_core import (
     String,
     InputSelector,
     CaptureType,
-    get_value_for_hints_and_ordered_resource_tuple,
     ToolMetadata,
 )
+from janis_bioinformatics.resources import resource_for_hints
 
 from janis_bioinformatics.data_types import BamBai, Bed, FastaFai, Vcf
 from janis_bioinformatics.tools import BioinformaticsTool
@@ -72,13 +72,13 @@ class VarDictGermlineBase(BioinformaticsTool, ABC):
         return "VarDict"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
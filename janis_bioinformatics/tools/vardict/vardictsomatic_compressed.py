@@ -16,7 +16,7 @@ from janis_core import (
     CaptureType,
     ToolMetadata,
 )
-from janis_core import get_value_for_hints_and_ordered_resource_tuple
+from janis_bioinformatics.resources import resource_for_hints
 from janis_core.operators.standard import JoinOperator
 
 from janis_bioinformatics.data_types import BamBai, Bed, FastaFai, Vcf, CompressedVcf
@@ -66,13 +66,13 @@ class VarDictSomaticCompressedBase(BioinformaticsTool, ABC):
         return "VarDict"
 
     def cpus(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, CORES_TUPLE)
+        val = resource_for_hints(self, "cpus", hints, CORES_TUPLE)
         if val:
             return val
         return 4
 
     def memory(self, hints: Dict[str, Any]):
-        val = get_value_for_hints_and_ordered_resource_tuple(hints, MEM_TUPLE)
+        val = resource_for_hints(self, "memory", hints, MEM_TUPLE)
         if val:
             return val
         return 8
@@ -1,6 +1,30 @@
-from .illuminagermline_strelka import IlluminaGermlineVariantCaller
-from .illuminasomatic_strelka import IlluminaSomaticVariantCaller
-from .vardictgermline_variants import VardictGermlineVariantCaller
-from .gridssgermline import GridssGermlineVariantCaller
-from .vardictsomatic_variants import VardictSomaticVariantCaller
-from .gatk import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "illuminagermline_strelka": ["IlluminaGermlineVariantCaller"],
+        "illuminasomatic_strelka": ["IlluminaSomaticVariantCaller"],
+        "vardictgermline_variants": [
+            "VardictGermlineVariantCaller",
+            "VardictGermlineVariantCaller_0_2_0",
+        ],
+        "gridssgermline": ["GridssGermlineVariantCaller"],
+        "vardictsomatic_variants": [
+            "VardictSomaticVariantCaller",
+            "VardictSomaticVariantCaller_0_2_0",
+        ],
+        "gatk": [
+            "GatkGermlineVariantCaller_4_0_12",
+            "GatkGermlineVariantCaller_4_1_3",
+            "GatkGermlineVariantCaller_4_1_3_0_1",
+            "GatkGermlineVariantCallerScattered_4_1_3",
+            "GatkSomaticVariantCaller_4_0_12",
+            "GatkSomaticVariantCaller_4_1_3",
+            "GatkSomaticVariantCaller_4_1_3_0_1",
+            "GatkSomaticVariantCallerScattered_4_1_3",
+            "GatkSomaticVariantCallerPairedTargeted",
+            "GatkSomaticVariantCallerTumorOnlyTargeted",
+        ],
+    },
+)
@@ -1,6 +1,18 @@
 from .gatkgermline_variants_4_0_12 import GatkGermlineVariantCaller_4_0_12
-from .gatkgermline_variants_4_1_3 import GatkGermlineVariantCaller_4_1_3
+from .gatkgermline_variants_4_1_3 import (
+    GatkGermlineVariantCaller_4_1_3,
+    GatkGermlineVariantCaller_4_1_3_0_1,
+)
+from .gatkgermline_variants_scattered_4_1_3 import (
+    GatkGermlineVariantCallerScattered_4_1_3,
+)
 from .gatksomatic_variants_4_0_12 import GatkSomaticVariantCaller_4_0_12
-from .gatksomatic_variants_4_1_3 import GatkSomaticVariantCaller_4_1_3
+from .gatksomatic_variants_4_1_3 import (
+    GatkSomaticVariantCaller_4_1_3,
+    GatkSomaticVariantCaller_4_1_3_0_1,
+)
+from .gatksomatic_variants_scattered_4_1_3 import (
+    GatkSomaticVariantCallerScattered_4_1_3,
+)
 from .gatksomatic_variants_paired import GatkSomaticVariantCallerPairedTargeted
 from .gatksomatic_variants_single import GatkSomaticVariantCallerTumorOnlyTargeted
@@ -0,0 +1,167 @@
+from datetime import date
+
+from janis_core import Array, Int
+from janis_core.tool.test_classes import TTestCase
+
+from janis_bioinformatics.tools import gatk4
+from janis_bioinformatics.data_types import (
+    FastaWithDict,
+    BamBai,
+    VcfTabix,
+    Bed,
+    Vcf,
+    CompressedVcf,
+)
+from janis_bioinformatics.tools.bcftools import BcfToolsIndex_1_9
+from janis_bioinformatics.tools.common import SplitMultiAllele
+from janis_bioinformatics.tools.htslib import BGZip_1_9
+from janis_bioinformatics.tools.pmac import SplitIntervalsIntoShards
+from janis_bioinformatics.tools.variantcallers.gatk.gatkgermline_variants_4_1_3 import (
+    GatkGermlineVariantCaller_4_1_3,
+)
+
+
+class GatkGermlineVariantCallerScattered_4_1_3(GatkGermlineVariantCaller_4_1_3):
+    def id(self):
+        return "GATK4_GermlineVariantCallerScattered"
+
+    def friendly_name(self):
+        return "GATK4 Germline Variant Caller (scattered by intervals)"
+
+    def bind_metadata(self):
+        super().bind_metadata()
+        self.metadata.dateUpdated = date(2026, 10, 18)
+        self.metadata.documentation = """
+        This is a VariantCaller based on the GATK Best Practice pipelines. It uses the GATK4 toolkit, specifically 4.1.3.
+
+        Unlike the GATK4_GermlineVariantCaller, the intervals are split into 'scatter_count' shards
+        of roughly equal size, and each shard is called in parallel. Intervals are never cut, and
+        shards are only split between intervals at least 500bp apart (further than an active region
+        and its padding reach), so calls near the shard boundaries see the same reads as they would
+        unscattered.
+
+        HaplotypeCaller walks each interval (with its padding) on its own, and SplitReads keeps the
+        reads overlapping the intervals of the shard, so every interval is called from the same
+        reads as in GATK4_GermlineVariantCaller. The gathered calls are the same as its calls (bar
+        the GATKCommandLine header) when the contigs of the intervals are in the order of the
+        reference, and no position has more reads starting at it than HaplotypeCaller's
+        max-reads-per-alignment-start (50), where it downsamples at random.
+
+        It has the following steps:
+
+        1. Split intervals (bed) into balanced shards
+        2. Split Bam based on each shard
+        3. HaplotypeCaller on each shard
+        4. GatherVcfs (in interval order) + MergeSamFiles for the assembled haplotypes
+        5. SplitMultiAllele
+                """.strip()
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input(
+            "intervals",
+            Bed,
+            doc="The regions to call variants over, these are split into 'scatter_count' "
+            "shards of roughly equal size (without cutting any interval)",
+        )
+        self.input("reference", FastaWithDict)
+        self.input("snps_dbsnp", VcfTabix)
+        self.input(
+            "scatter_count",
+            Int(optional=True),
+            default=24,
+            doc="The number of shards to split the intervals into (and run HaplotypeCaller "
+            "on in parallel), there are fewer shards if there are fewer intervals.",
+        )
+
+        self.step(
+            "split_intervals",
+            SplitIntervalsIntoShards(
+                intervals=self.intervals,
+                shards=self.scatter_count,
+                # HaplotypeCaller active regions are up to 300bp, padded by 100bp
+                minGap=500,
+            ),
+        )
+
+        self.step(
+            "split_bam",
+            gatk4.Gatk4SplitReads_4_1_3(
+                outputFilename="out",
+                bam=self.bam,
+                intervals=self.split_intervals.out_shards,
+            ),
+            scatter="intervals",
+        )
+
+        self.step(
+            "haplotype_caller",
+            gatk4.Gatk4HaplotypeCaller_4_1_3(
+                inputRead=self.split_bam.out,
+                intervals=self.split_intervals.out_shards,
+                reference=self.reference,
+                dbsnp=self.snps_dbsnp,
+                pairHmmImplementation="LOGLESS_CACHING",
+            ),
+            scatter=["inputRead", "intervals"],
+        )
+
+        # shards are in interval order, so the VCFs can be concatenated as is
+        self.step(
+            "gather_vcfs",
+            gatk4.Gatk4GatherVcfs_4_1_3(
+                vcfs=self.haplotype_caller.out.as_type(Array(Vcf))
+            ),
+        )
+        self.step(
+            "merge_bams",
+            gatk4.Gatk4MergeSamFiles_4_1_3(
+                bams=self.haplotype_caller.bam,
+                sortOrder="coordinate",
+                createIndex=True,
+                validationStringency="SILENT",
+            ),
+        )
+
+        self.step("compressvcf", BGZip_1_9(file=self.gather_vcfs.out))
+        self.step(
+            "indexvcf",
+            BcfToolsIndex_1_9(vcf=self.compressvcf.out.as_type(CompressedVcf)),
+        )
+
+        self.step(
+            "splitnormalisevcf",
+            SplitMultiAllele(vcf=self.gather_vcfs.out, reference=self.reference),
+        )
+
+        self.output("variants", source=self.indexvcf.out)
+        self.output("out_bam", source=self.merge_bams.out)
+        self.output("out", source=self.splitnormalisevcf.out)
+
+    def tests(self):
+        remote_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics/wgsgermline_data"
+        return [
+            TTestCase(
+                name="basic",
+                input={
+                    "bam": f"{remote_dir}/NA12878-BRCA1.recalibrated.bam",
+                    "intervals": f"{remote_dir}/BRCA1.hg38.bed",
+                    "reference": f"{remote_dir}/Homo_sapiens_assembly38.chr17.fasta",
+                    "snps_dbsnp": f"{remote_dir}/Homo_sapiens_assembly38.dbsnp138.BRCA1.vcf.gz",
+                    "scatter_count": 4,
+                },
+                # the same calls as GATK4_GermlineVariantCaller (see the documentation)
+                output=Vcf.basic_test(
+                    "out",
+                    51000,
+                    221,
+                    ["GATKCommandLine"],
+                    "5e48624cb5ef379a7d6d39cec44bc856",
+                ),
+            )
+        ]
+
+
+if __name__ == "__main__":
+    GatkGermlineVariantCallerScattered_4_1_3().translate("wdl", to_console=True)
@@ -210,6 +210,19 @@ class GatkSomaticVariantCaller_4_1_3(BioinformaticsWorkflow):
         ]
 
 
+class GatkSomaticVariantCaller_4_1_3_0_1(GatkSomaticVariantCaller_4_1_3):
+    def constructor(self):
+        super().constructor()
+        # SplitMultiAllele reads the compressed vcf, so it's not uncompressed first
+        self.remove_redundant_conversions()
+
+    def bind_metadata(self):
+        super().bind_metadata()
+        # the same GATK release, a revision of the workflow
+        self.metadata.version = "4.1.3.0-1"
+        self.metadata.dateUpdated = date(2026, 10, 18)
+
+
 if __name__ == "__main__":
     vc = GatkSomaticVariantCaller_4_1_3().translate("wdl", to_console=True)
     # print(vc.translate("cwl"))
@@ -0,0 +1,263 @@
+from datetime import date
+
+from janis_core import Array, Int, String, WorkflowBuilder
+from janis_core.tool.test_classes import TTestCase
+
+from janis_bioinformatics.tools import gatk4
+from janis_bioinformatics.data_types import (
+    FastaWithDict,
+    BamBai,
+    VcfTabix,
+    Bed,
+    Vcf,
+    CompressedVcf,
+)
+from janis_bioinformatics.tools.common import SplitMultiAllele
+from janis_bioinformatics.tools.htslib import BGZip_1_9, Tabix_1_9
+from janis_bioinformatics.tools.pmac import (
+    GatherPileupSummaries,
+    SplitIntervalsIntoShards,
+)
+from janis_bioinformatics.tools.vcftools import VcfToolsvcftoolsLatest
+from janis_bioinformatics.tools.variantcallers.gatk.gatksomatic_variants_4_1_3 import (
+    GatkSomaticVariantCaller_4_1_3,
+)
+
+
+class GatkSomaticVariantCallerScattered_4_1_3(GatkSomaticVariantCaller_4_1_3):
+    def id(self):
+        return "GATK4_SomaticVariantCallerScattered"
+
+    def friendly_name(self):
+        return "GATK4 Somatic Variant Caller (scattered by intervals)"
+
+    def bind_metadata(self):
+        super().bind_metadata()
+        self.metadata.dateUpdated = date(2026, 10, 18)
+        self.metadata.documentation = """
+        This is a VariantCaller based on the GATK Best Practice pipelines. It uses the GATK4 toolkit, specifically 4.1.3.
+
+        Unlike the GATK4_SomaticVariantCaller, the intervals are split into 'scatter_count' shards
+        of roughly equal size, and Mutect2 and GetPileupSummaries are run on each shard in parallel.
+        The stats are merged and the F1R2 counts of every shard are given to LearnReadOrientationModel,
+        so the filtering is the same as the unscattered workflow.
+
+        It has the following steps:
+
+        1. Split intervals (bed) into balanced shards
+        2. For each shard: split the normal and tumor bams, Mutect2 and GetPileupSummaries
+        3. GatherVcfs (in interval order), MergeMutectStats, MergeSamFiles and GatherPileupSummaries
+        4. LearnOrientationModel (with the F1R2 counts of every shard)
+        5. CalculateContamination
+        6. FilterMutectCalls
+        7. Split and normliase vcf
+        8. Filter PASS variants
+                """.strip()
+
+    def constructor(self):
+
+        self.input("normal_bam", BamBai)
+        self.input("tumor_bam", BamBai)
+        self.input("normal_name", String(optional=True))
+        self.input(
+            "intervals",
+            Bed,
+            doc="The regions to call variants over, these are split into 'scatter_count' "
+            "shards of roughly equal size (without cutting any interval)",
+        )
+        self.input("reference", FastaWithDict)
+        self.input("gnomad", VcfTabix)
+        self.input("panel_of_normals", VcfTabix(optional=True))
+        self.input(
+            "output_bam_name",
+            String,
+            default="mutect2.bam",
+            doc="Name of the merged bam of the haplotypes Mutect2 assembled in each shard",
+        )
+        self.input(
+            "scatter_count",
+            Int(optional=True),
+            default=24,
+            doc="The number of shards to split the intervals into (and run Mutect2 on in "
+            "parallel), there are fewer shards if there are fewer intervals.",
+        )
+
+        self.step(
+            "split_intervals",
+            SplitIntervalsIntoShards(
+                intervals=self.intervals, shards=self.scatter_count
+            ),
+        )
+
+        self.step(
+            "shard",
+            self.shard_subpipeline(
+                normal_bam=self.normal_bam,
+                tumor_bam=self.tumor_bam,
+                normal_name=self.normal_name,
+                intervals=self.split_intervals.out_shards,
+                reference=self.reference,
+                gnomad=self.gnomad,
+                panel_of_normals=self.panel_of_normals,
+                output_bam_name=self.output_bam_name,
+            ),
+            scatter="intervals",
+        )
+
+        # shards are in interval order, so the VCFs and pileups can be concatenated
+        self.step(
+            "gather_vcfs",
+            gatk4.Gatk4GatherVcfs_4_1_3(vcfs=self.shard.out.as_type(Array(Vcf))),
+        )
+        self.step("compressvcf", BGZip_1_9(file=self.gather_vcfs.out))
+        self.step("indexvcf", Tabix_1_9(inp=self.compressvcf.out))
+        self.step(
+            "merge_stats",
+            gatk4.Gatk4MergeMutectStats_4_1_3(statsFiles=self.shard.stats),
+        )
+        self.step(
+            "merge_bams",
+            gatk4.Gatk4MergeSamFiles_4_1_3(
+                # the subpipeline always names the bam, so every shard has one
+                bams=self.shard.bam.as_type(Array(BamBai)),
+                outputFilename=self.output_bam_name,
+                sortOrder="coordinate",
+                createIndex=True,
+                validationStringency="SILENT",
+            ),
+        )
+        self.step(
+            "gather_pileups",
+            GatherPileupSummaries(tables=self.shard.pileup_table),
+        )
+
+        self.step(
+            "learnorientationmodel",
+            gatk4.Gatk4LearnReadOrientationModelLatest(
+                f1r2CountsFiles=self.shard.f1r2,
+            ),
+        )
+        self.step(
+            "calculatecontamination",
+            gatk4.Gatk4CalculateContaminationLatest(
+                pileupTable=self.gather_pileups.out,
+            ),
+        )
+        self.step(
+            "filtermutect2calls",
+            gatk4.Gatk4FilterMutectCallsLatest(
+                vcf=self.indexvcf.out.as_type(VcfTabix),
+                reference=self.reference,
+                segmentationFile=self.calculatecontamination.segOut,
+                contaminationTable=self.calculatecontamination.contOut,
+                readOrientationModel=self.learnorientationmodel.out,
+                statsFile=self.merge_stats.out,
+            ),
+        )
+
+        # normalise and filter "PASS" variants
+        self.step(
+            "splitnormalisevcf",
+            SplitMultiAllele(
+                vcf=self.filtermutect2calls.out.as_type(CompressedVcf),
+                reference=self.reference,
+            ),
+        )
+        self.step(
+            "filterpass",
+            VcfToolsvcftoolsLatest(
+                vcf=self.splitnormalisevcf.out,
+                removeFileteredAll=True,
+                recode=True,
+                recodeINFOAll=True,
+            ),
+        )
+
+        self.output("variants", source=self.filtermutect2calls.out)
+        self.output("out_bam", source=self.merge_bams.out)
+        self.output("out", source=self.filterpass.out)
+
+    def tests(self):
+        parent_dir = "https://swift.rc.nectar.org.au/v1/AUTH_4df6e734a509497692be237549bbe9af/janis-test-data/bioinformatics"
+        germline_data = f"{parent_dir}/wgsgermline_data"
+        somatic_data = f"{parent_dir}/wgssomatic_data"
+        return [
+            TTestCase(
+                name="basic",
+                input={
+                    "normal_bam": f"{somatic_data}/NA24385-BRCA1.markduped.recalibrated.bam",
+                    "tumor_bam": f"{somatic_data}/NA12878-NA24385-mixture.markduped.recalibrated.bam",
+                    "reference": f"{germline_data}/Homo_sapiens_assembly38.chr17.fasta",
+                    "gnomad": f"{somatic_data}/af-only-gnomad.hg38.BRCA1.vcf.gz",
+                    "intervals": f"{germline_data}/BRCA1.hg38.bed",
+                    "normal_name": "NA24385-BRCA1",
+                    "filterpass_removeFileteredAll": True,
+                    "filterpass_recode": True,
+                    "filterpass_recodeINFOAll": True,
+                    "output_bam_name": "mutect2.bam",
+                    "scatter_count": 4,
+                },
+                # Mutect2 assembles each shard separately, so the calls near the
+                # shard boundaries (and the md5s) can differ from the unscattered
+                # workflow
+                output=Vcf.basic_test("out", 33000)
+                + VcfTabix.basic_test("variants", 13000, 260)
+                + BamBai.basic_test("out_bam", 813200, 21200),
+            )
+        ]
+
+    @staticmethod
+    def shard_subpipeline(**connections):
+        w = WorkflowBuilder("mutect2_shard_subpipeline")
+
+        w.input("normal_bam", BamBai)
+        w.input("tumor_bam", BamBai)
+        w.input("normal_name", String(optional=True))
+        w.input("intervals", Bed)
+        w.input("reference", FastaWithDict)
+        w.input("gnomad", VcfTabix)
+        w.input("panel_of_normals", VcfTabix(optional=True))
+        w.input("output_bam_name", String)
+
+        w.step(
+            "normal_split_bam",
+            gatk4.Gatk4SplitReads_4_1_3(bam=w.normal_bam, intervals=w.intervals),
+        )
+        w.step(
+            "tumor_split_bam",
+            gatk4.Gatk4SplitReads_4_1_3(bam=w.tumor_bam, intervals=w.intervals),
+        )
+        w.step(
+            "mutect2",
+            gatk4.GatkMutect2_4_1_3(
+                normalBams=[w.normal_split_bam.out],
+                tumorBams=[w.tumor_split_bam.out],
+                normalSample=w.normal_name,
+                intervals=w.intervals,
+                reference=w.reference,
+                germlineResource=w.gnomad,
+                panelOfNormals=w.panel_of_normals,
+                outputPrefix=w.normal_name,
+                outputBamName=w.output_bam_name,
+            ),
+        )
+        w.step(
+            "getpileupsummaries",
+            gatk4.Gatk4GetPileUpSummariesLatest(
+                bam=w.tumor_split_bam.out,
+                sites=w.gnomad,
+                intervals=w.intervals,
+            ),
+        )
+
+        w.output("out", source=w.mutect2.out)
+        w.output("stats", source=w.mutect2.stats)
+        w.output("f1r2", source=w.mutect2.f1f2r_out)
+        w.output("bam", source=w.mutect2.bam)
+        w.output("pileup_table", source=w.getpileupsummaries.out)
+
+        return w(**connections)
+
+
+if __name__ == "__main__":
+    GatkSomaticVariantCallerScattered_4_1_3().translate("wdl", to_console=True)
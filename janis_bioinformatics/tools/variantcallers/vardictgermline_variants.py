@@ -2,12 +2,13 @@ from datetime import datetime
 from janis_core import File, String, Float, Int, WorkflowMetadata
 from janis_unix.tools import UncompressArchive
 
-from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed
+from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed, Vcf
 from janis_bioinformatics.tools import BioinformaticsWorkflow
-from janis_bioinformatics.tools.bcftools import BcfToolsAnnotate_1_5
-from janis_bioinformatics.tools.common import SplitMultiAllele
+from janis_bioinformatics.tools.bcftools import BcfToolsAnnotate_1_5, BcfToolsSort_1_9
+from janis_bioinformatics.tools.common import SplitMultiAllele, NormaliseFilterVcf
 from janis_bioinformatics.tools.htslib import BGZipLatest, TabixLatest
 from janis_bioinformatics.tools.vardict import VarDictGermline_1_6_0
+from janis_bioinformatics.tools.pmac import GatherChunkedVcfs, SplitIntervalsIntoShards
 from janis_bioinformatics.tools.pmac.trimiupac.versions import TrimIUPAC_0_0_5
 from janis_bioinformatics.tools.vcftools import VcfToolsvcftoolsLatest
 
@@ -91,7 +92,128 @@ class VardictGermlineVariantCaller(BioinformaticsWorkflow):
         )
 
 
+class VardictGermlineVariantCaller_0_2_0(VardictGermlineVariantCaller):
+    def version(self):
+        return "v0.2.0"
+
+    def constructor(self):
+
+        self.input("bam", BamBai)
+        self.input("intervals", Bed)
+        self.input("sample_name", String)
+        self.input("header_lines", File)
+        self.input("reference", FastaWithDict)
+
+        # vardict options
+        self.input("allele_freq_threshold", Float, default=0.05)
+        self.input("minMappingQual", Int(optional=True))
+        self.input("filter", String(optional=True))
+
+        # chunking options
+        self.input(
+            "scatter_count",
+            Int(optional=True),
+            default=24,
+            doc="The number of VarDict jobs to split the (chunked) intervals between",
+        )
+        self.input(
+            "chunk_size",
+            Int(optional=True),
+            default=5000,
+            doc="Intervals longer than this are cut into chunks of this many bases, "
+            "which bounds the memory and runtime of VarDict on large or dense regions",
+        )
+        self.input(
+            "chunk_overlap",
+            Int(optional=True),
+            default=250,
+            doc="Bases of overlap between the chunks of an interval, so that indels "
+            "across the chunk boundaries are called",
+        )
+
+        self.step(
+            "split_intervals",
+            SplitIntervalsIntoShards(
+                intervals=self.intervals,
+                shards=self.scatter_count,
+                maxSize=self.chunk_size,
+                overlap=self.chunk_overlap,
+            ),
+        )
+
+        self.step(
+            "vardict",
+            VarDictGermline_1_6_0(
+                intervals=self.split_intervals.out_shards,
+                bam=self.bam,
+                reference=self.reference,
+                sampleName=self.sample_name,
+                var2vcfSampleName=self.sample_name,
+                alleleFreqThreshold=self.allele_freq_threshold,
+                var2vcfAlleleFreqThreshold=self.allele_freq_threshold,
+                vcfFormat=True,
+                chromColumn=1,
+                regStartCol=2,
+                geneEndCol=3,
+                threads=4,
+                minMappingQual=self.minMappingQual,
+                filter=self.filter,
+            ),
+            scatter="intervals",
+        )
+
+        # variants in the overlap of two chunks are called by both, keep the call of
+        # the chunk whose core (the chunk without the overlap) contains the variant
+        self.step(
+            "gather",
+            GatherChunkedVcfs(
+                vcfs=self.vardict.out,
+                cores=self.split_intervals.out_cores.assert_not_null(),
+            ),
+        )
+        self.step(
+            "sortvcf",
+            BcfToolsSort_1_9(
+                vcf=self.gather.out, outputType="v", outputFilename="vardict.vcf"
+            ),
+        )
+        self.step(
+            "annotate",
+            BcfToolsAnnotate_1_5(
+                vcf=self.sortvcf.out.as_type(Vcf), headerLines=self.header_lines
+            ),
+        )
+        self.step("compressvcf", BGZipLatest(file=self.annotate.out, stdout=True))
+        self.step("tabixvcf", TabixLatest(inp=self.compressvcf.out))
+
+        # split, normalise, trim IUPAC and filter "PASS" variants in one step
+        self.step(
+            "normalisefilter",
+            NormaliseFilterVcf(vcf=self.annotate.out, reference=self.reference),
+        )
+
+        self.output("variants", source=self.tabixvcf.out)
+        self.output("out", source=self.normalisefilter.out)
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            contributors=[
+                "Michael Franklin",
+                "Jiaan Yu",
+                "Peter MacCallum Cancer Centre",
+            ],
+            dateCreated=datetime(2019, 3, 28),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Call the germline variants with VarDict on chunks of the intervals (of at most
+chunk_size bases, overlapping by chunk_overlap bases) split between scatter_count
+jobs, and normalise, trim IUPAC codes and filter the PASS variants in one step
+(NormaliseFilterVcf, the out is a VcfTabix).
+""",
+        )
+
+
 if __name__ == "__main__":
-    v = VardictGermlineVariantCaller()
+    v = VardictGermlineVariantCaller_0_2_0()
     v.translate("wdl", with_resource_overrides=False)
     # print(v.generate_resources_file("wdl", { "CaptureType": "targeted" }))
@@ -2,12 +2,17 @@ from datetime import datetime
 from janis_core import File, String, Float, Int, WorkflowMetadata
 from janis_unix.tools import UncompressArchive
 
-from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed
+from janis_bioinformatics.data_types import FastaWithDict, BamBai, Bed, Vcf
 from janis_bioinformatics.tools import BioinformaticsWorkflow
-from janis_bioinformatics.tools.bcftools import BcfToolsAnnotate_1_5
-from janis_bioinformatics.tools.common import SplitMultiAllele, FilterVardictSomaticVcf
+from janis_bioinformatics.tools.bcftools import BcfToolsAnnotate_1_5, BcfToolsSort_1_9
+from janis_bioinformatics.tools.common import (
+    SplitMultiAllele,
+    FilterVardictSomaticVcf,
+    NormaliseFilterVcf,
+)
 from janis_bioinformatics.tools.htslib import BGZipLatest, TabixLatest
 from janis_bioinformatics.tools.vardict import VarDictSomatic_1_6_0
+from janis_bioinformatics.tools.pmac import GatherChunkedVcfs, SplitIntervalsIntoShards
 from janis_bioinformatics.tools.pmac.trimiupac.versions import TrimIUPAC_0_0_5
 
 
@@ -84,7 +89,135 @@ class VardictSomaticVariantCaller(BioinformaticsWorkflow):
         )
 
 
+class VardictSomaticVariantCaller_0_2_0(VardictSomaticVariantCaller):
+    def version(self):
+        return "v0.2.0"
+
+    def constructor(self):
+
+        self.input("normal_bam", BamBai)
+        self.input("tumor_bam", BamBai)
+        self.input("normal_name", String)
+        self.input("tumor_name", String)
+        self.input("intervals", Bed)
+        self.input("header_lines", File)
+        self.input("reference", FastaWithDict)
+
+        # vardict options
+        self.input("allele_freq_threshold", Float(), 0.05)
+        self.input("minMappingQual", Int(optional=True))
+        self.input("filter", String(optional=True))
+
+        # chunking options
+        self.input(
+            "scatter_count",
+            Int(optional=True),
+            default=24,
+            doc="The number of VarDict jobs to split the (chunked) intervals between",
+        )
+        self.input(
+            "chunk_size",
+            Int(optional=True),
+            default=5000,
+            doc="Intervals longer than this are cut into chunks of this many bases, "
+            "which bounds the memory and runtime of VarDict on large or dense regions",
+        )
+        self.input(
+            "chunk_overlap",
+            Int(optional=True),
+            default=250,
+            doc="Bases of overlap between the chunks of an interval, so that indels "
+            "across the chunk boundaries are called",
+        )
+
+        self.step(
+            "split_intervals",
+            SplitIntervalsIntoShards(
+                intervals=self.intervals,
+                shards=self.scatter_count,
+                maxSize=self.chunk_size,
+                overlap=self.chunk_overlap,
+            ),
+        )
+
+        self.step(
+            "vardict",
+            VarDictSomatic_1_6_0(
+                normalBam=self.normal_bam,
+                tumorBam=self.tumor_bam,
+                intervals=self.split_intervals.out_shards,
+                reference=self.reference,
+                normalName=self.normal_name,
+                tumorName=self.tumor_name,
+                alleleFreqThreshold=self.allele_freq_threshold,
+                vcfFormat=True,
+                chromColumn=1,
+                regStartCol=2,
+                geneEndCol=3,
+                threads=4,
+                minMappingQual=self.minMappingQual,
+                filter=self.filter,
+            ),
+            scatter="intervals",
+        )
+
+        # variants in the overlap of two chunks are called by both, keep the call of
+        # the chunk whose core (the chunk without the overlap) contains the variant
+        self.step(
+            "gather",
+            GatherChunkedVcfs(
+                vcfs=self.vardict.out,
+                cores=self.split_intervals.out_cores.assert_not_null(),
+            ),
+        )
+        self.step(
+            "sortvcf",
+            BcfToolsSort_1_9(
+                vcf=self.gather.out, outputType="v", outputFilename="vardict.vcf"
+            ),
+        )
+        self.step(
+            "annotate",
+            BcfToolsAnnotate_1_5(
+                vcf=self.sortvcf.out.as_type(Vcf), headerLines=self.header_lines
+            ),
+        )
+        self.step("compressvcf", BGZipLatest(file=self.annotate.out, stdout=True))
+        self.step("tabixvcf", TabixLatest(inp=self.compressvcf.out))
+
+        # split, normalise, trim IUPAC and filter "PASS" somatic variants in one step
+        self.step(
+            "normalisefilter",
+            NormaliseFilterVcf(
+                vcf=self.annotate.out,
+                reference=self.reference,
+                filters="PASS",
+                exclude='STATUS="Germline"',
+            ),
+        )
+
+        self.output("variants", source=self.tabixvcf.out)
+        self.output("out", source=self.normalisefilter.out)
+
+    def bind_metadata(self):
+        return WorkflowMetadata(
+            contributors=[
+                "Michael Franklin",
+                "Jiaan Yu",
+                "Peter MacCallum Cancer Centre",
+            ],
+            dateCreated=datetime(2019, 6, 12),
+            dateUpdated=datetime(2026, 10, 18),
+            documentation="""\
+Call the somatic variants with VarDict on chunks of the intervals (of at most
+chunk_size bases, overlapping by chunk_overlap bases) split between scatter_count
+jobs, and normalise, trim IUPAC codes and filter the PASS, non germline variants in
+one step (NormaliseFilterVcf, the out is a VcfTabix).
+""",
+        )
+
+
 if __name__ == "__main__":
-    v = VardictSomaticVariantCaller()
+    v = VardictSomaticVariantCaller_0_2_0()
     v.translate("wdl", with_resource_overrides=False)
     # print(v.generate_resources_file("wdl", { "CaptureType": "targeted" }))
@@ -1,13 +1,20 @@
-from .vcfallelicprimitives.versions import (
-    VcfAllelicPrimitives_1_0_1,
-    VcfAllelicPrimitivesLatest,
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "vcfallelicprimitives.versions": [
+            "VcfAllelicPrimitives_1_0_1",
+            "VcfAllelicPrimitivesLatest",
+        ],
+        "vcffixup.versions": ["VcfFixUp_1_0_1", "VcfFixUpLatest"],
+        "vcfrandomsample.versions": ["VcfRandomSample_1_0_1", "VcfRandomSampleLatest"],
+        "vcfroc.versions": ["VcfRoc_1_0_1", "VcfRocLatest"],
+        "vcfuniq.versions": ["VcfUniq_1_0_1", "VcfUniqLatest"],
+        "vcfuniqalleles.versions": ["VcfUniqAlleles_1_0_1", "VcfUniqAllelesLatest"],
+        "vcffilter.versions": ["VcfFilter_1_0_1", "VcfFilterLatest"],
+        "vcflength.versions": ["VcfLength_1_0_1", "VcfLengthLatest"],
+        "vcfcombine.versions": ["VcfCombine_1_0_1", "VcfCombineLatest"],
+        "vcfstreamsort.versions": ["VcfStreamSort_1_0_1", "VcfStreamSortLatest"],
+    },
 )
-from .vcffixup.versions import VcfFixUp_1_0_1, VcfFixUpLatest
-from .vcfrandomsample.versions import VcfRandomSample_1_0_1, VcfRandomSampleLatest
-from .vcfroc.versions import VcfRoc_1_0_1, VcfRocLatest
-from .vcfuniq.versions import VcfUniq_1_0_1, VcfUniqLatest
-from .vcfuniqalleles.versions import VcfUniqAlleles_1_0_1, VcfUniqAllelesLatest
-from .vcffilter.versions import VcfFilter_1_0_1, VcfFilterLatest
-from .vcflength.versions import VcfLength_1_0_1, VcfLengthLatest
-from .vcfcombine.versions import VcfCombine_1_0_1, VcfCombineLatest
-from .vcfstreamsort.versions import VcfStreamSort_1_0_1, VcfStreamSortLatest
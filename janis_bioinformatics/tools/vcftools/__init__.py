@@ -1,3 +1,10 @@
-from .vcfmerge.versions import VcfToolsVcfMergeLatest, VcfToolsVcfMerge_0_1_16
-from .vcfconcat.versions import VcfToolsVcfConcatLatest, VcfToolsVcfConcat_0_1_16
-from .vcftools.versions import VcfToolsvcftools_0_1_16, VcfToolsvcftoolsLatest
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "vcfmerge.versions": ["VcfToolsVcfMergeLatest", "VcfToolsVcfMerge_0_1_16"],
+        "vcfconcat.versions": ["VcfToolsVcfConcatLatest", "VcfToolsVcfConcat_0_1_16"],
+        "vcftools.versions": ["VcfToolsvcftools_0_1_16", "VcfToolsvcftoolsLatest"],
+    },
+)
@@ -1,2 +1,18 @@
-from .index.versions import *
-from .align.versions import *
+from janis_bioinformatics.utils.lazyimport import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submod_attrs={
+        "index.versions": [
+            "WhisperIndexBase",
+            "WhisperIndex_2_0",
+            "WhisperIndexLatest",
+        ],
+        "align.versions": [
+            "WhisperAlignBase",
+            "Whisper_2_0",
+            "WhisperAlign_2_0",
+            "WhisperAlignLatest",
+        ],
+    },
+)
@@ -10,6 +10,7 @@ from janis_core import (
 
 from janis_bioinformatics.data_types import FastqGzPair, Bam
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import resource_for_hints
 
 from ..data_types import WhisperIdx
 
@@ -39,9 +40,15 @@ class WhisperAlignBase(BioinformaticsTool, ABC):
         return [ToolOutput("out", Stdout(Bam()))]
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 8
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 4
 
     def bind_metadata(self):
@@ -14,6 +14,7 @@ from janis_core import (
 from janis_core import Array, InputSelector
 from janis_bioinformatics.data_types import Fasta
 from janis_bioinformatics.tools.bioinformaticstoolbase import BioinformaticsTool
+from janis_bioinformatics.resources import resource_for_hints
 
 from ..data_types import WhisperIdx
 
@@ -45,9 +46,15 @@ class WhisperIndexBase(BioinformaticsTool, ABC):
         ]
 
     def memory(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "memory", hints)
+        if val:
+            return val
         return 8
 
     def cpus(self, hints: Dict[str, Any]):
+        val = resource_for_hints(self, "cpus", hints)
+        if val:
+            return val
         return 1
 
     def bind_metadata(self):
@@ -1,7 +1,8 @@
+from functools import lru_cache
+
 from janis_unix import UncompressArchive
 
 from janis_bioinformatics.tools.common import IndexFasta
-from janis_core import JanisTransformation, JanisTransformationGraph
 
 from janis_bioinformatics.data_types import (
     CompressedVcf,
@@ -11,64 +12,113 @@ from janis_bioinformatics.data_types import (
     BamBai,
     VcfIdx,
     Fasta,
+    FastaFai,
+    FastaDict,
     FastaWithIndexes,
     BedGz,
     Bed,
     BedTabix,
 )
 
-from janis_bioinformatics.tools.samtools import SamToolsIndex_1_9
+from janis_bioinformatics.tools.samtools import SamToolsIndex_1_9, SamToolsFaidx_1_9
 from janis_bioinformatics.tools.htslib import Tabix_1_9, BGZip_1_9
 from janis_bioinformatics.tools.igvtools import IgvIndexFeature_2_5_3
+from janis_bioinformatics.tools.gatk4 import Gatk4CreateSequenceDictionary_4_1_4
+from janis_bioinformatics.transformations.graph import (
+    CostedJanisTransformation,
+    CostedJanisTransformationGraph,
+)
 
+# costs are rough CPU minutes for a human genome sized input
 transformations = [
-    JanisTransformation(Bam, BamBai, SamToolsIndex_1_9(), relevant_tool_input="bam"),
-    JanisTransformation(Vcf, VcfIdx, IgvIndexFeature_2_5_3()),
-    JanisTransformation(
+    CostedJanisTransformation(
+        Bam, BamBai, SamToolsIndex_1_9(), relevant_tool_input="bam", cost=10
+    ),
+    CostedJanisTransformation(Vcf, VcfIdx, IgvIndexFeature_2_5_3(), cost=2),
+    CostedJanisTransformation(
         Vcf,
         CompressedVcf,
         BGZip_1_9(),
         relevant_tool_input="file",
         relevant_tool_output="out",
+        cost=2,
     ),
-    JanisTransformation(
+    CostedJanisTransformation(
         CompressedVcf,
         VcfTabix,
         Tabix_1_9(),
         relevant_tool_input="inp",
         relevant_tool_output="out",
+        cost=1,
+    ),
+    CostedJanisTransformation(
+        Fasta,
+        FastaFai,
+        SamToolsFaidx_1_9(),
+        relevant_tool_input="reference",
+        relevant_tool_output="out",
+        cost=1,
     ),
-    JanisTransformation(Fasta, FastaWithIndexes, IndexFasta(bwa_algorithm="bwtsa")),
-    JanisTransformation(
+    CostedJanisTransformation(
+        Fasta,
+        FastaDict,
+        Gatk4CreateSequenceDictionary_4_1_4(),
+        relevant_tool_input="reference",
+        relevant_tool_output="out",
+        cost=2,
+    ),
+    # the BWA index takes a few hours on a human genome
+    CostedJanisTransformation(
+        Fasta,
+        FastaWithIndexes,
+        IndexFasta(bwa_algorithm="bwtsw"),
+        relevant_tool_input="reference",
+        relevant_tool_output="out_reference",
+        cost=180,
+    ),
+    CostedJanisTransformation(
         BedGz,
         Bed,
         UncompressArchive(),
         relevant_tool_input="file",
         relevant_tool_output="out",
+        cost=1,
     ),
-    JanisTransformation(
-        Bed, BedGz, BGZip_1_9(), relevant_tool_input="file", relevant_tool_output="out",
+    CostedJanisTransformation(
+        Bed,
+        BedGz,
+        BGZip_1_9(),
+        relevant_tool_input="file",
+        relevant_tool_output="out",
+        cost=1,
     ),
-    JanisTransformation(
+    CostedJanisTransformation(
         BedGz,
         BedTabix,
         Tabix_1_9(),
         relevant_tool_input="inp",
         relevant_tool_output="out",
+        cost=1,
     ),
 ]
 
-if __name__ == "__main__":
-    start = Bam
 
-    graph = JanisTransformationGraph()
+@lru_cache(maxsize=None)
+def transformation_graph() -> CostedJanisTransformationGraph:
+    """
+    The graph of the transformations, built once
+    """
+    graph = CostedJanisTransformationGraph()
     graph.add_edges(transformations)
+    return graph
+
 
-    wf = graph.build_workflow_to_translate(BamBai, BamBai)
+if __name__ == "__main__":
+    wf = transformation_graph().build_workflow_to_translate(Fasta, FastaFai)
 
     if wf is None:
         print("Types are already compatible")
-
-    wf.translate("wdl")
+    else:
+        wf.translate("wdl")
 
 # wf.get_dot_plot(show=True)
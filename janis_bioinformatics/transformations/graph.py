@@ -0,0 +1,120 @@
+"""
+A JanisTransformationGraph that picks the cheapest conversion between two types.
+
+The default graph finds the path with the fewest transformations, so eg: a workflow
+that needs a FastaFai could get a full IndexFasta (BWA index, hours on a human
+genome) instead of a samtools faidx. Each transformation here has a rough cost, and
+find_connection picks the path with the lowest total cost (Dijkstra). The solved
+paths are memoized per (source, target) pair, as the same few conversions are
+looked up for every step of a workflow.
+
+The janis runtime (JanisShed) builds its own JanisTransformationGraph from the
+`transformations` entry point, and it isn't replaceable from here, so it still picks
+the path with the fewest steps. This graph is for the lookups made through
+transformation_graph(), the costs are ignored by the runtime.
+"""
+import heapq
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+from janis_core import JanisTransformation, JanisTransformationGraph
+
+# the cost of a transformation without one
+DEFAULT_COST = 1.0
+
+
+class CostedJanisTransformation(JanisTransformation):
+    def __init__(
+        self,
+        type1,
+        type2,
+        tool,
+        relevant_tool_input: Optional[str] = None,
+        relevant_tool_output: Optional[str] = None,
+        cost: float = DEFAULT_COST,
+    ):
+        """
+        :param cost: rough cost of running the tool, in CPU minutes for a human
+            genome sized input (eg: a 30x BAM or the GRCh38 reference)
+        """
+        super().__init__(
+            type1,
+            type2,
+            tool,
+            relevant_tool_input=relevant_tool_input,
+            relevant_tool_output=relevant_tool_output,
+        )
+        self.cost = cost
+
+
+def transformation_cost(transformation: JanisTransformation) -> float:
+    return getattr(transformation, "cost", DEFAULT_COST)
+
+
+def _instantiate(datatype):
+    return datatype() if isinstance(datatype, type) else datatype
+
+
+def _name(datatype) -> str:
+    return _instantiate(datatype).name()
+
+
+class CostedJanisTransformationGraph(JanisTransformationGraph):
+    def __init__(self):
+        super().__init__()
+        self._transformations: List[JanisTransformation] = []
+        self._paths: Dict[Tuple[str, str], Optional[List[JanisTransformation]]] = {}
+
+    def add_edges(self, edges: List[JanisTransformation]):
+        super().add_edges(edges)
+        self._transformations.extend(edges)
+        # a new edge might make a cheaper path
+        self._paths.clear()
+
+    def find_connection(self, start, finish) -> List[JanisTransformation]:
+        key = (_name(start), _name(finish))
+        if key not in self._paths:
+            self._paths[key] = self.cheapest_path(start, finish)
+        path = self._paths[key]
+        if path is None:
+            raise Exception(f"There's no transformation from '{key[0]}' to '{key[1]}'")
+        return list(path)
+
+    def cheapest_path(self, start, finish) -> Optional[List[JanisTransformation]]:
+        """
+        The transformations with the lowest total cost from start to a type that
+        finish can receive from, [] if they're already compatible, or None if
+        there's no path.
+        """
+        start, finish = _instantiate(start), _instantiate(finish)
+        if finish.can_receive_from(start):
+            return []
+
+        # (cost, tiebreak, type, path), the tiebreak keeps the types from being compared
+        tiebreak = count()
+        queue = [(0.0, next(tiebreak), start, [])]
+        visited = set()
+        while queue:
+            cost, _, current, path = heapq.heappop(queue)
+            if current.name() in visited:
+                continue
+            visited.add(current.name())
+            if path and finish.can_receive_from(current):
+                return path
+
+            for transformation in self._transformations:
+                source = _instantiate(transformation.type1)
+                target = _instantiate(transformation.type2)
+                if target.name() in visited or not source.can_receive_from(current):
+                    continue
+                heapq.heappush(
+                    queue,
+                    (
+                        cost + transformation_cost(transformation),
+                        next(tiebreak),
+                        target,
+                        [*path, transformation],
+                    ),
+                )
+
+        return None
@@ -0,0 +1,340 @@
+"""
+A minimal, dependency free BGZF (blocked gzip) reader.
+
+BGZF files (BAM, bgzipped VCF, ...) are a series of independent gzip members of at
+most 64KiB each. The file is memory mapped and each block's compressed payload is
+handed to zlib as a memoryview, so the only copies made are the decompressed blocks.
+
+BgzfFile, read_bam_header, read_bai and bai_query read the regions of an indexed bam
+(the pmac PythonTools embed this module, so it only uses the standard library).
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# gzip member header, up to and including XLEN (RFC 1952)
+_HEADER = struct.Struct("<4BI2BH")
+# ISIZE is the last 4 bytes of the member
+_ISIZE = struct.Struct("<I")
+_SUBFIELD = struct.Struct("<2BH")
+
+BGZF_MAGIC = b"\x1f\x8b\x08\x04"
+BGZF_MAX_BLOCK_SIZE = 65536
+
+
+class BgzfError(Exception):
+    pass
+
+
+def _block_size(view, offset: int) -> Tuple[int, int]:
+    """
+    :return: (total size of the block at offset, size of the header's extra field)
+    """
+    if len(view) - offset < _HEADER.size:
+        raise BgzfError(f"Truncated BGZF block header at offset {offset}")
+    id1, id2, cm, flg, _, _, _, xlen = _HEADER.unpack_from(view, offset)
+    if (id1, id2, cm, flg) != tuple(BGZF_MAGIC):
+        raise BgzfError(f"Invalid BGZF block header at offset {offset}")
+
+    # find the BC subfield, which holds the total block size - 1
+    extra_start = offset + _HEADER.size
+    pos = extra_start
+    while pos < extra_start + xlen:
+        si1, si2, slen = _SUBFIELD.unpack_from(view, pos)
+        if si1 == 66 and si2 == 67 and slen == 2:
+            return struct.unpack_from("<H", view, pos + _SUBFIELD.size)[0] + 1, xlen
+        pos += _SUBFIELD.size + slen
+    raise BgzfError(f"BGZF block at offset {offset} has no BC (size) subfield")
+
+
+def iter_raw_blocks(buffer) -> Iterator[Tuple[int, memoryview, int]]:
+    """
+    Walk the BGZF blocks in buffer (bytes / mmap) without decompressing them
+
+    :return: (offset of the block in the file, compressed (raw deflate) payload, ISIZE)
+    """
+    view = memoryview(buffer)
+    offset, end = 0, len(view)
+    while offset < end:
+        bsize, xlen = _block_size(view, offset)
+        if offset + bsize > end:
+            raise BgzfError(f"Truncated BGZF block at offset {offset}")
+
+        payload = view[offset + _HEADER.size + xlen : offset + bsize - 8]
+        isize = _ISIZE.unpack_from(view, offset + bsize - 4)[0]
+        yield offset, payload, isize
+        offset += bsize
+
+
+def iter_blocks(buffer) -> Iterator[bytes]:
+    """
+    Decompress each BGZF block in buffer, the (empty) EOF block is skipped
+    """
+    for _, payload, isize in iter_raw_blocks(buffer):
+        if isize == 0:
+            continue
+        yield zlib.decompress(payload, -15, isize)
+
+
+def iter_blocks_threaded(buffer, threads: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Same as iter_blocks, but blocks are decompressed on a thread pool (zlib releases
+    the GIL), a bounded number of blocks are decompressed ahead of the consumer.
+    """
+    threads = threads or min(os.cpu_count() or 1, 8)
+    if threads <= 1:
+        yield from iter_blocks(buffer)
+        return
+
+    with ThreadPoolExecutor(threads) as pool:
+        pending = deque()
+        for _, payload, isize in iter_raw_blocks(buffer):
+            if isize == 0:
+                continue
+            pending.append(pool.submit(zlib.decompress, payload, -15, isize))
+            if len(pending) >= 4 * threads:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_chunks(buffer, chunk_size: int = 16 * BGZF_MAX_BLOCK_SIZE) -> Iterator[bytes]:
+    """
+    Decompress buffer in chunks of (at least) chunk_size bytes, fewer and larger
+    chunks are cheaper to process from Python than one chunk per 64KiB block.
+    """
+    return join_blocks(iter_blocks(buffer), chunk_size)
+
+
+def join_blocks(
+    blocks: Iterable[bytes], chunk_size: int = 16 * BGZF_MAX_BLOCK_SIZE
+) -> Iterator[bytes]:
+    pending, size = [], 0
+    for block in blocks:
+        pending.append(block)
+        size += len(block)
+        if size >= chunk_size:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def is_bgzf(path: str) -> bool:
+    """
+    Whether the file starts with a BGZF block (a gzip member with a BC subfield)
+    """
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size + _SUBFIELD.size)
+    return header[:4] == BGZF_MAGIC and header[12:14] == b"BC"
+
+
+class BgzfReader:
+    """
+    Memory maps a BGZF file, eg:
+
+        with BgzfReader("small.bam") as reader:
+            for chunk in reader.chunks():
+                ...
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # empty files can't be memory mapped
+            self._map = b""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def raw_blocks(self):
+        return iter_raw_blocks(self._map)
+
+    def blocks(self, start: int = 0, end: Optional[int] = None):
+        """
+        Decompressed blocks, optionally only those between the (compressed) offsets
+        start and end, which must both be block boundaries (see block_offsets).
+        """
+        if start == 0 and end is None:
+            return iter_blocks(self._map)
+        return iter_blocks(memoryview(self._map)[start:end])
+
+    def block_offsets(self) -> List[int]:
+        """
+        The offset of every block in the file, without decompressing any of them
+        """
+        return [offset for offset, _, _ in iter_raw_blocks(self._map)]
+
+    def chunks(
+        self, chunk_size: int = 16 * BGZF_MAX_BLOCK_SIZE, threads: Optional[int] = 1
+    ):
+        if threads == 1:
+            return iter_chunks(self._map, chunk_size)
+        return join_blocks(iter_blocks_threaded(self._map, threads), chunk_size)
+
+
+class BgzfFile:
+    """
+    Reads a BGZF file from virtual offsets (compressed block offset << 16 | offset
+    within the decompressed block), eg: the chunks of a bam index
+    """
+
+    def __init__(self, path: str, cache_size: int = 0):
+        """
+        :param cache_size: decompressed blocks to keep, for files that are read at
+            overlapping offsets (eg: the chunks of nearby regions)
+        """
+        self.f = open(path, "rb")
+        self.cache_size = cache_size
+        self.cache = {}
+        self.coffset, self.uoffset = 0, 0
+        self.data, self.next_coffset = b"", 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.f.close()
+
+    def block(self, coffset: int) -> Tuple[bytes, int]:
+        """
+        :return: (the decompressed block at coffset, the offset of the next block)
+        """
+        if coffset in self.cache:
+            return self.cache[coffset]
+        self.f.seek(coffset)
+        header = self.f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            return b"", coffset
+        header += self.f.read(_HEADER.unpack_from(header)[-1])
+        bsize, _ = _block_size(header, 0)
+        payload = self.f.read(bsize - len(header))
+        block = zlib.decompress(payload[:-8], -15), coffset + bsize
+        if self.cache_size:
+            if len(self.cache) >= self.cache_size:
+                self.cache.clear()
+            self.cache[coffset] = block
+        return block
+
+    def seek(self, voffset: int):
+        self.coffset, self.uoffset = voffset >> 16, voffset & 0xFFFF
+        self.data, self.next_coffset = self.block(self.coffset)
+
+    def tell(self) -> int:
+        # a position at the end of a block is the start of the next block
+        while self.data and self.uoffset >= len(self.data):
+            self.coffset = self.next_coffset
+            self.uoffset -= len(self.data)
+            self.data, self.next_coffset = self.block(self.coffset)
+        return self.coffset << 16 | self.uoffset
+
+    def read(self, n: int) -> bytes:
+        parts = []
+        while n > 0:
+            self.tell()
+            if not self.data:
+                break
+            part = self.data[self.uoffset : self.uoffset + n]
+            parts.append(part)
+            self.uoffset += len(part)
+            n -= len(part)
+        return b"".join(parts)
+
+    def records(self, start: int, end: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Raw bam records (without the block_size) from the virtual offset start until
+        end (or the end of the file)
+        """
+        self.seek(start)
+        while end is None or self.tell() < end:
+            size = self.read(4)
+            if len(size) < 4:
+                return
+            yield self.read(struct.unpack("<i", size)[0])
+
+
+def read_bam_header(path: str) -> Tuple[List[Tuple[str, int]], int]:
+    """
+    :return: ([(contig, length)], virtual offset of the first record)
+    """
+    with BgzfFile(path) as f:
+        f.seek(0)
+        if f.read(4) != b"BAM\x01":
+            raise BgzfError(f"{path} isn't a bam")
+        f.read(struct.unpack("<i", f.read(4))[0])
+        references = []
+        for _ in range(struct.unpack("<i", f.read(4))[0]):
+            name = f.read(struct.unpack("<i", f.read(4))[0])
+            length = struct.unpack("<i", f.read(4))[0]
+            references.append((name.rstrip(b"\0").decode(), length))
+        return references, f.tell()
+
+
+# the pseudo-bin of a bai holds the contig's read counts, not chunks
+_BAI_PSEUDO_BIN = 37450
+
+
+def read_bai(path: str) -> List[Tuple[Dict[int, List[Tuple[int, int]]], Tuple]]:
+    """
+    :return: for each contig, ({bin: [(start, end) chunks]}, linear index)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"BAI\x01":
+        raise BgzfError(f"{path} isn't a bam index")
+    offset, index = 8, []
+    for _ in range(struct.unpack_from("<i", data, 4)[0]):
+        bins = {}
+        n_bin = struct.unpack_from("<i", data, offset)[0]
+        offset += 4
+        for _ in range(n_bin):
+            bin_id, n_chunk = struct.unpack_from("<Ii", data, offset)
+            chunks = struct.unpack_from(f"<{2 * n_chunk}Q", data, offset + 8)
+            if bin_id != _BAI_PSEUDO_BIN:
+                bins[bin_id] = list(zip(chunks[0::2], chunks[1::2]))
+            offset += 8 + 16 * n_chunk
+        n_intv = struct.unpack_from("<i", data, offset)[0]
+        linear = struct.unpack_from(f"<{n_intv}Q", data, offset + 4)
+        offset += 4 + 8 * n_intv
+        index.append((bins, linear))
+    return index
+
+
+def bai_query(index, tid: int, beg: int = 0, end: int = 1 << 29) -> List[List[int]]:
+    """
+    The merged chunks (of virtual offsets) that may hold reads overlapping [beg, end)
+    of the contig tid, by default every read of the contig
+    """
+    bins, linear = index[tid]
+    min_offset = linear[min(beg >> 14, len(linear) - 1)] if linear and beg else 0
+    bin_ids = [0]
+    for shift, first in ((26, 1), (23, 9), (20, 73), (17, 585), (14, 4681)):
+        bin_ids.extend(range(first + (beg >> shift), first + ((end - 1) >> shift) + 1))
+    chunks = sorted(c for b in bin_ids for c in bins.get(b, []) if c[1] > min_offset)
+    merged = []
+    for start, stop in chunks:
+        start = max(start, min_offset)
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], stop)
+        else:
+            merged.append([start, stop])
+    return merged
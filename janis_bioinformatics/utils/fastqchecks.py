@@ -0,0 +1,257 @@
+"""
+Streaming statistics and validation for (paired end) FASTQ files.
+
+Both mates are read in lockstep, in a single pass, from large decompressed chunks.
+Records are handled in batches: each chunk is split into lines once, and the
+header / sequence / quality lines are sliced out of that list, so checks and counts
+run over whole batches instead of a Python loop per line.
+
+If isal (python-isal) or zlib-ng (zlib-ng) are installed, they're used to
+decompress the gzips, otherwise the standard library gzip module is used.
+
+USAGE: python -m janis_bioinformatics.utils.fastqchecks R1.fastq.gz R2.fastq.gz
+"""
+import gzip
+from itertools import zip_longest
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from isal import igzip as _gzip
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as _gzip
+    except ImportError:
+        _gzip = gzip
+
+CHUNK_SIZE = 4 * 1024 * 1024
+PHRED_OFFSET = 33
+
+
+class FastqValidationError(Exception):
+    pass
+
+
+class FastqStats:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.reads = 0
+        self.bases = 0
+        self.min_length: Optional[int] = None
+        self.max_length: Optional[int] = None
+        # quality character (eg: ord('I')) -> number of bases with that quality
+        self.quality_counts: Dict[int, int] = {}
+
+    def __repr__(self):
+        return (
+            f"FastqStats({self.file_path}: {self.reads} reads, {self.bases} bases, "
+            f"mean quality {self.mean_quality():.2f})"
+        )
+
+    def quality_distribution(self, offset: int = PHRED_OFFSET) -> Dict[int, int]:
+        """
+        Phred quality score -> number of bases with that score
+        """
+        return {q - offset: n for q, n in sorted(self.quality_counts.items())}
+
+    def mean_quality(self, offset: int = PHRED_OFFSET) -> float:
+        if not self.bases:
+            return 0.0
+        total = sum((q - offset) * n for q, n in self.quality_counts.items())
+        return total / self.bases
+
+    def add_batch(self, sequences: List[bytes], qualities: List[bytes]):
+        lengths = list(map(len, sequences))
+        if not lengths:
+            return
+        self.reads += len(lengths)
+        self.bases += sum(lengths)
+
+        if self.min_length is not None:
+            lengths += [self.min_length, self.max_length]
+        self.min_length, self.max_length = min(lengths), max(lengths)
+
+        # delete one quality character at a time, there are usually only a handful
+        # of distinct values (binned qualities), so this is a few passes over the
+        # batch in C instead of a Python loop over every base
+        remaining = b"".join(qualities)
+        while remaining:
+            q = remaining[0]
+            before = len(remaining)
+            remaining = remaining.translate(None, bytes([q]))
+            n = before - len(remaining)
+            self.quality_counts[q] = self.quality_counts.get(q, 0) + n
+
+
+def open_fastq(file_path: str):
+    if file_path.endswith(".gz"):
+        return _gzip.open(file_path, "rb")
+    return open(file_path, "rb")
+
+
+def iter_batches(file_path: str) -> Iterator[Tuple[List[bytes], ...]]:
+    """
+    Yield (headers, sequences, qualities) for batches of complete records, raising a
+    FastqValidationError if a record is malformed
+    """
+    record_idx = 0
+    remainder = b""
+    with open_fastq(file_path) as f:
+        while True:
+            chunk = f.read(CHUNK_SIZE)
+            data = remainder + chunk if remainder else chunk
+            lines = data.split(b"\n")
+            if chunk:
+                # only complete records (4 complete lines) are handled now
+                n_lines = (len(lines) - 1) // 4 * 4
+            else:
+                # end of file, the last line may not have a newline
+                if lines and lines[-1] == b"":
+                    lines.pop()
+                n_lines = len(lines)
+                if n_lines % 4:
+                    raise FastqValidationError(
+                        f"{file_path} is truncated, the last record "
+                        f"(#{record_idx + n_lines // 4 + 1}) has {n_lines % 4} lines"
+                    )
+
+            remainder = b"\n".join(lines[n_lines:])
+            batch = lines[:n_lines]
+            headers, sequences = batch[0::4], batch[1::4]
+            separators, qualities = batch[2::4], batch[3::4]
+            if batch:
+                _check_batch(
+                    file_path, record_idx, headers, sequences, separators, qualities
+                )
+                record_idx += len(headers)
+                yield headers, sequences, qualities
+
+            if not chunk:
+                return
+
+
+def _check_batch(file_path, record_idx, headers, sequences, separators, qualities):
+    if (
+        all(h[:1] == b"@" for h in headers)
+        and all(s[:1] == b"+" for s in separators)
+        and list(map(len, sequences)) == list(map(len, qualities))
+    ):
+        return
+
+    # find the offending record for the error message
+    for idx, (h, seq, sep, qual) in enumerate(
+        zip(headers, sequences, separators, qualities)
+    ):
+        record = f"record #{record_idx + idx + 1} ({h[:50].decode(errors='replace')})"
+        if h[:1] != b"@":
+            raise FastqValidationError(f"{file_path}: {record} doesn't start with '@'")
+        if sep[:1] != b"+":
+            raise FastqValidationError(
+                f"{file_path}: {record} doesn't have a '+' separator line"
+            )
+        if len(seq) != len(qual):
+            raise FastqValidationError(
+                f"{file_path}: {record} has {len(seq)} bases, but {len(qual)} qualities"
+            )
+
+
+def read_name(header: bytes) -> bytes:
+    """
+    The read name without the mate suffix, '@name/1 comment' -> 'name'
+    """
+    name = header[1:].split(None, 1)[0] if len(header) > 1 else b""
+    if name[-2:] in (b"/1", b"/2"):
+        return name[:-2]
+    return name
+
+
+def fastq_pair_stats(
+    r1: str, r2: str, max_reads: Optional[int] = None
+) -> Tuple[FastqStats, FastqStats]:
+    """
+    Walk both mates in lockstep, checking every record is well formed and that
+    the read names of the mates match (ignoring a /1, /2 suffix).
+
+    :param r1: path to the first mate (.fastq or .fastq.gz)
+    :param r2: path to the second mate
+    :param max_reads: only check the first max_reads pairs (a quick pre-flight check)
+    :raises FastqValidationError: on the first problem found
+    """
+    stats1, stats2 = FastqStats(r1), FastqStats(r2)
+    # batches from both files don't have the same number of records, so records
+    # that can't be paired yet are carried over to the next batch
+    pending1, pending2 = _empty_batch(), _empty_batch()
+    batches = zip_longest(iter_batches(r1), iter_batches(r2))
+
+    for batch1, batch2 in batches:
+        if batch1:
+            pending1 = _extend(pending1, batch1)
+        if batch2:
+            pending2 = _extend(pending2, batch2)
+
+        n = min(len(pending1[0]), len(pending2[0]))
+        if max_reads is not None:
+            n = min(n, max_reads - stats1.reads)
+        (h1, s1, q1), pending1 = _split(pending1, n)
+        (h2, s2, q2), pending2 = _split(pending2, n)
+
+        names1, names2 = list(map(read_name, h1)), list(map(read_name, h2))
+        if names1 != names2:
+            idx = next(i for i, (a, b) in enumerate(zip(names1, names2)) if a != b)
+            raise FastqValidationError(
+                f"The read names of pair #{stats1.reads + idx + 1} don't match: "
+                f"'{names1[idx].decode(errors='replace')}' ({r1}) vs "
+                f"'{names2[idx].decode(errors='replace')}' ({r2})"
+            )
+
+        stats1.add_batch(s1, q1)
+        stats2.add_batch(s2, q2)
+
+        if max_reads is not None and stats1.reads >= max_reads:
+            return stats1, stats2
+
+    if pending1[0] or pending2[0]:
+        longer, extra = r1, len(pending1[0])
+        if pending2[0]:
+            longer, extra = r2, len(pending2[0])
+        raise FastqValidationError(
+            f"The mates have a different number of reads, {longer} has {extra} more "
+            f"reads than its mate (after {stats1.reads} pairs)"
+        )
+
+    return stats1, stats2
+
+
+def fastq_stats(file_path: str) -> FastqStats:
+    stats = FastqStats(file_path)
+    for _, sequences, qualities in iter_batches(file_path):
+        stats.add_batch(sequences, qualities)
+    return stats
+
+
+def _empty_batch():
+    return [], [], []
+
+
+def _extend(pending, batch):
+    if not pending[0]:
+        return batch
+    return tuple(p + b for p, b in zip(pending, batch))
+
+
+def _split(batch, n: int):
+    return tuple(b[:n] for b in batch), tuple(b[n:] for b in batch)
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+
+    try:
+        for s in fastq_pair_stats(sys.argv[1], sys.argv[2]):
+            print(s)
+    except FastqValidationError as e:
+        print(f"INVALID: {e}")
+        sys.exit(1)
@@ -0,0 +1,200 @@
+"""
+In-process equivalent of 'samtools flagstat' (as of samtools 1.9).
+
+BAM records are read straight out of the decompressed BGZF chunks, only the fields
+flagstat needs (refID, mapq, flag, next_refID) are unpacked. The counters only
+depend on those, so records are tallied by (flag, mate on a different chr,
+mapq >= 5) and the flagstat counters are derived from the (few) distinct keys.
+"""
+import struct
+from collections import Counter
+from typing import Dict, Iterator, Tuple
+
+from janis_bioinformatics.utils.bgzf import BgzfReader
+
+# block_size, refID, [pos, l_read_name], mapq, [bin, n_cigar_op], flag, [l_seq],
+# next_refID (skipped fields in brackets)
+_RECORD = struct.Struct("<ii5xB4xH4xi")
+_INT32 = struct.Struct("<i")
+
+BAM_MAGIC = b"BAM\x01"
+
+FPAIRED = 0x1
+FPROPER_PAIR = 0x2
+FUNMAP = 0x4
+FMUNMAP = 0x8
+FREAD1 = 0x40
+FREAD2 = 0x80
+FSECONDARY = 0x100
+FQCFAIL = 0x200
+FDUP = 0x400
+FSUPPLEMENTARY = 0x800
+
+# in the order samtools flagstat prints them
+FLAGSTAT_FIELDS = [
+    "total",
+    "secondary",
+    "supplementary",
+    "duplicates",
+    "mapped",
+    "paired",
+    "read1",
+    "read2",
+    "properly_paired",
+    "with_itself_and_mate_mapped",
+    "singletons",
+    "mate_different_chr",
+    "mate_different_chr_mapq5",
+]
+
+
+def iter_record_keys(path: str) -> Iterator[Tuple[int, bool, bool]]:
+    """
+    Yield (flag, mate mapped to a different reference, mapq >= 5) for each
+    record in the BAM at path, in file order.
+    """
+    unpack_from = _RECORD.unpack_from
+    with BgzfReader(path) as reader:
+        chunks = reader.chunks()
+        data, offset = _skip_header(path, chunks)
+
+        while True:
+            end = len(data)
+            # the 4 + 32 byte fixed part of the record must be available
+            while offset + 36 <= end:
+                block_size, ref_id, mapq, flag, next_ref_id = unpack_from(data, offset)
+                if offset + 4 + block_size > end:
+                    break
+                yield flag, ref_id != next_ref_id, mapq >= 5
+                offset += 4 + block_size
+
+            chunk = next(chunks, None)
+            if chunk is None:
+                break
+            # carry the partial record over to the next chunk
+            data, offset = data[offset:] + chunk, 0
+
+        if offset != len(data):
+            raise Exception(f"Truncated BAM record at the end of {path}")
+
+
+def _skip_header(path: str, chunks: Iterator[bytes]) -> Tuple[bytes, int]:
+    """
+    Consume the BAM header from chunks, returning the remaining data + offset
+    """
+    data = b""
+
+    def ensure(n):
+        nonlocal data
+        while len(data) < n:
+            chunk = next(chunks, None)
+            if chunk is None:
+                raise Exception(f"Truncated BAM header in {path}")
+            data += chunk
+
+    ensure(8)
+    if data[:4] != BAM_MAGIC:
+        raise Exception(f"{path} is not a BAM file")
+    offset = 8 + _INT32.unpack_from(data, 4)[0]
+
+    ensure(offset + 4)
+    n_ref = _INT32.unpack_from(data, offset)[0]
+    offset += 4
+    for _ in range(n_ref):
+        ensure(offset + 4)
+        # l_name, name, l_ref
+        offset += 4 + _INT32.unpack_from(data, offset)[0] + 4
+    ensure(offset)
+
+    return data, offset
+
+
+def count_flags(path: str) -> Dict[str, Tuple[int, int]]:
+    """
+    The samtools flagstat counters for the BAM at path, each as a
+    (QC-passed, QC-failed) pair, keyed by FLAGSTAT_FIELDS.
+    """
+    counts = {f: [0, 0] for f in FLAGSTAT_FIELDS}
+
+    for (flag, diff_chr, high_mapq), n in Counter(iter_record_keys(path)).items():
+        w = 1 if flag & FQCFAIL else 0
+        counts["total"][w] += n
+        if flag & FSECONDARY:
+            counts["secondary"][w] += n
+        elif flag & FSUPPLEMENTARY:
+            counts["supplementary"][w] += n
+        elif flag & FPAIRED:
+            counts["paired"][w] += n
+            if flag & FPROPER_PAIR and not flag & FUNMAP:
+                counts["properly_paired"][w] += n
+            if flag & FREAD1:
+                counts["read1"][w] += n
+            if flag & FREAD2:
+                counts["read2"][w] += n
+            if flag & FMUNMAP and not flag & FUNMAP:
+                counts["singletons"][w] += n
+            if not flag & FUNMAP and not flag & FMUNMAP:
+                counts["with_itself_and_mate_mapped"][w] += n
+                if diff_chr:
+                    counts["mate_different_chr"][w] += n
+                    if high_mapq:
+                        counts["mate_different_chr_mapq5"][w] += n
+        if not flag & FUNMAP:
+            counts["mapped"][w] += n
+        if flag & FDUP:
+            counts["duplicates"][w] += n
+
+    return {k: tuple(v) for k, v in counts.items()}
+
+
+def _percent(n: int, total: int) -> str:
+    if total == 0:
+        return "N/A"
+    # samtools computes (float)n / total * 100.0, single precision matters for %.2f
+    ratio = _as_float32(_as_float32(n) / _as_float32(total))
+    return f"{ratio * 100.0:.2f}%"
+
+
+def _as_float32(value) -> float:
+    return struct.unpack("f", struct.pack("f", value))[0]
+
+
+def format_flagstat(counts: Dict[str, Tuple[int, int]]) -> str:
+    """
+    Render the counters exactly as samtools flagstat prints them
+    """
+
+    def pair(field):
+        return f"{counts[field][0]} + {counts[field][1]}"
+
+    def percents(field, of):
+        return (
+            f"({_percent(counts[field][0], counts[of][0])} : "
+            f"{_percent(counts[field][1], counts[of][1])})"
+        )
+
+    lines = [
+        f"{pair('total')} in total (QC-passed reads + QC-failed reads)",
+        f"{pair('secondary')} secondary",
+        f"{pair('supplementary')} supplementary",
+        f"{pair('duplicates')} duplicates",
+        f"{pair('mapped')} mapped {percents('mapped', 'total')}",
+        f"{pair('paired')} paired in sequencing",
+        f"{pair('read1')} read1",
+        f"{pair('read2')} read2",
+        f"{pair('properly_paired')} properly paired "
+        f"{percents('properly_paired', 'paired')}",
+        f"{pair('with_itself_and_mate_mapped')} with itself and mate mapped",
+        f"{pair('singletons')} singletons {percents('singletons', 'paired')}",
+        f"{pair('mate_different_chr')} with mate mapped to a different chr",
+        f"{pair('mate_different_chr_mapq5')} with mate mapped to a different chr "
+        f"(mapQ>=5)",
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def flagstat(path: str) -> str:
+    """
+    Equivalent to the stdout of 'samtools flagstat {path}'
+    """
+    return format_flagstat(count_flags(path))
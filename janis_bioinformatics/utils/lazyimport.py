@@ -0,0 +1,56 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional
+
+
+def attach(
+    package_name: str,
+    submodules: Optional[Iterable[str]] = None,
+    submod_attrs: Optional[Dict[str, List[str]]] = None,
+):
+    """
+    Build the module level __getattr__ / __dir__ / __all__ (PEP 562) for a package
+    whose contents should only be imported when they're first accessed.
+
+    :param package_name: __name__ of the package attaching the loader
+    :param submodules: subpackages / modules exposed as attributes of the package
+    :param submod_attrs: index of {relative module: [names the package re-exports]}
+    :return: (__getattr__, __dir__, __all__)
+    """
+    submodules = set(submodules or [])
+    attr_to_module = {
+        attr: module for module, attrs in (submod_attrs or {}).items() for attr in attrs
+    }
+    __all__ = sorted(submodules | set(attr_to_module.keys()))
+
+    def __getattr__(name):
+        if name in attr_to_module:
+            module = importlib.import_module(f"{package_name}.{attr_to_module[name]}")
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package_name}.{name}")
+        else:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+
+        # cache on the package so __getattr__ is only hit once per name
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return __all__
+
+    return __getattr__, __dir__, list(__all__)
+
+
+def load_all(module: ModuleType) -> ModuleType:
+    """
+    Resolve every lazily attached name of a package (and of its lazy subpackages),
+    so that tools that traverse module.__dict__ (eg: JanisShed) can see them.
+    """
+    prefix = module.__name__ + "."
+    for name in getattr(module, "__all__", []):
+        value = getattr(module, name)
+        if isinstance(value, ModuleType) and value.__name__.startswith(prefix):
+            load_all(value)
+    return module
@@ -0,0 +1,82 @@
+"""
+Map a function over forked worker processes.
+
+Unlike multiprocessing.Pool / ProcessPoolExecutor, the function isn't pickled (the
+workers inherit it when they're forked), so it can be a closure, eg: the nested
+functions of a PythonTool's code_block. Only the results are pickled back. The pmac
+PythonTools embed this module, so it only uses the standard library.
+"""
+
+import multiprocessing
+import os
+import queue
+import traceback
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple
+
+# seconds between checks that the workers are still alive
+_POLL_INTERVAL = 1
+
+
+class WorkerError(Exception):
+    pass
+
+
+def fork_map(
+    func: Callable, items: Iterable, processes: Optional[int] = None
+) -> Iterator[Tuple[Any, Any]]:
+    """
+    (item, func(item)) for each item, in the order they finish
+
+    :param processes: defaults to the number of available cpus, the items are mapped
+        in this process if there's only one
+    :raises WorkerError: if func raises in a worker, or a worker dies (eg: it's
+        killed for using too much memory), instead of waiting for it forever
+    """
+    items = list(items)
+    processes = min(len(items), processes or len(os.sched_getaffinity(0)))
+    if processes <= 1:
+        for item in items:
+            yield item, func(item)
+        return
+
+    ctx = multiprocessing.get_context("fork")
+    todo, done = ctx.Queue(), ctx.Queue()
+
+    def worker():
+        for idx in iter(todo.get, None):
+            try:
+                done.put((idx, None, func(items[idx])))
+            except BaseException:
+                done.put((idx, traceback.format_exc(), None))
+                return
+
+    for idx in range(len(items)):
+        todo.put(idx)
+    for _ in range(processes):
+        todo.put(None)
+    workers = [ctx.Process(target=worker, daemon=True) for _ in range(processes)]
+    for w in workers:
+        w.start()
+
+    try:
+        for _ in items:
+            while True:
+                try:
+                    idx, error, result = done.get(timeout=_POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    for w in workers:
+                        if w.exitcode not in (None, 0):
+                            raise WorkerError(
+                                f"A worker process exited with code {w.exitcode}"
+                            )
+            if error is not None:
+                raise WorkerError(
+                    f"{items[idx]!r} failed in a worker process:\n{error}"
+                )
+            yield items[idx], result
+    finally:
+        for w in workers:
+            if w.is_alive():
+                w.terminate()
+            w.join()
@@ -0,0 +1,294 @@
+"""
+A content addressed, on-disk cache for tool / workflow translations.
+
+Translating a large workflow (eg: BwaAligner, GatkSomaticVariantCaller_4_1_3) renders
+every nested tool, even though the output only changes when one of those tools (or the
+translation options) change. The cache key is built from:
+
+    - the tool's versioned_id,
+    - the versioned_id, source (the files of every class in its MRO) and state (eg:
+      constructor arguments, builder definitions) of every tool / subworkflow it
+      contains,
+    - the installed janis_core and janis_bioinformatics versions,
+    - the translation and the translation options,
+
+and entries are evicted least-recently-used first once the cache exceeds max_entries.
+
+BioinformaticsWorkflow.translate goes through the cache when the translation is only
+returned (not written to disk), JANIS_BIOINFORMATICS_TRANSLATION_CACHE=off turns it off.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+import tempfile
+from typing import Dict, List, Optional
+
+from janis_bioinformatics.__meta__ import __version__
+
+DEFAULT_CACHE_DIR = os.environ.get(
+    "JANIS_BIOINFORMATICS_TRANSLATION_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "janis", "translations"),
+)
+DEFAULT_MAX_ENTRIES = 512
+DISABLED_VALUES = {"", "0", "off", "false"}
+
+_source_hashes: Dict[str, str] = {}
+
+# instance attributes that differ between otherwise identical tools, eg: janis numbers
+# every node it creates from a process wide counter
+VOLATILE_ATTRIBUTES = {"_nodeId"}
+
+
+def cache_enabled() -> bool:
+    return DEFAULT_CACHE_DIR.lower() not in DISABLED_VALUES
+
+
+def translate_cached(
+    tool,
+    translation: str,
+    cache_dir: Optional[str] = None,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+    to_console: bool = False,
+    **kwargs,
+):
+    """
+    Equivalent to tool.translate(translation, **kwargs) (without writing to disk),
+    but the result is memoised on disk, keyed on the contents of the tool.
+
+    :param tool: tool or workflow (class or instance)
+    :param translation: eg: "wdl", "cwl"
+    :param cache_dir: defaults to $JANIS_BIOINFORMATICS_TRANSLATION_CACHE
+    :param max_entries: translations to keep before evicting the least recently used
+    :param to_console: print the translated tool
+    :param kwargs: other translation options passed to tool.translate
+    :return: whatever tool.translate returns
+    """
+    if kwargs.get("to_disk"):
+        raise Exception(
+            "translate_cached only returns the translation, call tool.translate "
+            "directly to write the translation to disk"
+        )
+
+    if inspect.isclass(tool):
+        tool = tool()
+
+    cache = TranslationCache(cache_dir or DEFAULT_CACHE_DIR, max_entries=max_entries)
+    key = translation_key(tool, translation, kwargs)
+
+    result = cache.get(key)
+    if result is None:
+        # a BioinformaticsWorkflow's translate would come back to the cache
+        translate = getattr(tool, "translate_uncached", tool.translate)
+        result = translate(translation, to_console=False, to_disk=False, **kwargs)
+        cache.set(key, result)
+
+    if to_console:
+        print(result[0] if isinstance(result, tuple) else result)
+
+    return result
+
+
+def translation_key(tool, translation: str, options: dict) -> str:
+    import janis_core
+
+    dependencies = sorted(
+        f"{t.versioned_id()}:{_source_hash(t)}:{_state_hash(t)}"
+        for t in _dependency_tree(tool)
+    )
+    components = {
+        "tool": tool.versioned_id(),
+        "dependencies": dependencies,
+        "janis_core": getattr(janis_core, "__version__", None),
+        "janis_bioinformatics": __version__,
+        "translation": str(translation),
+        "options": {k: _stable_repr(v) for k, v in sorted(options.items())},
+    }
+    serialised = json.dumps(components, sort_keys=True).encode()
+    return hashlib.sha256(serialised).hexdigest()
+
+
+def _dependency_tree(tool) -> List:
+    """
+    The tool, and recursively every tool and subworkflow it contains
+    """
+    tools, queue, seen = [], [tool], set()
+    while queue:
+        t = queue.pop()
+        if id(t) in seen:
+            continue
+        seen.add(id(t))
+        tools.append(t)
+        step_nodes = getattr(t, "step_nodes", None) or {}
+        queue.extend(s.tool for s in step_nodes.values())
+    return tools
+
+
+def _source_hash(tool) -> str:
+    """
+    Hash of the files of every class in the tool's MRO, as the inputs and command of
+    a versioned tool usually live in its base class (eg: Gatk4HaplotypeCaller_4_1_3)
+    """
+    paths = []
+    for cls in type(tool).__mro__:
+        try:
+            path = inspect.getsourcefile(cls)
+        except TypeError:
+            # builtins (eg: object)
+            continue
+        if path and path not in paths and os.path.exists(path):
+            paths.append(path)
+
+    return hashlib.sha256(
+        "".join(f"{p}:{_file_hash(p)}" for p in paths).encode()
+    ).hexdigest()
+
+
+def _file_hash(path: str) -> str:
+    stat = os.stat(path)
+    cache_key = f"{path}:{stat.st_mtime_ns}:{stat.st_size}"
+    if cache_key not in _source_hashes:
+        with open(path, "rb") as f:
+            _source_hashes[cache_key] = hashlib.sha256(f.read()).hexdigest()
+    return _source_hashes[cache_key]
+
+
+def _state_hash(tool) -> str:
+    """
+    Hash of the instance state of the tool, so two instances of the same class built
+    differently (constructor arguments, CommandToolBuilder / WorkflowBuilder
+    definitions) don't share an entry. Nested tools are represented by their
+    versioned_id, they're hashed as dependencies of their own.
+    """
+    state = _stable_repr(
+        _attributes(tool) if hasattr(tool, "__dict__") else tool, root=tool
+    )
+    return hashlib.sha256(state.encode()).hexdigest()
+
+
+def _stable_repr(
+    value, root=None, seen: Optional[set] = None, memo: Optional[dict] = None
+) -> str:
+    """
+    A repr that's the same across processes: no id() / memory addresses, sorted
+    dicts and sets, and cycles (eg: workflow graphs) replaced by a reference. Objects
+    reached more than once (eg: the nodes of a workflow graph) are only rendered once.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return repr(value)
+    if inspect.isclass(value) or inspect.isroutine(value):
+        return f"{getattr(value, '__module__', '')}.{value.__qualname__}"
+    # not hasattr: janis' StepNode.__getattr__ raises a KeyError for any missing name
+    if getattr(type(value), "versioned_id", None) and value is not root:
+        try:
+            return f"<tool {value.versioned_id()}>"
+        except Exception:
+            pass
+
+    seen = seen if seen is not None else set()
+    memo = memo if memo is not None else {}
+    if id(value) in seen:
+        return f"<ref {type(value).__qualname__}>"
+    if id(value) in memo:
+        return memo[id(value)][1]
+
+    def inner(v):
+        return _stable_repr(v, root, seen, memo)
+
+    seen.add(id(value))
+    try:
+        if isinstance(value, (list, tuple)):
+            r = "[" + ", ".join(inner(v) for v in value) + "]"
+        elif isinstance(value, (set, frozenset)):
+            r = "{" + ", ".join(sorted(inner(v) for v in value)) + "}"
+        elif isinstance(value, dict):
+            items = sorted((inner(k), inner(v)) for k, v in value.items())
+            r = "{" + ", ".join(f"{k}: {v}" for k, v in items) + "}"
+        elif hasattr(value, "__dict__"):
+            r = f"{type(value).__qualname__}{inner(_attributes(value))}"
+        else:
+            r = repr(value)
+            # the default object repr embeds the address
+            if " at 0x" in r:
+                r = type(value).__qualname__
+    finally:
+        seen.discard(id(value))
+
+    # keep the value alive, so its id isn't reused by another object
+    memo[id(value)] = (value, r)
+    return r
+
+
+def _attributes(value) -> dict:
+    return {k: v for k, v in vars(value).items() if k not in VOLATILE_ATTRIBUTES}
+
+
+class TranslationCache:
+    def __init__(self, cache_dir: str, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".pickle")
+
+    def get(self, key: str):
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as f:
+                result = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # mark as recently used for the LRU eviction
+        os.utime(path)
+        return result
+
+    def set(self, key: str, value):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # write then rename, so concurrent readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path_for(key))
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for e in it:
+                if e.name.endswith(".pickle"):
+                    entries.append((e.stat().st_mtime, e.path))
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[: len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # another process already evicted it
+                pass
+
+    def clear(self):
+        if not os.path.exists(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pickle"):
+                os.remove(os.path.join(self.cache_dir, name))
+
+
+if __name__ == "__main__":
+    # python -m janis_bioinformatics.utils.translationcache clear
+    if len(sys.argv) > 1 and sys.argv[1] == "clear":
+        TranslationCache(DEFAULT_CACHE_DIR).clear()
@@ -0,0 +1,224 @@
+"""
+Block based implementations of the VCF test preprocessors (Vcf / CompressedVcf).
+
+Files are read in large binary chunks (BGZF blocks are decompressed on a thread
+pool), only the lines that contain '##' are inspected to filter headers, and
+everything in between is hashed as is. Lines are counted by counting b"\\n" in each
+chunk, large BGZF files are split (on block boundaries) across a process pool.
+"""
+import gzip
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from janis_bioinformatics.utils.bgzf import BgzfReader, is_bgzf, join_blocks
+
+CHUNK_SIZE = 1024 * 1024
+# smaller BGZF files aren't worth starting a process pool for
+PARALLEL_MIN_SIZE = 64 * 1024 * 1024
+
+
+def iter_decompressed_chunks(
+    file_path: str, compressed: bool, threads: Optional[int] = None
+) -> Iterator[bytes]:
+    """
+    The (decompressed) contents of the file in chunks of roughly CHUNK_SIZE bytes
+    """
+    if not compressed:
+        with open(file_path, "rb") as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+    elif is_bgzf(file_path):
+        with BgzfReader(file_path) as reader:
+            yield from reader.chunks(CHUNK_SIZE, threads=threads)
+    else:
+        with gzip.open(file_path, "rb") as f:
+            yield from iter(lambda: f.read(CHUNK_SIZE), b"")
+
+
+def iter_line_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Re-cut the chunks so that every chunk ends on a line ending, the newlines are
+    normalised the way a file opened in text mode (universal newlines) reads them.
+    """
+    remainder = b""
+    for chunk in chunks:
+        data = remainder + chunk if remainder else chunk
+        # keep a trailing '\r', it might be the start of a '\r\n'
+        cut = max(data.rfind(b"\n"), data.rfind(b"\r", 0, len(data) - 1)) + 1
+        if cut == 0:
+            remainder = data
+            continue
+        remainder = data[cut:]
+        yield _normalise_newlines(data[:cut])
+    if remainder:
+        yield _normalise_newlines(remainder)
+
+
+def _normalise_newlines(data: bytes) -> bytes:
+    if b"\r" not in data:
+        return data
+    return data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
+def md5_without_header(
+    file_path: str,
+    headers_to_remove: List[str],
+    compressed: bool = False,
+    threads: Optional[int] = None,
+) -> str:
+    """
+    md5 of the (decompressed) VCF, skipping every line that contains '##{header}'
+    for any of the headers_to_remove.
+    """
+    to_remove = [("##" + header).encode() for header in headers_to_remove]
+    hash_md5 = hashlib.md5()
+
+    chunks = iter_decompressed_chunks(file_path, compressed, threads=threads)
+    for chunk in iter_line_chunks(chunks):
+        if not to_remove:
+            hash_md5.update(chunk)
+            continue
+        for kept in _without_lines_containing(chunk, to_remove):
+            hash_md5.update(kept)
+
+    return hash_md5.hexdigest()
+
+
+def _without_lines_containing(chunk: bytes, to_remove: List[bytes]) -> List[bytes]:
+    """
+    The slices of chunk left after removing each line that contains any of
+    to_remove, only lines containing '##' (which every value of to_remove starts
+    with) are inspected.
+    """
+    kept, start = [], 0
+    pos = chunk.find(b"##")
+    while pos != -1:
+        line_start = chunk.rfind(b"\n", 0, pos) + 1
+        line_end = chunk.find(b"\n", pos) + 1 or len(chunk)
+        line = chunk[line_start:line_end]
+        if any(h in line for h in to_remove):
+            kept.append(chunk[start:line_start])
+            start = line_end
+        pos = chunk.find(b"##", line_end)
+    kept.append(chunk[start:])
+    return kept
+
+
+class LineStats(NamedTuple):
+    """
+    Line counts of a contiguous piece of a file, adjacent pieces are merged with
+    merge_line_stats, so the first / last bytes are kept to stitch lines (and CRLF
+    line endings) that cross from one piece into the next.
+    """
+
+    # line endings (LF, CRLF or CR, as text mode reads them)
+    newlines: int = 0
+    # lines starting with '#', excluding the line that starts the piece
+    header_lines: int = 0
+    first: bytes = b""
+    last: bytes = b""
+
+    def line_count(self) -> int:
+        """
+        Same as the number of lines readline() returns in text mode
+        """
+        return self.newlines + (1 if self.last not in b"\r\n" else 0)
+
+    def record_count(self) -> int:
+        """
+        The number of lines that aren't headers (ie: don't start with '#')
+        """
+        return self.line_count() - self.header_lines - (self.first == b"#")
+
+
+def chunk_line_stats(chunk: bytes) -> LineStats:
+    normalised = chunk
+    if b"\r" in chunk:
+        normalised = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return LineStats(
+        newlines=normalised.count(b"\n"),
+        header_lines=normalised.count(b"\n#"),
+        first=chunk[:1],
+        last=chunk[-1:],
+    )
+
+
+def merge_line_stats(a: LineStats, b: LineStats) -> LineStats:
+    if not a.first:
+        return b
+    if not b.first:
+        return a
+    newlines = a.newlines + b.newlines
+    header_lines = a.header_lines + b.header_lines
+    if a.last == b"\r" and b.first == b"\n":
+        # a CRLF split across the pieces
+        newlines -= 1
+    elif a.last in b"\r\n" and b.first == b"#":
+        header_lines += 1
+    return LineStats(newlines, header_lines, a.first, b.last)
+
+
+def line_stats(
+    file_path: str, compressed: bool, processes: Optional[int] = None
+) -> LineStats:
+    """
+    Count the lines of a (compressed) file, large BGZF files are split into ranges
+    of blocks that are counted on a process pool.
+    """
+    processes = processes or os.cpu_count() or 1
+    if (
+        compressed
+        and processes > 1
+        and os.path.getsize(file_path) >= PARALLEL_MIN_SIZE
+        and is_bgzf(file_path)
+    ):
+        return _bgzf_line_stats_parallel(file_path, processes)
+
+    chunks = iter_decompressed_chunks(file_path, compressed)
+    return reduce(merge_line_stats, map(chunk_line_stats, chunks), LineStats())
+
+
+def _bgzf_line_stats_parallel(file_path: str, processes: int):
+    with BgzfReader(file_path) as reader:
+        offsets = reader.block_offsets()
+    offsets.append(os.path.getsize(file_path))
+
+    # a few ranges per process, so a slow range doesn't hold up the rest
+    n_ranges = min(4 * processes, len(offsets) - 1)
+    bounds = [offsets[(len(offsets) - 1) * i // n_ranges] for i in range(n_ranges + 1)]
+    ranges = list(zip(bounds[:-1], bounds[1:]))
+
+    with ProcessPoolExecutor(processes) as pool:
+        stats = pool.map(
+            _bgzf_range_line_stats,
+            [file_path] * len(ranges),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+        )
+        return reduce(merge_line_stats, stats, LineStats())
+
+
+def _bgzf_range_line_stats(file_path: str, start: int, end: int) -> LineStats:
+    with BgzfReader(file_path) as reader:
+        chunks = join_blocks(reader.blocks(start, end), CHUNK_SIZE)
+        return reduce(merge_line_stats, map(chunk_line_stats, chunks), LineStats())
+
+
+def line_count(
+    file_path: str, compressed: bool = False, processes: Optional[int] = None
+) -> int:
+    """
+    The number of lines in the (decompressed) file
+    """
+    return line_stats(file_path, compressed, processes).line_count()
+
+
+def record_count(
+    file_path: str, compressed: bool = False, processes: Optional[int] = None
+) -> int:
+    """
+    The number of non-header lines (that don't start with '#') in the VCF
+    """
+    return line_stats(file_path, compressed, processes).record_count()
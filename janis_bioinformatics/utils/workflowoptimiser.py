@@ -0,0 +1,352 @@
+"""
+Remove redundant compress / decompress steps from a workflow before it's translated.
+
+Workflows often convert a file with one of the registered transformations (eg: bgzip,
+UncompressArchive) only because the next tool was written for the other format, eg:
+
+    combinevariants -> BGZip -> BcfToolsSort (which accepts a Vcf or CompressedVcf)
+    haplotype_caller -> UncompressArchive -> SplitMultiAllele (same)
+
+Each of those steps reads and writes the whole file. remove_redundant_conversions
+walks the workflow's steps and:
+
+    1. fuses round-trips, a conversion straight back to the type it started from (eg:
+       BGZip -> UncompressArchive) by connecting the consumers to the original file,
+    2. removes a conversion when every step consuming it also accepts the unconverted
+       file (eg: the UncompressArchive before SplitMultiAllele).
+
+A step is only removed when nothing else depends on it: it isn't scattered or
+conditional, isn't a workflow output, and all of its consumers are connected to its
+output directly or through .as_type (not through another operator or a scatter). When
+the consumer's input only accepts a parent of the unconverted type (eg: a VcfTabix into
+Union<Vcf, CompressedVcf>), the new connection is .as_type(<that parent>).
+
+It's opt in, translating a workflow doesn't call it: the released workflows keep the
+graph they were published with, and a revision of one calls
+self.remove_redundant_conversions() at the end of its constructor (eg:
+GatkGermlineVariantCaller_4_1_3_0_1).
+"""
+
+from typing import Dict, List, NamedTuple, Optional
+
+from janis_core import UnionType
+from janis_core.operators.selectors import AliasSelector
+
+# rough bgzip ratio of a vcf / bed, to estimate the size of the other side of a step
+COMPRESSION_RATIO = 4
+COMPRESSED_EXTENSIONS = (".gz", ".bgz")
+
+
+class RemovedConversion(NamedTuple):
+    step_id: str
+    tool_id: str
+    # the step that replaced it in its consumers, None for a workflow input
+    source_id: Optional[str]
+    # True if the step compressed its input, False if it decompressed it, None if it
+    # did neither (eg: an indexer like SamToolsIndex or faidx)
+    compresses: Optional[bool]
+
+    def bytes_saved(self, input_size: int) -> int:
+        """
+        Bytes the step would have read and written, for an input of input_size bytes.
+        Only compressing and decompressing are counted, an indexer's output isn't
+        estimated from its input.
+        """
+        if self.compresses is None:
+            return 0
+        if self.compresses:
+            return input_size + input_size // COMPRESSION_RATIO
+        return input_size + input_size * COMPRESSION_RATIO
+
+
+class OptimisationReport:
+    def __init__(self, workflow_id: str, removed: List[RemovedConversion]):
+        self.workflow_id = workflow_id
+        self.removed = removed
+
+    def bytes_saved(self, input_sizes: Dict[str, int]) -> int:
+        """
+        :param input_sizes: {step_id: size in bytes of the file going into the step},
+            eg: from the outputs of a previous run, removed steps without a size count
+            as 0
+        """
+        return sum(
+            r.bytes_saved(input_sizes[r.step_id])
+            for r in self.removed
+            if r.step_id in input_sizes
+        )
+
+    def report(self, input_sizes: Optional[Dict[str, int]] = None) -> str:
+        lines = [
+            f"{self.workflow_id}: removed {len(self.removed)} redundant conversion(s)"
+        ]
+        for r in self.removed:
+            source = r.source_id or "(workflow input)"
+            line = f"    {r.step_id} ({r.tool_id}), consumers now read from {source}"
+            if input_sizes and r.step_id in input_sizes:
+                line += f", saves ~{r.bytes_saved(input_sizes[r.step_id])} bytes"
+            lines.append(line)
+        if input_sizes:
+            lines.append(f"    I/O saved: ~{self.bytes_saved(input_sizes)} bytes")
+        return "\n".join(lines)
+
+    def __str__(self):
+        return self.report()
+
+
+def conversion_tools() -> Dict[str, Optional[bool]]:
+    """
+    {tool_id: compresses} for the tools of the registered transformations, where
+    compresses is None for the tools that neither compress nor decompress (indexers)
+    """
+    from janis_bioinformatics.transformations import transformations
+
+    tools = {}
+    for t in transformations:
+        compressed_in, compressed_out = _is_compressed(t.type1), _is_compressed(t.type2)
+        tools[t.tool.id()] = None if compressed_in == compressed_out else compressed_out
+    return tools
+
+
+def remove_redundant_conversions(workflow) -> OptimisationReport:
+    """
+    Remove the redundant conversions from workflow (in place), call this before the
+    workflow is translated.
+    """
+    tools = conversion_tools()
+    removed: List[RemovedConversion] = []
+
+    changed = True
+    while changed:
+        changed = False
+        for step in list(workflow.step_nodes.values()):
+            if step.id() not in workflow.step_nodes or not _is_conversion(step, tools):
+                continue
+
+            source = _single_source(step)
+            if source is None:
+                continue
+
+            # 1. a round-trip: source -> conversion -> step, where the consumers of
+            #    step accept the type before the first conversion
+            upstream = getattr(_unaliased(source), "node", None)
+            if (
+                upstream is not None
+                and upstream.id() in workflow.step_nodes
+                and _is_conversion(upstream, tools)
+                and _consumers(workflow, upstream) == [step]
+            ):
+                original = _single_source(upstream)
+                if original is not None and _can_bypass(workflow, step, original):
+                    for s in (upstream, step):
+                        removed.append(_remove_step(workflow, s, original, tools))
+                    changed = True
+                    continue
+
+            # 2. every consumer accepts the unconverted file
+            if _can_bypass(workflow, step, source, conversions=tools):
+                removed.append(_remove_step(workflow, step, source, tools))
+                changed = True
+
+    return OptimisationReport(workflow.id(), removed)
+
+
+def _is_compressed(datatype) -> bool:
+    dt = datatype() if isinstance(datatype, type) else datatype
+    extension = getattr(dt, "extension", None) or ""
+    return extension.endswith(COMPRESSED_EXTENSIONS)
+
+
+def _is_conversion(step, tools: Dict[str, Optional[bool]]) -> bool:
+    return (
+        step.tool.id() in tools
+        and getattr(step, "scatter", None) is None
+        and getattr(step, "when", None) is None
+    )
+
+
+def _unaliased(selector):
+    """
+    The selector under any .as_type(...)
+    """
+    while isinstance(selector, AliasSelector):
+        selector = selector.inner_selector
+    return selector
+
+
+def _edges(step):
+    for tag_input in step.sources.values():
+        for edge in tag_input.source_map:
+            yield tag_input, edge
+
+
+def _single_source(step):
+    """
+    The selector of the one file the step converts, or None if it's not that simple
+    (eg: several connected inputs, or an operator in between). Static and defaulted
+    inputs (eg: force=True, which janis turns into a workflow input) are options of
+    the step rather than the file it converts.
+    """
+    files = []
+    for _, edge in _edges(step):
+        source = _unaliased(edge.source)
+        if hasattr(source, "node") or (
+            hasattr(source, "input_node") and not _is_static(source)
+        ):
+            files.append(edge.source)
+    if len(files) != 1:
+        return None
+    return files[0]
+
+
+def _is_static(selector) -> bool:
+    node = selector.input_node
+    return (
+        getattr(node, "default", None) is not None
+        or getattr(node, "value", None) is not None
+    )
+
+
+def _consumer_edges(workflow, step):
+    """
+    The (tag_input, edge, consumer) that read any output of step. If something else
+    reads from step (a workflow output, an operator) this returns None.
+    """
+    for output in workflow.output_nodes.values():
+        if _references(output.source, step):
+            return None
+
+    found = []
+    for consumer in workflow.step_nodes.values():
+        for tag_input, edge in _edges(consumer):
+            if getattr(_unaliased(edge.source), "node", None) is step:
+                if getattr(edge, "scatter", False):
+                    return None
+                found.append((tag_input, edge, consumer))
+            elif _references(edge.source, step):
+                return None
+    return found
+
+
+def _consumers(workflow, step) -> Optional[list]:
+    edges = _consumer_edges(workflow, step)
+    if edges is None:
+        return None
+    return list({id(c): c for _, _, c in edges}.values())
+
+
+def _references(value, step) -> bool:
+    """
+    Whether an operator (or list of them) reads from step
+    """
+    if value is None:
+        return False
+    if isinstance(value, (list, tuple)):
+        return any(_references(v, step) for v in value)
+    if getattr(_unaliased(value), "node", None) is step:
+        return True
+    args = getattr(value, "args", None)
+    return args is not None and _references(list(args), step)
+
+
+def _can_bypass(workflow, step, source, conversions=None) -> bool:
+    """
+    Whether the consumers of step can read source instead
+
+    :param conversions: if given, consumers running one of these tools block the bypass
+    """
+    edges = _consumer_edges(workflow, step)
+    if not edges:
+        return False
+
+    source_type = source.returntype()
+    for tag_input, edge, consumer in edges:
+        if conversions and consumer.tool.id() in conversions:
+            # the consumer's conversion needs this one's output, eg: BGZip -> Tabix
+            return False
+        intype = _input_type(consumer, edge.ftag, tag_input)
+        if intype is None or _receivable_type(intype, source_type) is None:
+            return False
+    return True
+
+
+def _receivable_type(intype, source_type):
+    """
+    The type to connect source_type into intype as: source_type itself if intype
+    accepts it, else the type in intype that source_type is a kind of (eg: a VcfTabix
+    is a CompressedVcf with an index). None if intype can't read it.
+    """
+    if intype.can_receive_from(source_type):
+        return source_type
+    options = intype.subtypes if isinstance(intype, UnionType) else [intype]
+    for option in options:
+        if isinstance(source_type, type(option)):
+            return option
+    return None
+
+
+def _source_for(consumer, edge, tag_input, source):
+    source_type = source.returntype()
+    dt = _receivable_type(_input_type(consumer, edge.ftag, tag_input), source_type)
+    if dt is source_type:
+        return source
+    return AliasSelector(_unaliased(source), dt)
+
+
+def _input_type(consumer, tag: str, tag_input):
+    inputs = {i.id(): i.intype for i in consumer.tool.tool_inputs()}
+    intype = inputs.get(tag)
+    if intype is not None and getattr(tag_input, "multiple_inputs", False):
+        # eg: vcfs=[a.out, b.out] are checked against the Array's subtype
+        intype = intype.subtype() if hasattr(intype, "subtype") else None
+    return intype
+
+
+def _remove_step(workflow, step, source, tools) -> RemovedConversion:
+    for tag_input, edge, consumer in _consumer_edges(workflow, step) or []:
+        edge.source = _source_for(consumer, edge, tag_input, source)
+
+    del workflow.step_nodes[step.id()]
+    workflow.nodes.pop(step.id(), None)
+    _remove_step_options(workflow, step)
+
+    upstream = getattr(_unaliased(source), "node", None)
+    return RemovedConversion(
+        step_id=step.id(),
+        tool_id=step.tool.id(),
+        source_id=upstream.id() if upstream is not None else None,
+        compresses=tools[step.tool.id()],
+    )
+
+
+def _remove_step_options(workflow, step):
+    """
+    Remove the workflow inputs janis made for the static options of a removed step (eg:
+    uncompressvcf_force for force=True), unless something else reads them
+    """
+    for tag, tag_input in step.sources.items():
+        for edge in tag_input.source_map:
+            node = getattr(edge.source, "input_node", None)
+            if node is None or node.id() != f"{step.id()}_{tag}":
+                continue
+            if _reads_input(workflow, node):
+                continue
+            workflow.input_nodes.pop(node.id(), None)
+            workflow.nodes.pop(node.id(), None)
+
+
+def _reads_input(workflow, node) -> bool:
+    def reads(value):
+        if isinstance(value, (list, tuple)):
+            return any(reads(v) for v in value)
+        value = _unaliased(value)
+        if getattr(value, "input_node", None) is node:
+            return True
+        args = getattr(value, "args", None)
+        return args is not None and reads(list(args))
+
+    return any(
+        reads(edge.source)
+        for s in workflow.step_nodes.values()
+        for _, edge in _edges(s)
+    ) or any(reads(o.source) for o in workflow.output_nodes.values())
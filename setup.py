@@ -25,11 +25,16 @@ setup(
         for p in sorted(find_packages("./janis_bioinformatics"))
     ],
     # Note: pip is not smart enough to include subdirectories (** also does not work)
-    package_data={"": ["*/test_data/*", "*/test_data/*/*", "*/test_data/*/*/*"]},
+    package_data={
+        "": ["*/test_data/*", "*/test_data/*/*", "*/test_data/*/*/*"],
+        # generated with: python -m janis_bioinformatics.catalogue
+        # generated with: python -m janis_bioinformatics.resources calibrate runs.tsv
+        "janis_bioinformatics": ["catalogue.json", "resources.json"],
+    },
     include_package_data=True,
     entry_points={
         "janis.extension": ["bioinformatics=janis_bioinformatics"],
-        "janis.tools": ["bioinformatics=janis_bioinformatics.tools"],
+        "janis.tools": ["bioinformatics=janis_bioinformatics.shed:tools"],
         "janis.types": ["bioinformatics=janis_bioinformatics.data_types"],
         "janis.datatype_transformations": [
             "bioinformatics=janis_bioinformatics.transformations:transformations"
@@ -0,0 +1,55 @@
+"""
+Compares the in-process Bam.flagstat against 'samtools flagstat' (subprocess).
+
+USAGE: python tests/local_benchmark_flagstat.py [bam] [repeats]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from janis_bioinformatics.utils.flagstat import flagstat
+
+default_bam = os.path.join(
+    os.path.dirname(__file__),
+    "../janis_bioinformatics/tools/test_data/small.bam",
+)
+
+
+def samtools_flagstat(path: str):
+    return subprocess.run(
+        ["samtools", "flagstat", path],
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    ).stdout
+
+
+def time_function(f, path: str, repeats: int):
+    timings, result = [], None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = f(path)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), result
+
+
+if __name__ == "__main__":
+    bam = sys.argv[1] if len(sys.argv) > 1 else default_bam
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    elapsed, ours = time_function(flagstat, bam, repeats)
+    print(f"{'in-process':<16}{elapsed:>10.3f}s")
+
+    try:
+        elapsed, theirs = time_function(samtools_flagstat, bam, repeats)
+    except FileNotFoundError:
+        print("samtools isn't installed, skipping the comparison")
+        sys.exit(0)
+
+    print(f"{'samtools':<16}{elapsed:>10.3f}s")
+    if ours != theirs:
+        print("The outputs differ:\n" + ours + "\n---\n" + theirs)
+        sys.exit(1)
+    print("The outputs are identical")
@@ -0,0 +1,97 @@
+"""
+Compares the Gatk4ToolBase JVM profile against the previous defaults (only -Xmx), by
+running several single core GATK jobs at the same time, like a scheduler packing
+1 cpu HaplotypeCaller jobs onto a node.
+
+USAGE: python tests/local_benchmark_gatk4_jvm.py [--bam small.bam] [--jobs N]
+    [--memory GB] [--gatk "docker run --rm -v $PWD:$PWD -w $PWD broadinstitute/gatk:4.1.3.0 gatk"]
+"""
+import argparse
+import os
+import shlex
+import statistics
+import subprocess
+import time
+
+default_bam = os.path.join(
+    os.path.dirname(__file__),
+    "../janis_bioinformatics/tools/test_data/small.bam",
+)
+
+
+def default_options(cpus: int, memory: float):
+    return f"-Xmx{memory * 3 / 4:g}G"
+
+
+def profile_options(cpus: int, memory: float):
+    # mirrors Gatk4ToolBase.java_options()
+    heap = memory * 3 / 4
+    gc = "-XX:+UseG1GC" if heap >= 8 else "-XX:+UseParallelGC"
+    return (
+        f"-Xmx{heap:g}G -XX:+IgnoreUnrecognizedVMOptions "
+        f"-XX:ActiveProcessorCount={cpus} -XX:ParallelGCThreads={cpus} {gc} "
+        f"-Djava.io.tmpdir=."
+    )
+
+
+def gc_threads(gatk: str, java_options: str) -> str:
+    """The ParallelGCThreads the JVM ends up with"""
+    java = shlex.split(gatk)[:-1] + ["java"]
+    out = subprocess.run(
+        java + shlex.split(java_options) + ["-XX:+PrintFlagsFinal", "-version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+    ).stdout
+    for line in out.splitlines():
+        if "ParallelGCThreads" in line:
+            return line.split()[3]
+    return "?"
+
+
+def run_concurrently(gatk: str, java_options: str, bam: str, jobs: int):
+    """
+    Start the jobs together, returning (wall time, cpu seconds of all the jobs)
+    """
+    command = shlex.split(gatk) + [
+        "--java-options",
+        java_options,
+        "CountReads",
+        "-I",
+        bam,
+    ]
+    start = time.perf_counter()
+    processes = [
+        subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for _ in range(jobs)
+    ]
+    cpu = 0.0
+    for p in processes:
+        _, status, usage = os.wait4(p.pid, 0)
+        if status != 0:
+            raise Exception(f"'{' '.join(command)}' failed ({status})")
+        cpu += usage.ru_utime + usage.ru_stime
+    return time.perf_counter() - start, cpu
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bam", default=default_bam)
+    parser.add_argument("--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--memory", type=float, default=4, help="GB per job")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--gatk", default="gatk")
+    args = parser.parse_args()
+
+    print(f"{args.jobs} concurrent 1 cpu CountReads jobs on {args.bam}")
+    print(f"{'profile':<10}{'GC threads':>12}{'wall':>10}{'cpu':>10}")
+    for name, options in [("default", default_options), ("profile", profile_options)]:
+        java_options = options(1, args.memory)
+        timings = [
+            run_concurrently(args.gatk, java_options, args.bam, args.jobs)
+            for _ in range(args.repeats)
+        ]
+        wall = statistics.median(t[0] for t in timings)
+        cpu = statistics.median(t[1] for t in timings)
+        threads = gc_threads(args.gatk, java_options)
+        print(f"{name:<10}{threads:>12}{wall:>9.2f}s{cpu:>9.2f}s")
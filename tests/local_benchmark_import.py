@@ -0,0 +1,45 @@
+"""
+Cold-start import benchmark, each statement is timed in a fresh interpreter.
+
+USAGE: python tests/local_benchmark_import.py [repeats]
+"""
+import statistics
+import subprocess
+import sys
+
+statements = {
+    "package": "import janis_bioinformatics",
+    "data type": "from janis_bioinformatics.data_types import BamBai",
+    "one tool": "from janis_bioinformatics.tools.gatk4 import Gatk4HaplotypeCaller_4_1_3",
+    "one workflow": "from janis_bioinformatics.tools.common import BwaAligner",
+    "all tools (previous behaviour)": "from janis_bioinformatics.shed import tools",
+}
+
+template = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def time_statement(statement: str, repeats: int):
+    timings, n_modules = [], 0
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-c", template.format(statement=statement)],
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        elapsed, n_modules = result.stdout.split()
+        timings.append(float(elapsed))
+    return statistics.median(timings), int(n_modules)
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'import':<32}{'median (s)':>12}{'modules':>10}")
+    for name, statement in statements.items():
+        elapsed, n_modules = time_statement(statement, repeats)
+        print(f"{name:<32}{elapsed:>12.3f}{n_modules:>10}")
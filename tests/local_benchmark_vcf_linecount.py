@@ -0,0 +1,84 @@
+"""
+Compares CompressedVcf line counting (readline loop vs bulk, single process vs a
+process pool) on a large bgzipped VCF.
+
+USAGE:
+    python tests/local_benchmark_vcf_linecount.py path/to/large.vcf.gz
+    python tests/local_benchmark_vcf_linecount.py --generate 4
+        (writes a synthetic ~4GB (uncompressed) BGZF VCF to a temporary directory)
+"""
+import gzip
+import os
+import random
+import sys
+import tempfile
+import time
+import zlib
+from struct import pack
+
+from janis_bioinformatics.utils.vcfchecks import line_count, record_count
+
+
+def readline_line_count(file_path: str):
+    # the previous CompressedVcf.LineCount
+    count = 0
+    with gzip.open(file_path, "rt") as f:
+        while f.readline():
+            count += 1
+    return count
+
+
+def bgzf_block(data: bytes):
+    compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+    cdata = compressor.compress(data) + compressor.flush()
+    header = pack(
+        "<4BI2BH2BHH", 31, 139, 8, 4, 0, 0, 255, 6, 66, 67, 2, len(cdata) + 25
+    )
+    return header + cdata + pack("<II", zlib.crc32(data), len(data))
+
+
+def generate_vcf(file_path: str, size_gb: float):
+    random.seed(0)
+    header = (
+        b"##fileformat=VCFv4.2\n"
+        b"#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\tSAMPLE\n"
+    )
+    records = "".join(
+        f"chr1\t{i * 100}\t.\tA\t{random.choice('CGT')}\t{random.randint(1, 99)}\t"
+        f"PASS\tDP={random.randint(1, 200)}\tGT:AD\t0/1:{random.randint(1, 99)},5\n"
+        for i in range(300)
+    ).encode()
+
+    with open(file_path, "wb") as f:
+        f.write(bgzf_block(header))
+        for _ in range(int(size_gb * 1024**3 / len(records))):
+            f.write(bgzf_block(records))
+        f.write(bgzf_block(b""))
+
+
+def timed(name, f, *args, **kwargs):
+    start = time.perf_counter()
+    result = f(*args, **kwargs)
+    print(f"{name:<36}{time.perf_counter() - start:>10.2f}s{result:>14}")
+
+
+if __name__ == "__main__":
+    tmpdir = None
+    if len(sys.argv) > 2 and sys.argv[1] == "--generate":
+        tmpdir = tempfile.TemporaryDirectory()
+        path = os.path.join(tmpdir.name, "large.vcf.gz")
+        generate_vcf(path, float(sys.argv[2]))
+    elif len(sys.argv) > 1:
+        path = sys.argv[1]
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+    print(f"{path} ({os.path.getsize(path) / 1024 ** 2:.0f}MB compressed)")
+    timed("readline (previous)", readline_line_count, path)
+    timed("bulk, 1 process", line_count, path, compressed=True, processes=1)
+    timed("bulk, process pool", line_count, path, compressed=True)
+    timed("records only, process pool", record_count, path, compressed=True)
+
+    if tmpdir:
+        tmpdir.cleanup()
@@ -3,7 +3,7 @@ import sys
 from parameterized import parameterized
 from nose.plugins.attrib import attr
 
-import janis_bioinformatics
+from janis_bioinformatics.shed import tools
 
 from janis_core.tool.test_suite_runner import ToolTestSuiteRunner
 from janis_core.tool import test_helpers
@@ -30,7 +30,7 @@ if tool_id is None or engine is None or version is None:
     )
     exit(1)
 
-tool = test_helpers.get_one_tool(tool_id, [janis_bioinformatics.tools], version)
+tool = test_helpers.get_one_tool(tool_id, [tools], version)
 runner = ToolTestSuiteRunner(tool)
 
 
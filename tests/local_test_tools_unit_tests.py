@@ -1,14 +1,14 @@
 import unittest
 from parameterized import parameterized
 
-import janis_bioinformatics
+from janis_bioinformatics.shed import tools
 
 from janis_core.tool.test_suite_runner import ToolTestSuiteRunner
 from janis_core.tool import test_helpers
 
 
 all_engines = test_helpers.get_available_engines()
-all_tools = test_helpers.get_all_tools([janis_bioinformatics.tools])
+all_tools = test_helpers.get_all_tools([tools])
 
 all_versioned_tools = []
 for tool_versions in all_tools:
@@ -0,0 +1,153 @@
+"""
+Write small coordinate sorted, indexed bams for the tests, without samtools / pysam.
+"""
+
+import re
+import struct
+import zlib
+from typing import List, NamedTuple, Optional, Tuple
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+CIGAR_OPS = "MIDNSHP=X"
+REF_CONSUMING = "MDN=X"
+
+
+class Read(NamedTuple):
+    tid: int
+    pos: int
+    cigar: str
+    seq: str
+    flag: int = 0
+    mapq: int = 60
+    qual: Optional[List[int]] = None
+    name: str = "read"
+    next_tid: int = -1
+    next_pos: int = -1
+    tlen: int = 0
+
+    def end(self):
+        lengths = re.findall(r"(\d+)([MIDNSHP=X])", self.cigar)
+        return self.pos + sum(int(n) for n, op in lengths if op in REF_CONSUMING)
+
+
+def reg2bin(beg: int, end: int) -> int:
+    end -= 1
+    for shift, first in ((14, 4681), (17, 585), (20, 73), (23, 9), (26, 1)):
+        if beg >> shift == end >> shift:
+            return first + (beg >> shift)
+    return 0
+
+
+def encode(read: Read) -> bytes:
+    cigar = [
+        int(n) << 4 | CIGAR_OPS.index(op)
+        for n, op in re.findall(r"(\d+)([MIDNSHP=X])", read.cigar)
+    ]
+    seq = [("=ACMGRSVTWYHKDBN".index(b)) for b in read.seq] + [0]
+    packed = bytes(seq[i] << 4 | seq[i + 1] for i in range(0, len(read.seq), 2))
+    qual = bytes(read.qual or [30] * len(read.seq))
+    name = read.name.encode() + b"\0"
+    end = read.end() if read.tid >= 0 else read.pos + 1
+    record = struct.pack(
+        "<iiBBHHHiiii",
+        read.tid,
+        read.pos,
+        len(name),
+        read.mapq,
+        reg2bin(max(read.pos, 0), max(end, read.pos + 1, 1)),
+        len(cigar),
+        read.flag,
+        len(read.seq),
+        read.next_tid,
+        read.next_pos,
+        read.tlen,
+    )
+    record += name + struct.pack(f"<{len(cigar)}I", *cigar) + packed + qual
+    return struct.pack("<i", len(record)) + record
+
+
+def bgzf_block(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    payload = compressor.compress(data) + compressor.flush()
+    header = b"\x1f\x8b\x08\x04\0\0\0\0\0\xff\x06\0BC\x02\0"
+    size = len(header) + 2 + len(payload) + 8
+    return (
+        header
+        + struct.pack("<H", size - 1)
+        + payload
+        + struct.pack("<II", zlib.crc32(data), len(data))
+    )
+
+
+def write_bam(
+    path: str, references: List[Tuple[str, int]], reads: List[Read], block_size=1000
+):
+    """
+    Write the (sorted) reads to path and its index to path.bai, the reads are split
+    into blocks of block_size bytes (records span blocks) to exercise the readers
+    """
+    header = b"BAM\x01" + struct.pack("<i", 0) + struct.pack("<i", len(references))
+    for name, length in references:
+        header += struct.pack("<i", len(name) + 1) + name.encode() + b"\0"
+        header += struct.pack("<i", length)
+
+    data = b"".join(encode(r) for r in reads)
+    blocks = [header] + [
+        data[i : i + block_size] for i in range(0, len(data), block_size)
+    ]
+    with open(path, "wb") as f:
+        # the (compressed offset, uncompressed start) of each block
+        offsets = []
+        uoffset = 0
+        for block in blocks:
+            offsets.append((f.tell(), uoffset))
+            uoffset += len(block)
+            f.write(bgzf_block(block))
+        end_coffset = f.tell()
+        f.write(BGZF_EOF)
+
+    def voffset(position):
+        # positions at the end of a block are the start of the next block
+        for (coffset, start), block in zip(offsets, blocks):
+            if start <= position < start + len(block):
+                return coffset << 16 | (position - start)
+        return end_coffset << 16
+
+    index = [({}, {}, [None, None, 0, 0]) for _ in references]
+    position, n_no_coor = len(header), 0
+    for read in reads:
+        start = voffset(position)
+        position += len(encode(read))
+        end = voffset(position)
+        if read.tid < 0:
+            n_no_coor += 1
+            continue
+        bins, linear, meta = index[read.tid]
+        chunks = bins.setdefault(reg2bin(read.pos, max(read.end(), read.pos + 1)), [])
+        if chunks and chunks[-1][1] == start:
+            chunks[-1][1] = end
+        else:
+            chunks.append([start, end])
+        for window in range(
+            read.pos >> 14, (max(read.end(), read.pos + 1) - 1 >> 14) + 1
+        ):
+            linear.setdefault(window, start)
+        meta[0] = start if meta[0] is None else meta[0]
+        meta[1] = end
+        meta[2 if not read.flag & 0x4 else 3] += 1
+
+    with open(path + ".bai", "wb") as f:
+        f.write(b"BAI\x01" + struct.pack("<i", len(references)))
+        for bins, linear, meta in index:
+            f.write(struct.pack("<i", len(bins) + (meta[0] is not None)))
+            for bin_id, chunks in bins.items():
+                f.write(struct.pack("<Ii", bin_id, len(chunks)))
+                for chunk in chunks:
+                    f.write(struct.pack("<QQ", *chunk))
+            if meta[0] is not None:
+                # the pseudo-bin with the read counts
+                f.write(struct.pack("<Ii4Q", 37450, 2, *meta))
+            n_intv = max(linear) + 1 if linear else 0
+            values = [linear.get(w, 0) for w in range(n_intv)]
+            f.write(struct.pack(f"<i{n_intv}Q", n_intv, *values))
+        f.write(struct.pack("<Q", n_no_coor))
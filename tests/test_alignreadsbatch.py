@@ -0,0 +1,53 @@
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_core import CaptureType
+
+from janis_bioinformatics.tools.star import StarAlignReadsBatch_2_7_1
+from janis_bioinformatics.tools.star.alignreadsbatch import (
+    GENOME_MEMORY_GB,
+    SAMPLE_MEMORY_GB,
+)
+
+
+def translate(translation):
+    return StarAlignReadsBatch_2_7_1().translate(
+        translation, to_console=False, allow_empty_container=True
+    )
+
+
+@attr("ci")
+class TestStarAlignReadsBatchTranslation(unittest.TestCase):
+    def test_cwl_shell_isnt_an_expression(self):
+        # $(...) in a CWL argument is a javascript expression, not a subshell
+        cwl = translate("cwl")
+        self.assertIn("star_`printf '%04d' $i`.$name.", cwl)
+        self.assertIn("i=`expr $i + 1`", cwl)
+        self.assertNotIn("$(printf", cwl)
+        self.assertNotIn("$((", cwl)
+
+    def test_cwl_reads_are_paths(self):
+        cwl = translate("cwl")
+        self.assertIn(
+            'inputs.reads.map(function(el) { return el.path; }).join(" ")', cwl
+        )
+        self.assertNotIn(".flat()", cwl)
+
+    def test_wdl_reads(self):
+        wdl = translate("wdl")
+        self.assertIn('set -- ~{sep(" ", reads)}; i=0;', wdl)
+        self.assertIn("i=`expr $i + 1`", wdl)
+
+
+@attr("ci")
+class TestStarAlignReadsBatchResources(unittest.TestCase):
+    def test_genome_once_plus_a_sample(self):
+        tool = StarAlignReadsBatch_2_7_1()
+        self.assertEqual(GENOME_MEMORY_GB + SAMPLE_MEMORY_GB, tool.memory({}))
+        self.assertEqual(8, tool.cpus({}))
+
+    def test_chromosome_genome(self):
+        tool = StarAlignReadsBatch_2_7_1()
+        hints = {CaptureType.key(): CaptureType.CHROMOSOME}
+        self.assertLess(tool.memory(hints), GENOME_MEMORY_GB)
+        self.assertEqual(4, tool.cpus(hints))
@@ -0,0 +1,128 @@
+import os
+import tempfile
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.tools.pmac import AnnotateBamStats
+from tests.syntheticbam import Read, write_bam
+
+HEADER = """\
+##fileformat=VCFv4.2
+##contig=<ID=chr1,length=2000>
+##contig=<ID=chr2,length=2000>
+"""
+COLUMNS = "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO"
+
+
+def snv_read(tid, pos, base, offset=10, **kwargs):
+    """A 20bp read starting at pos, with base at pos + offset (and A elsewhere)"""
+    seq = "A" * offset + base + "A" * (19 - offset)
+    return Read(tid, pos, "20M", seq, **kwargs)
+
+
+class TestAnnotateBamStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.bam = os.path.join(cls.tmpdir.name, "sample.bam")
+        low_quality = [30] * 10 + [5] + [30] * 9
+        reads = [
+            # chr1:101 A>C, 4 ref and 3 alt reads count towards the AD
+            *[snv_read(0, 90, "A") for _ in range(4)],
+            *[snv_read(0, 90, "C") for _ in range(3)],
+            # a third allele and a deletion only count towards the DP
+            snv_read(0, 90, "G"),
+            Read(0, 92, "8M2D12M", "A" * 20),
+            # skipped: duplicate, low base quality, low mapping quality
+            snv_read(0, 95, "C", offset=5, flag=0x400),
+            snv_read(0, 95, "C", offset=5, qual=low_quality[5:] + [30] * 5),
+            snv_read(0, 95, "A", offset=5, mapq=0),
+            # doesn't reach the variant
+            snv_read(0, 101, "C"),
+            # chr2:501 A>T
+            *[snv_read(1, 495, "T", offset=5) for _ in range(2)],
+            snv_read(1, 495, "A", offset=5),
+            Read(-1, -1, "", "ACGT", flag=0x4),
+        ]
+        write_bam(cls.bam, [("chr1", 2000), ("chr2", 2000)], reads, block_size=200)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    def annotate(self, vcf: str, **kwargs):
+        with open("in.vcf", "w") as f:
+            f.write(HEADER + vcf)
+        out = AnnotateBamStats.code_block(
+            "in.vcf", minMappingQuality=1, minBaseQuality=10, **kwargs
+        )
+        with open(out["out"]) as f:
+            lines = f.read().splitlines()
+        return [l for l in lines if l.startswith("#CHROM")], [
+            l.split("\t") for l in lines if not l.startswith("#")
+        ]
+
+    @attr("ci")
+    def test_germline_snv_depths(self):
+        _, records = self.annotate(
+            f"{COLUMNS}\tFORMAT\tNA12878\n"
+            "chr1\t101\t.\tA\tC\t.\tPASS\t.\tGT\t0/1\n"
+            "chr2\t501\t.\tA\tT\t.\tPASS\t.\tGT\t0/1\n"
+            "chr3\t10\t.\tA\tT\t.\tPASS\t.\tGT\t0/1\n",
+            type="germline",
+            bam=self.bam,
+        )
+        self.assertEqual(
+            [
+                ["GT:AD:DP:AF", "0/1:4,3:9:0.3333"],
+                ["GT:AD:DP:AF", "0/1:1,2:3:0.6667"],
+                ["GT:AD:DP:AF", "0/1:0,0:0:0"],
+            ],
+            [r[8:] for r in records],
+        )
+
+    @attr("ci")
+    def test_sites_only_vcf(self):
+        header, records = self.annotate(
+            f"{COLUMNS}\nchr1\t101\t.\tA\tC\t.\tPASS\t.\n",
+            type="germline",
+            bam=self.bam,
+        )
+        self.assertEqual([f"{COLUMNS}\tFORMAT\tsample"], header)
+        self.assertEqual([["AD:DP:AF", "4,3:9:0.3333"]], [r[8:] for r in records])
+
+    @attr("ci")
+    def test_somatic_samples(self):
+        vcf = (
+            f"{COLUMNS}\tFORMAT\tNORMAL\tTUMOR\n"
+            "chr2\t501\t.\tA\tT\t.\tPASS\t.\tGT\t0/0\t0/1\n"
+        )
+        _, records = self.annotate(
+            vcf,
+            type="somatic",
+            tumorBam=self.bam,
+            normalBam=self.bam,
+            tumorID="TUMOR",
+            normalID="NORMAL",
+        )
+        self.assertEqual(
+            [["GT:AD:DP:AF", "0/0:1,2:3:0.6667", "0/1:1,2:3:0.6667"]],
+            [r[8:] for r in records],
+        )
+
+        with self.assertRaises(Exception):
+            self.annotate(
+                vcf,
+                type="somatic",
+                tumorBam=self.bam,
+                normalBam=self.bam,
+                tumorID="TUMOUR",
+                normalID="NORMAL",
+            )
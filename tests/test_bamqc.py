@@ -0,0 +1,123 @@
+import os
+import tempfile
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.tools.pmac import BamQc
+from tests.syntheticbam import Read, write_bam
+
+# paired, proper pair, mate reverse, read1 / paired, proper pair, reverse, read2
+READ1, READ2 = 0x1 | 0x2 | 0x20 | 0x40, 0x1 | 0x2 | 0x10 | 0x80
+DUPLICATE, SECONDARY, UNMAPPED = 0x400, 0x100, 0x4
+
+
+def pair(flag=0):
+    return [
+        Read(0, 100, "50M", "A" * 50, READ1 | flag, next_tid=0, next_pos=250, tlen=200),
+        Read(
+            0, 250, "50M", "A" * 50, READ2 | flag, next_tid=0, next_pos=100, tlen=-200
+        ),
+    ]
+
+
+class TestBamQc(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.bam = os.path.join(cls.tmpdir.name, "sample.bam")
+        first, second = pair()
+        duplicate_first, duplicate_second = pair(DUPLICATE)
+        reads = [
+            first,
+            duplicate_first,
+            second,
+            duplicate_second,
+            Read(1, 10, "50M", "A" * 50, SECONDARY),
+            Read(-1, -1, "", "ACGT", UNMAPPED),
+        ]
+        write_bam(cls.bam, [("chr1", 1000), ("chr2", 500)], reads, block_size=100)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+
+    @staticmethod
+    def read(path):
+        with open(path) as f:
+            return f.read()
+
+    @attr("ci")
+    def test_flagstat(self):
+        out = BamQc.code_block(self.bam)
+        self.assertEqual(
+            """\
+6 + 0 in total (QC-passed reads + QC-failed reads)
+1 + 0 secondary
+0 + 0 supplementary
+2 + 0 duplicates
+5 + 0 mapped (83.33% : N/A)
+4 + 0 paired in sequencing
+2 + 0 read1
+2 + 0 read2
+4 + 0 properly paired (100.00% : N/A)
+4 + 0 with itself and mate mapped
+0 + 0 singletons (0.00% : N/A)
+0 + 0 with mate mapped to a different chr
+0 + 0 with mate mapped to a different chr (mapQ>=5)
+""",
+            self.read(out["flagstat"]),
+        )
+        rmdup = self.read(out["rmdupFlagstat"]).splitlines()
+        self.assertEqual("4 + 0 in total (QC-passed reads + QC-failed reads)", rmdup[0])
+        self.assertEqual("0 + 0 duplicates", rmdup[3])
+        self.assertEqual("3 + 0 mapped (75.00% : N/A)", rmdup[4])
+        self.assertIsNone(out["targetFlagstat"])
+
+    @attr("ci")
+    def test_genome_coverage(self):
+        out = BamQc.code_block(self.bam)
+        self.assertEqual(
+            """\
+chr1\t0\t900\t1000\t0.9
+chr1\t1\t100\t1000\t0.1
+chr2\t0\t450\t500\t0.9
+chr2\t1\t50\t500\t0.1
+genome\t0\t1350\t1500\t0.9
+genome\t1\t150\t1500\t0.1
+""",
+            self.read(out["coverage"]),
+        )
+
+    @attr("ci")
+    def test_insert_size_metrics(self):
+        out = BamQc.code_block(self.bam)
+        lines = self.read(out["insertSizeMetrics"]).splitlines()
+        columns = lines.index("## METRICS CLASS\tpicard.analysis.InsertSizeMetrics")
+        metrics = dict(
+            zip(lines[columns + 1].split("\t"), lines[columns + 2].split("\t"))
+        )
+        self.assertEqual("200", metrics["MEDIAN_INSERT_SIZE"])
+        self.assertEqual("FR", metrics["PAIR_ORIENTATION"])
+        self.assertEqual("1", metrics["READ_PAIRS"])
+        self.assertEqual(["200\t1"], lines[-2:-1])
+
+    @attr("ci")
+    def test_targeted(self):
+        with open("regions.bed", "w") as f:
+            f.write("chr1\t120\t130\ttarget\n")
+        out = BamQc.code_block(self.bam, regionBed="regions.bed")
+        self.assertEqual(
+            "1 + 0 in total (QC-passed reads + QC-failed reads)",
+            self.read(out["targetFlagstat"]).splitlines()[0],
+        )
+        self.assertEqual(
+            "chr1\t120\t130\ttarget\t1\t10\t10\t1\nall\t1\t10\t10\t1\n",
+            self.read(out["coverage"]),
+        )
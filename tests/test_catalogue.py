@@ -0,0 +1,82 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from nose.plugins.attrib import attr
+
+from janis_core.tool import test_helpers
+
+from janis_bioinformatics.catalogue import ToolCatalogue
+from janis_bioinformatics import shed
+from janis_bioinformatics.shed import tools
+
+
+class TestToolCatalogue(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.catalogue = ToolCatalogue.build()
+
+    @attr("ci")
+    def test_contains_every_tool(self):
+        for tool_versions in test_helpers.get_all_tools([tools]):
+            for tool in tool_versions:
+                if not type(tool).__module__.startswith("janis_bioinformatics"):
+                    # eg: janis_unix tools imported by the workflows
+                    continue
+                entry = self.catalogue.find(tool.versioned_id())
+                self.assertIsNotNone(entry, tool.versioned_id())
+                self.assertEqual(tool.id(), entry.tool_id)
+                self.assertEqual(tool.version(), entry.version)
+
+    @attr("ci")
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "catalogue.json")
+            self.catalogue.write(path)
+            loaded = ToolCatalogue.load(path)
+
+        self.assertEqual(
+            [e.to_dict() for e in self.catalogue], [e.to_dict() for e in loaded]
+        )
+
+    @attr("ci")
+    def test_resolve_tool(self):
+        entry = self.catalogue.get("Gatk4HaplotypeCaller", "4.1.3.0")
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.versioned_id, entry.tool().versioned_id())
+
+    @attr("ci")
+    def test_missing_catalogue(self):
+        with self.assertRaises(FileNotFoundError):
+            ToolCatalogue.load(os.path.join(tempfile.gettempdir(), "missing.json"))
+
+    @attr("ci")
+    def test_shed_warns_without_a_catalogue(self):
+        missing = os.path.join(tempfile.gettempdir(), "missing.json")
+        with mock.patch.object(shed, "CATALOGUE_PATH", missing), mock.patch.object(
+            shed, "_catalogue", None
+        ), mock.patch.object(ToolCatalogue, "build", return_value=self.catalogue):
+            with self.assertWarns(UserWarning):
+                catalogue = shed.catalogue()
+        self.assertIs(self.catalogue, catalogue)
+
+    @attr("ci")
+    def test_shed_lookup_only_imports_the_tool(self):
+        # in a new interpreter, as this one has already imported every tool
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "catalogue.json")
+            self.catalogue.write(path)
+            script = f"""
+import sys
+from janis_bioinformatics import shed
+from janis_bioinformatics.catalogue import ToolCatalogue
+shed._catalogue = ToolCatalogue.load({path!r})
+assert "4.1.3.0" in shed.versions("Gatk4HaplotypeCaller")
+tool = shed.get_tool("Gatk4HaplotypeCaller", "4.1.3.0")
+assert tool.versioned_id() == "Gatk4HaplotypeCaller_4_1_3_0", tool.versioned_id()
+loaded = [m for m in sys.modules if m.startswith("janis_bioinformatics.tools.")]
+assert "janis_bioinformatics.tools.oshlack" not in loaded, loaded
+"""
+            subprocess.run([sys.executable, "-c", script], check=True)
@@ -0,0 +1,79 @@
+import gzip
+import os
+import tempfile
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.utils import fastqchecks
+from janis_bioinformatics.utils.fastqchecks import (
+    FastqValidationError,
+    fastq_pair_stats,
+)
+
+test_data = os.path.join(
+    os.path.dirname(__file__), "../janis_bioinformatics/tools/test_data"
+)
+R1 = os.path.join(test_data, "BRCA1_R1.fastq.gz")
+R2 = os.path.join(test_data, "BRCA1_R2.fastq.gz")
+
+
+class TestFastqPairStats(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        with gzip.open(R2) as f:
+            cls.r2_lines = f.read().split(b"\n")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    def write_r2(self, name: str, lines):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "wb") as f:
+            f.write(b"\n".join(lines))
+        return path
+
+    @attr("ci")
+    def test_stats(self):
+        stats1, stats2 = fastq_pair_stats(R1, R2)
+        self.assertEqual(9862, stats1.reads)
+        self.assertEqual(9862, stats2.reads)
+        self.assertEqual(1459576, stats1.bases)
+        self.assertEqual(stats1.bases, sum(stats1.quality_counts.values()))
+        self.assertEqual((148, 148), (stats1.min_length, stats1.max_length))
+
+    @attr("ci")
+    def test_stats_dont_depend_on_chunk_size(self):
+        expected = fastq_pair_stats(R1, R2)[1]
+        chunk_size = fastqchecks.CHUNK_SIZE
+        try:
+            fastqchecks.CHUNK_SIZE = 1000
+            stats = fastq_pair_stats(R1, R2)[1]
+        finally:
+            fastqchecks.CHUNK_SIZE = chunk_size
+        self.assertEqual(expected.reads, stats.reads)
+        self.assertEqual(expected.quality_counts, stats.quality_counts)
+
+    @attr("ci")
+    def test_max_reads(self):
+        stats1, stats2 = fastq_pair_stats(R1, R2, max_reads=10)
+        self.assertEqual((10, 10), (stats1.reads, stats2.reads))
+
+    @attr("ci")
+    def test_mismatched_read_names(self):
+        r2 = self.write_r2("missing.fastq", self.r2_lines[:400] + self.r2_lines[404:])
+        with self.assertRaisesRegex(FastqValidationError, "pair #101 don't match"):
+            fastq_pair_stats(R1, r2)
+
+    @attr("ci")
+    def test_different_number_of_reads(self):
+        r2 = self.write_r2("fewer.fastq", self.r2_lines[:-5])
+        with self.assertRaisesRegex(FastqValidationError, "different number of reads"):
+            fastq_pair_stats(R1, r2)
+
+    @attr("ci")
+    def test_truncated(self):
+        r2 = self.write_r2("truncated.fastq", self.r2_lines[:-3])
+        with self.assertRaisesRegex(FastqValidationError, "truncated"):
+            fastq_pair_stats(R1, r2)
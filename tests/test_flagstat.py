@@ -0,0 +1,125 @@
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.utils.bgzf import iter_blocks
+from janis_bioinformatics.utils.flagstat import count_flags, flagstat
+
+BGZF_EOF = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def bgzf_block(data: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    cdata = compressor.compress(data) + compressor.flush()
+    header = struct.pack(
+        "<4BI2BH2BHH", 31, 139, 8, 4, 0, 0, 255, 6, 66, 67, 2, len(cdata) + 25
+    )
+    trailer = struct.pack("<II", zlib.crc32(data), len(data))
+    return header + cdata + trailer
+
+
+def bam_record(flag: int, ref_id: int = 0, next_ref_id: int = 0, mapq: int = 60):
+    read_name = b"read\x00"
+    fixed = struct.pack(
+        "<iiBBHHHiiii",
+        ref_id,
+        100,
+        len(read_name),
+        mapq,
+        0,
+        0,
+        flag,
+        0,
+        next_ref_id,
+        200,
+        0,
+    )
+    body = fixed + read_name
+    return struct.pack("<i", len(body)) + body
+
+
+def write_bam(path: str, records, block_size: int = 50):
+    text = b"@HD\tVN:1.6\n"
+    header = b"BAM\x01" + struct.pack("<i", len(text)) + text + struct.pack("<i", 2)
+    for name in (b"chr1\x00", b"chr2\x00"):
+        header += struct.pack("<i", len(name)) + name + struct.pack("<i", 1000)
+    data = header + b"".join(records)
+
+    with open(path, "wb") as f:
+        # small blocks, so records (and the header) span block boundaries
+        for i in range(0, len(data), block_size):
+            f.write(bgzf_block(data[i : i + block_size]))
+        f.write(BGZF_EOF)
+
+
+class TestFlagstat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.bam = os.path.join(cls.tmpdir.name, "test.bam")
+        records = [
+            # properly paired, both mapped
+            bam_record(0x1 | 0x2 | 0x40),
+            bam_record(0x1 | 0x2 | 0x80),
+            # mate unmapped (singleton) + the unmapped mate
+            bam_record(0x1 | 0x8 | 0x40),
+            bam_record(0x1 | 0x4 | 0x80),
+            # mate on a different chr, with a low and high mapq
+            bam_record(0x1 | 0x40, next_ref_id=1, mapq=3),
+            bam_record(0x1 | 0x80, ref_id=1, next_ref_id=0, mapq=30),
+            # secondary, supplementary, QC-failed duplicate
+            bam_record(0x1 | 0x100),
+            bam_record(0x1 | 0x800),
+            bam_record(0x1 | 0x2 | 0x40 | 0x200 | 0x400),
+        ]
+        write_bam(cls.bam, records)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+    @attr("ci")
+    def test_bgzf_blocks(self):
+        with open(self.bam, "rb") as f:
+            blocks = list(iter_blocks(f.read()))
+        self.assertTrue(len(blocks) > 1)
+        self.assertEqual(b"BAM\x01", blocks[0][:4])
+
+    @attr("ci")
+    def test_counts(self):
+        counts = count_flags(self.bam)
+        self.assertEqual((8, 1), counts["total"])
+        self.assertEqual((1, 0), counts["secondary"])
+        self.assertEqual((1, 0), counts["supplementary"])
+        self.assertEqual((0, 1), counts["duplicates"])
+        self.assertEqual((7, 1), counts["mapped"])
+        self.assertEqual((6, 1), counts["paired"])
+        self.assertEqual((3, 1), counts["read1"])
+        self.assertEqual((3, 0), counts["read2"])
+        self.assertEqual((2, 1), counts["properly_paired"])
+        self.assertEqual((4, 1), counts["with_itself_and_mate_mapped"])
+        self.assertEqual((1, 0), counts["singletons"])
+        self.assertEqual((2, 0), counts["mate_different_chr"])
+        self.assertEqual((1, 0), counts["mate_different_chr_mapq5"])
+
+    @attr("ci")
+    def test_format(self):
+        expected = """\
+8 + 1 in total (QC-passed reads + QC-failed reads)
+1 + 0 secondary
+1 + 0 supplementary
+0 + 1 duplicates
+7 + 1 mapped (87.50% : 100.00%)
+6 + 1 paired in sequencing
+3 + 1 read1
+3 + 0 read2
+2 + 1 properly paired (33.33% : 100.00%)
+4 + 1 with itself and mate mapped
+1 + 0 singletons (16.67% : 0.00%)
+2 + 0 with mate mapped to a different chr
+1 + 0 with mate mapped to a different chr (mapQ>=5)
+"""
+        self.assertEqual(expected, flagstat(self.bam))
@@ -0,0 +1,69 @@
+import ast
+import importlib
+import inspect
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_core import Tool
+
+import janis_bioinformatics.tools
+
+
+def attached_index(package):
+    """
+    The (submodules, submod_attrs) a package passes to attach, read from its source
+    so that nothing is resolved through the package's __getattr__
+    """
+    for node in ast.walk(ast.parse(inspect.getsource(package))):
+        if isinstance(node, ast.Call) and getattr(node.func, "id", None) == "attach":
+            kwargs = {k.arg: ast.literal_eval(k.value) for k in node.keywords}
+            return kwargs.get("submodules", []), kwargs.get("submod_attrs", {})
+    return None
+
+
+def providers(package=janis_bioinformatics.tools):
+    """
+    The package and every package under it with a lazy index
+    """
+    index = attached_index(package)
+    if index is None:
+        return
+    yield package, index[1]
+    for submodule in index[0]:
+        yield from providers(importlib.import_module(f"{package.__name__}.{submodule}"))
+
+
+def is_tool_of(value, module) -> bool:
+    return (
+        inspect.isclass(value)
+        and issubclass(value, Tool)
+        and value.__module__ == module.__name__
+    )
+
+
+class TestProviderIndexes(unittest.TestCase):
+    @attr("ci")
+    def test_index_has_the_tools_of_each_module(self):
+        for package, submod_attrs in providers():
+            for module_name, names in submod_attrs.items():
+                module = importlib.import_module(f"{package.__name__}.{module_name}")
+                defined = {
+                    n
+                    for n, v in vars(module).items()
+                    if not n.startswith("_") and is_tool_of(v, module)
+                }
+                # the index can also re-export bases from other modules (eg: StarBase)
+                indexed = {n for n in names if is_tool_of(getattr(module, n), module)}
+                self.assertEqual(defined, indexed, module.__name__)
+
+    @attr("ci")
+    def test_index_entries_resolve_to_the_module(self):
+        for package, submod_attrs in providers():
+            for module_name, names in submod_attrs.items():
+                module = importlib.import_module(f"{package.__name__}.{module_name}")
+                for name in names:
+                    self.assertIs(
+                        getattr(module, name),
+                        getattr(package, name),
+                        f"{package.__name__}.{name}",
+                    )
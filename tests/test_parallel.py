@@ -0,0 +1,33 @@
+import os
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.utils.parallel import WorkerError, fork_map
+
+
+class TestForkMap(unittest.TestCase):
+    @attr("ci")
+    def test_closure(self):
+        offset = 10
+        results = dict(fork_map(lambda x: x + offset, range(5), processes=2))
+        self.assertEqual({i: i + offset for i in range(5)}, results)
+
+    @attr("ci")
+    def test_error_is_raised(self):
+        def fail(x):
+            if x == 3:
+                raise ValueError("three")
+            return x
+
+        with self.assertRaisesRegex(WorkerError, "three"):
+            list(fork_map(fail, range(5), processes=2))
+
+    @attr("ci")
+    def test_dead_worker_is_raised(self):
+        def die(x):
+            if x == 3:
+                os._exit(3)
+            return x
+
+        with self.assertRaisesRegex(WorkerError, "exited with code 3"):
+            list(fork_map(die, range(5), processes=2))
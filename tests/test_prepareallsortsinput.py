@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+from nose.plugins.attrib import attr
+
+import numpy as np
+
+from janis_bioinformatics.tools.oshlack import (
+    OncopipeSamplePreparation,
+    OncopipeSamplePreparation_0_2_0,
+    PrepareALLSortsInput_0_1_0,
+    PrepareALLSortsInput_0_2_0,
+)
+
+GENES = ["GENE1", "GENE2", "GENE3"]
+
+
+def featurecounts(bams, counts, genes=GENES):
+    lines = [
+        "# Program:featureCounts v2.0.1",
+        "\t".join(["Geneid", "Chr", "Start", "End", "Strand", "Length", *bams]),
+    ]
+    for gene, row in zip(genes, counts):
+        lines.append("\t".join([gene, "chr1", "1", "100", "+", "100", *map(str, row)]))
+    return "\n".join(lines) + "\n"
+
+
+class TestPrepareALLSortsInput(unittest.TestCase):
+    def setUp(self):
+        # the tool writes its outputs to the working directory
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def write(self, name: str, contents: str):
+        with open(name, "w") as f:
+            f.write(contents)
+        return name
+
+    def read(self, path: str):
+        with open(path) as f:
+            return f.read()
+
+    def cohort(self):
+        # a file per sample, and a file with the other three samples
+        return [
+            self.write("a.txt", featurecounts(["a.bam"], [[1], [2], [3]])),
+            self.write(
+                "bcd.txt",
+                featurecounts(
+                    ["b.bam", "c.bam", "d.bam"], [[4, 7, 10], [5, 8, 11], [6, 9, 12]]
+                ),
+            ),
+        ]
+
+    @attr("ci")
+    def test_same_csv_as_0_1_0(self):
+        inps = [
+            self.write(f"{s}.txt", featurecounts([f"{s}.bam"], [[i], [i * 10], [0]]))
+            for i, s in enumerate("abc")
+        ]
+        labels = ["A", "B", "C"]
+        PrepareALLSortsInput_0_1_0.code_block(inps, labels, output_filename="v1.csv")
+        for batch_size in (1, 2, 128):
+            PrepareALLSortsInput_0_2_0.code_block(
+                inps, labels, output_filename="v2.csv", batch_size=batch_size
+            )
+            self.assertEqual(self.read("v1.csv"), self.read("v2.csv"))
+
+    @attr("ci")
+    def test_columns_are_read_a_batch_at_a_time(self):
+        expected = (
+            ",GENE1,GENE2,GENE3\n"
+            "a.bam,1,2,3\nb.bam,4,5,6\nc.bam,7,8,9\nd.bam,10,11,12\n"
+        )
+        inps = self.cohort()
+        for batch_size in (1, 2, 3, 4, 128):
+            out = PrepareALLSortsInput_0_2_0.code_block(inps, batch_size=batch_size)
+            self.assertEqual(expected, self.read(out["out"]))
+
+    @attr("ci")
+    def test_npy(self):
+        out = PrepareALLSortsInput_0_2_0.code_block(
+            self.cohort(), output_filename="m.csv", output_format="npy", batch_size=2
+        )
+        matrix = np.load(out["out_matrix"])
+        self.assertEqual(np.int32, matrix.dtype)
+        self.assertEqual(
+            [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]], matrix.tolist()
+        )
+        self.assertEqual("GENE1\nGENE2\nGENE3\n", self.read(out["out_genes"]))
+        self.assertEqual("a.bam\nb.bam\nc.bam\nd.bam\n", self.read(out["out_samples"]))
+
+    @attr("ci")
+    def test_genes_are_reordered(self):
+        inps = [
+            self.write("a.txt", featurecounts(["a.bam"], [[1], [2], [3]])),
+            self.write(
+                "b.txt",
+                featurecounts(
+                    ["b.bam", "c.bam"], [[6, 9], [4, 7], [5, 8]], GENES[::-1]
+                ),
+            ),
+        ]
+        out = PrepareALLSortsInput_0_2_0.code_block(inps, batch_size=1)
+        self.assertEqual(
+            ",GENE1,GENE2,GENE3\na.bam,1,2,3\nb.bam,5,4,6\nc.bam,8,7,9\n",
+            self.read(out["out"]),
+        )
+
+    @attr("ci")
+    def test_different_genes(self):
+        inps = [
+            self.write("a.txt", featurecounts(["a.bam"], [[1], [2], [3]])),
+            self.write(
+                "b.txt", featurecounts(["b.bam"], [[1], [2], [3]], ["GENE1", "X", "Y"])
+            ),
+        ]
+        with self.assertRaises(Exception):
+            PrepareALLSortsInput_0_2_0.code_block(inps)
+
+    @attr("ci")
+    def test_htseq(self):
+        inps = [
+            self.write(
+                f"{s}.htseq", "GENE1\t1\nGENE2\t2\n__no_feature\t5\n__ambiguous\t0\n"
+            )
+            for s in "ab"
+        ]
+        out = PrepareALLSortsInput_0_2_0.code_block(
+            inps, ["A", "B"], fusion_caller="htseq", batch_size=1
+        )
+        self.assertEqual(",GENE1,GENE2\nA,1,2\nB,1,2\n", self.read(out["out"]))
+
+
+class TestOncopipeSamplePreparationVersions(unittest.TestCase):
+    @attr("ci")
+    def test_released_workflow_keeps_0_1_0(self):
+        step = OncopipeSamplePreparation().step_nodes["prepareAllsortsInput"]
+        self.assertEqual(PrepareALLSortsInput_0_1_0().version(), step.tool.version())
+
+    @attr("ci")
+    def test_0_2_0_streams_counts(self):
+        step = OncopipeSamplePreparation_0_2_0().step_nodes["prepareAllsortsInput"]
+        self.assertEqual(PrepareALLSortsInput_0_2_0().version(), step.tool.version())
@@ -0,0 +1,222 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+from nose.plugins.attrib import attr
+
+from janis_core import CaptureType
+
+from janis_bioinformatics import resources
+from janis_bioinformatics.resources import ResourceModel
+
+
+class TestResourceModel(unittest.TestCase):
+    @attr("ci")
+    def test_fit_covers_every_run(self):
+        sizes = [2, 10, 45, 90, 95, 270]
+        values = [4 + 0.5 * s + (1 if i % 2 else -1) for i, s in enumerate(sizes)]
+        model = resources.fit_model(sizes, [None] * len(sizes), values, headroom=1)
+        self.assertAlmostEqual(0.5, model.per_gb, places=1)
+        for size, value in zip(sizes, values):
+            self.assertGreaterEqual(model.estimate(size), value)
+
+    @attr("ci")
+    def test_fit_same_size(self):
+        model = resources.fit_model([5, 5, 5], [None] * 3, [3, 6, 4], headroom=1)
+        self.assertEqual(0, model.per_gb)
+        self.assertEqual(6, model.estimate(5))
+
+    @attr("ci")
+    def test_estimate_bounds(self):
+        model = ResourceModel(intercept=1, per_gb=0.5, minimum=4, maximum=64)
+        self.assertEqual(4, model.estimate(2))
+        self.assertEqual(46, model.estimate(90))
+        self.assertEqual(64, model.estimate(900))
+
+    @attr("ci")
+    def test_input_size_from_hints(self):
+        self.assertIsNone(resources.input_size(None))
+        self.assertIsNone(resources.input_size({"engine": "cromwell"}))
+        self.assertEqual(
+            (90, None), resources.input_size({CaptureType.key(): CaptureType.THIRTYX})
+        )
+        self.assertEqual(
+            (12.5, 40.0),
+            resources.input_size(
+                {
+                    CaptureType.key(): CaptureType.THIRTYX,
+                    resources.INPUT_SIZE_HINT: "12.5",
+                    resources.READ_COUNT_HINT: 40_000_000,
+                }
+            ),
+        )
+
+
+class TestCalibrate(unittest.TestCase):
+    @attr("ci")
+    def test_calibrate_roundtrip(self):
+        runs = [
+            ("combinevariants", 2, "", 1, 3, ""),
+            ("combinevariants", 10, "", 1, 5, ""),
+            ("combinevariants", 90, "", 1, 12, ""),
+            ("combinevariants", 270, "", 1, 30, ""),
+            # too few runs to fit
+            ("Gatk4HaplotypeCaller", 90, 600e6, 1, 8, 7200),
+        ]
+        with tempfile.TemporaryDirectory() as d:
+            runs_path = os.path.join(d, "runs.tsv")
+            with open(runs_path, "w") as f:
+                f.write("tool\tinputSize\treadCount\tcpus\tmemory\ttime\n")
+                for run in runs:
+                    f.write("\t".join(map(str, run)) + "\n")
+
+            models = resources.calibrate(runs_path)
+            self.assertEqual(["combinevariants"], list(models))
+            self.assertEqual({"cpus", "memory"}, set(models["combinevariants"]))
+
+            path = os.path.join(d, "resources.json")
+            resources.write_models(models, path)
+            self.assertEqual(models, resources.load_models(path))
+
+        hints = {resources.INPUT_SIZE_HINT: 10}
+        memory = resources.estimate_resource(
+            "combinevariants", "memory", hints, models=models
+        )
+        self.assertGreaterEqual(memory, 5)
+        # much less than the 64GB of the 30x capture type table
+        self.assertLess(memory, 32)
+        self.assertIsNone(
+            resources.estimate_resource("combinevariants", "disk", hints, models)
+        )
+
+
+class _Tool:
+    def id(self):
+        return "SomeTool"
+
+
+class TestDiskAndTime(unittest.TestCase):
+    profile = resources.IoProfile(disk_per_gb=3, disk_overhead=20, seconds_per_gb=60)
+
+    @attr("ci")
+    def test_from_input_size(self):
+        hints = {resources.INPUT_SIZE_HINT: 90}
+        self.assertEqual(290, resources.disk_for_hints(_Tool(), hints, self.profile))
+        self.assertEqual(
+            1800 + 90 * 60, resources.time_for_hints(_Tool(), hints, self.profile)
+        )
+
+    @attr("ci")
+    def test_hint_overrides(self):
+        hints = {resources.INPUT_SIZE_HINT: 90, "disk": 500, "time": 600}
+        self.assertEqual(500, resources.disk_for_hints(_Tool(), hints, self.profile))
+        self.assertEqual(600, resources.time_for_hints(_Tool(), hints, self.profile))
+
+    @attr("ci")
+    def test_no_size(self):
+        self.assertIsNone(resources.disk_for_hints(_Tool(), None, self.profile))
+        self.assertIsNone(resources.time_for_hints(_Tool(), {}, self.profile))
+
+
+class _TableTool:
+    # memory from a capture type table, like the tools' MEM_TUPLEs
+    table = [
+        (
+            CaptureType.key(),
+            {
+                CaptureType.TARGETED: 8,
+                CaptureType.CHROMOSOME: 4,
+                CaptureType.EXOME: 12,
+                CaptureType.THIRTYX: 16,
+                CaptureType.NINETYX: 64,
+                CaptureType.THREEHUNDREDX: 64,
+            },
+        )
+    ]
+
+    def id(self):
+        return "TableTool"
+
+    def memory(self, hints):
+        val = resources.resource_for_hints(self, "memory", hints, self.table)
+        if val:
+            return val
+        return 4
+
+    def cpus(self, hints):
+        return 1
+
+
+class TestSeed(unittest.TestCase):
+    @attr("ci")
+    def test_seed_from_table(self):
+        models = resources.seed([_TableTool()])
+        # the cpus don't depend on the capture type
+        self.assertEqual(["memory"], list(models["TableTool"]))
+        model = models["TableTool"]["memory"]
+        # a chromosome (5GB) never gets less than a panel (2GB)
+        self.assertEqual(
+            [[2, 8], [5, 8], [10, 12], [90, 16], [270, 64], [900, 64]], model.knots
+        )
+
+        def estimate(hints):
+            return resources.estimate_resource("TableTool", "memory", hints, models)
+
+        self.assertEqual(14, estimate({resources.INPUT_SIZE_HINT: 50}))
+        self.assertEqual(64, estimate({resources.INPUT_SIZE_HINT: 2000}))
+        # a capture type gets the value from the table
+        self.assertIsNone(estimate({CaptureType.key(): CaptureType.EXOME}))
+
+    @attr("ci")
+    def test_measured_models_are_kept(self):
+        seeded = ResourceModel(intercept=0, knots=[[2, 8], [900, 64]])
+        measured = ResourceModel(intercept=4, per_gb=0.5, runs=10)
+        existing = {"A": {"memory": measured, "cpus": seeded}, "B": {"cpus": seeded}}
+        merged = resources.merge_models(
+            {"A": {"memory": seeded}}, resources.measured_models(existing)
+        )
+        self.assertEqual({"A": {"memory": measured}}, merged)
+
+    @attr("ci")
+    def test_routed_tools_use_models(self):
+        from janis_bioinformatics.tools.bedtools import BedToolsIntersectBedLatest
+        from janis_bioinformatics.tools.star import StarAlignReads_2_7_1
+
+        models = {
+            tool.id(): {"memory": ResourceModel(intercept=2, per_gb=1, runs=3)}
+            for tool in (StarAlignReads_2_7_1(), BedToolsIntersectBedLatest())
+        }
+        hints = {resources.INPUT_SIZE_HINT: 20}
+        with mock.patch.object(resources, "load_models", return_value=models):
+            self.assertEqual(22, StarAlignReads_2_7_1().memory(hints))
+            self.assertEqual(22, BedToolsIntersectBedLatest().memory(hints))
+        with mock.patch.object(resources, "load_models", return_value={}):
+            self.assertEqual(64, StarAlignReads_2_7_1().memory(hints))
+            self.assertEqual(8, BedToolsIntersectBedLatest().memory(hints))
+
+    @attr("ci")
+    def test_shipped_seeds_are_current(self):
+        from janis_bioinformatics.catalogue import ToolCatalogue
+
+        shipped = resources.load_models(resources.RESOURCES_PATH)
+        seeded = {
+            (tool, resource): model.knots
+            for tool, tool_models in shipped.items()
+            for resource, model in tool_models.items()
+            if model.knots
+        }
+        self.assertTrue(seeded)
+
+        catalogue = ToolCatalogue.build()
+        tools = [catalogue.get(tool_id).tool() for tool_id, _ in seeded]
+        with mock.patch.object(resources, "load_models", return_value={}):
+            expected = {
+                (tool, resource): model.knots
+                for tool, tool_models in resources.seed(tools).items()
+                for resource, model in tool_models.items()
+            }
+        self.assertEqual(
+            expected,
+            seeded,
+            "regenerate with: python -m janis_bioinformatics.resources seed",
+        )
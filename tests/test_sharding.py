@@ -0,0 +1,268 @@
+import os
+import tempfile
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.tools.pmac import (
+    CreateBalancedCallRegions,
+    GatherChunkedVcfs,
+    SplitIntervalsIntoShards,
+)
+
+
+class ShardingTestCase(unittest.TestCase):
+    def setUp(self):
+        # the tools write their shards to the working directory
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cwd = os.getcwd()
+        os.chdir(self.tmpdir.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmpdir.cleanup()
+
+    def write(self, name: str, contents: str):
+        with open(name, "w") as f:
+            f.write(contents)
+        return name
+
+    def read_shards(self, out, key="out_shards"):
+        shards = []
+        for path in out[key]:
+            with open(path) as f:
+                shards.append([tuple(l.rstrip("\n").split("\t")) for l in f])
+        return shards
+
+
+class TestSplitIntervalsIntoShards(ShardingTestCase):
+    def split(self, bed: str, shards: int, **kwargs):
+        out = SplitIntervalsIntoShards.code_block(
+            self.write("intervals.bed", bed), shards, **kwargs
+        )
+        return self.read_shards(out)
+
+    @staticmethod
+    def sizes(shards):
+        return [sum(int(e) - int(s) for _, s, e, *_ in shard) for shard in shards]
+
+    @attr("ci")
+    def test_largest_shard_is_minimised(self):
+        starts = [0, 10000, 20000, 30000, 40000]
+        ends = [3000, 13000, 23000, 30100, 43000]
+        bed = "".join(f"chr1\t{s}\t{e}\n" for s, e in zip(starts, ends))
+        shards = self.split(bed, 4)
+        self.assertEqual([3000, 3000, 3100, 3000], self.sizes(shards))
+
+    @attr("ci")
+    def test_order_and_columns_are_kept(self):
+        bed = "".join(
+            f"chr{c}\t{s}\t{s + 100}\tname{s}\n" for c in (2, 1) for s in (0, 500)
+        )
+        shards = self.split(bed, 3)
+        self.assertEqual(3, len(shards))
+        self.assertEqual(bed, "".join("\t".join(l) + "\n" for s in shards for l in s))
+
+    @attr("ci")
+    def test_fewer_intervals_than_shards(self):
+        shards = self.split("chr1\t0\t100\nchr1\t200\t300\n", 10)
+        self.assertEqual([[("chr1", "0", "100")], [("chr1", "200", "300")]], shards)
+
+    @attr("ci")
+    def test_only_split_at_min_gap(self):
+        bed = "chr1\t0\t100\nchr1\t150\t250\nchr1\t1000\t1100\nchr2\t0\t100\n"
+        shards = self.split(bed, 4, minGap=100)
+        self.assertEqual([200, 100, 100], self.sizes(shards))
+
+    @attr("ci")
+    def test_min_gap_sorts_each_contig(self):
+        bed = "chr1\t5000\t5100\nchr1\t0\t100\nchr2\t0\t100\nchr1_alt\t0\t100\n"
+        shards = self.split(bed, 2, minGap=100)
+        self.assertEqual(
+            [("chr1", "0", "100"), ("chr1", "5000", "5100"), ("chr2", "0", "100")],
+            [l for shard in shards for l in shard][:3],
+        )
+
+    @attr("ci")
+    def test_min_gap_from_the_furthest_end(self):
+        # 0-10000 reaches past 100-200, so there's no gap before 5000-6000
+        bed = "chr1\t0\t10000\nchr1\t100\t200\nchr1\t5000\t6000\nchr2\t0\t100\n"
+        shards = self.split(bed, 3, minGap=1000)
+        self.assertEqual(
+            [
+                [
+                    ("chr1", "0", "10000"),
+                    ("chr1", "100", "200"),
+                    ("chr1", "5000", "6000"),
+                ]
+            ],
+            shards[:1],
+        )
+        self.assertEqual([[("chr2", "0", "100")]], shards[1:])
+
+    @attr("ci")
+    def test_min_gap_rejects_split_contigs(self):
+        with self.assertRaises(Exception):
+            self.split("chr1\t0\t100\nchr2\t0\t100\nchr1\t500\t600\n", 2, minGap=100)
+
+    @attr("ci")
+    def test_max_size_with_overlap(self):
+        shards = self.split("chr1\t0\t250\tregion\n", 3, maxSize=100, overlap=10)
+        self.assertEqual(
+            [
+                [("chr1", "0", "110", "region")],
+                [("chr1", "100", "210", "region")],
+                [("chr1", "200", "250", "region")],
+            ],
+            shards,
+        )
+
+    @attr("ci")
+    def test_invalid_overlap(self):
+        with self.assertRaises(Exception):
+            self.split("chr1\t0\t250\n", 3, maxSize=100, overlap=100)
+
+    @attr("ci")
+    def test_max_size_cores(self):
+        bed = "chr1\t0\t250\tregion\nchr1\t1000\t1050\n"
+        out = SplitIntervalsIntoShards.code_block(
+            self.write("intervals.bed", bed), 2, maxSize=100, overlap=10
+        )
+        self.assertEqual(
+            [
+                [("chr1", "0", "100", "region")],
+                [
+                    ("chr1", "100", "200", "region"),
+                    ("chr1", "200", "250", "region"),
+                    ("chr1", "1000", "1050"),
+                ],
+            ],
+            self.read_shards(out, "out_cores"),
+        )
+
+    @attr("ci")
+    def test_no_cores_without_max_size(self):
+        out = SplitIntervalsIntoShards.code_block(
+            self.write("intervals.bed", "chr1\t0\t250\n"), 2
+        )
+        self.assertNotIn("out_cores", out)
+
+
+class TestGatherChunkedVcfs(ShardingTestCase):
+    header = "##fileformat=VCFv4.2\n#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n"
+
+    def vcf(self, name, records):
+        return self.write(
+            name,
+            self.header
+            + "".join(f"chr1\t{p}\t.\tA\t{a}\t.\t.\t.\n" for p, a in records),
+        )
+
+    @attr("ci")
+    def test_calls_are_kept_from_the_core(self):
+        # chunks [0, 110) and [100, 200), with the cores [0, 100) and [100, 200)
+        vcfs = [
+            self.vcf("1.vcf", [(50, "C"), (101, "T"), (105, "G")]),
+            self.vcf("2.vcf", [(101, "T"), (105, "GA"), (150, "C")]),
+        ]
+        cores = [
+            self.write("1.bed", "chr1\t0\t100\n"),
+            self.write("2.bed", "chr1\t100\t200\n"),
+        ]
+        out = GatherChunkedVcfs.code_block(vcfs, cores)
+        with open(out["out"]) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(self.header.splitlines(), lines[:2])
+        self.assertEqual(
+            [("50", "C"), ("101", "T"), ("105", "GA"), ("150", "C")],
+            [(l.split("\t")[1], l.split("\t")[4]) for l in lines[2:]],
+        )
+
+    @attr("ci")
+    def test_a_core_for_each_vcf(self):
+        with self.assertRaises(Exception):
+            GatherChunkedVcfs.code_block([self.vcf("1.vcf", [])], [])
+
+
+class TestCreateBalancedCallRegions(ShardingTestCase):
+    def write_reference(self, contigs, linebases=60):
+        fai = []
+        with open("ref.fasta", "w") as f:
+            for name, seq in contigs:
+                f.write(f">{name}\n")
+                offset = f.tell()
+                for i in range(0, len(seq), linebases):
+                    f.write(seq[i : i + linebases] + "\n")
+                fai.append(
+                    f"{name}\t{len(seq)}\t{offset}\t{linebases}\t{linebases + 1}\n"
+                )
+        self.write("ref.fasta.fai", "".join(fai))
+        return "ref.fasta"
+
+    @attr("ci")
+    def test_gaps_are_left_out(self):
+        reference = self.write_reference(
+            [("chr1", "A" * 300 + "N" * 200 + "C" * 300), ("chr2", "G" * 200)]
+        )
+        out = CreateBalancedCallRegions.code_block(reference, shards=4)
+        self.assertEqual(
+            [
+                [("chr1", "0", "200")],
+                [("chr1", "200", "300"), ("chr1", "500", "600")],
+                [("chr1", "600", "800")],
+                [("chr2", "0", "200")],
+            ],
+            self.read_shards(out),
+        )
+
+    @attr("ci")
+    def test_excluded_regions_and_short_gaps(self):
+        reference = self.write_reference([("chr1", "A" * 100 + "NN" + "A" * 98)])
+        excluded = self.write("excluded.bed", "chr1\t150\t200\n")
+        out = CreateBalancedCallRegions.code_block(
+            reference, regionSize=1000, excludedRegions=excluded, minGapSize=10
+        )
+        self.assertEqual([[("chr1", "0", "150")]], self.read_shards(out))
+
+    @attr("ci")
+    def test_shards_or_region_size(self):
+        reference = self.write_reference([("chr1", "A" * 100)])
+        with self.assertRaises(Exception):
+            CreateBalancedCallRegions.code_block(reference)
+
+    @attr("ci")
+    def test_translates(self):
+        for translation in ("cwl", "wdl"):
+            CreateBalancedCallRegions().translate(
+                translation, to_console=False, allow_empty_container=True
+            )
+
+
+class TestGatkGermlineVariantCallerScattered(unittest.TestCase):
+    @attr("ci")
+    def test_translates(self):
+        from janis_bioinformatics.tools.variantcallers.gatk.gatkgermline_variants_scattered_4_1_3 import (
+            GatkGermlineVariantCallerScattered_4_1_3,
+        )
+
+        for translation in ("cwl", "wdl"):
+            GatkGermlineVariantCallerScattered_4_1_3().translate(
+                translation, to_console=False
+            )
+
+    @attr("ci")
+    def test_same_md5_as_unscattered(self):
+        from janis_bioinformatics.tools.variantcallers.gatk import (
+            GatkGermlineVariantCaller_4_1_3,
+        )
+        from janis_bioinformatics.tools.variantcallers.gatk.gatkgermline_variants_scattered_4_1_3 import (
+            GatkGermlineVariantCallerScattered_4_1_3,
+        )
+
+        def md5(tool):
+            [test] = tool().tests()
+            return [o.expected_value for o in test.output if o.tag == "out"][-1]
+
+        self.assertEqual(
+            md5(GatkGermlineVariantCaller_4_1_3),
+            md5(GatkGermlineVariantCallerScattered_4_1_3),
+        )
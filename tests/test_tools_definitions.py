@@ -2,11 +2,11 @@ import unittest
 from nose.plugins.attrib import attr
 from parameterized import parameterized
 
-import janis_bioinformatics
+from janis_bioinformatics.shed import tools
 from janis_core.tool.test_definitions import ToolEvaluator
 from janis_core.tool import test_helpers
 
-all_tools = test_helpers.get_all_tools([janis_bioinformatics.tools])
+all_tools = test_helpers.get_all_tools([tools])
 
 all_versioned_tools = []
 # TODO: revert to full list
@@ -0,0 +1,48 @@
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.data_types import (
+    Fasta,
+    FastaFai,
+    FastaDict,
+    FastaWithIndexes,
+    Vcf,
+    VcfTabix,
+)
+from janis_bioinformatics.transformations import transformation_graph
+
+
+class TestCheapestTransformation(unittest.TestCase):
+    def tool_ids(self, start, finish):
+        return [
+            t.tool.id() for t in transformation_graph().find_connection(start, finish)
+        ]
+
+    @attr("ci")
+    def test_fai_without_bwa_index(self):
+        self.assertEqual(["SamToolsFaidx"], self.tool_ids(Fasta, FastaFai))
+
+    @attr("ci")
+    def test_dict_without_bwa_index(self):
+        self.assertEqual(
+            ["Gatk4CreateSequenceDictionary"], self.tool_ids(Fasta, FastaDict)
+        )
+
+    @attr("ci")
+    def test_all_indexes(self):
+        self.assertEqual(["IndexFasta"], self.tool_ids(Fasta, FastaWithIndexes))
+
+    @attr("ci")
+    def test_multiple_steps(self):
+        self.assertEqual(["bgzip", "tabix"], self.tool_ids(Vcf, VcfTabix))
+
+    @attr("ci")
+    def test_already_compatible(self):
+        self.assertEqual([], self.tool_ids(FastaWithIndexes, FastaFai))
+
+    @attr("ci")
+    def test_memoized(self):
+        graph = transformation_graph()
+        self.assertIs(graph, transformation_graph())
+        graph.find_connection(Vcf, VcfTabix)
+        self.assertIn(("VCF", "CompressedIndexedVCF"), graph._paths)
@@ -0,0 +1,154 @@
+import importlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+from nose.plugins.attrib import attr
+
+from janis_core import Workflow
+
+from janis_bioinformatics.tools.common import BwaAligner
+from janis_bioinformatics.utils import translationcache
+from janis_bioinformatics.utils.translationcache import (
+    TranslationCache,
+    translate_cached,
+    translation_key,
+)
+
+
+class Aligner:
+    translations = []
+
+    def __init__(self, **connections):
+        self.connections = connections
+
+    def versioned_id(self):
+        return "aligner/v1"
+
+    def translate(self, translation, **kwargs):
+        Aligner.translations.append(translation)
+        return f"{translation}: {sorted(self.connections.items())}"
+
+
+class Options:
+    def __init__(self, value):
+        self.value = value
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        Aligner.translations = []
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    @attr("ci")
+    def test_translation_is_cached(self):
+        first = translate_cached(Aligner(), "wdl", cache_dir=self.cache_dir)
+        second = translate_cached(Aligner(), "wdl", cache_dir=self.cache_dir)
+        self.assertEqual(first, second)
+        self.assertEqual(["wdl"], Aligner.translations)
+
+        translate_cached(Aligner(), "cwl", cache_dir=self.cache_dir)
+        self.assertEqual(["wdl", "cwl"], Aligner.translations)
+
+    @attr("ci")
+    def test_key_includes_constructor_arguments(self):
+        self.assertEqual(
+            translation_key(Aligner(algorithm="bwtsw"), "wdl", {}),
+            translation_key(Aligner(algorithm="bwtsw"), "wdl", {}),
+        )
+        self.assertNotEqual(
+            translation_key(Aligner(algorithm="bwtsw"), "wdl", {}),
+            translation_key(Aligner(algorithm="is"), "wdl", {}),
+        )
+
+    @attr("ci")
+    def test_key_of_object_options_is_stable(self):
+        # the default repr of an object contains its address
+        self.assertEqual(
+            translation_key(Aligner(), "wdl", {"options": Options(1)}),
+            translation_key(Aligner(), "wdl", {"options": Options(1)}),
+        )
+        self.assertNotEqual(
+            translation_key(Aligner(), "wdl", {"options": Options(1)}),
+            translation_key(Aligner(), "wdl", {"options": Options(2)}),
+        )
+
+    @attr("ci")
+    def test_key_includes_base_class_source(self):
+        module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, module_dir)
+        self.addCleanup(sys.path.remove, module_dir)
+        sys.path.insert(0, module_dir)
+
+        base_path = os.path.join(module_dir, "cachetestbase.py")
+        with open(base_path, "w") as f:
+            f.write("class Base:\n    def versioned_id(self):\n        return 'b/v1'\n")
+        with open(os.path.join(module_dir, "cachetesttool.py"), "w") as f:
+            f.write("from cachetestbase import Base\n\nclass Tool(Base):\n    pass\n")
+        tool = importlib.import_module("cachetesttool").Tool()
+
+        before = translation_key(tool, "wdl", {})
+        with open(base_path, "a") as f:
+            f.write("\n# the inputs changed\n")
+        self.assertNotEqual(before, translation_key(tool, "wdl", {}))
+
+    @attr("ci")
+    def test_least_recently_used_is_evicted(self):
+        cache = TranslationCache(self.cache_dir, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        os.utime(cache.path_for("a"), (0, 0))
+        os.utime(cache.path_for("b"), (1, 1))
+        self.assertEqual(1, cache.get("a"))
+
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+
+
+class TestWorkflowTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        patcher = mock.patch.object(
+            translationcache, "DEFAULT_CACHE_DIR", self.cache_dir
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    @attr("ci")
+    def test_key_of_a_workflow(self):
+        self.assertEqual(
+            translation_key(BwaAligner(), "wdl", {}),
+            translation_key(BwaAligner(), "wdl", {}),
+        )
+        self.assertNotEqual(
+            translation_key(BwaAligner(), "wdl", {}),
+            translation_key(BwaAligner(), "cwl", {}),
+        )
+
+    @attr("ci")
+    def test_translate_uses_the_cache(self):
+        with mock.patch.object(
+            Workflow, "translate", autospec=True, side_effect=Workflow.translate
+        ) as translate:
+            first = BwaAligner().translate("cwl", to_console=False)
+            second = BwaAligner().translate("cwl", to_console=False)
+
+        self.assertEqual(1, translate.call_count)
+        self.assertEqual(first, second)
+        self.assertEqual(1, len(os.listdir(self.cache_dir)))
+
+    @attr("ci")
+    def test_cache_can_be_turned_off(self):
+        with mock.patch.object(translationcache, "DEFAULT_CACHE_DIR", "off"):
+            BwaAligner().translate("cwl", to_console=False)
+        self.assertEqual([], os.listdir(self.cache_dir))
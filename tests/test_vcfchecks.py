@@ -0,0 +1,120 @@
+import gzip
+import hashlib
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+from nose.plugins.attrib import attr
+
+from janis_bioinformatics.utils import vcfchecks
+from janis_bioinformatics.utils.vcfchecks import md5_without_header
+
+HEADERS = [
+    "##fileformat=VCFv4.2\n",
+    "##source=HaplotypeCaller\n",
+    "##GATKCommandLine=<ID=HaplotypeCaller>\n",
+    "##contig=<ID=chr17,length=83257441>\n",
+    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\n",
+]
+
+
+def bgzip(data: bytes, block_size: int = 4096) -> bytes:
+    blocks = []
+    # the last (empty) block is the BGZF EOF marker
+    for i in [*range(0, len(data), block_size), len(data)]:
+        block = data[i : i + block_size]
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        cdata = compressor.compress(block) + compressor.flush()
+        header = struct.pack(
+            "<4BI2BH2BHH", 31, 139, 8, 4, 0, 0, 255, 6, 66, 67, 2, len(cdata) + 25
+        )
+        blocks.append(
+            header + cdata + struct.pack("<II", zlib.crc32(block), len(block))
+        )
+    return b"".join(blocks)
+
+
+def md5_readline(file_path: str, headers_to_remove, compressed: bool):
+    # the previous (line by line) implementation, which the digest must match
+    opened = gzip.open(file_path, "rt") if compressed else open(file_path, "r")
+    with opened as f:
+        hash_md5 = hashlib.md5()
+        for line in iter(f.readline, ""):
+            if all(("##" + header) not in line for header in headers_to_remove):
+                hash_md5.update(line.encode())
+    return hash_md5.hexdigest()
+
+
+class VcfFilesTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        body = [
+            f"chr17\t{43044295 + i}\t.\tA\tG\t50\tPASS\tDP={i % 97}"
+            # a header-like value in the body must be handled the same way
+            + (";X=##source" if i == 1234 else "") + "\n"
+            for i in range(5000)
+        ]
+        cls.files = []
+        for eol in ("\n", "\r\n"):
+            data = "".join(HEADERS + body).replace("\n", eol).encode()
+            name = "crlf" if eol == "\r\n" else "lf"
+            for suffix, contents, compressed in [
+                (".vcf", data, False),
+                (".gzip.vcf.gz", gzip.compress(data), True),
+                (".bgzf.vcf.gz", bgzip(data), True),
+            ]:
+                path = os.path.join(cls.tmpdir.name, name + suffix)
+                with open(path, "wb") as f:
+                    f.write(contents)
+                cls.files.append((path, compressed))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmpdir.cleanup()
+
+
+class TestVcfMd5WithoutHeader(VcfFilesTestCase):
+    @attr("ci")
+    def test_same_digest_as_readline(self):
+        for headers_to_remove in [[], ["source", "GATKCommandLine"], [""]]:
+            for path, compressed in self.files:
+                self.assertEqual(
+                    md5_readline(path, headers_to_remove, compressed),
+                    md5_without_header(path, headers_to_remove, compressed),
+                    f"{os.path.basename(path)}, removing {headers_to_remove}",
+                )
+
+    @attr("ci")
+    def test_single_thread(self):
+        path, compressed = self.files[2]
+        self.assertEqual(
+            md5_without_header(path, ["source"], compressed, threads=1),
+            md5_without_header(path, ["source"], compressed, threads=4),
+        )
+
+
+class TestVcfLineCount(VcfFilesTestCase):
+    @attr("ci")
+    def test_same_count_as_readline(self):
+        for path, compressed in self.files:
+            opened = gzip.open(path, "rt") if compressed else open(path, "r")
+            with opened as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), vcfchecks.line_count(path, compressed))
+            self.assertEqual(
+                len([l for l in lines if not l.startswith("#")]),
+                vcfchecks.record_count(path, compressed),
+            )
+
+    @attr("ci")
+    def test_process_pool(self):
+        path, compressed = self.files[2]
+        min_size = vcfchecks.PARALLEL_MIN_SIZE
+        try:
+            vcfchecks.PARALLEL_MIN_SIZE = 0
+            stats = vcfchecks.line_stats(path, compressed, processes=2)
+        finally:
+            vcfchecks.PARALLEL_MIN_SIZE = min_size
+        self.assertEqual(vcfchecks.line_stats(path, compressed, processes=1), stats)
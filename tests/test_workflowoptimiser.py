@@ -0,0 +1,143 @@
+import unittest
+from nose.plugins.attrib import attr
+
+from janis_core import WorkflowBuilder
+from janis_core.operators.selectors import AliasSelector
+from janis_unix.tools import UncompressArchive
+
+from janis_bioinformatics.data_types import CompressedVcf, FastaWithDict, Vcf
+from janis_bioinformatics.tools.bcftools import BcfToolsSort_1_9
+from janis_bioinformatics.tools.common import BwaAligner, SplitMultiAllele
+from janis_bioinformatics.tools.htslib import BGZip_1_9, Tabix_1_9
+from janis_bioinformatics.tools.variantcallers.gatk import (
+    GatkGermlineVariantCaller_4_1_3,
+    GatkGermlineVariantCaller_4_1_3_0_1,
+    GatkSomaticVariantCaller_4_1_3,
+    GatkSomaticVariantCaller_4_1_3_0_1,
+    GatkSomaticVariantCallerScattered_4_1_3,
+)
+from janis_bioinformatics.utils.workflowoptimiser import remove_redundant_conversions
+
+
+class TestRemoveRedundantConversions(unittest.TestCase):
+    @attr("ci")
+    def test_compress_before_tool_accepting_vcf(self):
+        w = WorkflowBuilder("test_compress")
+        w.input("vcf", Vcf)
+        w.step("compressvcf", BGZip_1_9(file=w.vcf))
+        w.step("sortvcf", BcfToolsSort_1_9(vcf=w.compressvcf.out))
+        w.output("out", source=w.sortvcf.out)
+
+        report = remove_redundant_conversions(w)
+        self.assertEqual(["compressvcf"], [r.step_id for r in report.removed])
+        self.assertEqual(["sortvcf"], list(w.step_nodes))
+        self.assertEqual(1250, report.bytes_saved({"compressvcf": 1000}))
+
+    @attr("ci")
+    def test_uncompress_before_tool_accepting_compressed(self):
+        w = WorkflowBuilder("test_uncompress")
+        w.input("vcf", CompressedVcf)
+        w.input("reference", FastaWithDict)
+        w.step("uncompressvcf", UncompressArchive(file=w.vcf, force=True))
+        w.step(
+            "splitnormalisevcf",
+            SplitMultiAllele(vcf=w.uncompressvcf.out, reference=w.reference),
+        )
+        w.output("out", source=w.splitnormalisevcf.out)
+
+        report = remove_redundant_conversions(w)
+        self.assertEqual(["uncompressvcf"], [r.step_id for r in report.removed])
+        self.assertEqual(5000, report.bytes_saved({"uncompressvcf": 1000}))
+
+    @attr("ci")
+    def test_round_trip(self):
+        w = WorkflowBuilder("test_round_trip")
+        w.input("vcf", Vcf)
+        w.input("reference", FastaWithDict)
+        w.step("compressvcf", BGZip_1_9(file=w.vcf))
+        w.step("uncompressvcf", UncompressArchive(file=w.compressvcf.out))
+        w.step(
+            "splitnormalisevcf",
+            SplitMultiAllele(vcf=w.uncompressvcf.out, reference=w.reference),
+        )
+        w.output("out", source=w.splitnormalisevcf.out)
+
+        report = remove_redundant_conversions(w)
+        self.assertEqual(
+            ["compressvcf", "uncompressvcf"], [r.step_id for r in report.removed]
+        )
+        self.assertEqual(["splitnormalisevcf"], list(w.step_nodes))
+
+    @attr("ci")
+    def test_keeps_workflow_outputs(self):
+        w = WorkflowBuilder("test_outputs")
+        w.input("vcf", Vcf)
+        w.step("compressvcf", BGZip_1_9(file=w.vcf))
+        w.step("sortvcf", BcfToolsSort_1_9(vcf=w.compressvcf.out))
+        w.output("compressed", source=w.compressvcf.out)
+        w.output("out", source=w.sortvcf.out)
+
+        report = remove_redundant_conversions(w)
+        self.assertEqual([], report.removed)
+
+    @attr("ci")
+    def test_indexers_save_no_bytes(self):
+        w = WorkflowBuilder("test_indexer")
+        w.input("vcf", CompressedVcf)
+        w.step("indexvcf", Tabix_1_9(inp=w.vcf))
+        w.step("sortvcf", BcfToolsSort_1_9(vcf=w.indexvcf.out))
+        w.output("out", source=w.sortvcf.out)
+
+        report = remove_redundant_conversions(w)
+        self.assertEqual(["indexvcf"], [r.step_id for r in report.removed])
+        self.assertEqual(0, report.bytes_saved({"indexvcf": 1000}))
+
+
+class TestRemoveRedundantConversionsFromWorkflows(unittest.TestCase):
+    def assertReadsCompressed(self, w, source_step):
+        edge = w.step_nodes["splitnormalisevcf"].sources["vcf"].source_map[0]
+        self.assertIsInstance(edge.source, AliasSelector)
+        self.assertIs(w.step_nodes[source_step], edge.source.inner_selector.node)
+        self.assertIsInstance(edge.source.returntype(), CompressedVcf)
+
+    @attr("ci")
+    def test_germline(self):
+        w = GatkGermlineVariantCaller_4_1_3()
+        report = w.remove_redundant_conversions()
+        self.assertEqual(["uncompressvcf"], [r.step_id for r in report.removed])
+        self.assertReadsCompressed(w, "haplotype_caller")
+        self.assertNotIn("uncompressvcf_force", w.input_nodes)
+        self.assertNotIn("UncompressArchive", w.translate_uncached("wdl")[0])
+
+    @attr("ci")
+    def test_somatic(self):
+        w = GatkSomaticVariantCaller_4_1_3()
+        report = w.remove_redundant_conversions()
+        self.assertEqual(["uncompressvcf"], [r.step_id for r in report.removed])
+        self.assertReadsCompressed(w, "filtermutect2calls")
+        self.assertNotIn("uncompressvcf_force", w.input_nodes)
+        self.assertNotIn("UncompressArchive", w.translate_uncached("wdl")[0])
+
+    @attr("ci")
+    def test_released_workflows_are_unchanged(self):
+        for cls in (GatkGermlineVariantCaller_4_1_3, GatkSomaticVariantCaller_4_1_3):
+            self.assertIn("uncompressvcf", cls().step_nodes)
+
+    @attr("ci")
+    def test_revisions_are_optimised(self):
+        for cls in (
+            GatkGermlineVariantCaller_4_1_3_0_1,
+            GatkSomaticVariantCaller_4_1_3_0_1,
+        ):
+            w = cls()
+            self.assertNotIn("uncompressvcf", w.step_nodes)
+            self.assertEqual([], w.remove_redundant_conversions().removed)
+
+    @attr("ci")
+    def test_keeps_needed_conversions(self):
+        # the scattered caller's bgzip / tabix make the index its consumers need
+        for cls in (GatkSomaticVariantCallerScattered_4_1_3, BwaAligner):
+            w = cls()
+            steps = list(w.step_nodes)
+            self.assertEqual([], w.remove_redundant_conversions().removed)
+            self.assertEqual(steps, list(w.step_nodes))